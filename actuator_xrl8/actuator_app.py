@@ -1,8 +1,5 @@
 from flask import Flask
-import matplotlib.pyplot as plt
-import numpy as np
 from threading import Thread, Event
-from time import time_ns
 
 try:
     from actuator_xrl8.motor import MotorGcodeMachine as GcodeMachine
@@ -10,6 +7,18 @@ except RuntimeError:
     from actuator_xrl8.gcode_machine import NullGcodeMachine as GcodeMachine
 
 from actuator_xrl8.gcode_interpreter import GcodeInterpreter
+from actuator_xrl8.gcode_machine import PreviewGcodeMachine
+from actuator_xrl8.gcode_stream import GcodeStream
+from actuator_xrl8.program_analysis import analyze, command_estimates
+from actuator_xrl8.program_cache import ProgramCache
+from actuator_xrl8.profiling import RunProfiler
+from actuator_xrl8.progress import ProgramProgress
+from actuator_xrl8.render import TrajectoryRenderer
+from actuator_xrl8.status import StatusBroadcaster
+from actuator_xrl8.telemetry import TelemetryChannel, TELEMETRY_ROOM
+from actuator_xrl8.timeline import Timeline
+
+PROGRAM_CACHE_DIR = "/var/tmp/actuator_xrl8/programs"
 
 class ActuatorApp(Flask):
     def __init__(self):
@@ -23,45 +32,45 @@ class ActuatorApp(Flask):
         self.ws = None
 
         self.machine = GcodeMachine()
+        self.program_cache = ProgramCache(self.machine.parameters(), PROGRAM_CACHE_DIR)
+        # Mudanças de estado são publicadas pelo broadcaster, iniciado pelo main
+        self.status_broadcaster = StatusBroadcaster(
+            self.get_status,
+            lambda event, status: self.ws.emit(event, status),
+            lambda: self.running or self.machine.is_moving(),
+        )
+
+        self.telemetry = TelemetryChannel(
+            self.machine.trajectory,
+            lambda frame: self.ws.emit("telemetry", frame, to=TELEMETRY_ROOM),
+            self.machine.TRAJECTORY_STEPS_PER_MM,
+        )
+
+        # Spans dos comandos do programa carregado, e o profiler da próxima execução
+        self.timeline = Timeline()
+        self.profiler = RunProfiler(lambda files: self.ws.emit("profile_ready", files))
+
+        self.progress = None
         self.interpreter = None
         self.running = False
         self.last_gcode = None
+        self.gcode_stream = None
         self.pause_request = False
 
-        self.trajectory_timestamps = []
-        self.trajectory_x = []
-        self.trajectory_y = []
-        self.trajectory_figure = plt.figure()
+        self.trajectory_start = 0
+        self.renderer = TrajectoryRenderer(lambda: self.ws.emit("new_trajectory_plot"))
 
         self.play_event = Event()
         self.play_event.clear()
         Thread(target=self.__run, daemon=True).start()
 
     def __start_recording_trajectory(self):
-        self.trajectory_timestamps = []
-        self.trajectory_x = []
-        self.trajectory_y = []
-        self.trajectory_figure.clear()
-
-    def __append_to_trajectory(self, ts, x, y):
-        self.trajectory_timestamps.append(ts)
-        self.trajectory_x.append(x)
-        self.trajectory_y.append(y)
+        # O gravador roda sempre, só marca onde a execução começa
+        self.trajectory_start = self.machine.trajectory.count()
 
     def __stop_recording_trajectory(self):
-        np.savez(
-            "/tmp/trajectory.npz",
-            timestamp=self.trajectory_timestamps,
-            x=self.trajectory_x,
-            y=self.trajectory_y
-        )
-
-        ax = self.trajectory_figure.add_subplot()
-        ax.axis("off")
-        ax.invert_yaxis()
-        ax.plot(self.trajectory_x, self.trajectory_y)
-        self.trajectory_figure.savefig("/tmp/trajectory.jpg")
-        self.ws.emit("new_trajectory_plot")
+        # Salvar e desenhar fica com o renderer, a próxima execução não espera
+        self.renderer.submit(*self.machine.trajectory_mm(self.trajectory_start))
 
     def __run(self):
         while True:
@@ -73,12 +82,14 @@ class ActuatorApp(Flask):
                 self.running = True
                 self.pause_request = False
 
-                while status := self.interpreter.step():
-                    if status is not True:
-                        print(f"{status}")
-                        break
-                    if self.pause_request:
-                        break
+                with self.profiler.run():
+                    while status := self.interpreter.step():
+                        if status is not True:
+                            print(f"{status}")
+                            break
+                        self.progress.update(self.interpreter.executed)
+                        if self.pause_request:
+                            break
 
                 if self.interpreter.is_finished():
                     self.interpreter = None
@@ -86,6 +97,29 @@ class ActuatorApp(Flask):
                 self.__stop_recording_trajectory()
                 self.running = False
 
+    @property
+    def running(self):
+        return self._running
+
+    @running.setter
+    def running(self, running):
+        self._running = running
+        if self.progress is not None:
+            if running:
+                self.progress.start()
+            else:
+                self.progress.stop()
+        self.status_broadcaster.notify()
+
+    @property
+    def interpreter(self):
+        return self._interpreter
+
+    @interpreter.setter
+    def interpreter(self, interpreter):
+        self._interpreter = interpreter
+        self.status_broadcaster.notify()
+
     def is_running(self):
         return self.running
 
@@ -96,21 +130,106 @@ class ActuatorApp(Flask):
         return self.interpreter is not None
 
     def initialize_trajectory(self, gcode_src):
+        """
+        Loads a program and runs its first command. The analysis of the program
+        is sent to the clients as `gcode_analysis`, and a program with errors is
+        rejected before anything moves.
+        """
+        self.__abort_stream()
+        interpreter = GcodeInterpreter(
+            gcode_src, self.machine, self.program_cache, self.timeline
+        )
+
+        # Expandido uma vez só, para a análise e para as estimativas
+        program, truncated = interpreter.expand_program()
+        analysis = self.analyze_program(interpreter, program, truncated)
+        self.ws.emit("gcode_analysis", analysis)
+        if analysis["errors"]:
+            for line, message in analysis["errors"]:
+                print(f"gcode error at line {line}: {message}")
+            return
+
+        self.progress = ProgramProgress(
+            *command_estimates(
+                program,
+                self.machine.get_position(),
+                self.machine.parameters().get("acceleration"),
+            )
+        )
         self.running = True
-        self.interpreter = GcodeInterpreter(gcode_src, self.machine)
-        self.interpreter.step()
+        self.timeline.clear()
+        self.interpreter = interpreter
+        self.interpreter.step(lookahead=False)
+        self.progress.update(interpreter.executed)
         self.running = False
         self.last_gcode = gcode_src
         self.pause_request = False
 
+    def stream_trajectory(self) -> GcodeStream:
+        """
+        Starts a program whose source arrives in chunks, given to feed() of the
+        returned stream. Its first command runs as soon as it is parsed, like in
+        initialize_trajectory, and the rest is parsed while it runs.
+        """
+        self.__abort_stream()
+        stream = self.gcode_stream = GcodeStream()
+        Thread(target=self.__initialize_stream, args=(stream,), daemon=True).start()
+        return stream
+
+    def __initialize_stream(self, stream):
+        interpreter = GcodeInterpreter(stream, self.machine, timeline=self.timeline)
+        # O tamanho de um fluxo não é conhecido, só os comandos executados
+        self.progress = ProgramProgress()
+        self.running = True
+        self.timeline.clear()
+        interpreter.step(lookahead=False)
+        self.progress.update(interpreter.executed)
+        self.running = False
+
+        if stream is self.gcode_stream:
+            self.interpreter = interpreter
+            self.last_gcode = None
+            self.pause_request = False
+
+    def __abort_stream(self):
+        if self.gcode_stream is not None:
+            self.gcode_stream.abort()
+            self.gcode_stream = None
+
+    def preview_trajectory(self, gcode_src):
+        "Path of a program from the current position, as a list of (x, y) in mm"
+        machine = PreviewGcodeMachine(self.machine.get_position())
+        interpreter = GcodeInterpreter(gcode_src, machine, self.program_cache)
+
+        while interpreter.step() is True:
+            pass
+
+        return machine.path
+
+    def analyze_program(self, interpreter, program, truncated) -> dict:
+        """
+        Checks and estimates from the current position the program of an
+        interpreter, as returned by its expand_program()
+        """
+        return analyze(
+            program,
+            interpreter.strings,
+            self.machine.get_position(),
+            self.machine.bounds(),
+            self.machine.parameters().get("acceleration"),
+            truncated,
+        )
+
     def reinitialize_last_trajectory(self):
-        self.initialize_trajectory(self.last_gcode)
+        if self.last_gcode is not None:
+            self.initialize_trajectory(self.last_gcode)
 
     def step(self):
         self.running = True
-        if status := self.interpreter.step():
+        if status := self.interpreter.step(lookahead=False):
             if status is not True:
                 print(f"{status}")
+        self.progress.update(self.interpreter.executed)
 
         if self.interpreter.is_finished():
             self.interpreter = None
@@ -134,13 +253,28 @@ class ActuatorApp(Flask):
         self.machine.encoder.host = host
         self.ws.emit("encoder_host", host)
 
+    def start_encoder_monitor(self):
+        "Reports the encoder reachability to the clients as `encoder_health`"
+        self.machine.encoder.start_monitor(
+            lambda health: self.ws.emit("encoder_health", health)
+        )
+
+    def set_step_metrics(self, enabled):
+        "Switches the timing histograms of the step loop on or off"
+        self.machine.step_metrics.enabled = enabled
+        self.status_broadcaster.notify()
+
     def get_status(self):
         pos = self.machine.get_position()
-        self.__append_to_trajectory(time_ns(), *pos)
+        metrics = self.machine.step_metrics
 
         return {
             "running": self.is_running(),
             "gcode_loaded": self.is_trajectory_initialized(),
             "pos": pos,
             "calibrated": self.is_calibrated(),
+            "progress": self.progress.summary() if self.progress else None,
+            "step_timing": (
+                metrics.summary() if metrics.enabled else {"enabled": False}
+            ),
         }
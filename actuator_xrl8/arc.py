@@ -0,0 +1,94 @@
+from functools import lru_cache
+import math
+
+import numpy as np
+
+ARC_TOLERANCE = 0.01  # mm, maximum distance between the arc and its chords
+
+
+def arc_center(x0, y0, x, y, raio, clockwise):
+    """
+    Returns the center of the arc from (x0, y0) to (x, y) with radius `raio`, in mm.
+    The center is to the left of the movement on G2 (clockwise) and to the right
+    on G3. Returns None if the radius is smaller than half the chord.
+    """
+    dx = x - x0
+    dy = y - y0
+    distancia = math.sqrt(dx**2 + dy**2)
+
+    if distancia > 2 * raio:
+        return None
+
+    if distancia == 0:
+        return x0, y0
+
+    h = math.sqrt(raio**2 - (distancia / 2) ** 2)
+    side = 1 if clockwise else -1
+    centro_x = (x0 + x) / 2 - side * h * dy / distancia
+    centro_y = (y0 + y) / 2 + side * h * dx / distancia
+
+    return centro_x, centro_y
+
+
+def arc_tangent(px, py, centro_x, centro_y, clockwise):
+    """
+    Unit direction of movement at the point (px, py) of an arc.
+    G2 runs through increasing angles and G3 through decreasing ones.
+    """
+    rx = px - centro_x
+    ry = py - centro_y
+    raio = math.hypot(rx, ry)
+
+    if clockwise:
+        return -ry / raio, rx / raio
+    else:
+        return ry / raio, -rx / raio
+
+
+def arc_sweep(x0, y0, x, y, centro_x, centro_y, clockwise):
+    "Signed angle swept by the arc, positive for G2 and negative for G3"
+    angulo_inicial = math.atan2(y0 - centro_y, x0 - centro_x)
+    angulo_final = math.atan2(y - centro_y, x - centro_x)
+
+    if clockwise and angulo_final < angulo_inicial:
+        angulo_final += 2 * math.pi
+    elif not clockwise and angulo_final > angulo_inicial:
+        angulo_final -= 2 * math.pi
+
+    return angulo_final - angulo_inicial
+
+
+@lru_cache(maxsize=256)
+def arc_points(x0, y0, x, y, raio, clockwise, tolerance=ARC_TOLERANCE):
+    """
+    Points of the arc from (x0, y0) to (x, y), in mm, including both ends, as a
+    read only (n, 2) array. The number of points is the smallest one that keeps
+    every chord within `tolerance` of the arc. Results are cached, so repeated arcs
+    of a scan are only computed once. Returns None if the radius is too small.
+    """
+    centro = arc_center(x0, y0, x, y, raio, clockwise)
+    if centro is None:
+        return None
+
+    centro_x, centro_y = centro
+    raio = math.hypot(x0 - centro_x, y0 - centro_y)
+    sweep = arc_sweep(x0, y0, x, y, centro_x, centro_y, clockwise)
+
+    # Uma corda de ângulo a se afasta do arco r * (1 - cos(a / 2))
+    if raio > tolerance:
+        max_angle = 2 * math.acos(1 - tolerance / raio)
+        segments = max(1, math.ceil(abs(sweep) / max_angle))
+    else:
+        segments = 1
+
+    angulo_inicial = math.atan2(y0 - centro_y, x0 - centro_x)
+    theta = angulo_inicial + sweep * np.linspace(0, 1, segments + 1)
+
+    points = np.column_stack(
+        (centro_x + raio * np.cos(theta), centro_y + raio * np.sin(theta))
+    )
+    points[0] = x0, y0
+    points[-1] = x, y
+    points.setflags(write=False)
+
+    return points
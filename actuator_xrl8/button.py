@@ -1,24 +1,17 @@
 import RPi.GPIO as GPIO
-from time import sleep
-from threading import Thread
 
-BUTTON = 14
-
-def __check_button(app):
-    last_button_state = GPIO.HIGH
-
-    while True:
-        current_state = GPIO.input(BUTTON)
+from actuator_xrl8.inputs import InputEvents, GpioInputSource
 
-        if last_button_state == GPIO.HIGH and current_state == GPIO.LOW:
-            app.play_pause()
-
-        last_button_state = current_state
-        sleep(0.01)
+BUTTON = 14
 
 
-def start_button_thread(app):
+def start_button_events(app):
+    "Toggles play/pause when the button is pressed (falling edge)"
     GPIO.setmode(GPIO.BCM)
     GPIO.setup(BUTTON, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
-    Thread(target=__check_button, args=(app,), daemon=True).start()
+    events = InputEvents(GpioInputSource(GPIO))
+    events.watch(BUTTON, active_level=GPIO.LOW)
+    events.subscribe(BUTTON, lambda pin, pressed: pressed and app.play_pause())
+
+    return events
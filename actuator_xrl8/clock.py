@@ -0,0 +1,76 @@
+from time import perf_counter_ns, sleep
+
+# Sleeps on the Pi may overshoot by ~100 us, so the last part is spun
+SPIN_NS = 200_000
+LATE_NS = 50_000
+
+
+class SpinClock:
+    "Real clock that busy waits until each deadline"
+
+    def now_ns(self) -> int:
+        return perf_counter_ns()
+
+    def wait_until(self, deadline_ns: int):
+        while perf_counter_ns() < deadline_ns:
+            pass
+
+
+class VirtualClock:
+    "Clock that jumps straight to each deadline, so nothing really waits"
+
+    def __init__(self, start_ns=0):
+        self.time_ns = start_ns
+
+    def now_ns(self) -> int:
+        return self.time_ns
+
+    def wait_until(self, deadline_ns: int):
+        self.time_ns = max(self.time_ns, deadline_ns)
+
+
+class HybridClock:
+    """
+    Real clock that sleeps while the deadline is far away and busy waits only for
+    the last `spin_ns`, so slow moves do not keep a core at 100%.
+
+    Keeps the timing error of every wait, the time between the deadline and the
+    moment the wait returned, in `stats`: number of waits, sum and maximum of the
+    errors in ns and how many waits were later than `late_ns`.
+    """
+
+    def __init__(self, spin_ns=SPIN_NS, late_ns=LATE_NS):
+        self.spin_ns = spin_ns
+        self.late_ns = late_ns
+        self.stats = [0, 0, 0, 0]
+
+    def now_ns(self) -> int:
+        return perf_counter_ns()
+
+    def wait_until(self, deadline_ns: int):
+        remaining = deadline_ns - perf_counter_ns()
+        if remaining > self.spin_ns:
+            sleep((remaining - self.spin_ns) / 1e9)
+
+        while (now := perf_counter_ns()) < deadline_ns:
+            pass
+
+        error = now - deadline_ns
+        stats = self.stats
+        stats[0] += 1
+        stats[1] += error
+        if error > stats[2]:
+            stats[2] = error
+        if error > self.late_ns:
+            stats[3] += 1
+
+
+def timing_summary(stats) -> dict:
+    "Summary of HybridClock.stats, with the errors in microseconds"
+    waits, error_sum, error_max, late = stats
+    return {
+        "waits": waits,
+        "mean_error_us": error_sum / waits / 1000 if waits else 0.0,
+        "max_error_us": error_max / 1000,
+        "late": late,
+    }
@@ -0,0 +1,94 @@
+"""
+Local stand-in for the virtual encoder, to test EncoderApi without the real one.
+
+    python -m actuator_xrl8.fake_encoder --port 8081 --delay 0.2
+
+and set the encoder host to 127.0.0.1:8081.
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from time import sleep
+from urllib.parse import unquote
+
+COMMANDS = (
+    "start_acquisition",
+    "stop_acquisition",
+    "start_stream",
+    "stop_stream",
+    "set_exposure",
+)
+
+
+class FakeEncoderServer:
+    """
+    Accepts the POST commands of the virtual encoder and keeps them in `received`
+    as (command, args) tuples. Each answer waits `delay` seconds, and with
+    `fail=True` every command is answered with an error.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, como o encoder
+
+            def do_POST(self):
+                command, *args = [unquote(p) for p in self.path.strip("/").split("/")]
+                sleep(server.delay)
+
+                if command not in COMMANDS or server.fail:
+                    self.send_response(404 if command not in COMMANDS else 500)
+                else:
+                    server.received.append((command, tuple(args)))
+                    self.send_response(200)
+
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def address(self) -> str:
+        "host:port to use as the encoder host"
+        host, port = self._httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def start(self):
+        "Serves from a background thread"
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in virtual encoder")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds per answer")
+    parser.add_argument("--fail", action="store_true", help="answer commands with 500")
+    args = parser.parse_args()
+
+    server = FakeEncoderServer(args.host, args.port, args.delay, args.fail)
+    print(f"Fake encoder listening on {server.address}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,240 +1,702 @@
+from copy import copy
+import io
 import re
+from time import perf_counter_ns
+
+import numpy as np
+
+from actuator_xrl8.lookahead import LOOKAHEAD_COMMANDS
+
+# Opcodes of the compiled program
+OPCODES = (
+    "G0",
+    "G1",
+    "G2",
+    "G3",
+    "G4",
+    "G28",
+    "G90",
+    "G91",
+    "M1000",
+    "M1001",
+    "M1002",
+    "M1003",
+    "M1004",
+)
+OPCODE = {name: op for op, name in enumerate(OPCODES)}
+MOTION_OPS = frozenset(OPCODE[name] for name in ("G0", "G1", "G2", "G3"))
+
+# Blocos O, resolvidos pela expansão e nunca enviados à máquina
+CONTROL_OPCODES = ("REPEAT", "ENDREPEAT", "SUB", "ENDSUB", "CALL")
+CONTROL = {name: len(OPCODES) + i for i, name in enumerate(CONTROL_OPCODES)}
+
+# Uma linha por comando: G0-G3 usam x, y, s e r, G4 P, M1000 F e M1004 E usam n.
+# O texto do M1000 fica em uma tabela à parte, indexada por s.
+# Os blocos O usam n para o seu número, x (a contagem do REPEAT) ou x, y, s e r
+# (os parâmetros do CALL) e jump, a distância até a linha do outro lado do bloco.
+COMMAND_DTYPE = np.dtype(
+    [
+        ("op", np.uint8),
+        ("line", np.uint32),
+        ("x", np.float64),
+        ("y", np.float64),
+        ("s", np.float64),
+        ("r", np.float64),
+        ("n", np.int32),
+        ("jump", np.int32),
+        ("refs", np.uint8),  # Bits de x, y, s e r que são parâmetros: #2 é 2, -#2 é -2
+    ]
+)
+
+# Parâmetros esperados por cada comando, na ordem
+ARGUMENTS = {
+    "G0": "XY",
+    "G1": "XYS",
+    "G2": "XYSR",
+    "G3": "XYSR",
+    "G4": "P",
+    "M1000": "F",
+    "M1004": "E",
+}
+INTEGER_ARGUMENTS = "PFE"
+
+PARAMETERS = 4  # Parameters of a subroutine, #1 to #4
+MAX_CALL_DEPTH = 32  # Nested subroutine calls, a deeper call is skipped
+
+STREAM_BATCH = 64  # Commands compiled at a time from a stream
+EXPANSION_BATCH = 256  # Commands expanded at a time for the machine
+PROGRAM_EXPANSION_LIMIT = 1_000_000  # Commands returned by GcodeInterpreter.program
+VECTOR_RUN = 16  # Rows without control flow expanded with NumPy instead of one by one
+
+
+def tokenize(chunks):
+    """
+    Yields the (token, line) pairs of G-code arriving as an iterable of text
+    chunks. Only complete lines are tokenized, so a chunk may end anywhere.
+    """
+    pattern = re.compile(Lexer.pattern)
+    line = 0
+    rest = ""
+
+    for chunk in chunks:
+        lines = (rest + chunk).split("\n")
+        rest = lines.pop()
+
+        for text in lines:
+            line += 1
+            for tok in pattern.findall(text.upper()):
+                yield tok, line
+
+    for tok in pattern.findall(rest.upper()):
+        yield tok, line + 1
 
 
 class Lexer:
-    def __init__(self, gcode: str):
-        Lexer.pattern = r'([\w]\-?[\d\.]+|"[\w ]*")'
-        self._tokens = re.findall(Lexer.pattern, gcode.upper())
-        self._i = 0
+    pattern = (
+        r'([\w]\-?(?:[\d\.]+|#\d+)|\[\-?(?:[\d\.]+|#\d+)\]|"[\w ]*"'
+        r"|\b(?:ENDREPEAT|REPEAT|ENDSUB|SUB|CALL)\b)"
+    )
+
+    def __init__(self, gcode):
+        "`gcode` is the whole source or an iterable of chunks of it"
+        chunks = io.StringIO(gcode) if isinstance(gcode, str) else gcode
+        self._tokens = tokenize(chunks)
+        self._next = None
+        self.line = 1
 
     def available(self):
-        return self._i < len(self._tokens)
+        # Só lê o próximo token quando precisa, pois um fluxo pode bloquear
+        if self._next is None:
+            self._next = next(self._tokens, None)
+        return self._next is not None
 
     def get_next_token(self):
         if self.available():
-            self._i += 1
-            return self._tokens[self._i - 1]
+            tok, self.line = self._next
+            self._next = None
+            return tok
         else:
             return None
 
+    def peek_token(self):
+        "Next token without consuming it, or None"
+        return self._next[0] if self.available() else None
+
+
+def _value(text, letter=None, integer=False):
+    """
+    Number in `text`, or the text of a parameter like #2 or -#2. With `letter`,
+    the number of a word like X10 or O1 starting with it. None if malformed
+    """
+    if letter is not None:
+        if type(text) is not str or text[0] != letter:
+            return None
+        text = text[1:]
+
+    if "#" in text:
+        return None if integer else text
+
+    try:
+        return int(text) if integer else float(text)
+    except ValueError:
+        return None
+
+
+def _parameter(text):
+    "Index of a parameter like #2, negative for -#2"
+    index = int(text.lstrip("-")[1:])
+    return -index if text[0] == "-" else index
+
+
+def _operands(values):
+    "x, y, s and r of a row from up to four values, and the bits of the parameters"
+    values = values + [0] * (4 - len(values))
+    if str not in map(type, values):
+        return (*values, 0)
+
+    operands = []
+    refs = 0
+    for bit, value in enumerate(values):
+        if type(value) is str:
+            value = _parameter(value)
+            refs |= 1 << bit
+        operands.append(value)
+
+    return (*operands, refs)
+
+
+class Expansion:
+    """
+    Runs the control flow of a compiled program: repeats the loops, calls the
+    subroutines with their parameters and turns relative coordinates (G91) into
+    absolute ones. The commands for the machine come out in batches, so a loop
+    takes only its own rows in the compiled program, however often it repeats.
+
+    `position` is the position of the machine before the program, in mm.
+    """
+
+    def __init__(self, source, position=(0.0, 0.0)):
+        self.pc = 0
+        # Loops [REPEAT, início, voltas restantes] e chamadas [CALL, retorno,
+        # parâmetros de quem chamou], o mais interno por último
+        self.frames = []
+        self.params = ()
+        self.relative = False
+        self.position = tuple(map(float, position))
+        self.set_source(source)
+
+    def set_source(self, source, dropped=0):
+        "Replaces the program by `source`, which lost the first `dropped` rows"
+        self.source = source
+        self.pc -= dropped
+        for frame in self.frames:
+            frame[1] -= dropped
+
+        # Linhas que não podem ser copiadas em bloco para a máquina
+        op = source["op"]
+        special = (op >= len(OPCODES)) | (source["refs"] != 0)
+        special |= np.isin(op, [OPCODE["G28"], OPCODE["G90"], OPCODE["G91"]])
+        self._special = np.flatnonzero(special)
+
+    def copy(self):
+        expansion = copy(self)
+        expansion.frames = [list(frame) for frame in self.frames]
+        return expansion
+
+    def keep(self) -> int:
+        "First row still needed, by the loops and calls running and the subroutines"
+        needed = [self.pc] + [frame[1] for frame in self.frames]
+        subs = np.flatnonzero(self.source["op"] == CONTROL["SUB"])
+        if len(subs):
+            needed.append(int(subs[0]))
+
+        return min(needed)
+
+    def expand(self, limit):
+        """
+        Next commands for the machine, as an array of at most `limit` rows. Fewer
+        only at the end of the program.
+        """
+        batches = []
+        rows = []  # Linhas vindas uma a uma, convertidas juntas
+        count = 0
+        end = len(self.source)
+
+        while count < limit and self.pc < end:
+            i = np.searchsorted(self._special, self.pc)
+            special = int(self._special[i]) if i < len(self._special) else end
+
+            if special - self.pc >= VECTOR_RUN:
+                # Trecho longo sem controle: copiado de uma vez
+                if rows:
+                    batches.append(np.array(rows, dtype=COMMAND_DTYPE))
+                    rows = []
+                stop = min(special, self.pc + limit - count)
+                batches.append(self._resolve(self.source[self.pc : stop]))
+                count += stop - self.pc
+                self.pc = stop
+            elif special > self.pc:
+                stop = min(special, self.pc + limit - count)
+                for row in self.source[self.pc : stop].tolist():
+                    rows.append(self._resolve_row(*row))
+                count += stop - self.pc
+                self.pc = stop
+            elif (row := self._special_row()) is not None:
+                rows.append(row)
+                count += 1
+
+        if rows:
+            batches.append(np.array(rows, dtype=COMMAND_DTYPE))
+        if not batches:
+            return np.empty(0, dtype=COMMAND_DTYPE)
+        return np.concatenate(batches)
+
+    def _special_row(self):
+        "Runs the row at pc, returns it if it goes to the machine"
+        i = self.pc
+        self.pc += 1
+        op, line, x, y, s, r, n, jump, refs = self.source[i].item()
+
+        if refs:
+            operands = [x, y, s, r]
+            for bit in range(4):
+                if refs >> bit & 1:
+                    index = int(operands[bit])
+                    value = self.params[abs(index) - 1]
+                    operands[bit] = -value if index < 0 else value
+            x, y, s, r = operands
+
+        if op < len(OPCODES):
+            if op == OPCODE["G90"]:
+                self.relative = False
+            elif op == OPCODE["G91"]:
+                self.relative = True
+            elif op == OPCODE["G28"]:
+                self.position = (0.0, 0.0)
+
+            return self._resolve_row(op, line, x, y, s, r, n, 0, 0)
+
+        if op == CONTROL["REPEAT"]:
+            count = int(x)
+            if count > 0 and jump > 1:
+                self.frames.append([op, i + 1, count])
+            else:
+                self.pc = i + jump + 1
+        elif op == CONTROL["ENDREPEAT"]:
+            frame = self.frames[-1]
+            frame[2] -= 1
+            if frame[2] > 0:
+                self.pc = frame[1]
+            else:
+                self.frames.pop()
+        elif op == CONTROL["SUB"]:
+            # Definição: o corpo só roda quando chamado
+            self.pc = i + jump + 1
+        elif op == CONTROL["ENDSUB"]:
+            _, self.pc, self.params = self.frames.pop()
+        elif op == CONTROL["CALL"]:
+            depth = sum(frame[0] == op for frame in self.frames)
+            if depth >= MAX_CALL_DEPTH:
+                print(
+                    f"gcode error at line {line}: calls nested deeper than "
+                    f"{MAX_CALL_DEPTH}, O{n} skipped"
+                )
+                return None
+
+            self.frames.append([op, i + 1, self.params])
+            self.params = (x, y, s, r)
+            self.pc = i + jump + 1
+
+        return None
+
+    def _resolve_row(self, op, line, x, y, s, r, n, jump, refs):
+        "Same as _resolve for a single row, as a tuple"
+        if op in MOTION_OPS:
+            if self.relative:
+                x += self.position[0]
+                y += self.position[1]
+            self.position = (x, y)
+
+        return (op, line, x, y, s, r, n, jump, refs)
+
+    def _resolve(self, rows):
+        "The rows with relative movements made absolute, following the position"
+        motion = np.isin(rows["op"], list(MOTION_OPS))
+        if not motion.any():
+            return rows
+
+        if self.relative:
+            rows = rows.copy()
+            for axis, field in enumerate(("x", "y")):
+                moves = np.where(motion, rows[field], 0.0)
+                rows[field][motion] = (self.position[axis] + np.cumsum(moves))[motion]
+
+        last = rows[np.flatnonzero(motion)[-1]]
+        self.position = (float(last["x"]), float(last["y"]))
+        return rows
+
 
 class GcodeInterpreter:
-    def __init__(self, gcode: str, gcode_machine):
-        self._lexer = Lexer(gcode)
+    """
+    Compiles G-code into a compact program, a NumPy structured array with one row
+    per command (see COMMAND_DTYPE), and runs it by advancing a program counter.
+    Loops and subroutine calls stay one row each in the compiled program and are
+    expanded while it runs (see Expansion), so a raster of thousands of lines can
+    be sent and compiled as a dozen.
+
+    `gcode` may also be an iterable of chunks of source, like a GcodeStream. Then
+    it is compiled in batches while it runs, and the executed commands are dropped.
+    A source given whole is looked up in `cache` (a ProgramCache) first.
+
+    With a `timeline` (a Timeline) the span of every executed command is recorded
+    there, with the planned and waited time reported by the machine.
+    """
+
+    def __init__(self, gcode, gcode_machine, cache=None, timeline=None):
         self._machine = gcode_machine
+        self.timeline = timeline
 
-        self._commands = []
-        self._parse()
-
-    def _parse(self):
-        while self._lexer.available():
-            tok = self._lexer.get_next_token()
-
-            if tok == "G0":
-                tok = self._lexer.get_next_token()
-                x = float(tok[1:]) if type(tok) is str and tok[0] == "X" else None
-                tok = self._lexer.get_next_token()
-                y = float(tok[1:]) if type(tok) is str and tok[0] == "Y" else None
-
-                if (x, y) != (None, None):
-                    self._commands.append(("G0", x, y))
-                else:
-                    print(f"gcode error: malformed G0: {x = }, {y = }")
-
-            elif tok == "G1":
-                tok = self._lexer.get_next_token()
-                x = float(tok[1:]) if type(tok) is str and tok[0] == "X" else None
-                tok = self._lexer.get_next_token()
-                y = float(tok[1:]) if type(tok) is str and tok[0] == "Y" else None
-                tok = self._lexer.get_next_token()
-                s = float(tok[1:]) if type(tok) is str and tok[0] == "S" else None
-
-                if all(i is not None for i in [x, y, s]):
-                    self._commands.append(("G1", x, y, s))
-                else:
-                    print(f"gcode error: malformed G1: {x = }, {y = }, {s = }")
-
-            elif tok == "G2":
-                tok = self._lexer.get_next_token()
-                x = float(tok[1:]) if type(tok) is str and tok[0] == "X" else None
-                tok = self._lexer.get_next_token()
-                y = float(tok[1:]) if type(tok) is str and tok[0] == "Y" else None
-                tok = self._lexer.get_next_token()
-                s = float(tok[1:]) if type(tok) is str and tok[0] == "S" else None
-                tok = self._lexer.get_next_token()
-                r = float(tok[1:]) if type(tok) is str and tok[0] == "R" else None
-
-                if all(i is not None for i in [x, y, s, r]):
-                    self._commands.append(("G2", x, y, s, r))
-                else:
-                    print(f"gcode error: malformed G2: {x = }, {y = }, {s = }, {r = }")
-
-            elif tok == "G3":
-                tok = self._lexer.get_next_token()
-                x = float(tok[1:]) if type(tok) is str and tok[0] == "X" else None
-                tok = self._lexer.get_next_token()
-                y = float(tok[1:]) if type(tok) is str and tok[0] == "Y" else None
-                tok = self._lexer.get_next_token()
-                s = float(tok[1:]) if type(tok) is str and tok[0] == "S" else None
-                tok = self._lexer.get_next_token()
-                r = float(tok[1:]) if type(tok) is str and tok[0] == "R" else None
-
-                if all(i is not None for i in [x, y, s, r]):
-                    self._commands.append(("G3", x, y, s, r))
-                else:
-                    print(f"gcode error: malformed G3: {x = }, {y = }, {s = }, {r = }")
-
-            elif tok == "G4":
-                tok = self._lexer.get_next_token()
-                p = int(tok[1:]) if type(tok) is str and tok[0] == "P" else None
-
-                if p is not None:
-                    self._commands.append(("G4", p))
-                else:
-                    print(f"gcode error: malformed G4: {p = }")
-
-            elif tok == "M1000":
-                tok = self._lexer.get_next_token()
-                f = int(tok[1:]) if type(tok) is str and tok[0] == "F" else None
-                s = self._lexer.get_next_token()[1:-1]
-
-                if all(i is not None for i in [f, s]):
-                    self._commands.append(("M1000", f, s))
-                else:
-                    print(f"gcode error: malformed M1000: {f = }, {s = }")
-
-            elif tok == "M1004":
-                tok = self._lexer.get_next_token()
-                e = int(tok[1:]) if type(tok) is str and tok[0] == "E" else None
-
-                if e:
-                    self._commands.append(("M1004", e))
-                else:
-                    print(f"gcode error: malformed M1004: {e = }")
-
-            elif tok in ["G28", "G90", "G91", "M1001", "M1002", "M1003"]:
-                self._commands.append((tok,))
+        self._strings = []
+        self._subs = {}  # Subrotinas definidas: número -> linha do O SUB
+        self._parsed = 0  # Linhas compiladas, também as já descartadas de um fluxo
+        self._pc = 0
+        self.executed = 0  # Comandos executados, também os já descartados de um fluxo
 
+        if isinstance(gcode, str):
+            self._lexer = None
+            compiled = cache.get(gcode) if cache is not None else None
+
+            if compiled is not None:
+                self._source, self._strings = compiled
             else:
+                self._source = self._parse(Lexer(gcode))
+                if cache is not None:
+                    cache.put(gcode, self._source, self._strings)
+        else:
+            self._lexer = Lexer(gcode)
+            self._source = np.empty(0, dtype=COMMAND_DTYPE)
+
+        # Comandos já expandidos para a máquina, a partir do contador de programa
+        self._expansion = Expansion(self._source, gcode_machine.get_position())
+        self._program = np.empty(0, dtype=COMMAND_DTYPE)
+
+        self._handlers = [getattr(self, f"_exec_{name.lower()}") for name in OPCODES]
+
+    def _parse(self, lexer, limit=None):
+        """
+        Compiles the commands of `lexer`, at most `limit` of them unless a block
+        is still open, so a batch never ends inside a loop or subroutine
+        """
+        rows = []
+        blocks = []  # Blocos abertos: (palavra, número, índice em rows)
+
+        while (limit is None or len(rows) < limit or blocks) and lexer.available():
+            tok = lexer.get_next_token()
+            line = lexer.line
+
+            if (number := _value(tok, "O", integer=True)) is not None:
+                row = self._block(lexer, number, line, rows, blocks)
+                if row is not None:
+                    rows.append(row)
+                continue
+
+            if tok not in OPCODE:
                 print(f'gcode error: invalid "{tok}" code')
+                continue
+
+            letters = ARGUMENTS.get(tok, "")
+            args = [
+                _value(lexer.get_next_token(), letter, letter in INTEGER_ARGUMENTS)
+                for letter in letters
+            ]
+
+            if tok == "M1000":
+                text = lexer.get_next_token()
+                args.append(text[1:-1] if type(text) is str else None)
+
+            if None in args or (tok == "M1004" and not args[0]):
+                values = ", ".join(
+                    f"{letter.lower()} = {arg}" for letter, arg in zip(letters, args)
+                )
+                print(f"gcode error: malformed {tok}: {values}")
+                continue
+
+            row = self._compile(tok, line, args)
+            if row[8] and (error := self._check_parameters(args, blocks)):
+                print(f"gcode error at line {line}: {error}")
+                continue
+
+            rows.append(row)
+
+        if blocks:
+            # Fim do código com um bloco aberto: ele é descartado inteiro
+            _, number, start = blocks[0]
+            print(f"gcode error: O{number} is never closed")
+            del rows[start:]
+            first = self._parsed + start
+            self._subs = {n: i for n, i in self._subs.items() if i < first}
+
+        self._parsed += len(rows)
+        return np.array(rows, dtype=COMMAND_DTYPE)
+
+    def _block(self, lexer, number, line, rows, blocks):
+        "Row of an O block command, like O1 REPEAT [10], or None if malformed"
+        word = lexer.get_next_token()
+        index = len(rows)
+        error = None
+
+        if word in ("REPEAT", "CALL"):
+            values = self._bracket_values(lexer)
+
+            if None in values:
+                error = f"malformed O{number} {word} value"
+            elif word == "REPEAT" and len(values) != 1:
+                error = f"O{number} REPEAT needs a count, like [10]"
+            elif len(values) > PARAMETERS:
+                error = f"O{number} CALL takes at most {PARAMETERS} parameters"
+            elif word == "CALL" and number not in self._subs:
+                error = f"O{number} is called before its O{number} SUB"
+            else:
+                error = self._check_parameters(values, blocks)
+        elif word == "SUB":
+            if blocks:
+                error = f"O{number} SUB must not be inside another block"
+        elif word in ("ENDREPEAT", "ENDSUB"):
+            if not blocks or blocks[-1][:2] != (word[3:], number):
+                error = f"O{number} {word} does not close an O{number} {word[3:]}"
+        else:
+            error = f'invalid "O{number} {word}" block'
 
-    def is_finished(self):
-        return len(self._commands) == 0
-
-    def step(self):
-        if not self.is_finished():
-            comm = self._commands[0][0]
-
-            if comm == "G0":
-                x = self._commands[0][1]
-                y = self._commands[0][2]
-
-                if (x, y) != (None, None):
-                    if self._machine.g0(x, y):
-                        self._commands.pop(0)
-                        return True
-                    else:
-                        return False
-                else:
-                    return "interpreter error: malformed G0"
-
-            elif comm == "G1":
-                x, y, s = self._commands[0][1:]
-
-                if all(i is not None for i in [x, y, s]):
-                    if self._machine.g1(x, y, s):
-                        self._commands.pop(0)
-                        return True
-                    else:
-                        return False
-                else:
-                    return "interpreter error: malformed G1"
-
-            elif comm == "G2":
-                x, y, s, r = self._commands[0][1:]
-
-                if all(i is not None for i in [x, y, s]):
-                    if self._machine.g2(x, y, s, r):
-                        self._commands.pop(0)
-                        return True
-                    else:
-                        return False
-                else:
-                    return "interpreter error: malformed G2"
-
-            elif comm == "G3":
-                x, y, s, r = self._commands[0][1:]
-
-                if all(i is not None for i in [x, y, s]):
-                    if self._machine.g3(x, y, s, r):
-                        self._commands.pop(0)
-                        return True
-                    else:
-                        return False
-                else:
-                    return "interpreter error: malformed G3"
-
-            elif comm == "G4":
-                p = self._commands[0][1]
-
-                if p is not None:
-                    self._machine.g4(p)
-                    self._commands.pop(0)
-                    return True
-                else:
-                    return "interpreter error: malformed G4"
-
-            elif comm == "M1000":
-                f = self._commands[0][1]
-                s = self._commands[0][2]
-
-                if all(i is not None for i in [f, s]):
-                    self._machine.m1000(f, s)
-                    self._commands.pop(0)
-                    return True
-                else:
-                    return "interpreter error: malformed M1000"
-
-            elif comm == "M1004":
-                e = self._commands[0][1]
-
-                if e:
-                    self._machine.m1004(e)
-                    self._commands.pop(0)
-                    return True
-                else:
-                    return "interpreter error: malformed M1004"
-
-            elif comm == "G28":
-                if self._machine.g28():
-                    self._commands.pop(0)
-                    return True
-                else:
-                    return False
-
-            elif comm == "G90":
-                self._machine.g90()
-                self._commands.pop(0)
-
-            elif comm == "G91":
-                self._machine.g91()
-                self._commands.pop(0)
-
-            elif comm == "M1001":
-                self._machine.m1001()
-                self._commands.pop(0)
-
-            elif comm == "M1002":
-                self._machine.m1002()
-                self._commands.pop(0)
-
-            elif comm == "M1003":
-                self._machine.m1003()
-                self._commands.pop(0)
+        if error:
+            print(f"gcode error at line {line}: {error}")
+            return None
 
-            else:
-                return f'interpreter error: invalid command {comm}"'
+        op = CONTROL[word]
+        if word == "REPEAT":
+            *operands, refs = _operands(values)
+            blocks.append((word, number, index))
+            return (op, line, *operands, number, 0, refs)
+        elif word == "SUB":
+            self._subs[number] = self._parsed + index
+            blocks.append((word, number, index))
+            return (op, line, 0, 0, 0, 0, number, 0, 0)
+        elif word == "CALL":
+            *operands, refs = _operands(values)
+            jump = self._subs[number] - (self._parsed + index)
+            return (op, line, *operands, number, jump, refs)
+
+        # Fim de bloco: o início passa a saber onde ele termina
+        _, _, start = blocks.pop()
+        rows[start] = (*rows[start][:7], index - start, rows[start][8])
+        return (op, line, 0, 0, 0, 0, number, start - index, 0)
+
+    def _bracket_values(self, lexer):
+        "Values of the [n] tokens that follow, numbers or parameters like [#1]"
+        values = []
+
+        while type(tok := lexer.peek_token()) is str and tok[0] == "[":
+            lexer.get_next_token()
+            values.append(_value(tok[1:-1]))
+
+        return values
+
+    def _check_parameters(self, values, blocks):
+        "Error in the parameters like #1 among `values`, or None"
+        names = [value for value in values if type(value) is str and "#" in value]
+        if not names:
+            return None
+
+        if not any(word == "SUB" for word, _, _ in blocks):
+            return f"parameter {names[0]} outside a subroutine"
+
+        for name in names:
+            if not 1 <= abs(_parameter(name)) <= PARAMETERS:
+                return f"parameter {name} must be one of #1 to #{PARAMETERS}"
+
+        return None
 
-            return True
+    def _compile(self, tok, line, args):
+        "Row of the compiled program for a command and its arguments"
+        op = OPCODE[tok]
+
+        if tok in ("G0", "G1", "G2", "G3"):
+            x, y, s, r, refs = _operands(args)
+            return (op, line, x, y, s, r, 0, 0, refs)
+        elif tok == "M1000":
+            f, text = args
+            self._strings.append(text)
+            return (op, line, 0, 0, len(self._strings) - 1, 0, f, 0, 0)
+        elif args:
+            return (op, line, 0, 0, 0, 0, args[0], 0, 0)
         else:
+            return (op, line, 0, 0, 0, 0, 0, 0, 0)
+
+    def _read_stream(self):
+        "Compiles the next batch of a stream, dropping the rows no longer needed"
+        rows = self._parse(self._lexer, STREAM_BATCH)
+        if len(rows) < STREAM_BATCH:
+            # Fim do fluxo
+            self._lexer = None
+
+        dropped = self._expansion.keep()
+        self._source = np.concatenate((self._source[dropped:], rows))
+        self._expansion.set_source(self._source, dropped)
+
+    def _fill(self):
+        "Expands the program until the lookahead window is available"
+        missing = self._pc + 1 + LOOKAHEAD_COMMANDS - len(self._program)
+        if missing <= 0:
+            return
+
+        limit = max(missing, EXPANSION_BATCH)
+        batches = [self._program[self._pc :]]
+        count = 0
+
+        while count < limit:
+            rows = self._expansion.expand(limit - count)
+            batches.append(rows)
+            count += len(rows)
+
+            if count < limit:
+                # Acabaram as linhas compiladas
+                if self._lexer is None:
+                    break
+                self._read_stream()
+
+        self._program = np.concatenate(batches)
+        self._pc = 0
+
+    def is_finished(self):
+        self._fill()
+        return self._pc >= len(self._program)
+
+    @property
+    def program(self):
+        """
+        Commands not executed yet, with the loops and calls expanded and in
+        absolute coordinates, at most PROGRAM_EXPANSION_LIMIT of them. A stream
+        has only the ones parsed so far
+        """
+        return self.expand_program()[0]
+
+    def expand_program(self, limit=PROGRAM_EXPANSION_LIMIT):
+        "Like `program`, returns (commands, truncated) with at most `limit` commands"
+        head = self._program[self._pc : self._pc + limit + 1]
+        rest = self._expansion.copy().expand(limit + 1 - len(head))
+        program = np.concatenate((head, rest))
+        return program[:limit], len(program) > limit
+
+    @property
+    def strings(self):
+        "Texts of the M1000 commands, indexed by the `s` of their rows"
+        return self._strings
+
+    def current_line(self):
+        "Source line of the next command, or None when finished"
+        if self.is_finished():
+            return None
+        return int(self._program["line"][self._pc])
+
+    def _upcoming_motion(self):
+        """
+        Movement commands right after the current one, up to the first non movement,
+        as tuples like ('G1', x, y, s)
+        """
+        upcoming = []
+        end = self._pc + 1 + LOOKAHEAD_COMMANDS
+
+        for op, line, x, y, s, r, *_ in self._program[self._pc + 1 : end].tolist():
+            if op not in MOTION_OPS:
+                break
+
+            if op == OPCODE["G0"]:
+                upcoming.append(("G0", x, y))
+            elif op == OPCODE["G1"]:
+                upcoming.append(("G1", x, y, s))
+            else:
+                upcoming.append((OPCODES[op], x, y, s, r))
+
+        return upcoming
+
+    def step(self, lookahead=True):
+        """
+        Executes the next command. With `lookahead`, movements end at the speed
+        allowed by the next ones, so step must be called again right away.
+        """
+        if self.is_finished():
             return None
+
+        row = self._program[self._pc].item()
+        op = row[0]
+
+        if op in MOTION_OPS:
+            self._machine.lookahead(self._upcoming_motion() if lookahead else [])
+
+        if self.timeline is None:
+            status = self._handlers[op](*row[2:7])
+        else:
+            machine = self._machine
+            machine.planned_ns = machine.wait_ns = 0
+            start = perf_counter_ns()
+            status = self._handlers[op](*row[2:7])
+            self.timeline.record(
+                op,
+                row[1],
+                start,
+                perf_counter_ns() - start,
+                machine.planned_ns,
+                machine.wait_ns,
+            )
+
+        if status is True:
+            self._pc += 1
+            self.executed += 1
+
+        return status
+
+    # Handlers, called with the x, y, s, r and n operands of the command
+
+    def _exec_g0(self, x, y, s, r, n):
+        return bool(self._machine.g0(x, y))
+
+    def _exec_g1(self, x, y, s, r, n):
+        return bool(self._machine.g1(x, y, s))
+
+    def _exec_g2(self, x, y, s, r, n):
+        return bool(self._machine.g2(x, y, s, r))
+
+    def _exec_g3(self, x, y, s, r, n):
+        return bool(self._machine.g3(x, y, s, r))
+
+    def _exec_g4(self, x, y, s, r, n):
+        self._machine.g4(n)
+        return True
+
+    def _exec_g28(self, x, y, s, r, n):
+        return bool(self._machine.g28())
+
+    def _exec_g90(self, x, y, s, r, n):
+        self._machine.g90()
+        return True
+
+    def _exec_g91(self, x, y, s, r, n):
+        self._machine.g91()
+        return True
+
+    def _exec_m1000(self, x, y, s, r, n):
+        return bool(self._machine.m1000(n, self._strings[int(s)]))
+
+    def _exec_m1001(self, x, y, s, r, n):
+        return bool(self._machine.m1001())
+
+    def _exec_m1002(self, x, y, s, r, n):
+        self._machine.m1002()
+        return True
+
+    def _exec_m1003(self, x, y, s, r, n):
+        self._machine.m1003()
+        return True
+
+    def _exec_m1004(self, x, y, s, r, n):
+        self._machine.m1004(n)
+        return True
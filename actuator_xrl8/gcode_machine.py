@@ -1,18 +1,37 @@
 import numpy as np
 from numpy.typing import NDArray
 
-from time import sleep
+from time import perf_counter_ns, sleep, time_ns
 
+from actuator_xrl8.arc import arc_points
+from actuator_xrl8.step_metrics import StepMetrics
+from actuator_xrl8.trajectory import TrajectoryRing
 from actuator_xrl8.virtual_encoder_api import EncoderApi
 
+# Amostras da trajetória nas máquinas sem processo de movimentação, 1.5 MB
+LOCAL_TRAJECTORY_CAPACITY = 1 << 16
+
 
 class NullGcodeMachine:
-    def __init__(self):
+    STEPS_PER_MM = 5 * 16
+    TRAJECTORY_STEPS_PER_MM = STEPS_PER_MM  # Signed, steps of `trajectory` per mm
+
+    def __init__(self, trajectory_capacity=LOCAL_TRAJECTORY_CAPACITY):
         self.pos = np.array([0, 0], dtype=float)
         self.pause_requested = False
         self.calibrated = False
         self.encoder = EncoderApi("virtual-encoder.local")
 
+        # Tempo do último comando, zerado pelo interpretador antes de cada um:
+        # duração planejada e tempo esperando o movimento, em ns
+        self.planned_ns = 0
+        self.wait_ns = 0
+
+        # Posições percorridas, em passos
+        self.trajectory = TrajectoryRing(trajectory_capacity)
+        # Sem processo de movimentação nada é gravado, mas a interface é a mesma
+        self.step_metrics = StepMetrics()
+
     def is_calibrated(self):
         "Returns true after homing"
         return self.calibrated
@@ -21,9 +40,36 @@ class NullGcodeMachine:
         "Returns position in mm"
         return tuple(self.pos)
 
+    def parameters(self) -> dict:
+        "Machine parameters that change how a program is planned"
+        return {}
+
+    def is_moving(self) -> bool:
+        "True while a movement runs outside of the interpreter thread"
+        return False
+
+    def bounds(self):
+        "Valid positions in mm, as ((x_min, x_max), (y_min, y_max)), None if any"
+        return None
+
     def pause(self):
         self.pause_requested = True
 
+    def trajectory_mm(self, start=0):
+        """
+        Samples of `trajectory` recorded since the count `start`, as the arrays
+        (timestamps_ns, x, y) with the positions in mm
+        """
+        timestamps, x, y = self.trajectory.samples(start)
+        scale = self.TRAJECTORY_STEPS_PER_MM
+        return timestamps, x / scale, y / scale
+
+    def lookahead(self, commands):
+        """
+        Receives the movement commands that follow the next one, as command tuples.
+        Machines that plan junction speeds use them to avoid stopping between moves.
+        """
+
     def _convert_mm_to_steps(self, a: NDArray):
         return (a * self.STEPS_PER_MM).astype(int)
 
@@ -43,18 +89,7 @@ class NullGcodeMachine:
         Returns true if movement was finished
         """
         print(f"Recebido comando g1: {x = } {y = } {s = }")
-        end = np.array([x, y])
-        dir = end - self.pos
-        dir /= np.linalg.norm(dir)
-        while np.linalg.norm(end - self.pos) > 1:
-            if self.pause_requested:
-                self.pause_requested = False
-                return False
-
-            self.pos += dir
-            sleep(1 / s)
-
-        return True
+        return self._follow(np.array([self.pos, (x, y)]), s)
 
     def g2(self, x: float, y: float, s: float, r: float) -> bool:
         """
@@ -63,18 +98,7 @@ class NullGcodeMachine:
         Returns true if movement was finished
         """
         print(f"Recebido comando g2: {x = } {y = } {s = } {r = }")
-        end = np.array([x, y])
-        dir = end - self.pos
-        dir /= np.linalg.norm(dir)
-        while np.linalg.norm(end - self.pos) > 1:
-            if self.pause_requested:
-                self.pause_requested = False
-                return False
-
-            self.pos += dir
-            sleep(1 / s)
-
-        return True
+        return self._arc(x, y, s, r, clockwise=True)
 
     def g3(self, x: float, y: float, s: float, r: float) -> bool:
         """
@@ -83,16 +107,35 @@ class NullGcodeMachine:
         Returns true if movement was finished
         """
         print(f"Recebido comando g3: {x = } {y = } {s = } {r = }")
-        end = np.array([x, y])
-        dir = end - self.pos
-        dir /= np.linalg.norm(dir)
-        while np.linalg.norm(end - self.pos) > 1:
-            if self.pause_requested:
-                self.pause_requested = False
-                return False
+        return self._arc(x, y, s, r, clockwise=False)
+
+    def _arc(self, x, y, s, r, clockwise):
+        x0, y0 = self.pos
+        points = arc_points(float(x0), float(y0), x, y, r, clockwise)
+
+        if points is None:
+            distancia = np.hypot(x - x0, y - y0)
+            print(f"Erro: o raio deve ser maior que ({distancia / 2:.2f}) ")
+            return
+
+        return self._follow(points, s)
+
+    def _follow(self, points: NDArray, s: float) -> bool:
+        """
+        Moves through the points, in steps of at most 1 mm, taking as long as
+        moving at s mm/s.
+        Returns false if movement was paused
+        """
+        for end in points[1:]:
+            while (distance := np.linalg.norm(end - self.pos)) > 0:
+                if self.pause_requested:
+                    self.pause_requested = False
+                    return False
 
-            self.pos += dir
-            sleep(1 / s)
+                step = min(1, distance)
+                self.pos += (end - self.pos) * (step / distance)
+                self._wait(step / s)
+                self.trajectory.record(time_ns(), *self._convert_mm_to_steps(self.pos))
 
         return True
 
@@ -101,7 +144,14 @@ class NullGcodeMachine:
         Dwell. Stops for p millisecons.
         """
         print(f"Recebido comando g4: {p = }")
-        sleep(p / 1000)
+        self._wait(p / 1000)
+
+    def _wait(self, seconds):
+        "Sleeps like a movement or a dwell that takes `seconds`"
+        start = perf_counter_ns()
+        sleep(seconds)
+        self.planned_ns += round(seconds * 1e9)
+        self.wait_ns += perf_counter_ns() - start
 
     def g28(self) -> bool:
         """
@@ -120,26 +170,40 @@ class NullGcodeMachine:
     def g90(self):
         """
         Absolute coordinates. Movement commands use absolute coordinates.
+        The interpreter resolves the coordinate mode, so the movement commands of
+        the machine always receive absolute ones.
         """
         print("Recebido comando g90")
 
     def g91(self):
         """
         Relative coordinates. Movement commands use relative coordinates.
+        Already converted to absolute by the interpreter, see g90.
         """
         print("Recebido comando g91")
 
-    def m1000(self, f: int, acquisition_name: str):
+    def m1000(self, f: int, acquisition_name: str) -> bool:
         """
-        Start encoder. Sends the command `start_acquisition` to the virtual encoder.
+        Start encoder. Sends the command `start_acquisition` to the virtual encoder
+        and waits for it. Returns false if the encoder did not start, so the
+        program stops here instead of moving without recording.
         """
-        self.encoder.start_acquisition(pulses_per_second=f, reason=acquisition_name)
+        if self.encoder.start_acquisition(f, acquisition_name, wait=True):
+            return True
+
+        print(f"Encoder did not start the acquisition {acquisition_name!r}")
+        return False
 
-    def m1001(self):
+    def m1001(self) -> bool:
         """
-        Stop encoder. Sends the command `stop_acquisition` to the virtual encoder.
+        Stop encoder. Sends the command `stop_acquisition` to the virtual encoder
+        and waits for it. Returns false if the encoder did not stop.
         """
-        self.encoder.stop_acquisition()
+        if self.encoder.stop_acquisition(wait=True):
+            return True
+
+        print("Encoder did not stop the acquisition")
+        return False
 
     def m1002(self):
         """
@@ -158,3 +222,62 @@ class NullGcodeMachine:
         Set exposure. Sets the camera's exposture to n microseconds.
         """
         self.encoder.set_exposure(e)
+
+
+class PreviewGcodeMachine(NullGcodeMachine):
+    """
+    Machine that only records the path of a program, with the same arc points as
+    NullGcodeMachine, without waiting and without talking to the encoder.
+    """
+
+    def __init__(self, start=(0, 0)):
+        super().__init__(trajectory_capacity=1)
+        self.pos = np.array(start, dtype=float)
+        self.path = [tuple(self.pos.tolist())]
+
+    def g0(self, x: float, y: float) -> bool:
+        return self._follow(np.array([self.pos, (x, y)]), 100)
+
+    def g1(self, x: float, y: float, s: float) -> bool:
+        return self._follow(np.array([self.pos, (x, y)]), s)
+
+    def g2(self, x: float, y: float, s: float, r: float) -> bool:
+        return self._arc(x, y, s, r, clockwise=True)
+
+    def g3(self, x: float, y: float, s: float, r: float) -> bool:
+        return self._arc(x, y, s, r, clockwise=False)
+
+    def _follow(self, points: NDArray, s: float) -> bool:
+        self.path.extend(map(tuple, points[1:].tolist()))
+        self.pos = np.array(points[-1], dtype=float)
+        return True
+
+    def g4(self, p: int):
+        pass
+
+    def g28(self) -> bool:
+        self.pos = np.zeros(2)
+        self.path.append((0.0, 0.0))
+        self.calibrated = True
+        return True
+
+    def g90(self):
+        pass
+
+    def g91(self):
+        pass
+
+    def m1000(self, f: int, acquisition_name: str) -> bool:
+        return True
+
+    def m1001(self) -> bool:
+        return True
+
+    def m1002(self):
+        pass
+
+    def m1003(self):
+        pass
+
+    def m1004(self, e: int):
+        pass
@@ -0,0 +1,48 @@
+import queue
+
+STREAM_CHUNKS = 64  # Chunks waiting to be parsed before feed blocks
+
+
+class GcodeStream:
+    """
+    G-code arriving in chunks, from socket messages or an upload, read by the
+    interpreter while it runs. The buffer holds at most `max_chunks` chunks: feed
+    blocks while it is full, which slows the sender down to the machine's pace.
+    """
+
+    def __init__(self, max_chunks=STREAM_CHUNKS):
+        self._chunks = queue.Queue(max_chunks)
+        self.closed = False
+        self.aborted = False
+
+    def feed(self, chunk: str) -> bool:
+        "Appends a chunk, waiting for room in the buffer. False if it was aborted"
+        while not self.aborted:
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def close(self):
+        "End of the source"
+        self.closed = True
+        self.feed(None)
+
+    def abort(self):
+        "Discards the buffered chunks and ends the stream, releasing feed and reads"
+        self.aborted = True
+
+        try:
+            while True:
+                self._chunks.get_nowait()
+        except queue.Empty:
+            pass
+
+        self._chunks.put(None)
+
+    def __iter__(self):
+        while (chunk := self._chunks.get()) is not None:
+            yield chunk
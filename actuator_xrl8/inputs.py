@@ -0,0 +1,145 @@
+import threading
+from time import monotonic
+
+DEBOUNCE = 0.005  # s
+
+
+class GpioInputSource:
+    "Input pins read through RPi.GPIO edge detection"
+
+    def __init__(self, gpio):
+        self.gpio = gpio
+
+    def read(self, pin) -> int:
+        return self.gpio.input(pin)
+
+    def on_edge(self, pin, callback):
+        "Calls callback(pin) on both edges of the pin, from the RPi.GPIO thread"
+        self.gpio.add_event_detect(pin, self.gpio.BOTH, callback=callback)
+
+
+class SimulatedInputSource:
+    "Input pins without hardware. Tests change the levels with set_level"
+
+    def __init__(self, levels=None):
+        self.levels = dict(levels or {})
+        self.callbacks = {}
+
+    def read(self, pin) -> int:
+        return self.levels.get(pin, 0)
+
+    def on_edge(self, pin, callback):
+        self.callbacks[pin] = callback
+
+    def set_level(self, pin, level: int):
+        if self.levels.get(pin, 0) != level:
+            self.levels[pin] = level
+            if (callback := self.callbacks.get(pin)) is not None:
+                callback(pin)
+
+
+class InputEvents:
+    """
+    Edge events of input pins, with software debouncing, delivered to the
+    subscribers of each pin as callback(pin, active).
+
+    A change is accepted right away and the edges that follow it inside the
+    debounce window are ignored. At the end of the window the pin is read again,
+    so a bounce can not leave the wrong state behind.
+    """
+
+    def __init__(self, source, debounce=DEBOUNCE, clock=monotonic):
+        self.source = source
+        self.debounce = debounce
+        self.clock = clock
+
+        self._active_level = {}
+        self._active = {}
+        self._last_change = {}
+        self._settle = {}
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def watch(self, pin, active_level: int):
+        "Starts watching a pin, active when it reads `active_level`"
+        self._active_level[pin] = active_level
+        self._active[pin] = self.source.read(pin) == active_level
+        self._last_change[pin] = -self.debounce
+        self._subscribers.setdefault(pin, [])
+        self.source.on_edge(pin, self._edge)
+
+    def subscribe(self, pin, callback):
+        "callback(pin, active) is called from the edge thread on every accepted change"
+        self._subscribers.setdefault(pin, []).append(callback)
+
+    def is_active(self, pin) -> bool:
+        return self._active[pin]
+
+    def _edge(self, pin):
+        with self._lock:
+            now = self.clock()
+
+            if now - self._last_change[pin] < self.debounce:
+                # Repique: confere o nível de novo quando a janela acabar
+                if pin not in self._settle:
+                    timer = threading.Timer(self.debounce, self._settled, (pin,))
+                    timer.daemon = True
+                    self._settle[pin] = timer
+                    timer.start()
+                return
+
+            changed = self._update(pin, now)
+
+        if changed:
+            self._notify(pin)
+
+    def _settled(self, pin):
+        with self._lock:
+            self._settle.pop(pin, None)
+            changed = self._update(pin, self.clock())
+
+        if changed:
+            self._notify(pin)
+
+    def _update(self, pin, now) -> bool:
+        active = self.source.read(pin) == self._active_level[pin]
+        if active == self._active[pin]:
+            return False
+
+        self._active[pin] = active
+        self._last_change[pin] = now
+        return True
+
+    def _notify(self, pin):
+        active = self._active[pin]
+        for callback in self._subscribers[pin]:
+            callback(pin, active)
+
+
+class AxisFlags:
+    """
+    STEP_X/STEP_Y style bits of the axes that have an active input, kept up to
+    date by input events. Calling it only reads an int, so the step loop can check
+    it on every tick.
+    """
+
+    def __init__(self, events, pins_by_bit):
+        self.bits = 0
+        self._pins_by_bit = pins_by_bit
+        self._events = events
+
+        for pins in pins_by_bit.values():
+            for pin in pins:
+                events.subscribe(pin, self._changed)
+
+        self._changed(None, None)
+
+    def __call__(self) -> int:
+        return self.bits
+
+    def _changed(self, pin, active):
+        bits = 0
+        for bit, pins in self._pins_by_bit.items():
+            if any(self._events.is_active(p) for p in pins):
+                bits |= bit
+        self.bits = bits
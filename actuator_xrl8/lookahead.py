@@ -0,0 +1,123 @@
+import math
+
+from actuator_xrl8.arc import arc_center, arc_tangent, arc_sweep
+
+LOOKAHEAD_COMMANDS = 16  # Movement commands scanned ahead of the current one
+MOTION_COMMANDS = ("G0", "G1", "G2", "G3")
+G0_SPEED = 50  # mm/s
+
+
+class Segment:
+    """
+    Geometry of a G0/G1/G2/G3 movement in mm, with the directions of movement at
+    its start and at its end.
+    """
+
+    def __init__(self, start, end, feed, raio=None, clockwise=False):
+        self.start = start
+        self.end = end
+        self.feed = feed
+        self.max_speed = feed
+        self.center = None
+        self.clockwise = clockwise
+
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        chord = math.hypot(dx, dy)
+
+        if raio is None or chord == 0:
+            self.length = chord
+            direction = (dx / chord, dy / chord) if chord else (0.0, 0.0)
+            self.entry_dir = self.exit_dir = direction
+            return
+
+        self.center = arc_center(*start, *end, raio, clockwise)
+        if self.center is None:
+            raise ValueError(f"arc radius must be at least {chord / 2:.2f}")
+
+        raio = math.hypot(start[0] - self.center[0], start[1] - self.center[1])
+        self.length = abs(arc_sweep(*start, *end, *self.center, clockwise)) * raio
+        self.entry_dir = arc_tangent(*start, *self.center, clockwise)
+        self.exit_dir = arc_tangent(*end, *self.center, clockwise)
+        self.raio = raio
+
+    def limit_centripetal(self, acceleration):
+        "Caps the speed on arcs so that v²/r stays under the acceleration limit"
+        if self.center is not None:
+            self.max_speed = min(self.feed, math.sqrt(acceleration * self.raio))
+
+
+def segment_from_command(start, command, acceleration) -> Segment:
+    """
+    Builds the Segment of a ('G0', x, y), ('G1', x, y, s) or ('G2'/'G3', x, y, s, r)
+    command tuple starting at `start`.
+    """
+    comm = command[0]
+
+    if comm == "G0":
+        segment = Segment(start, command[1:3], G0_SPEED)
+    elif comm == "G1":
+        segment = Segment(start, command[1:3], command[3])
+    else:
+        segment = Segment(start, command[1:3], command[3], command[4], comm == "G2")
+
+    segment.limit_centripetal(acceleration)
+    return segment
+
+
+def segments_from_commands(start, commands, acceleration) -> list:
+    "Chains the segments of consecutive movement commands, stopping at invalid ones"
+    segments = []
+
+    for command in commands:
+        try:
+            segment = segment_from_command(start, command, acceleration)
+        except ValueError:
+            break
+
+        segments.append(segment)
+        start = segment.end
+
+    return segments
+
+
+def junction_speed(prev: Segment, next: Segment, acceleration, deviation) -> float:
+    """
+    Maximum speed when going from `prev` to `next` (mm/s). Uses the junction
+    deviation model: the corner is taken as an arc that deviates at most
+    `deviation` mm from it, at the centripetal acceleration limit.
+    """
+    v_max = min(prev.max_speed, next.max_speed)
+    cos_theta = -(
+        prev.exit_dir[0] * next.entry_dir[0] + prev.exit_dir[1] * next.entry_dir[1]
+    )
+
+    if cos_theta > 0.999999:
+        # Reversão: precisa parar
+        return 0.0
+    if cos_theta < -0.999999:
+        # Linha reta
+        return v_max
+
+    sin_half = math.sqrt((1 - cos_theta) / 2)
+    v = math.sqrt(acceleration * deviation * sin_half / (1 - sin_half))
+    return min(v, v_max)
+
+
+def plan_exit_speed(entry_speed, segments, acceleration, deviation) -> float:
+    """
+    Speed at the end of segments[0], given the segments that follow it.
+    The last segment is assumed to stop, and every junction must be reachable
+    with the acceleration limit from the speeds after it (backward pass) and
+    before it (forward pass).
+    """
+    exit_speed = 0.0
+
+    for i in range(len(segments) - 2, -1, -1):
+        limit = junction_speed(segments[i], segments[i + 1], acceleration, deviation)
+        next_length = segments[i + 1].length
+        reachable = math.sqrt(exit_speed**2 + 2 * acceleration * next_length)
+        exit_speed = min(limit, reachable)
+
+    reachable = math.sqrt(entry_speed**2 + 2 * acceleration * segments[0].length)
+    return min(exit_speed, reachable)
@@ -0,0 +1,412 @@
+import atexit
+from array import array
+import multiprocessing
+import os
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from time import sleep, time_ns
+
+import numpy as np
+
+from actuator_xrl8.step_planner import (
+    StepPlan,
+    STEP_X,
+    STEP_Y,
+    DIR_X,
+    DIR_Y,
+    STEP_MASK,
+    DIR_MASK,
+)
+from actuator_xrl8.step_metrics import StepMetrics
+from actuator_xrl8.trajectory import (
+    TrajectoryRing,
+    TRAJECTORY_CAPACITY,
+    RECORD_INTERVAL_NS,
+)
+
+NO_ENDSTOP = 0b10000  # Tick bit: do not check the endstops (used to leave them)
+
+# Control words, written only by the web side
+WRITE_INDEX = 0
+STOP_SEQ = 1
+SHUTDOWN = 2
+SET_POS_SEQ = 3
+SET_POS_X = 4
+SET_POS_Y = 5
+DISCARD_SEQ = 6  # Last stop whose queued ticks the web side discarded
+
+# Status words, written only by the motion process
+READ_INDEX = 8
+STOP_ACK = 9
+POS_X = 10
+POS_Y = 11
+STATE = 12
+FAULTS = 13
+DIR_BITS = 14
+SET_POS_ACK = 15
+STOPPED_AT = 16
+TIMING = 17  # 4 words with the stats of the backend clock, see HybridClock
+
+HEADER_WORDS = 24
+
+# Values of STATE
+IDLE = 0
+RUNNING = 1
+
+IDLE_POLL = 0.0005  # s
+FULL_POLL = 0.001  # s
+
+# Deslocamento de cada eixo para cada combinação de bits de um tick
+_MOVE_X = [(1 if b & DIR_X else -1) if b & STEP_X else 0 for b in range(32)]
+_MOVE_Y = [(1 if b & DIR_Y else -1) if b & STEP_Y else 0 for b in range(32)]
+
+
+class MotionProcess:
+    """
+    Step executor running in its own process, optionally pinned to a CPU core.
+
+    Planned ticks reach it through a single producer/single consumer ring in shared
+    memory: the web side only writes WRITE_INDEX and the motion process only
+    advances READ_INDEX, so no locks are needed. Position, state and faults come
+    back in the status words of the same block.
+
+    A stop or an endstop halts the motion process without touching the ring. The
+    thread that enqueues then calls discard(), which drops the ticks not run by
+    moving WRITE_INDEX back, so ticks published while the stop was on its way
+    never run.
+
+    `backend_factory` is called inside the motion process to build the backend
+    that drives the pins. The process is spawned, not forked from the threads of
+    the web side, so the factory must be picklable and build everything it needs,
+    GPIO setup included. A backend must provide:
+        now_ns() -> int
+        wait_until(deadline_ns: int)
+        endstop_triggered() -> int  (STEP_X and/or STEP_Y bits, 0 if none)
+        set_direction(dir_bits: int)
+        step(step_bits: int)
+
+    The position after the steps is recorded in `trajectory`, a TrajectoryRing in
+    the same block, with the tick deadlines as timestamps. With `metrics.enabled`
+    the timing of every tick is also recorded in `metrics`, a StepMetrics there.
+    """
+
+    def __init__(
+        self,
+        backend_factory,
+        capacity=1 << 16,
+        core=None,
+        trajectory_capacity=TRAJECTORY_CAPACITY,
+        record_interval_ns=RECORD_INTERVAL_NS,
+        metrics=False,
+    ):
+        self.capacity = capacity
+        self.core = core
+        self._shm = SharedMemory(
+            create=True,
+            size=self._ring_end()
+            + TrajectoryRing.size(trajectory_capacity)
+            + StepMetrics.size(),
+        )
+        self._map(trajectory_capacity)
+        self.trajectory.interval_ns = record_interval_ns
+        self.metrics.enabled = metrics
+
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=self._main, args=(backend_factory,), daemon=True
+        )
+        self._process.start()
+        atexit.register(self.close)
+
+        if core is not None:
+            # O resto do processo web fica fora do núcleo da movimentação
+            try:
+                os.sched_setaffinity(0, os.sched_getaffinity(0) - {core})
+            except (AttributeError, OSError):
+                pass
+
+    def _ring_end(self):
+        "Bytes used by the header and the tick ring"
+        return HEADER_WORDS * 8 + self.capacity * 9
+
+    def __getstate__(self):
+        # O processo de movimentação recebe só o nome do bloco e o remapeia
+        return self.capacity, self.core, self._shm.name, self.trajectory.capacity
+
+    def __setstate__(self, state):
+        self.capacity, self.core, name, trajectory_capacity = state
+        self._shm = SharedMemory(name, track=False)
+        self._map(trajectory_capacity)
+
+    def _map(self, trajectory_capacity):
+        buf = self._shm.buf
+        times_end = HEADER_WORDS * 8 + self.capacity * 8
+
+        self._header = buf[: HEADER_WORDS * 8].cast("q")
+        self._intervals = buf[HEADER_WORDS * 8 : times_end].cast("q")
+        self._bits = buf[times_end : times_end + self.capacity].cast("B")
+        self._intervals_np = np.frombuffer(
+            buf, np.int64, self.capacity, HEADER_WORDS * 8
+        )
+        self._bits_np = np.frombuffer(buf, np.uint8, self.capacity, times_end)
+
+        trajectory_end = self._ring_end() + TrajectoryRing.size(trajectory_capacity)
+        self.trajectory = TrajectoryRing(
+            trajectory_capacity, buf[self._ring_end() : trajectory_end]
+        )
+        self.metrics = StepMetrics(buf[trajectory_end:])
+
+    # Web side
+
+    def enqueue(self, plan: StepPlan, check_endstops=True) -> int:
+        """
+        Appends the ticks of a plan to the ring, waiting while it is full.
+        The ring holds the interval before each tick, so consecutive plans are
+        played back to back. Returns the tick index at which the plan ends, or -1
+        if the motion was stopped and its queue was not discarded yet.
+        """
+        h = self._header
+        intervals = np.diff(plan.times, prepend=0)
+        bits = plan.bits if check_endstops else plan.bits | NO_ENDSTOP
+        done = 0
+
+        while done < len(intervals):
+            if h[STOP_SEQ] != h[DISCARD_SEQ] or h[FAULTS]:
+                return -1
+
+            write = h[WRITE_INDEX]
+            free = self.capacity - (write - h[READ_INDEX])
+
+            if free == 0:
+                sleep(FULL_POLL)
+                continue
+
+            start = write % self.capacity
+            n = min(free, len(intervals) - done, self.capacity - start)
+            self._intervals_np[start : start + n] = intervals[done : done + n]
+            self._bits_np[start : start + n] = bits[done : done + n]
+            done += n
+
+            # Publica os ticks só depois de escritos
+            h[WRITE_INDEX] = write + n
+
+        return h[WRITE_INDEX]
+
+    def executed(self) -> int:
+        "Total number of ticks executed by the motion process"
+        return self._header[READ_INDEX]
+
+    def is_idle(self) -> bool:
+        h = self._header
+        return h[READ_INDEX] == h[WRITE_INDEX] and h[STATE] == IDLE
+
+    def wait(self, index, stop_check=lambda: False, poll=0.0005) -> bool:
+        """
+        Waits until the ticks up to `index` were executed. Returns false if they
+        were discarded by a stop or an endstop, or if `stop_check` returned true.
+        """
+        h = self._header
+        stop_seq = h[STOP_SEQ]
+
+        while h[READ_INDEX] < index:
+            if stop_check() or h[FAULTS] or h[STOP_SEQ] != stop_seq:
+                return False
+            sleep(poll)
+
+        return not h[FAULTS] and h[STOP_SEQ] == stop_seq
+
+    def stopped_at(self) -> int:
+        "Index of the first tick not run because of the last stop or endstop"
+        return self._header[STOPPED_AT]
+
+    def request_stop(self):
+        "Stops the motion before its next pulse, without waiting"
+        self._header[STOP_SEQ] += 1
+
+    def wait_stopped(self):
+        "Waits until the motion process acknowledges the last stop request"
+        h = self._header
+
+        while h[STOP_ACK] != h[STOP_SEQ] and self._process.is_alive():
+            sleep(IDLE_POLL)
+
+    def discard(self):
+        """
+        Drops the queued ticks that were not run, after a stop or an endstop, and
+        lets the motion process take new ones. Only the thread that enqueues may
+        call it, so no enqueue is publishing ticks meanwhile.
+        """
+        h = self._header
+        self.wait_stopped()
+
+        # Só com o processo parado, que não lê mais a fila até DISCARD_SEQ mudar
+        if h[FAULTS] or h[DISCARD_SEQ] != h[STOP_ACK]:
+            h[WRITE_INDEX] = h[READ_INDEX]
+            h[DISCARD_SEQ] = h[STOP_ACK]
+
+    def position(self) -> (int, int):
+        "Position in steps"
+        return self._header[POS_X], self._header[POS_Y]
+
+    def set_position(self, x: int, y: int):
+        h = self._header
+        h[SET_POS_X] = x
+        h[SET_POS_Y] = y
+        h[SET_POS_SEQ] += 1
+
+        while h[SET_POS_ACK] != h[SET_POS_SEQ] and self._process.is_alive():
+            sleep(IDLE_POLL)
+
+    def faults(self) -> int:
+        "STEP_X and/or STEP_Y bits of the endstops that stopped the motion"
+        return self._header[FAULTS]
+
+    def clear_faults(self):
+        self.request_stop()
+        self.discard()
+
+    def dir_bits(self) -> int:
+        return self._header[DIR_BITS]
+
+    def timing(self) -> tuple:
+        "Timing error stats of the backend clock, updated after each batch of ticks"
+        return tuple(self._header[TIMING : TIMING + 4])
+
+    def close(self):
+        if self._shm is None:
+            return
+
+        atexit.unregister(self.close)
+        self._header[SHUTDOWN] = 1
+        self._process.join(1)
+
+        self._shm.unlink()
+        self._unmap()
+
+    def _unmap(self):
+        self._header.release()
+        self._intervals.release()
+        self._bits.release()
+        self._intervals_np = self._bits_np = None
+        self.trajectory.release()
+        self.metrics.release()
+        self._shm.close()
+        self._shm = None
+
+    # Motion process
+
+    def _main(self, backend_factory):
+        if self.core is not None:
+            try:
+                os.sched_setaffinity(0, {self.core})
+            except (AttributeError, OSError) as e:
+                print(f"Could not pin the motion process to core {self.core}: {e}")
+
+        try:
+            os.nice(-10)
+        except OSError:
+            pass
+
+        # As bordas das entradas chegam por outra thread, que precisa do GIL logo
+        sys.setswitchinterval(0.0005)
+
+        self._run(backend_factory())
+        self._unmap()
+
+    def _run(self, backend):
+        h = self._header
+        intervals = self._intervals
+        bits = self._bits
+        capacity = self.capacity
+        move_x = _MOVE_X
+        move_y = _MOVE_Y
+        wait_until = backend.wait_until
+        endstop_triggered = backend.endstop_triggered
+        step = backend.step
+        trajectory = self.trajectory
+        record = trajectory.record
+        metrics = self.metrics
+        now_ns = backend.now_ns
+
+        x, y = h[POS_X], h[POS_Y]
+        dir_bits = -1
+        deadline = None
+        next_record = 0
+        timing = getattr(getattr(backend, "clock", None), "stats", None)
+        trajectory.epoch_offset = time_ns() - backend.now_ns()
+
+        while not h[SHUTDOWN]:
+            stop_seq = h[STOP_SEQ]
+
+            if stop_seq != h[STOP_ACK]:
+                # Pausa: para até o lado web descartar a fila
+                h[STOPPED_AT] = h[READ_INDEX]
+                h[FAULTS] = 0
+                h[STOP_ACK] = stop_seq
+
+            if h[SET_POS_SEQ] != h[SET_POS_ACK]:
+                x, y = h[SET_POS_X], h[SET_POS_Y]
+                h[POS_X], h[POS_Y] = x, y
+                h[SET_POS_ACK] = h[SET_POS_SEQ]
+
+            read = h[READ_INDEX]
+            write = h[WRITE_INDEX]
+
+            if read == write or h[FAULTS] or h[DISCARD_SEQ] != stop_seq:
+                # Parado ou sem ticks a tempo: o próximo tick conta a partir de agora
+                if deadline is not None:
+                    record(backend.now_ns(), x, y)
+
+                h[STATE] = IDLE
+                deadline = None
+                sleep(IDLE_POLL)
+                continue
+
+            h[STATE] = RUNNING
+            if deadline is None:
+                deadline = backend.now_ns()
+                record(deadline, x, y)
+
+            interval = trajectory.interval_ns
+            # Desligado, o custo é só um teste de uma variável local por tick
+            instrument = metrics.enabled
+
+            for i in range(read, write):
+                deadline += intervals[i % capacity]
+                b = bits[i % capacity]
+                wait_until(deadline)
+                if instrument:
+                    woke = now_ns()
+
+                # Um stop pedido durante a espera já vale para este pulso
+                if h[STOP_SEQ] != stop_seq:
+                    break
+
+                if not b & NO_ENDSTOP and (endstop := endstop_triggered()):
+                    h[FAULTS] = endstop
+                    h[STOPPED_AT] = i
+                    break
+
+                if b & DIR_MASK != dir_bits:
+                    dir_bits = b & DIR_MASK
+                    backend.set_direction(dir_bits)
+                    h[DIR_BITS] = dir_bits
+
+                step(b & STEP_MASK)
+                x += move_x[b]
+                y += move_y[b]
+                h[POS_X] = x
+                h[POS_Y] = y
+                h[READ_INDEX] = i + 1
+
+                if deadline >= next_record:
+                    record(deadline, x, y)
+                    next_record = deadline + interval
+
+                if instrument:
+                    metrics.record(b, woke - deadline, now_ns() - woke)
+
+            if timing is not None:
+                h[TIMING : TIMING + 4] = array("q", timing)
+
+        h[STATE] = IDLE
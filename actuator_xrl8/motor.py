@@ -1,10 +1,25 @@
 import RPi.GPIO as GPIO
-import time
 import multiprocessing
+import threading
 import math
-import numpy as np
+from functools import partial
+from time import perf_counter_ns
 
 from actuator_xrl8.gcode_machine import NullGcodeMachine
+from actuator_xrl8.step_planner import (
+    plan_line,
+    plan_arc,
+    STEP_X,
+    STEP_Y,
+    DIR_X,
+    DIR_Y,
+)
+from actuator_xrl8.lookahead import segments_from_commands, plan_exit_speed
+from actuator_xrl8.motion_process import MotionProcess
+from actuator_xrl8.trajectory import TRAJECTORY_CAPACITY
+from actuator_xrl8.pin_driver import GpioPinDriver, PinStepBackend, MIN_PULSE_NS
+from actuator_xrl8.inputs import InputEvents, GpioInputSource, AxisFlags
+from actuator_xrl8.clock import HybridClock, SPIN_NS, timing_summary
 
 # Pin definitions (adjust according to your wiring)
 STEP_PIN_X = 10  # Step pin for X axis
@@ -23,46 +38,90 @@ DEFAULT_INTERVAL = 0.0005  # Default step interval
 STEPS_PER_MM = 5 * 16
 
 
+def setup_gpio():
+    "Sets up the pins, in each process that uses them, with the outputs low"
+    GPIO.setwarnings(False)
+    GPIO.setmode(GPIO.BCM)
+
+    # Motor control pins
+    for pin in (STEP_PIN_X, DIR_PIN_X, STEP_PIN_Y, DIR_PIN_Y):
+        GPIO.setup(pin, GPIO.OUT, initial=GPIO.LOW)
+
+    # Endstop pins
+    for pin in (ENDSTOP_X_MIN, ENDSTOP_X_MAX, ENDSTOP_Y_MIN, ENDSTOP_Y_MAX):
+        GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+
+def gpio_step_backend(spin_ns=SPIN_NS, min_pulse_ns=MIN_PULSE_NS):
+    """
+    Builds the backend used inside the motion process. The endstops are watched
+    by edge events, so the step loop only reads the flags they keep, and the clock
+    sleeps between pulses until the last `spin_ns`. Step pulses stay high for at
+    least `min_pulse_ns`.
+    """
+    # O processo de movimentação é novo (spawn), sem o setup do processo web
+    setup_gpio()
+
+    events = InputEvents(GpioInputSource(GPIO))
+    for pin in (ENDSTOP_X_MIN, ENDSTOP_X_MAX, ENDSTOP_Y_MIN, ENDSTOP_Y_MAX):
+        events.watch(pin, active_level=GPIO.HIGH)
+
+    endstops = AxisFlags(
+        events,
+        {
+            STEP_X: (ENDSTOP_X_MIN, ENDSTOP_X_MAX),
+            STEP_Y: (ENDSTOP_Y_MIN, ENDSTOP_Y_MAX),
+        },
+    )
+
+    driver = GpioPinDriver(GPIO, (STEP_PIN_X, STEP_PIN_Y, DIR_PIN_X, DIR_PIN_Y))
+    return PinStepBackend(
+        driver,
+        (STEP_PIN_X, STEP_PIN_Y),
+        (DIR_PIN_X, DIR_PIN_Y),
+        endstops,
+        HybridClock(spin_ns),
+        min_pulse_ns,
+    )
+
+
 class MotorGcodeMachine(NullGcodeMachine):
+    STEPS_PER_MM = STEPS_PER_MM
+    TRAJECTORY_STEPS_PER_MM = -STEPS_PER_MM  # Os eixos em passos são invertidos
+
     def __init__(
         self,
-        accelerate=0.01,
+        acceleration=1000,
+        junction_deviation=0.05,
         max_position=130000 * STEPS_PER_MM,
         min_position=-130000 * STEPS_PER_MM,
+        motion_core=3,
+        spin_threshold_us=SPIN_NS // 1000,
+        min_pulse_us=MIN_PULSE_NS / 1000,
+        step_metrics=False,
     ):
-        super().__init__()
+        # A trajetória é gravada pelo processo de movimentação
+        super().__init__(trajectory_capacity=1)
         GPIO.setwarnings(False)
         GPIO.cleanup()
 
         # Movement parameters
         self.max_position = max_position
         self.min_position = min_position
+        self.acceleration = acceleration  # mm/s²
+        self.junction_deviation = junction_deviation  # mm
+
+        # Posição (em passos) no fim do último movimento enfileirado
         self.curr_position_x = 0
         self.curr_position_y = 0
-        self.accelerate = accelerate
+
+        # Look-ahead: próximos comandos de movimento e velocidade no fim do último
+        self.upcoming = ()
+        self.exit_speed = 0.0
 
         # Setup GPIO
         try:
-            GPIO.setmode(GPIO.BCM)
-
-            # Motor control pins
-            GPIO.setup(STEP_PIN_X, GPIO.OUT)
-            GPIO.setup(DIR_PIN_X, GPIO.OUT)
-            GPIO.setup(STEP_PIN_Y, GPIO.OUT)
-            GPIO.setup(DIR_PIN_Y, GPIO.OUT)
-
-            # Endstop pins
-            GPIO.setup(ENDSTOP_X_MIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            GPIO.setup(ENDSTOP_X_MAX, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            GPIO.setup(ENDSTOP_Y_MIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            GPIO.setup(ENDSTOP_Y_MAX, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-
-            # Initialize outputs
-            GPIO.output(STEP_PIN_X, False)
-            GPIO.output(DIR_PIN_X, False)
-            GPIO.output(STEP_PIN_Y, False)
-            GPIO.output(DIR_PIN_Y, False)
-
+            setup_gpio()
         except Exception as e:
             print(f"GPIO setup failed: {e}")
             raise
@@ -72,14 +131,25 @@ class MotorGcodeMachine(NullGcodeMachine):
         self.movement_done = multiprocessing.Event()
         self.movement_done.clear()
 
-        # Variáveis para perfis de velocidade
-        self.ramp_profile_up_x = None
-        self.ramp_profile_down_x = None
-        self.ramp_steps_x = 0
+        # Os passos são dados por um processo separado, que recebe os planos
+        self.motion = MotionProcess(
+            partial(
+                gpio_step_backend,
+                spin_threshold_us * 1000,
+                round(min_pulse_us * 1000),
+            ),
+            core=motion_core,
+            trajectory_capacity=TRAJECTORY_CAPACITY,
+            metrics=step_metrics,
+        )
+        self.trajectory = self.motion.trajectory
+        self.step_metrics = self.motion.metrics
 
-        self.ramp_profile_up_y = None
-        self.ramp_profile_down_y = None
-        self.ramp_steps_y = 0
+        # Movimentos que retornaram antes de terminar (command, center, end_index),
+        # e o movimento interrompido por uma pausa que precisa ser retomado
+        self.in_flight = []
+        self.resume = None
+        self.pause_lock = threading.Lock()
 
     def is_calibrated(self):
         "Returns true after homing"
@@ -87,10 +157,44 @@ class MotorGcodeMachine(NullGcodeMachine):
 
     def get_position(self) -> (float, float):
         "Returns position in mm"
-        return (
-            -self.curr_position_x / STEPS_PER_MM,
-            -self.curr_position_y / STEPS_PER_MM,
-        )
+        x, y = self.motion.position()
+        return (-x / STEPS_PER_MM, -y / STEPS_PER_MM)
+
+    def parameters(self) -> dict:
+        "Machine parameters that change how a program is planned"
+        return {
+            "steps_per_mm": STEPS_PER_MM,
+            "acceleration": self.acceleration,
+            "junction_deviation": self.junction_deviation,
+            "max_position": self.max_position,
+            "min_position": self.min_position,
+        }
+
+    def is_moving(self) -> bool:
+        return not self.motion.is_idle()
+
+    def bounds(self):
+        "Valid positions in mm, as ((x_min, x_max), (y_min, y_max))"
+        # Os eixos em passos são invertidos
+        low = -self.max_position / STEPS_PER_MM
+        high = -self.min_position / STEPS_PER_MM
+        return (low, high), (low, high)
+
+    def timing_stats(self) -> dict:
+        "Error between the planned and the real pulse times of the motion process"
+        return timing_summary(self.motion.timing())
+
+    def pause(self):
+        with self.pause_lock:
+            self.motion.request_stop()
+            super().pause()
+
+    def lookahead(self, commands):
+        """
+        Receives the movement commands that follow the next one, so that it can end
+        at the speed allowed by the junction with them instead of stopping.
+        """
+        self.upcoming = commands
 
     def g0(self, x, y) -> bool:
         """
@@ -98,7 +202,7 @@ class MotorGcodeMachine(NullGcodeMachine):
         Returns false if movement was not finished
         Returns true if movement was finished
         """
-        return self.g1(x, y, 50)
+        return self.__line(("G0", x, y))
 
     def g1(self, x, y, s) -> bool:
         """
@@ -106,166 +210,125 @@ class MotorGcodeMachine(NullGcodeMachine):
         Returns false if movement was not finished
         Returns true if movement was finished
         """
-
-        dx = x - self.curr_position_x / -STEPS_PER_MM
-        dy = y - self.curr_position_y / -STEPS_PER_MM
-        position = math.sqrt(dx**2 + dy**2)
-
-        if position == 0:
-            return True
-
-        speed_x = (abs(dx) / position) * s
-        speed_y = (abs(dy) / position) * s
-
-        return self.move(speed_x, x, speed_y, y)
+        return self.__line(("G1", x, y, s))
 
     def g2(self, x, y, s, raio) -> bool:
-        x0 = self.curr_position_x / -STEPS_PER_MM
-        y0 = self.curr_position_y / -STEPS_PER_MM
-        dx = x - x0
-        dy = y - y0
-        x_time = x
-        y_time = y
-
-        speed_x = []
-        speed_y = []
-        position = math.sqrt(dx**2 + dy**2)
-
-        distancia = np.sqrt((x - x0) ** 2 + (y - y0) ** 2)
-
-        if distancia > 2 * raio:
-            # precisa colocar uma condição na interface para que o raio, seja no minimo distancia/2
-            print(f"Erro: o raio deve ser maior que ({distancia / 2:.2f}) ")
-            return
-        meio_x, meio_y = (x0 + x) / 2, (y0 + y) / 2
-        distancia_meio = np.sqrt(meio_x**2 + meio_y**2)
-
-        if distancia_meio == 0 and x0 == 0 and y0 == 0:
-            centro_x, centro_y = raio, 0
-        else:
-            h = np.sqrt(raio**2 - (distancia / 2) ** 2)
-            perp_x = -dy
-            perp_y = dx
-
-            # sentido horario
-            comprimento_perp = np.sqrt(perp_x**2 + perp_y**2)
-            if comprimento_perp > 0:
-                perp_x /= comprimento_perp
-                perp_y /= comprimento_perp
-
-            centro_x = meio_x + h * perp_x
-            centro_y = meio_y + h * perp_y
-
-        angulo_inicial = np.arctan2(y0 - centro_y, x0 - centro_x)
-        angulo_final = np.arctan2(y - centro_y, x - centro_x)
-        # sentido horario
-        if angulo_final < angulo_inicial:
-            angulo_final += 2 * np.pi
-
-        theta = np.linspace(angulo_inicial, angulo_final, int(position * 2))
-
-        x_semi = centro_x + raio * np.cos(theta)
-        y_semi = centro_y + raio * np.sin(theta)
-
-        """os pontos q fazem a curva estao listados em (x_semi,y_semi), se quiser fazer uma estimativa da curva que ele vai fazer
-        no web, para visualizar melhor a trajetoria, é só reutilizar o codigo daqui pra cima, nao utilizei a velocidade para nada acima deste comentário,
-        se achar que vai facilitar a implementação fazer uma função só para gerar esses pontos e depois a gente integra com o g2(), me da um toque
         """
+        Clockwise arc movement.
+        Returns false if movement was not finished
+        Returns true if movement was finished
+        """
+        return self.__arc(("G2", x, y, s, raio))
 
-        for i in range(len(x_semi)):
-            x_semi[i] = round(x_semi[i] * 80, 0) / 80
-            y_semi[i] = round(y_semi[i] * 80, 0) / 80
+    def g3(self, x, y, s, raio) -> bool:
+        """
+        Counterclockwise arc movement.
+        Returns false if movement was not finished
+        Returns true if movement was finished
+        """
+        return self.__arc(("G3", x, y, s, raio))
 
-            x_time = x_semi[i] - x_time
-            y_time = y_semi[i] - y_time
-            position = math.sqrt(x_time**2 + y_time**2)
+    def __line(self, command):
+        if not self.__resume_interrupted(command):
+            return False
 
-            if position == 0:
-                return True
-            speed_x.append((abs(x_time) / position) * s)
-            speed_y.append((abs(y_time) / position) * s)
+        return self.__line_to(command)
 
-            x_time = x_semi[i]
-            y_time = y_semi[i]
+    def __line_to(self, command):
+        segment, entry_speed, exit_speed = self.__plan_speeds(command)
 
-        return all(
-            self.move(speed_x[i], x_semi[i], speed_y[i], y_semi[i])
-            for i in range(0, len(x_semi))
+        target_x, target_y = self.__to_steps(*command[1:3])
+        plan = plan_line(
+            target_x - self.curr_position_x,
+            target_y - self.curr_position_y,
+            segment.max_speed * STEPS_PER_MM,
+            self.acceleration * STEPS_PER_MM,
+            entry_speed * STEPS_PER_MM,
+            exit_speed * STEPS_PER_MM,
         )
+        return self.__execute(plan, exit_speed, command)
 
-    def g3(self, x, y, s, raio) -> bool:
-        """a diferença do g2 para o g3 é só a parte que esta comentada "sentido anti horario" """
-
-        x0 = self.curr_position_x / -STEPS_PER_MM
-        y0 = self.curr_position_y / -STEPS_PER_MM
-        dx = x - x0
-        dy = y - y0
+    def __arc(self, command):
+        if (resumed := self.__resume_interrupted(command)) is False:
+            return False
 
-        x_time = x
-        y_time = y
+        # Retomando depois de uma pausa, o centro é o do arco original
+        return self.__arc_around(command, None if resumed is True else resumed)
 
-        speed_x = []
-        speed_y = []
-        position = math.sqrt(dx**2 + dy**2)
+    def __arc_around(self, command, centro=None):
+        x0, y0 = self.__planned_position()
+        _, x, y, _, raio = command
+        distancia = math.hypot(x - x0, y - y0)
 
-        distancia = np.sqrt((x - x0) ** 2 + (y - y0) ** 2)
+        if distancia == 0:
+            return True
 
-        if distancia > 2 * raio:
+        if distancia > 2 * raio and centro is None:
             # precisa colocar uma condição na interface para que o raio, seja no minimo distancia/2
             print(f"Erro: o raio deve ser maior que ({distancia / 2:.2f}) ")
             return
 
-        meio_x, meio_y = (x0 + x) / 2, (y0 + y) / 2
-        distancia_meio = np.sqrt(meio_x**2 + meio_y**2)
-
-        if distancia_meio == 0 and x0 == 0 and y0 == 0:
-            centro_x, centro_y = raio, 0
-        else:
-            h = np.sqrt(raio**2 - (distancia / 2) ** 2)
-
-            perp_x = dy
-            perp_y = -dx
-
-            # sentido anti horario
-            comprimento_perp = np.sqrt(perp_x**2 + perp_y**2)
-            if comprimento_perp > 0:
-                perp_x /= comprimento_perp
-                perp_y /= comprimento_perp
+        segment, entry_speed, exit_speed = self.__plan_speeds(command)
+        if centro is None:
+            centro = segment.center
+
+        # Em passos os dois eixos são invertidos (rotação de 180°), e o g2 percorre
+        # ângulos crescentes nas duas coordenadas
+        target_x, target_y = self.__to_steps(x, y)
+        centro_x, centro_y = centro
+        plan = plan_arc(
+            target_x - self.curr_position_x,
+            target_y - self.curr_position_y,
+            centro_x * -STEPS_PER_MM - self.curr_position_x,
+            centro_y * -STEPS_PER_MM - self.curr_position_y,
+            segment.clockwise,
+            segment.max_speed * STEPS_PER_MM,
+            self.acceleration * STEPS_PER_MM,
+            entry_speed * STEPS_PER_MM,
+            exit_speed * STEPS_PER_MM,
+        )
+        return self.__execute(plan, exit_speed, command, centro)
 
-            centro_x = meio_x + h * perp_x
-            centro_y = meio_y + h * perp_y
+    def __resume_interrupted(self, command):
+        """
+        Finishes the movement interrupted by the last pause before `command`.
+        Returns false if it was paused again, the center of the interrupted arc if
+        it is `command` itself, and true otherwise.
+        """
+        if self.pause_requested:
+            self.__stopped()
+            return False
 
-        angulo_inicial = np.arctan2(y0 - centro_y, x0 - centro_x)
-        angulo_final = np.arctan2(y - centro_y, x - centro_x)
-        # sentido anti horario
-        if angulo_final > angulo_inicial:
-            angulo_final -= 2 * np.pi
+        if self.resume is None:
+            return True
 
-        theta = np.linspace(angulo_inicial, angulo_final, int(position * 2))
+        interrupted, centro = self.resume
+        self.resume = None
 
-        x_semi = centro_x + raio * np.cos(theta)
-        y_semi = centro_y + raio * np.sin(theta)
+        if interrupted == command:
+            return centro if centro is not None else True
 
-        for i in range(len(x_semi)):
-            x_semi[i] = round(x_semi[i] * 80, 0) / 80
-            y_semi[i] = round(y_semi[i] * 80, 0) / 80
+        self.upcoming = ()
+        if interrupted[0] in ("G2", "G3"):
+            return self.__arc_around(interrupted, centro) is not False
+        else:
+            return self.__line_to(interrupted)
 
-            x_time = x_semi[i] - x_time
-            y_time = y_semi[i] - y_time
-            position = math.sqrt(x_time**2 + y_time**2)
+    def __plan_speeds(self, command):
+        "Returns the segment of the command and its entry and exit speeds in mm/s"
+        segments = segments_from_commands(
+            self.__planned_position(), (command, *self.upcoming), self.acceleration
+        )
+        self.upcoming = ()
 
-            if position == 0:
-                return True
-            speed_x.append((abs(x_time) / position) * s)
-            speed_y.append((abs(y_time) / position) * s)
-            x_time = x_semi[i]
-            y_time = y_semi[i]
-
-        return all(
-            self.move(speed_x[i], x_semi[i], speed_y[i], y_semi[i])
-            for i in range(0, len(x_semi))
+        segment = segments[0]
+        entry_speed = min(self.exit_speed, segment.max_speed)
+        exit_speed = plan_exit_speed(
+            entry_speed, segments, self.acceleration, self.junction_deviation
         )
 
+        return segment, entry_speed, exit_speed
+
     def g28(self) -> bool:
         """
         Auto home. Finds home position by moving to the endstops.
@@ -275,6 +338,7 @@ class MotorGcodeMachine(NullGcodeMachine):
         if self.move(0, 0, 50, -30000) and self.move(50, -30000, 0, 0):
             # Verifica se o movimento foi pausado, o 2o move só é chamado se o primeiro não foi pausado
             self.calibrated = True
+            self.motion.set_position(0, 0)
             self.curr_position_x = 0
             self.curr_position_y = 0
             return True
@@ -282,76 +346,32 @@ class MotorGcodeMachine(NullGcodeMachine):
         return False
 
     def move(self, speed_x, position_x, speed_y, position_y):
-        # print(position_x, position_y)
-
-        position_x *= -STEPS_PER_MM
-        position_y *= -STEPS_PER_MM
-        speed_x *= STEPS_PER_MM
-        speed_y *= STEPS_PER_MM
-
-        self.emergency_stop = False
-        self.movement_done.clear()
-
-        # Pré-calcular perfis de aceleração/desaceleração para X
-        total_steps_x = abs(position_x - self.curr_position_x)
-        self.ramp_steps_x = max(1, int(self.accelerate * speed_x))
-
-        if self.ramp_steps_x > 0 and total_steps_x > 0:
-            # Perfil exponencial de aceleração (de 0.1 a 1.0)
-            self.ramp_profile_up_x = np.logspace(-1, 0, self.ramp_steps_x, base=6)
-            self.ramp_profile_up_x = self.ramp_profile_up_x / np.max(
-                self.ramp_profile_up_x
-            )
-
-            # Perfil exponencial de desaceleração (de 1.0 a 0.1)
-            self.ramp_profile_down_x = np.logspace(0, -1, self.ramp_steps_x, base=6)
-            self.ramp_profile_down_x = self.ramp_profile_down_x / np.max(
-                self.ramp_profile_down_x
-            )
-        else:
-            # Caso não haja aceleração/desaceleração
-            self.ramp_profile_up_x = np.ones(1)
-            self.ramp_profile_down_x = np.ones(1)
-
-        # Pré-calcular perfis de aceleração/desaceleração para Y
-        total_steps_y = abs(position_y - self.curr_position_y)
-        self.ramp_steps_y = max(1, int(self.accelerate * speed_y))
-
-        if self.ramp_steps_y > 0 and total_steps_y > 0:
-            # Perfil exponencial de aceleração (de 0.1 a 1.0)
-            self.ramp_profile_up_y = np.logspace(-1, 0, self.ramp_steps_y, base=6)
-            self.ramp_profile_up_y = self.ramp_profile_up_y / np.max(
-                self.ramp_profile_up_y
-            )
-
-            # Perfil exponencial de desaceleração (de 1.0 a 0.1)
-            self.ramp_profile_down_y = np.logspace(0, -1, self.ramp_steps_y, base=6)
-            self.ramp_profile_down_y = self.ramp_profile_down_y / np.max(
-                self.ramp_profile_down_y
-            )
-        else:
-            # Caso não haja aceleração/desaceleração
-            self.ramp_profile_up_y = np.ones(1)
-            self.ramp_profile_down_y = np.ones(1)
-
-        try:
-            self.__move(speed_x * 2, position_x, speed_y * 2, position_y)
-        except Exception as e:
-            print(f"Movement error: {e}")
-            raise
-        finally:
-            GPIO.output(STEP_PIN_X, False)
-            GPIO.output(STEP_PIN_Y, False)
-            self.movement_done.set()
+        "Moves each axis to its position in mm, at its speed in mm/s"
+        if self.pause_requested:
+            self.__stopped()
+            return False
+
+        target_x, target_y = self.__to_steps(position_x, position_y)
+        plan = plan_line(
+            target_x - self.curr_position_x,
+            target_y - self.curr_position_y,
+            math.hypot(speed_x, speed_y) * STEPS_PER_MM,
+            self.acceleration * STEPS_PER_MM,
+        )
+        return self.__execute(plan)
 
-            if self.pause_requested:
-                self.pause_requested = False
-                return False
+    def __planned_position(self):
+        "Position in mm where the last queued movement ends"
+        return (
+            -self.curr_position_x / STEPS_PER_MM,
+            -self.curr_position_y / STEPS_PER_MM,
+        )
 
-            return True
+    def __to_steps(self, x, y):
+        "Converts a position in mm to steps, validating the bounds"
+        position_x = round(x * -STEPS_PER_MM)
+        position_y = round(y * -STEPS_PER_MM)
 
-    def __move(self, speed_x, position_x, speed_y, position_y):
-        # Validate positions
         if (
             position_x > self.max_position
             or position_x < self.min_position
@@ -360,135 +380,74 @@ class MotorGcodeMachine(NullGcodeMachine):
         ):
             raise ValueError("Desired position out of bounds")
 
-        # Setup X axis movement
-        dir_x = 1 if position_x > self.curr_position_x else -1
-        GPIO.output(DIR_PIN_X, dir_x == 1)
-        total_steps_x = abs(position_x - self.curr_position_x)
-        steps_remaining_x = total_steps_x
-
-        # Velocidade mínima para evitar divisão por zero
-        min_speed = 0.1
-        effective_speed_x = max(speed_x, min_speed)
-        step_interval_x = 1.0 / effective_speed_x
-
-        # Setup Y axis movement
-        dir_y = 1 if position_y > self.curr_position_y else -1
-        GPIO.output(DIR_PIN_Y, dir_y == 1)
-        total_steps_y = abs(position_y - self.curr_position_y)
-        steps_remaining_y = total_steps_y
-
-        effective_speed_y = max(speed_y, min_speed)
-        step_interval_y = 1.0 / effective_speed_y
-
-        # Initialize timing
-        last_step_time_x = last_step_time_y = time.time()
-
-        while (
-            steps_remaining_x > 0 or steps_remaining_y > 0
-        ) and not self.emergency_stop:
-            if self.pause_requested:
-                return False
-
-            current_time = time.time()
-
-            # Check endstops
-            if (
-                GPIO.input(ENDSTOP_X_MIN) == GPIO.HIGH
-                or GPIO.input(ENDSTOP_X_MAX) == GPIO.HIGH
-            ):
-                self.__handle_endstop_x()
-                return True
+        return position_x, position_y
 
-            if (
-                GPIO.input(ENDSTOP_Y_MIN) == GPIO.HIGH
-                or GPIO.input(ENDSTOP_Y_MAX) == GPIO.HIGH
-            ):
-                self.__handle_endstop_y()
+    def __execute(self, plan, exit_speed=0.0, command=None, centro=None):
+        """
+        Queues a plan on the motion process. If it ends moving, returns as soon as
+        the previous movement finishes, so the next one can be planned while this
+        one runs. Otherwise waits for it to finish.
+        """
+        self.emergency_stop = False
+        self.movement_done.clear()
+        self.exit_speed = 0.0
+        self.planned_ns += plan.duration_ns
+
+        # Espera pela fila cheia e pelo movimento anterior
+        waiting = perf_counter_ns()
+        end = self.motion.enqueue(plan)
+        if end >= 0:
+            done_x, done_y = plan.displacement(len(plan))
+            self.curr_position_x += done_x
+            self.curr_position_y += done_y
+            self.in_flight.append((command, centro, end))
+
+            wait_index = end - len(plan) if exit_speed > 0 else end
+            finished = self.motion.wait(wait_index, lambda: self.pause_requested)
+            self.wait_ns += perf_counter_ns() - waiting
+
+            if finished:
+                self.in_flight = [m for m in self.in_flight if m[2] > wait_index]
+                self.exit_speed = exit_speed
+                if exit_speed == 0:
+                    self.movement_done.set()
                 return True
 
-            # X axis movement
-            # print(steps_remaining_x, steps_remaining_y)
-
-            if (
-                steps_remaining_x > 0
-                and current_time - last_step_time_x >= step_interval_x
-            ):
-                GPIO.output(STEP_PIN_X, not GPIO.input(STEP_PIN_X))
-
-                if GPIO.input(STEP_PIN_X):
-                    self.curr_position_x += dir_x
-                    steps_remaining_x -= 1
-
-                steps_performed_x = total_steps_x - steps_remaining_x
-
-                # Calcular velocidade atual com perfil exponencial para X
-                if total_steps_x > 100:
-                    if steps_performed_x <= self.ramp_steps_x:
-                        # Ramp up exponencial
-                        profile_index = min(
-                            int(steps_performed_x), len(self.ramp_profile_up_x) - 1
-                        )
-                        speed_factor = max(0.1, self.ramp_profile_up_x[profile_index])
-                        step_interval_x = 1.0 / (effective_speed_x * speed_factor)
-
-                    elif steps_performed_x >= (total_steps_x - self.ramp_steps_x):
-                        # Ramp down exponencial
-                        decel_progress = steps_performed_x - (
-                            total_steps_x - self.ramp_steps_x
-                        )
-                        profile_index = min(
-                            int(decel_progress), len(self.ramp_profile_down_x) - 1
-                        )
-                        speed_factor = max(0.1, self.ramp_profile_down_x[profile_index])
-                        step_interval_x = 1.0 / (effective_speed_x * speed_factor)
-
-                    else:
-                        # Constant speed
-                        step_interval_x = 1.0 / effective_speed_x
-
-                last_step_time_x = current_time
-
-            # Y axis movement
-            if (
-                steps_remaining_y > 0
-                and current_time - last_step_time_y >= step_interval_y
-            ):
-                GPIO.output(STEP_PIN_Y, not GPIO.input(STEP_PIN_Y))
-
-                if GPIO.input(STEP_PIN_Y):
-                    self.curr_position_y += dir_y
-                    steps_remaining_y -= 1
-
-                steps_performed_y = total_steps_y - steps_remaining_y
-
-                # Calcular velocidade atual com perfil exponencial para Y
-                if total_steps_y > 100:
-                    if steps_performed_y <= self.ramp_steps_y:
-                        # Ramp up exponencial
-                        profile_index = min(
-                            int(steps_performed_y), len(self.ramp_profile_up_y) - 1
-                        )
-                        speed_factor = max(0.1, self.ramp_profile_up_y[profile_index])
-                        step_interval_y = 1.0 / (effective_speed_y * speed_factor)
-
-                    elif steps_performed_y >= (total_steps_y - self.ramp_steps_y):
-                        # Ramp down exponencial
-                        decel_progress = steps_performed_y - (
-                            total_steps_y - self.ramp_steps_y
-                        )
-                        profile_index = min(
-                            int(decel_progress), len(self.ramp_profile_down_y) - 1
-                        )
-                        speed_factor = max(0.1, self.ramp_profile_down_y[profile_index])
-                        step_interval_y = 1.0 / (effective_speed_y * speed_factor)
-
-                    else:
-                        # Constant speed
-                        step_interval_y = 1.0 / effective_speed_y
-
-                last_step_time_y = current_time
-
-        return True
+        return self.__stopped()
+
+    def __stopped(self):
+        """
+        Handles a pause or an endstop that stopped the motion process.
+        Returns false after a pause and true after an endstop.
+        """
+        # Espera o pause() terminar, caso a parada tenha sido vista no meio dele
+        with self.pause_lock:
+            faults = self.motion.faults()
+            self.motion.discard()
+
+        # Só o que foi executado conta, o resto da fila foi descartado
+        stopped_at = self.motion.stopped_at()
+        interrupted = [m for m in self.in_flight if m[2] > stopped_at]
+        self.in_flight = []
+        self.exit_speed = 0.0
+        self.curr_position_x, self.curr_position_y = self.motion.position()
+
+        if faults & STEP_X:
+            self.__handle_endstop_x()
+        elif faults & STEP_Y:
+            self.__handle_endstop_y()
+
+        self.movement_done.set()
+
+        if faults:
+            self.resume = None
+            return True
+
+        if interrupted and interrupted[0][0] is not None:
+            self.resume = interrupted[0][:2]
+
+        self.pause_requested = False
+        return False
 
     def __handle_endstop_x(self):
         pressed = []
@@ -498,7 +457,7 @@ class MotorGcodeMachine(NullGcodeMachine):
             pressed.append("X Max")
 
         print(f"X axis endstop triggered ({', '.join(pressed)})! Reversing...")
-        self.__reverse_motion(STEP_PIN_X, DIR_PIN_X, "x")
+        self.__reverse_motion(STEP_X)
 
     def __handle_endstop_y(self):
         pressed = []
@@ -508,30 +467,28 @@ class MotorGcodeMachine(NullGcodeMachine):
             pressed.append("Y Max")
 
         print(f"Y axis endstop triggered ({', '.join(pressed)})! Reversing...")
-        self.__reverse_motion(STEP_PIN_Y, DIR_PIN_Y, "y")
-
-    def __reverse_motion(self, step_pin, dir_pin, axis):
-        current_dir = GPIO.input(dir_pin)
-        new_dir = not current_dir
-        GPIO.output(dir_pin, new_dir)
-
-        steps = 0
-        while steps < 1000:  # Move back fixed number of steps
-            GPIO.output(step_pin, True)
-            time.sleep(DEFAULT_INTERVAL / 2)
-            GPIO.output(step_pin, False)
-            time.sleep(DEFAULT_INTERVAL / 2)
-            steps += 1
-
-            # Update position
-            if axis == "x":
-                self.curr_position_x += -1 if new_dir else 1
-            else:
-                self.curr_position_y += -1 if new_dir else 1
-
-        print(f"{axis.upper()} axis endstop cleared! Reverse motion completed.")
+        self.__reverse_motion(STEP_Y)
+
+    def __reverse_motion(self, axis):
+        # Move back fixed number of steps, against the direction of the last step
+        forward = self.motion.dir_bits() & (DIR_X if axis == STEP_X else DIR_Y)
+        steps = -1000 if forward else 1000
+        speed = 1 / DEFAULT_INTERVAL
+
+        if axis == STEP_X:
+            plan = plan_line(steps, 0, speed, math.inf, speed, speed)
+        else:
+            plan = plan_line(0, steps, speed, math.inf, speed, speed)
+
+        self.motion.clear_faults()
+        self.motion.wait(self.motion.enqueue(plan, check_endstops=False))
+        self.curr_position_x, self.curr_position_y = self.motion.position()
+
+        name = "X" if axis == STEP_X else "Y"
+        print(f"{name} axis endstop cleared! Reverse motion completed.")
         self.emergency_stop = True
 
     def cleanup(self):
         """Clean up GPIO resources"""
+        self.motion.close()
         GPIO.cleanup()
@@ -0,0 +1,119 @@
+from time import perf_counter_ns
+
+import numpy as np
+
+from actuator_xrl8.clock import SpinClock
+from actuator_xrl8.step_planner import STEP_X, STEP_Y, DIR_X, DIR_Y
+
+MIN_PULSE_NS = 2_000  # Shortest high time of a step pulse, drivers need 1-2 us
+
+
+class GpioPinDriver:
+    """
+    Writes output pins through RPi.GPIO keeping their levels in a shadow register,
+    so pins are never read back and unchanged pins are not written. Pins that
+    change together are set in a single GPIO.output call.
+    """
+
+    def __init__(self, gpio, pins):
+        self.gpio = gpio
+        self.levels = {pin: False for pin in pins}
+
+    def write(self, pins, level: bool):
+        levels = self.levels
+        changed = [pin for pin in pins if levels[pin] != level]
+
+        if changed:
+            for pin in changed:
+                levels[pin] = level
+            self.gpio.output(changed, level)
+
+    def level(self, pin) -> bool:
+        return self.levels[pin]
+
+
+class FakePinDriver:
+    """
+    Pin driver without hardware. Records every edge as (time_ns, pin, level) with
+    the time of `clock`, and counts the batched writes.
+    """
+
+    def __init__(self, pins, clock=None):
+        self.clock = clock if clock is not None else SpinClock()
+        self.levels = {pin: False for pin in pins}
+        self.edges = []
+        self.writes = 0
+
+    def write(self, pins, level: bool):
+        levels = self.levels
+        changed = [pin for pin in pins if levels[pin] != level]
+
+        if changed:
+            now = self.clock.now_ns()
+            for pin in changed:
+                levels[pin] = level
+                self.edges.append((now, pin, level))
+            self.writes += 1
+
+    def level(self, pin) -> bool:
+        return self.levels[pin]
+
+    def rising_edges(self, pin):
+        "Times in ns of the rising edges of a pin"
+        return np.array([t for t, p, level in self.edges if p == pin and level])
+
+    def step_count(self, pin) -> int:
+        return len(self.rising_edges(pin))
+
+
+class PinStepBackend:
+    """
+    MotionProcess backend that drives the step and direction pins through a pin
+    driver. Both step pins of a tick go up together and down together, staying
+    high for at least `min_pulse_ns`.
+    """
+
+    def __init__(
+        self,
+        driver,
+        step_pins,
+        dir_pins,
+        endstop_triggered,
+        clock=None,
+        min_pulse_ns=MIN_PULSE_NS,
+    ):
+        self.driver = driver
+        self.endstop_triggered = endstop_triggered
+        self.min_pulse_ns = min_pulse_ns
+
+        clock = clock if clock is not None else SpinClock()
+        self.clock = clock
+        self.now_ns = clock.now_ns
+        self.wait_until = clock.wait_until
+
+        # Pinos de cada combinação de bits, calculados uma vez só
+        step_x, step_y = step_pins
+        dir_x, dir_y = dir_pins
+        self._step_pins = [
+            tuple(pin for pin, bit in ((step_x, STEP_X), (step_y, STEP_Y)) if b & bit)
+            for b in range((STEP_X | STEP_Y) + 1)
+        ]
+        self._dir_x = dir_x
+        self._dir_y = dir_y
+
+    def set_direction(self, dir_bits: int):
+        write = self.driver.write
+        write((self._dir_x,), bool(dir_bits & DIR_X))
+        write((self._dir_y,), bool(dir_bits & DIR_Y))
+
+    def step(self, step_bits: int):
+        pins = self._step_pins[step_bits]
+        if not pins:
+            return
+
+        self.driver.write(pins, True)
+        # Espera ocupada: o pulso é curto demais para dormir
+        end = perf_counter_ns() + self.min_pulse_ns
+        while perf_counter_ns() < end:
+            pass
+        self.driver.write(pins, False)
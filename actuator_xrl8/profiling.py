@@ -0,0 +1,119 @@
+import cProfile
+from collections import Counter
+from contextlib import contextmanager
+import io
+import os
+import pstats
+import sys
+import threading
+
+PROFILE_DIR = "/tmp"  # Served by /dl/<file>
+PROFILE_MODES = ("cprofile", "sampling")
+SAMPLE_INTERVAL = 0.005  # s
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of a thread every `interval` seconds from another thread.
+    Costs little to the sampled thread, unlike cProfile, so the run keeps its
+    real timing. The result is in the collapsed stack format of flamegraph.pl
+    and speedscope: one "outer;inner count" line per stack.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> str:
+        self._stop.set()
+        self._thread.join()
+
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                name = os.path.basename(code.co_filename)
+                stack.append(f"{code.co_name} ({name}:{frame.f_lineno})")
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class RunProfiler:
+    """
+    Profiles only the next run, when asked with request(), so a slow run can be
+    diagnosed without restarting. The run loop wraps every run in run(), which
+    does nothing unless a profile was requested.
+
+    The result is written to `directory` and on_done(files) is called with the
+    names of the files written.
+    """
+
+    def __init__(self, on_done=lambda files: None, directory=PROFILE_DIR):
+        self.on_done = on_done
+        self.directory = directory
+        self._mode = None
+
+    def request(self, mode="cprofile") -> bool:
+        "Profiles the next run with cProfile or by sampling. False if mode is unknown"
+        if mode not in PROFILE_MODES:
+            print(f"Unknown profile mode {mode!r}, expected one of {PROFILE_MODES}")
+            return False
+
+        self._mode = mode
+        return True
+
+    def pending(self):
+        "Mode requested for the next run, or None"
+        return self._mode
+
+    @contextmanager
+    def run(self):
+        mode, self._mode = self._mode, None
+
+        if mode is None:
+            yield
+        elif mode == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                self._save_cprofile(profile)
+        else:
+            sampler = SamplingProfiler(threading.get_ident())
+            sampler.start()
+            try:
+                yield
+            finally:
+                self._write("profile.folded", sampler.stop())
+                self.on_done(["profile.folded"])
+
+    def _save_cprofile(self, profile):
+        profile.dump_stats(os.path.join(self.directory, "profile.pstats"))
+
+        text = io.StringIO()
+        pstats.Stats(profile, stream=text).sort_stats("cumulative").print_stats(40)
+        self._write("profile.txt", text.getvalue())
+
+        self.on_done(["profile.pstats", "profile.txt"])
+
+    def _write(self, name, text):
+        with open(os.path.join(self.directory, name), "w") as f:
+            f.write(text)
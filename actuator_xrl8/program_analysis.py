@@ -0,0 +1,190 @@
+import numpy as np
+
+from actuator_xrl8.gcode_interpreter import OPCODE, MOTION_OPS
+from actuator_xrl8.lookahead import G0_SPEED
+
+
+def _arc_lengths(x0, y0, x, y, r, clockwise, chord):
+    "Length of each arc, with the center and sweep of arc_center and arc_sweep"
+    safe_chord = np.where(chord > 0, chord, 1)
+    h = np.sqrt(np.maximum(r**2 - (chord / 2) ** 2, 0))
+    side = np.where(clockwise, 1, -1)
+    centro_x = (x0 + x) / 2 - side * h * (y - y0) / safe_chord
+    centro_y = (y0 + y) / 2 + side * h * (x - x0) / safe_chord
+
+    inicial = np.arctan2(y0 - centro_y, x0 - centro_x)
+    final = np.arctan2(y - centro_y, x - centro_x)
+    final = np.where(clockwise & (final < inicial), final + 2 * np.pi, final)
+    final = np.where(~clockwise & (final > inicial), final - 2 * np.pi, final)
+
+    return np.abs(final - inicial) * np.hypot(x0 - centro_x, y0 - centro_y)
+
+
+def _starts(program, start):
+    "Position in mm where each command starts, and the chord to its target"
+    op = program["op"]
+    x, y = program["x"], program["y"]
+    motion = np.isin(op, list(MOTION_OPS))
+    home = op == OPCODE["G28"]
+
+    # Posição no fim de cada comando: o alvo do último movimento até ele
+    last = np.maximum.accumulate(np.where(motion | home, np.arange(len(op)), -1))
+    end_x = np.where(last >= 0, np.where(home, 0.0, x)[np.maximum(last, 0)], start[0])
+    end_y = np.where(last >= 0, np.where(home, 0.0, y)[np.maximum(last, 0)], start[1])
+    x0 = np.concatenate(([start[0]], end_x[:-1]))
+    y0 = np.concatenate(([start[1]], end_y[:-1]))
+
+    return x0, y0, np.hypot(x - x0, y - y0)
+
+
+def command_estimates(program, start=(0.0, 0.0), acceleration=None):
+    """
+    Planned duration in seconds and path length in mm of each command of a
+    compiled program, as two arrays. Movements take their length at the
+    programmed speed, dwells their time, and everything else nothing.
+    """
+    op = program["op"]
+    x, y, s, r = program["x"], program["y"], program["s"], program["r"]
+    motion = np.isin(op, list(MOTION_OPS))
+    arc = (op == OPCODE["G2"]) | (op == OPCODE["G3"])
+    x0, y0, chord = _starts(program, start)
+
+    length = np.where(motion, chord, 0.0)
+    valid_arc = arc & (chord <= 2 * r) & (chord > 0)
+    length[valid_arc] = _arc_lengths(
+        x0[valid_arc],
+        y0[valid_arc],
+        x[valid_arc],
+        y[valid_arc],
+        r[valid_arc],
+        (op == OPCODE["G2"])[valid_arc],
+        chord[valid_arc],
+    )
+
+    speed = np.where(op == OPCODE["G0"], G0_SPEED, s)
+    if acceleration is not None:
+        speed = np.where(arc, np.minimum(speed, np.sqrt(acceleration * r)), speed)
+    duration = np.divide(length, speed, out=np.zeros(len(op)), where=speed > 0)
+    duration[op == OPCODE["G4"]] = program["n"][op == OPCODE["G4"]] / 1000
+
+    return duration, length
+
+
+def analyze(
+    program,
+    strings=(),
+    start=(0.0, 0.0),
+    bounds=None,
+    acceleration=None,
+    truncated=False,
+):
+    """
+    Checks a compiled program (see COMMAND_DTYPE) before it runs, all commands at
+    once, and estimates it. `start` is the position in mm before the program,
+    `bounds` the ((x_min, x_max), (y_min, y_max)) range of valid positions in mm
+    and `acceleration` (mm/s²) limits the speed on arcs like the look-ahead does.
+    `truncated` tells that the program goes on after these commands, which is
+    reported as a warning on the last of them.
+
+    Returns a dict with:
+        errors, warnings: lists of (line, message), by line
+        length_mm: length of the path
+        duration_s: time at the programmed speeds plus the dwells, without the
+            acceleration ramps (SimulatedGcodeMachine gives the exact one)
+        acquisitions: the M1000/M1001 windows, with their lines, estimated
+            start and end times and length of path
+
+    G28 is taken as a jump to the origin.
+    """
+    op = program["op"]
+    lines = program["line"]
+    x, y, s, r = program["x"], program["y"], program["s"], program["r"]
+
+    motion = np.isin(op, list(MOTION_OPS))
+    arc = (op == OPCODE["G2"]) | (op == OPCODE["G3"])
+    _, _, chord = _starts(program, start)
+    errors = []
+
+    if bounds is not None:
+        (x_min, x_max), (y_min, y_max) = bounds
+        outside = motion & ((x < x_min) | (x > x_max) | (y < y_min) | (y > y_max))
+        for i in np.flatnonzero(outside):
+            errors.append(
+                (int(lines[i]), f"position ({x[i]:g}, {y[i]:g}) is out of bounds")
+            )
+
+    bad_radius = arc & (chord > 2 * r)
+    for i in np.flatnonzero(bad_radius):
+        errors.append(
+            (
+                int(lines[i]),
+                f"arc radius {r[i]:g} must be at least half the chord, "
+                f"{chord[i] / 2:.2f}",
+            )
+        )
+
+    bad_feed = motion & (op != OPCODE["G0"]) & (s <= 0)
+    for i in np.flatnonzero(bad_feed):
+        errors.append((int(lines[i]), f"feed {s[i]:g} must be positive"))
+
+    duration, length = command_estimates(program, start, acceleration)
+    elapsed = np.cumsum(duration)
+    travelled = np.cumsum(length)
+    acquisitions, warnings = _acquisitions(program, strings, elapsed, travelled)
+    if truncated and len(op):
+        warnings.append(
+            (
+                int(lines[-1]),
+                f"only the first {len(op)} commands were checked and estimated",
+            )
+        )
+
+    return {
+        "errors": sorted(errors),
+        "warnings": sorted(warnings),
+        "commands": len(op),
+        "length_mm": float(travelled[-1]) if len(op) else 0.0,
+        "duration_s": float(elapsed[-1]) if len(op) else 0.0,
+        "acquisitions": acquisitions,
+    }
+
+
+def _acquisitions(program, strings, elapsed, travelled):
+    "Pairs each M1000 with the next M1001, returns (windows, warnings)"
+    windows = []
+    warnings = []
+    current = None
+
+    starts_stops = np.isin(program["op"], [OPCODE["M1000"], OPCODE["M1001"]])
+    for i in np.flatnonzero(starts_stops).tolist():
+        line = int(program["line"][i])
+
+        if program["op"][i] == OPCODE["M1000"]:
+            if current is not None:
+                warnings.append((line, "acquisition started while another runs"))
+                continue
+
+            text = int(program["s"][i])
+            current = {
+                "name": strings[text] if text < len(strings) else None,
+                "pulses_per_second": int(program["n"][i]),
+                "start_line": line,
+                "end_line": None,
+                "start_s": float(elapsed[i]),
+                "end_s": None,
+                "length_mm": None,
+            }
+            windows.append(current)
+            start_length = travelled[i]
+        elif current is None:
+            warnings.append((line, "acquisition stopped without being started"))
+        else:
+            current["end_line"] = line
+            current["end_s"] = float(elapsed[i])
+            current["length_mm"] = float(travelled[i] - start_length)
+            current = None
+
+    if current is not None:
+        warnings.append((current["start_line"], "acquisition is never stopped"))
+
+    return windows, sorted(warnings)
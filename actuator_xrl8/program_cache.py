@@ -0,0 +1,139 @@
+from collections import OrderedDict
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from actuator_xrl8.gcode_interpreter import COMMAND_DTYPE
+
+PROGRAM_CACHE_ENTRIES = 32  # Programs kept in memory
+PROGRAM_CACHE_FILES = 256  # Programs kept on disk
+
+
+class ProgramCache:
+    """
+    Compiled programs by a hash of their source and of the machine parameters,
+    so running the same scan again skips the compilation.
+
+    The most recently used programs stay in memory. With `directory`, every
+    program is also saved there, and found again after a restart.
+    """
+
+    def __init__(
+        self,
+        parameters=None,
+        directory=None,
+        max_entries=PROGRAM_CACHE_ENTRIES,
+        max_files=PROGRAM_CACHE_FILES,
+    ):
+        # O formato do programa compilado também faz parte da chave
+        self._salt = repr((sorted((parameters or {}).items()), COMMAND_DTYPE.descr))
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError as e:
+                print(f"Program cache kept only in memory: {e}")
+                self.directory = None
+
+    def key(self, source: str) -> str:
+        sha = hashlib.sha256(self._salt.encode())
+        sha.update(source.encode())
+        return sha.hexdigest()
+
+    def get(self, source: str):
+        "Returns the (program, strings) compiled from `source`, or None"
+        key = self.key(source)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and (entry := self._load(key)) is not None:
+            self._remember(key, entry)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        program, strings = entry
+        return program, list(strings)
+
+    def put(self, source: str, program, strings):
+        program.setflags(write=False)
+        key = self.key(source)
+        entry = (program, tuple(strings))
+
+        self._remember(key, entry)
+        self._save(key, entry)
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                program = data["program"]
+                strings = tuple(data["strings"].tolist())
+        except (OSError, KeyError, ValueError):
+            return None
+
+        if program.dtype != COMMAND_DTYPE:
+            return None
+
+        program.setflags(write=False)
+        os.utime(self._path(key))
+        return program, strings
+
+    def _save(self, key, entry):
+        if self.directory is None:
+            return
+
+        program, strings = entry
+        tmp = os.path.join(self.directory, f".{key}.{threading.get_ident()}.npz")
+
+        try:
+            np.savez(tmp, program=program, strings=np.array(strings, dtype=str))
+            os.replace(tmp, self._path(key))
+            self._prune()
+        except OSError as e:
+            print(f"Could not save the compiled program: {e}")
+
+    def _prune(self):
+        "Removes the least recently used files beyond max_files"
+        files = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".npz") and not name.startswith(".")
+        ]
+        if len(files) <= self.max_files:
+            return
+
+        files.sort(key=os.path.getmtime)
+        for path in files[: len(files) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,100 @@
+from time import monotonic
+
+import numpy as np
+
+CALIBRATION_S = 10.0  # Planned seconds done before the measured rate is trusted
+
+
+class ProgramProgress:
+    """
+    How far a program has got: commands done, distance against the total and an
+    ETA, from the planned duration and length of every command (see
+    program_analysis.command_estimates).
+
+    The planned durations leave out the acceleration ramps, the junction speeds
+    and the encoder commands, so the planned time left is scaled by the measured
+    rate, the real running time over the planned time done. Only the time between
+    start() and stop() counts, so pauses do not change the rate. Inside a long
+    command the progress advances with the time since the command started.
+
+    Without estimates (a streamed program) only the commands done are known. A
+    program longer than its estimates (GcodeInterpreter.program is truncated)
+    counts as done at the end of the estimated commands.
+    """
+
+    def __init__(self, durations=None, lengths=None, clock=monotonic):
+        self.clock = clock
+        self.known = durations is not None
+        if self.known:
+            self._durations = durations
+            self._lengths = lengths
+            self._ends_s = np.cumsum(durations)
+            self._ends_mm = np.cumsum(lengths)
+
+        self._index = 0
+        self._command_started = None
+        self._run_s = 0.0
+        self._running_since = None
+
+    def start(self):
+        "The program started running, or resumed after a pause"
+        if self._running_since is None:
+            self._running_since = self._command_started = self.clock()
+
+    def stop(self):
+        if self._running_since is not None:
+            self._run_s += self.clock() - self._running_since
+            self._running_since = None
+
+    def update(self, index):
+        "Number of commands executed so far"
+        if index != self._index:
+            self._index = index
+            self._command_started = self.clock()
+
+    def summary(self) -> dict:
+        """
+        command and commands: executed and total; distance_mm and total_mm;
+        elapsed_s: running time; eta_s: running time left. Totals and the ETA
+        are None for a streamed program.
+        """
+        now = self.clock()
+        index = self._index
+        run_s = self._run_s
+        if self._running_since is not None:
+            run_s += now - self._running_since
+
+        summary = {
+            "command": index,
+            "commands": None,
+            "distance_mm": None,
+            "total_mm": None,
+            "elapsed_s": round(run_s, 1),
+            "eta_s": None,
+        }
+        if not self.known:
+            return summary
+
+        total = len(self._durations)
+        done = min(index, total)
+        done_s = float(self._ends_s[done - 1]) if done else 0.0
+        done_mm = float(self._ends_mm[done - 1]) if done else 0.0
+        total_s = float(self._ends_s[-1]) if total else 0.0
+
+        rate = run_s / done_s if done_s >= min(CALIBRATION_S, total_s) > 0 else 1.0
+
+        if self._running_since is not None and index < total:
+            # Parte do comando atual, pelo tempo desde que começou
+            planned = float(self._durations[index])
+            if planned > 0:
+                fraction = min(1.0, (now - self._command_started) / (planned * rate))
+                done_s += fraction * planned
+                done_mm += fraction * float(self._lengths[index])
+
+        summary.update(
+            commands=total,
+            distance_mm=round(done_mm, 1),
+            total_mm=round(float(self._ends_mm[-1]) if total else 0.0, 1),
+            eta_s=round(max(0.0, total_s - done_s) * rate),
+        )
+        return summary
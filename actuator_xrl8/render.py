@@ -0,0 +1,130 @@
+import os
+import threading
+
+import numpy as np
+
+RENDER_POINTS = 4000  # Points kept in the plot of a trajectory
+TRAJECTORY_NPZ = "/tmp/trajectory.npz"
+TRAJECTORY_JPG = "/tmp/trajectory.jpg"
+
+
+def lttb(x, y, threshold):
+    """
+    Indices of `threshold` points of the path (x, y) chosen with Largest Triangle
+    Three Buckets: the points are split in buckets and each one keeps the point
+    that makes the largest triangle with the previous choice and the mean of the
+    next bucket, so corners and extremes survive the decimation.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # O primeiro e o último ponto ficam, o resto é dividido em threshold - 2 baldes
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (end, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        mean_x = x[next_start:next_end].mean()
+        mean_y = y[next_start:next_end].mean()
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        area = np.abs(
+            (x[a] - mean_x) * (bucket_y - y[a]) - (x[a] - bucket_x) * (mean_y - y[a])
+        )
+
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+class TrajectoryRenderer:
+    """
+    Saves and plots finished trajectories on a worker thread, so the run thread
+    goes on to the next program right away. `on_done` is called after each plot.
+
+    Only the latest trajectory matters: a job submitted while another is waiting
+    replaces it, and a plot that became stale while rendering is not published.
+
+    matplotlib takes seconds to import on the Pi, so it is only imported by the
+    worker, on the first plot.
+    """
+
+    def __init__(
+        self,
+        on_done,
+        points=RENDER_POINTS,
+        npz_path=TRAJECTORY_NPZ,
+        jpg_path=TRAJECTORY_JPG,
+    ):
+        self.on_done = on_done
+        self.points = points
+        self.npz_path = npz_path
+        self.jpg_path = jpg_path
+
+        self.figure = None
+
+        self._job = None
+        self._generation = 0
+        self._condition = threading.Condition()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def submit(self, timestamps, x, y):
+        with self._condition:
+            self._generation += 1
+            self._job = (self._generation, timestamps, x, y)
+            self._condition.notify()
+
+    def _stale(self, generation) -> bool:
+        return generation != self._generation
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while self._job is None:
+                    self._condition.wait()
+
+                job = self._job
+                self._job = None
+
+            try:
+                self._render(*job)
+            except Exception as e:
+                print(f"Could not render the trajectory: {e}")
+
+    def _render(self, generation, timestamps, x, y):
+        np.savez(self.npz_path, timestamp=timestamps, x=x, y=y)
+
+        keep = lttb(x, y, self.points)
+        if self._stale(generation):
+            return
+
+        if self.figure is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self.figure = Figure()
+            FigureCanvasAgg(self.figure)
+
+        self.figure.clear()
+        ax = self.figure.add_subplot()
+        ax.axis("off")
+        ax.invert_yaxis()
+        ax.plot(x[keep], y[keep])
+
+        # Escreve em outro arquivo antes, para o cliente nunca ler um jpg pela metade
+        root, ext = os.path.splitext(self.jpg_path)
+        tmp = f"{root}.tmp{ext}"
+        self.figure.savefig(tmp)
+
+        if self._stale(generation):
+            return
+
+        os.replace(tmp, self.jpg_path)
+        self.on_done()
@@ -0,0 +1,260 @@
+"""
+Runs G-code programs on a virtual clock, to know how long a scan takes and which
+path it follows without waiting for it.
+
+    python -m actuator_xrl8.simulation scan.gcode --npz scan.npz
+"""
+
+import argparse
+import math
+
+import numpy as np
+
+from actuator_xrl8.clock import VirtualClock
+from actuator_xrl8.gcode_interpreter import GcodeInterpreter
+from actuator_xrl8.gcode_machine import NullGcodeMachine, LOCAL_TRAJECTORY_CAPACITY
+from actuator_xrl8.lookahead import segments_from_commands, plan_exit_speed
+from actuator_xrl8.step_planner import plan_line, plan_arc
+from actuator_xrl8.trajectory import TRAJECTORY_CAPACITY
+
+SIMULATION_RECORD_INTERVAL_NS = 10_000_000  # 0 records every step
+HOME_SPEED = 50  # mm/s
+
+
+class SimulatedGcodeMachine(NullGcodeMachine):
+    """
+    Machine that plans every movement like MotorGcodeMachine, with the same step
+    planner, look-ahead and acceleration ramps, and plays the plans on a
+    VirtualClock instead of the pins. A program runs as fast as it is planned.
+
+    The positions are recorded in `trajectory` with the virtual time since the
+    start as timestamps, keeping the last `trajectory_capacity` samples, and the
+    encoder commands in `events` as (time_ns, command, args) tuples instead of
+    being sent.
+    """
+
+    def __init__(
+        self,
+        acceleration=1000,
+        junction_deviation=0.05,
+        record_interval_ns=SIMULATION_RECORD_INTERVAL_NS,
+        trajectory_capacity=LOCAL_TRAJECTORY_CAPACITY,
+    ):
+        super().__init__(trajectory_capacity)
+        self.acceleration = acceleration  # mm/s²
+        self.junction_deviation = junction_deviation  # mm
+        self.clock = VirtualClock()
+
+        # Posição em passos, no mesmo sentido dos mm
+        self.steps_x = 0
+        self.steps_y = 0
+        self.upcoming = ()
+        self.exit_speed = 0.0
+
+        self.events = []
+        self.trajectory.interval_ns = record_interval_ns
+        self.trajectory.record(0, 0, 0)
+
+    def duration(self) -> float:
+        "Virtual seconds since the start"
+        return self.clock.now_ns() / 1e9
+
+    def run(self, gcode) -> float:
+        """
+        Runs a whole program from the current state and returns the duration of
+        the simulation so far, in seconds. Raises ValueError if it stops early.
+        """
+        interpreter = GcodeInterpreter(gcode, self)
+
+        while (status := interpreter.step()) is True:
+            pass
+
+        if status is not None:
+            line = interpreter.current_line()
+            raise ValueError(f"program stopped at line {line}: {status}")
+
+        self._record_position()
+        return self.duration()
+
+    def lookahead(self, commands):
+        self.upcoming = commands
+
+    def g0(self, x: float, y: float) -> bool:
+        return self._line(("G0", x, y))
+
+    def g1(self, x: float, y: float, s: float) -> bool:
+        return self._line(("G1", x, y, s))
+
+    def g2(self, x: float, y: float, s: float, r: float) -> bool:
+        return self._arc(("G2", x, y, s, r))
+
+    def g3(self, x: float, y: float, s: float, r: float) -> bool:
+        return self._arc(("G3", x, y, s, r))
+
+    def _line(self, command):
+        segment, entry_speed, exit_speed = self._plan_speeds(command)
+
+        target_x, target_y = self._to_steps(*command[1:3])
+        plan = plan_line(
+            target_x - self.steps_x,
+            target_y - self.steps_y,
+            segment.max_speed * self.STEPS_PER_MM,
+            self.acceleration * self.STEPS_PER_MM,
+            entry_speed * self.STEPS_PER_MM,
+            exit_speed * self.STEPS_PER_MM,
+        )
+        return self._play(plan, exit_speed)
+
+    def _arc(self, command):
+        x0, y0 = self.get_position()
+        _, x, y, _, raio = command
+        distancia = math.hypot(x - x0, y - y0)
+
+        if distancia == 0:
+            return True
+
+        if distancia > 2 * raio:
+            print(f"Erro: o raio deve ser maior que ({distancia / 2:.2f}) ")
+            return
+
+        segment, entry_speed, exit_speed = self._plan_speeds(command)
+
+        # Mesma orientação dos passos do MotorGcodeMachine, que gira os eixos 180°
+        target_x, target_y = self._to_steps(x, y)
+        centro_x, centro_y = segment.center
+        plan = plan_arc(
+            target_x - self.steps_x,
+            target_y - self.steps_y,
+            centro_x * self.STEPS_PER_MM - self.steps_x,
+            centro_y * self.STEPS_PER_MM - self.steps_y,
+            segment.clockwise,
+            segment.max_speed * self.STEPS_PER_MM,
+            self.acceleration * self.STEPS_PER_MM,
+            entry_speed * self.STEPS_PER_MM,
+            exit_speed * self.STEPS_PER_MM,
+        )
+        return self._play(plan, exit_speed)
+
+    def _plan_speeds(self, command):
+        "Returns the segment of the command and its entry and exit speeds in mm/s"
+        segments = segments_from_commands(
+            self.get_position(), (command, *self.upcoming), self.acceleration
+        )
+        self.upcoming = ()
+
+        segment = segments[0]
+        entry_speed = min(self.exit_speed, segment.max_speed)
+        exit_speed = plan_exit_speed(
+            entry_speed, segments, self.acceleration, self.junction_deviation
+        )
+
+        return segment, entry_speed, exit_speed
+
+    def _to_steps(self, x, y):
+        return round(x * self.STEPS_PER_MM), round(y * self.STEPS_PER_MM)
+
+    def _play(self, plan, exit_speed) -> bool:
+        "Advances the clock by the plan, recording the positions it goes through"
+        self.exit_speed = exit_speed
+        if not len(plan):
+            return True
+        self.planned_ns += plan.duration_ns
+
+        start = self.clock.now_ns()
+        times = start + plan.times
+        steps_x, steps_y = plan.steps()
+        x = self.steps_x + steps_x
+        y = self.steps_y + steps_y
+
+        interval = self.trajectory.interval_ns
+        if interval > 0:
+            # Primeiro tick de cada intervalo, como o processo de movimentação
+            keep = np.flatnonzero(np.diff(times // interval, prepend=-1))
+            self.trajectory.extend(times[keep], x[keep], y[keep])
+        else:
+            self.trajectory.extend(times, x, y)
+
+        self.clock.wait_until(int(times[-1]))
+        self._set_steps(int(x[-1]), int(y[-1]))
+        return True
+
+    def _set_steps(self, x, y):
+        self.steps_x, self.steps_y = x, y
+        self.pos = np.array((x, y), dtype=float) / self.STEPS_PER_MM
+
+    def _record_position(self):
+        self.trajectory.record(self.clock.now_ns(), self.steps_x, self.steps_y)
+
+    def g4(self, p: int):
+        self._record_position()
+        self.planned_ns += p * 1_000_000
+        self.clock.wait_until(self.clock.now_ns() + p * 1_000_000)
+        self._record_position()
+
+    def g28(self) -> bool:
+        self.upcoming = ()
+        self._line(("G1", 0, 0, HOME_SPEED))
+        self.calibrated = True
+        return True
+
+    def g90(self):
+        pass
+
+    def g91(self):
+        pass
+
+    def _event(self, command, *args):
+        self.events.append((self.clock.now_ns(), command, args))
+
+    def m1000(self, f: int, acquisition_name: str) -> bool:
+        self._event("M1000", f, acquisition_name)
+        return True
+
+    def m1001(self) -> bool:
+        self._event("M1001")
+        return True
+
+    def m1002(self):
+        self._event("M1002")
+
+    def m1003(self):
+        self._event("M1003")
+
+    def m1004(self, e: int):
+        self._event("M1004", e)
+
+
+def simulate(gcode, **kwargs):
+    """
+    Simulates a program on a new SimulatedGcodeMachine built with `kwargs`.
+    Returns (duration_s, timestamps_ns, x_mm, y_mm).
+    """
+    machine = SimulatedGcodeMachine(**kwargs)
+    duration = machine.run(gcode)
+    return (duration, *machine.trajectory_mm())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulates a G-code program")
+    parser.add_argument("gcode", help="program file")
+    parser.add_argument("--acceleration", type=float, default=1000, help="mm/s²")
+    parser.add_argument("--npz", help="save the timed trajectory to this file")
+    args = parser.parse_args()
+
+    with open(args.gcode) as f:
+        gcode = f.read()
+
+    # O arquivo leva a trajetória inteira, até TRAJECTORY_CAPACITY amostras
+    capacity = TRAJECTORY_CAPACITY if args.npz else LOCAL_TRAJECTORY_CAPACITY
+    duration, timestamps, x, y = simulate(
+        gcode, acceleration=args.acceleration, trajectory_capacity=capacity
+    )
+    minutes, seconds = divmod(duration, 60)
+    print(f"Duration: {duration:.3f} s ({int(minutes)} min {seconds:.1f} s)")
+
+    if args.npz:
+        np.savez(args.npz, timestamps_ns=timestamps, x=x, y=y)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import threading
+from time import monotonic, sleep
+
+STATUS_RATE = 30  # Hz, maximum rate of the status updates
+FULL_STATUS_INTERVAL = 5.0  # s
+
+
+class StatusBroadcaster:
+    """
+    Publishes the status when it changes, instead of polling it all the time.
+
+    notify() is called on every change. Changes that arrive together are sent
+    at most `max_rate` times a second, as `status_delta` with only the fields
+    that changed. While `is_active()` is true (the machine is moving) the status
+    is read at `max_rate`, so the position updates smoothly. A full `status`
+    is sent every `full_interval` seconds, for clients that missed a delta.
+    """
+
+    def __init__(
+        self,
+        get_status,
+        emit,
+        is_active=lambda: False,
+        max_rate=STATUS_RATE,
+        full_interval=FULL_STATUS_INTERVAL,
+    ):
+        self.get_status = get_status
+        self.emit = emit
+        self.is_active = is_active
+        self.max_rate = max_rate
+        self.full_interval = full_interval
+
+        self._changed = threading.Event()
+        self._last = {}
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def notify(self):
+        self._changed.set()
+
+    def publish(self, full=False):
+        "Reads the status and emits it whole, or only the fields that changed"
+        status = self.get_status()
+
+        if full:
+            self.emit("status", status)
+        else:
+            delta = {k: v for k, v in status.items() if self._last.get(k) != v}
+            if delta:
+                self.emit("status_delta", delta)
+
+        self._last = status
+
+    def _run(self):
+        next_full = monotonic()
+
+        while True:
+            if not self.is_active():
+                # Parado: só acorda com uma mudança ou para o status completo
+                self._changed.wait(max(0.0, next_full - monotonic()))
+            self._changed.clear()
+
+            now = monotonic()
+            full = now >= next_full
+            if full:
+                next_full = now + self.full_interval
+
+            self.publish(full)
+            sleep(1 / self.max_rate)
@@ -0,0 +1,195 @@
+import numpy as np
+
+from actuator_xrl8.clock import LATE_NS
+from actuator_xrl8.step_planner import STEP_X, STEP_Y
+
+# Buckets of the histograms: values below SUB_BUCKETS ns have their own bucket,
+# and each power of two above is split in SUB_BUCKETS, so every bucket is at most
+# 1/SUB_BUCKETS (6%) wide. Values of 2**MAX_BITS ns (18 min) and up are clamped.
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+MAX_BITS = 40
+BUCKETS = (MAX_BITS - SUB_BITS + 1) * SUB_BUCKETS
+
+# Header words
+ENABLED = 0
+LATE = 1  # Errors above this many ns are missed deadlines
+MISSED_X = 2
+MISSED_Y = 3
+SUM_X = 4
+SUM_Y = 5
+SUM_LOOP = 6
+HEADER_WORDS = 8
+
+HISTOGRAMS = ("x", "y", "loop")
+
+# Limites (le) dos buckets no formato do Prometheus
+PROMETHEUS_BUCKETS_NS = (
+    1_000,
+    2_000,
+    5_000,
+    10_000,
+    20_000,
+    50_000,
+    100_000,
+    200_000,
+    500_000,
+    1_000_000,
+    2_000_000,
+    5_000_000,
+    10_000_000,
+)
+
+
+def bucket(value: int) -> int:
+    "Index of the histogram bucket of a value in ns"
+    if value < SUB_BUCKETS:
+        return value if value > 0 else 0
+
+    shift = value.bit_length() - SUB_BITS - 1
+    return min(shift * SUB_BUCKETS + (value >> shift), BUCKETS - 1)
+
+
+def _bucket_edges():
+    "Lowest value of every bucket, and the end of the last one"
+    i = np.arange(BUCKETS + 1, dtype=np.int64)
+    shift = np.maximum(i // SUB_BUCKETS - 1, 0)
+    lower = (SUB_BUCKETS + i % SUB_BUCKETS) << shift
+    return np.where(i < SUB_BUCKETS, i, lower)
+
+
+BUCKET_EDGES = _bucket_edges()
+
+
+class StepMetrics:
+    """
+    HDR style histograms of the motion process, in a buffer shared with the web
+    side like the TrajectoryRing: the lateness of the step pulses of each axis
+    against their deadlines, and the time each iteration of the step loop takes
+    after its wait. Pulses later than `late_ns` count as missed deadlines.
+
+    Only the motion process records, and only while `enabled`, which it reads
+    once per batch of ticks.
+    """
+
+    def __init__(self, buffer=None, late_ns=LATE_NS):
+        if buffer is None:
+            buffer = bytearray(self.size())
+
+        self._buffer = memoryview(buffer)[: self.size()]
+        self._words = self._buffer.cast("q")
+        self._words[LATE] = late_ns
+
+    @staticmethod
+    def size() -> int:
+        "Bytes used by the header and the histograms"
+        return (HEADER_WORDS + len(HISTOGRAMS) * BUCKETS) * 8
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._words[ENABLED])
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._words[ENABLED] = int(enabled)
+
+    def record(self, bits, error_ns, loop_ns):
+        "Records a tick with the step `bits`, woken `error_ns` after its deadline"
+        words = self._words
+        if error_ns < 0:
+            error_ns = 0
+        i = HEADER_WORDS + bucket(error_ns)
+        missed = error_ns > words[LATE]
+
+        if bits & STEP_X:
+            words[i] += 1
+            words[SUM_X] += error_ns
+            words[MISSED_X] += missed
+        if bits & STEP_Y:
+            words[i + BUCKETS] += 1
+            words[SUM_Y] += error_ns
+            words[MISSED_Y] += missed
+
+        words[HEADER_WORDS + 2 * BUCKETS + bucket(loop_ns)] += 1
+        words[SUM_LOOP] += loop_ns
+
+    def histogram(self, name):
+        "Copy of the counts of the histogram `name` (x, y or loop), per bucket"
+        start = HEADER_WORDS + HISTOGRAMS.index(name) * BUCKETS
+        return np.frombuffer(self._buffer, np.int64, BUCKETS, start * 8).copy()
+
+    def missed(self) -> dict:
+        return {"x": self._words[MISSED_X], "y": self._words[MISSED_Y]}
+
+    def summary(self) -> dict:
+        """
+        Count and percentiles in microseconds of each histogram, and the missed
+        deadlines. The percentiles are the upper end of their bucket.
+        """
+        summary = {"enabled": self.enabled, "missed": self.missed()}
+
+        for name in HISTOGRAMS:
+            counts = self.histogram(name)
+            total = int(counts.sum())
+            summary[name] = {"count": total}
+            if not total:
+                continue
+
+            cumulative = np.cumsum(counts)
+            for q in (50, 99):
+                i = np.searchsorted(cumulative, total * q / 100)
+                summary[name][f"p{q}_us"] = int(BUCKET_EDGES[i + 1]) / 1000
+            last = np.flatnonzero(counts)[-1]
+            summary[name]["max_us"] = int(BUCKET_EDGES[last + 1]) / 1000
+
+        return summary
+
+    def prometheus(self, prefix="actuator") -> str:
+        """
+        The histograms and counters in the Prometheus text format. Each `le`
+        bucket counts the histogram buckets that end at or below it.
+        """
+        words = self._words
+        sums = {"x": words[SUM_X], "y": words[SUM_Y], "loop": words[SUM_LOOP]}
+        upper = BUCKET_EDGES[1:]
+        lines = []
+
+        def histogram(metric, name, labels):
+            counts = self.histogram(name)
+            for le in PROMETHEUS_BUCKETS_NS:
+                count = int(counts[upper <= le].sum())
+                lines.append(f'{metric}_bucket{{{labels}le="{le / 1e9:g}"}} {count}')
+            lines.append(f'{metric}_bucket{{{labels}le="+Inf"}} {counts.sum()}')
+
+            labels = f"{{{labels.rstrip(',')}}}" if labels else ""
+            lines.append(f"{metric}_sum{labels} {sums[name] / 1e9:g}")
+            lines.append(f"{metric}_count{labels} {counts.sum()}")
+
+        metric = f"{prefix}_step_error_seconds"
+        lines.append(f"# HELP {metric} Step pulse time after its deadline.")
+        lines.append(f"# TYPE {metric} histogram")
+        histogram(metric, "x", 'axis="x",')
+        histogram(metric, "y", 'axis="y",')
+
+        metric = f"{prefix}_step_loop_seconds"
+        lines.append(f"# HELP {metric} Step loop iteration time, after the wait.")
+        lines.append(f"# TYPE {metric} histogram")
+        histogram(metric, "loop", "")
+
+        metric = f"{prefix}_step_missed_deadlines_total"
+        lines.append(f"# HELP {metric} Step pulses later than {words[LATE]} ns.")
+        lines.append(f"# TYPE {metric} counter")
+        for axis, missed in self.missed().items():
+            lines.append(f'{metric}{{axis="{axis}"}} {missed}')
+
+        metric = f"{prefix}_step_metrics_enabled"
+        lines.append(f"# HELP {metric} Whether the step loop is instrumented.")
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {int(self.enabled)}")
+
+        return "\n".join(lines) + "\n"
+
+    def release(self):
+        "Releases the views of the buffer, before closing a shared memory block"
+        self._words.release()
+        self._buffer.release()
@@ -0,0 +1,237 @@
+from functools import lru_cache
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Bits of a planned tick
+STEP_X = 0b0001  # Pulse the X step pin
+STEP_Y = 0b0010  # Pulse the Y step pin
+DIR_X = 0b0100  # X moves towards positive steps
+DIR_Y = 0b1000  # Y moves towards positive steps
+STEP_MASK = STEP_X | STEP_Y
+DIR_MASK = DIR_X | DIR_Y
+
+MIN_SPEED = 0.1  # Velocidade mínima para evitar divisão por zero (steps/s)
+PLAN_CACHE = 256  # Plans kept by plan_line and plan_arc
+
+
+class StepPlan:
+    """
+    Precompiled timing of a single move.
+    `times` holds the absolute deadline of each tick in nanoseconds since the start
+    of the move, and `bits` holds which step pins to pulse and the direction of
+    each axis at that tick. Plans are cached and shared, so both are read only.
+    """
+
+    def __init__(self, times: NDArray, bits: NDArray):
+        times.setflags(write=False)
+        bits.setflags(write=False)
+        self.times = times
+        self.bits = bits
+        self._steps_x = None
+        self._steps_y = None
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def duration_ns(self) -> int:
+        return int(self.times[-1]) if len(self.times) else 0
+
+    def steps(self) -> (NDArray, NDArray):
+        "Signed steps done on each axis after every tick, as two read only arrays"
+        if self._steps_x is None:
+            sign_x = np.where(self.bits & DIR_X, 1, -1)
+            sign_y = np.where(self.bits & DIR_Y, 1, -1)
+            self._steps_x = np.cumsum(((self.bits & STEP_X) != 0) * sign_x)
+            self._steps_y = np.cumsum(((self.bits & STEP_Y) != 0) * sign_y)
+            self._steps_x.setflags(write=False)
+            self._steps_y.setflags(write=False)
+
+        return self._steps_x, self._steps_y
+
+    def displacement(self, ticks: int) -> (int, int):
+        "Returns the signed steps done on each axis after the first `ticks` ticks"
+        if ticks <= 0:
+            return 0, 0
+
+        steps_x, steps_y = self.steps()
+        ticks = min(ticks, len(self.times))
+        return int(steps_x[ticks - 1]), int(steps_y[ticks - 1])
+
+
+def tick_times(
+    lengths: NDArray,
+    feed: float,
+    acceleration: float,
+    entry_speed: float = 0,
+    exit_speed: float = 0,
+) -> NDArray:
+    """
+    Deadlines in nanoseconds of ticks that travel `lengths` steps each.
+    Trapezoidal profile: accelerates from `entry_speed`, cruises at `feed` and
+    decelerates to `exit_speed`, everything in steps/s and steps/s².
+    """
+    travelled = np.cumsum(lengths)
+    remaining = travelled[-1] - travelled + lengths
+
+    speed = np.minimum(feed, np.sqrt(entry_speed**2 + 2 * acceleration * travelled))
+    speed = np.minimum(speed, np.sqrt(exit_speed**2 + 2 * acceleration * remaining))
+    speed = np.maximum(speed, MIN_SPEED)
+
+    return np.cumsum(1e9 * lengths / speed).astype(np.int64)
+
+
+def _tick_bits(moves_x: NDArray, moves_y: NDArray) -> NDArray:
+    """
+    Packs per tick moves of -1, 0 or 1 step into STEP/DIR bits. Ticks where an axis
+    does not step keep its last direction, so the direction pins only change when
+    the axis really reverses.
+    """
+    bits = np.zeros(len(moves_x), dtype=np.uint8)
+
+    for moves, step_bit, dir_bit in (
+        (moves_x, STEP_X, DIR_X),
+        (moves_y, STEP_Y, DIR_Y),
+    ):
+        stepping = moves != 0
+        last = np.maximum.accumulate(np.where(stepping, np.arange(len(moves)), -1))
+        forward = np.where(last >= 0, moves[np.maximum(last, 0)] > 0, False)
+
+        bits |= np.where(stepping, step_bit, 0).astype(np.uint8)
+        bits |= np.where(forward, dir_bit, 0).astype(np.uint8)
+
+    return bits
+
+
+def _line_moves(steps_x: int, steps_y: int) -> (NDArray, NDArray):
+    """
+    Integer DDA. The major axis steps every tick, the minor one whenever its exact
+    position crosses half a step.
+    """
+    total_x, total_y = abs(steps_x), abs(steps_y)
+    ticks = max(total_x, total_y)
+    if ticks == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    i = np.arange(ticks + 1, dtype=np.int64)
+
+    # Posição de cada eixo após o tick i, arredondada para o passo mais próximo
+    pos_x = (2 * i * total_x + ticks) // (2 * ticks)
+    pos_y = (2 * i * total_y + ticks) // (2 * ticks)
+
+    return np.diff(pos_x) * np.sign(steps_x), np.diff(pos_y) * np.sign(steps_y)
+
+
+@lru_cache(maxsize=PLAN_CACHE)
+def plan_line(
+    steps_x: int,
+    steps_y: int,
+    feed: float,
+    acceleration: float,
+    entry_speed: float = 0,
+    exit_speed: float = 0,
+) -> StepPlan:
+    """
+    Plans a straight move of `steps_x` and `steps_y` signed steps with both axes
+    stepped from the same tick clock, at `feed` steps/s along the path.
+    Repeated moves, like the lines of a raster scan, reuse the cached plan.
+    """
+    if steps_x == 0 and steps_y == 0:
+        return StepPlan(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint8))
+
+    moves_x, moves_y = _line_moves(steps_x, steps_y)
+    lengths = np.full(len(moves_x), math.hypot(steps_x, steps_y) / len(moves_x))
+
+    times = tick_times(lengths, feed, acceleration, entry_speed, exit_speed)
+    return StepPlan(times, _tick_bits(moves_x, moves_y))
+
+
+def _arc_moves(x, y, end_x, end_y, counterclockwise, arc_length):
+    """
+    Integer midpoint circle stepping around the origin, from (x, y) to (end_x, end_y).
+    Each tick takes the move along the tangent (one axis or both) that keeps
+    x² + y² closest to r².
+    """
+    r2 = (x * x + y * y + end_x * end_x + end_y * end_y) // 2
+    error = x * x + y * y - r2
+
+    # Cada tick anda entre 1 e √2 passos, então o fim só pode chegar depois disso
+    min_ticks = int(arc_length / math.sqrt(2)) - 1
+    max_ticks = int(2 * arc_length) + 4
+
+    moves_x = []
+    moves_y = []
+
+    for tick in range(max_ticks):
+        if tick >= min_ticks and abs(end_x - x) <= 1 and abs(end_y - y) <= 1:
+            break
+
+        tangent_x, tangent_y = (-y, x) if counterclockwise else (y, -x)
+        sx = (tangent_x > 0) - (tangent_x < 0)
+        sy = (tangent_y > 0) - (tangent_y < 0)
+
+        # No topo da curva um dos eixos precisa voltar para dentro do círculo
+        if sx == 0:
+            candidates = ((0, sy), (-1 if x > 0 else 1, sy))
+        elif sy == 0:
+            candidates = ((sx, 0), (sx, -1 if y > 0 else 1))
+        else:
+            candidates = ((sx, 0), (0, sy), (sx, sy))
+
+        best = None
+        for mx, my in candidates:
+            e = error + 2 * mx * x + mx * mx + 2 * my * y + my * my
+            if best is None or abs(e) < abs(best[2]):
+                best = (mx, my, e)
+
+        mx, my, error = best
+        x += mx
+        y += my
+        moves_x.append(mx)
+        moves_y.append(my)
+
+    # Fecha no ponto final exato
+    rest_x, rest_y = _line_moves(end_x - x, end_y - y)
+    moves_x.extend(rest_x.tolist())
+    moves_y.extend(rest_y.tolist())
+
+    return np.array(moves_x, dtype=np.int64), np.array(moves_y, dtype=np.int64)
+
+
+@lru_cache(maxsize=PLAN_CACHE)
+def plan_arc(
+    steps_x: int,
+    steps_y: int,
+    center_x: float,
+    center_y: float,
+    counterclockwise: bool,
+    feed: float,
+    acceleration: float,
+    entry_speed: float = 0,
+    exit_speed: float = 0,
+) -> StepPlan:
+    """
+    Plans an arc to `steps_x`, `steps_y` around the center `center_x`, `center_y`,
+    all relative to the current position in steps, at `feed` steps/s along the path.
+    """
+    if steps_x == 0 and steps_y == 0:
+        return StepPlan(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint8))
+
+    cx, cy = round(center_x), round(center_y)
+    x, y = -cx, -cy
+    end_x, end_y = steps_x - cx, steps_y - cy
+
+    sweep = math.atan2(end_y, end_x) - math.atan2(y, x)
+    if counterclockwise and sweep < 0:
+        sweep += 2 * math.pi
+    elif not counterclockwise and sweep > 0:
+        sweep -= 2 * math.pi
+    arc_length = abs(sweep) * math.hypot(x, y)
+
+    moves_x, moves_y = _arc_moves(x, y, end_x, end_y, counterclockwise, arc_length)
+    lengths = np.hypot(moves_x, moves_y)
+
+    times = tick_times(lengths, feed, acceleration, entry_speed, exit_speed)
+    return StepPlan(times, _tick_bits(moves_x, moves_y))
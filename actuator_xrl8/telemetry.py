@@ -0,0 +1,108 @@
+import struct
+import threading
+from time import sleep
+
+import numpy as np
+
+TELEMETRY_ROOM = "telemetry"
+TELEMETRY_RATE = 250  # Hz, position samples sent
+TELEMETRY_BATCH_RATE = 15  # Hz, frames sent
+
+# Frame: header, then uint32 microseconds since base_ns, int32 x and int32 y steps,
+# each as a column of `count` values. mm = steps / steps_per_mm
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<BxHqf")  # version, count, base_ns, steps_per_mm
+
+
+def pack_frame(timestamps, x, y, steps_per_mm) -> bytes:
+    base = int(timestamps[0])
+    header = FRAME_HEADER.pack(FRAME_VERSION, len(timestamps), base, steps_per_mm)
+
+    return b"".join(
+        (
+            header,
+            ((timestamps - base) // 1000).astype("<u4").tobytes(),
+            np.asarray(x).astype("<i4").tobytes(),
+            np.asarray(y).astype("<i4").tobytes(),
+        )
+    )
+
+
+def unpack_frame(frame: bytes):
+    "Returns (timestamps_ns, x, y, steps_per_mm) of a frame made by pack_frame"
+    version, count, base, steps_per_mm = FRAME_HEADER.unpack_from(frame)
+    if version != FRAME_VERSION:
+        raise ValueError(f"unknown telemetry frame version {version}")
+
+    columns = np.frombuffer(frame, "<i4", 3 * count, FRAME_HEADER.size)
+    timestamps = base + columns[:count].view("<u4").astype(np.int64) * 1000
+    return timestamps, columns[count : 2 * count], columns[2 * count :], steps_per_mm
+
+
+class TelemetryChannel:
+    """
+    Position samples of a TrajectoryRing sent as binary frames (see pack_frame)
+    to the clients that subscribed. The samples are thinned to `rate` per second
+    and sent `batch_rate` times a second. Without subscribers the worker waits
+    and nothing is read.
+    """
+
+    def __init__(
+        self,
+        trajectory,
+        emit,
+        steps_per_mm,
+        rate=TELEMETRY_RATE,
+        batch_rate=TELEMETRY_BATCH_RATE,
+    ):
+        self.trajectory = trajectory
+        self.emit = emit
+        self.steps_per_mm = steps_per_mm
+        self.rate = rate
+        self.batch_rate = batch_rate
+
+        self._subscribers = set()
+        self._active = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def subscribe(self, sid):
+        with self._lock:
+            self._subscribers.add(sid)
+            self._active.set()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self, sid):
+        with self._lock:
+            self._subscribers.discard(sid)
+            if not self._subscribers:
+                self._active.clear()
+
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def _run(self):
+        period = 1_000_000_000 // self.rate
+
+        while True:
+            self._active.wait()
+            # Só manda o que foi gravado depois da inscrição
+            start = self.trajectory.count()
+
+            while self._active.is_set():
+                sleep(1 / self.batch_rate)
+
+                end = self.trajectory.count()
+                timestamps, x, y = self.trajectory.samples(start, end)
+                start = end
+                if not len(timestamps):
+                    continue
+
+                # Primeira amostra de cada período
+                _, keep = np.unique(timestamps // period, return_index=True)
+                self.emit(
+                    pack_frame(timestamps[keep], x[keep], y[keep], self.steps_per_mm)
+                )
@@ -0,0 +1,121 @@
+from time import perf_counter_ns
+
+import numpy as np
+
+from actuator_xrl8.gcode_interpreter import OPCODES
+
+SPAN_CAPACITY = 1 << 16  # Spans kept, the oldest are overwritten
+
+# Uma linha por comando executado, tempos em ns de perf_counter_ns
+SPAN_DTYPE = np.dtype(
+    [
+        ("op", np.uint8),
+        ("line", np.uint32),
+        ("start_ns", np.int64),
+        ("duration_ns", np.int64),  # Tempo real do comando
+        ("planned_ns", np.int64),  # Duração planejada dos movimentos ou da pausa
+        ("wait_ns", np.int64),  # Parte do tempo real esperando o movimento
+    ]
+)
+
+
+class Timeline:
+    """
+    Span of every command executed by a GcodeInterpreter, kept in a preallocated
+    structured array of `capacity` rows. The time of a command not spent waiting
+    is planning and the interpreter itself.
+    """
+
+    def __init__(self, capacity=SPAN_CAPACITY):
+        self.capacity = capacity
+        self._spans = np.zeros(capacity, dtype=SPAN_DTYPE)
+        self._count = 0
+        self.origin_ns = perf_counter_ns()
+
+    def record(self, op, line, start_ns, duration_ns, planned_ns, wait_ns):
+        self._spans[self._count % self.capacity] = (
+            op,
+            line,
+            start_ns,
+            duration_ns,
+            planned_ns,
+            wait_ns,
+        )
+        self._count += 1
+
+    def clear(self):
+        self._count = 0
+        self.origin_ns = perf_counter_ns()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def spans(self):
+        "Copy of the spans kept, oldest first"
+        i = np.arange(self._count - len(self), self._count) % self.capacity
+        return self._spans[i]
+
+    def summary(self) -> dict:
+        "Per command: how many ran and their total real, planned and waited seconds"
+        spans = self.spans()
+        summary = {}
+
+        for op in np.unique(spans["op"]).tolist():
+            mine = spans[spans["op"] == op]
+            summary[OPCODES[op]] = {
+                "count": len(mine),
+                "duration_s": int(mine["duration_ns"].sum()) / 1e9,
+                "planned_s": int(mine["planned_ns"].sum()) / 1e9,
+                "wait_s": int(mine["wait_ns"].sum()) / 1e9,
+            }
+
+        return summary
+
+    def chrome_trace(self) -> dict:
+        """
+        The spans in the Chrome trace event format, to open in chrome://tracing or
+        Perfetto. The wait of each command is drawn inside it, at its end, since
+        a command waits for the previous movement after planning its own.
+        """
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "interpreter"},
+            }
+        ]
+
+        for op, line, start, duration, planned, wait in self.spans().tolist():
+            ts = (start - self.origin_ns) / 1000
+            events.append(
+                {
+                    "name": OPCODES[op],
+                    "cat": "command",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": 1,
+                    "ts": ts,
+                    "dur": duration / 1000,
+                    "args": {
+                        "line": line,
+                        "planned_ms": planned / 1e6,
+                        "wait_ms": wait / 1e6,
+                    },
+                }
+            )
+            if wait:
+                events.append(
+                    {
+                        "name": "wait",
+                        "cat": "wait",
+                        "ph": "X",
+                        "pid": 1,
+                        "tid": 1,
+                        "ts": ts + (duration - wait) / 1000,
+                        "dur": wait / 1000,
+                    }
+                )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
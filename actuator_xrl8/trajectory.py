@@ -0,0 +1,107 @@
+import numpy as np
+
+TRAJECTORY_CAPACITY = 1 << 20  # samples, about 17 min at the default interval
+RECORD_INTERVAL_NS = 1_000_000  # 0 records every step
+
+# Header words
+COUNT = 0  # Samples recorded since the start, written only by the recorder
+INTERVAL = 1  # Minimum time between samples, in ns
+EPOCH_OFFSET = 2  # Added to the timestamps to get time_ns() values
+HEADER_WORDS = 4
+
+
+class TrajectoryRing:
+    """
+    Preallocated ring of (timestamp_ns, x_steps, y_steps) samples, with a single
+    recorder and any number of readers. When it is full the oldest samples are
+    overwritten, so the memory used does not grow with the length of the runs.
+
+    With `buffer` the ring lives there, like in a SharedMemory block, so the
+    motion process can record while the web side reads.
+    """
+
+    def __init__(self, capacity=TRAJECTORY_CAPACITY, buffer=None):
+        if buffer is None:
+            buffer = bytearray(self.size(capacity))
+
+        self.capacity = capacity
+        self._buffer = memoryview(buffer)[: self.size(capacity)]
+        self._words = self._buffer.cast("q")
+
+        words = np.frombuffer(self._buffer, np.int64)
+        start = HEADER_WORDS
+        self._timestamps = words[start : start + capacity]
+        self._x = words[start + capacity : start + 2 * capacity]
+        self._y = words[start + 2 * capacity :]
+
+    @staticmethod
+    def size(capacity) -> int:
+        "Bytes used by a ring of `capacity` samples"
+        return (HEADER_WORDS + 3 * capacity) * 8
+
+    @property
+    def interval_ns(self) -> int:
+        return self._words[INTERVAL]
+
+    @interval_ns.setter
+    def interval_ns(self, interval_ns):
+        self._words[INTERVAL] = interval_ns
+
+    @property
+    def epoch_offset(self) -> int:
+        return self._words[EPOCH_OFFSET]
+
+    @epoch_offset.setter
+    def epoch_offset(self, offset):
+        self._words[EPOCH_OFFSET] = offset
+
+    def record(self, timestamp_ns, x, y):
+        words = self._words
+        n = words[COUNT]
+        i = HEADER_WORDS + n % self.capacity
+
+        words[i] = timestamp_ns
+        words[i + self.capacity] = x
+        words[i + 2 * self.capacity] = y
+
+        # Publica a amostra só depois de escrita
+        words[COUNT] = n + 1
+
+    def extend(self, timestamps, x, y):
+        "Records many samples at once, like calling record() for each of them"
+        words = self._words
+        n = words[COUNT]
+        total = len(timestamps)
+
+        # Só as últimas `capacity` amostras cabem
+        skip = max(0, total - self.capacity)
+        i = (n + np.arange(skip, total)) % self.capacity
+        self._timestamps[i] = timestamps[skip:]
+        self._x[i] = x[skip:]
+        self._y[i] = y[skip:]
+
+        words[COUNT] = n + total
+
+    def count(self) -> int:
+        "Number of samples recorded so far, including the overwritten ones"
+        return self._words[COUNT]
+
+    def samples(self, start=0, end=None):
+        """
+        Copies of the samples recorded from the count `start` up to `end` (by
+        default all of them), as the arrays (timestamps_ns, x_steps, y_steps).
+        Samples already overwritten are lost.
+        """
+        if end is None:
+            end = self.count()
+        start = max(start, end - self.capacity, 0)
+        i = np.arange(start, end) % self.capacity
+
+        timestamps = self._timestamps[i] + self.epoch_offset
+        return timestamps, self._x[i], self._y[i]
+
+    def release(self):
+        "Releases the views of the buffer, before closing a shared memory block"
+        self._timestamps = self._x = self._y = None
+        self._words.release()
+        self._buffer.release()
@@ -1,61 +1,233 @@
+from concurrent.futures import Future, TimeoutError
+import queue
+import socket
+import threading
+from time import monotonic, perf_counter
+from urllib.parse import quote, urlsplit
+
 import requests
+from requests.adapters import HTTPAdapter
+
+TIMEOUT = 3  # s
+WAIT_TIMEOUT = 2 * TIMEOUT  # s, a waited command may be queued behind another
+RESOLVE_TTL = 60  # s, how long a resolved address is used before resolving again
+HEALTH_INTERVAL = 5  # s
+
 
 class EncoderApi:
+    """
+    Client of the virtual encoder. Commands go through a queue to a worker thread
+    that sends them in order over a keep-alive session, so a slow or unreachable
+    encoder does not hold the caller.
+
+    Every command returns a Future with true if the encoder accepted it, or waits
+    for it and returns that bool when called with `wait=True`. A command not
+    answered in WAIT_TIMEOUT seconds counts as failed for who waits.
+
+    The address of `host` (an mDNS name, maybe with a port) is resolved once and
+    reused for RESOLVE_TTL seconds. start_monitor() refreshes it in background
+    and probes the encoder, so commands do not wait for name resolution.
+    """
+
     def __init__(self, host):
-        self.host = host
-        
-    def start_acquisition(self, pulses_per_second: int, reason: str):
+        self._host = host
+        self._address = None  # (ip, port, resolved_at)
+        self._resolve_lock = threading.Lock()
+
+        # Último resultado do monitor
+        self.health = {"reachable": None, "rtt_ms": None, "address": None}
+        self._monitor_wake = threading.Event()
+        self._monitor_thread = None
+
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._worker_thread = None
+
+    @property
+    def host(self):
+        return self._host
+
+    @host.setter
+    def host(self, host):
+        with self._resolve_lock:
+            self._host = host
+            self._address = None
+        self._monitor_wake.set()
+
+    def resolve(self, max_age=RESOLVE_TTL):
+        """
+        Returns the (ip, port) of the host, resolving it again if the cached one
+        is older than `max_age`. Returns None if it can not be resolved.
+        """
+        with self._resolve_lock:
+            host = self._host
+            address = self._address
+
+        if address is not None and monotonic() - address[2] < max_age:
+            return address[:2]
+
+        try:
+            url = urlsplit(f"//{host}")
+            port = url.port or 80
+            info = socket.getaddrinfo(url.hostname, port, type=socket.SOCK_STREAM)
+        except (OSError, ValueError):
+            # O monitor mostra o encoder como offline
+            return None
+
+        ip = info[0][4][0]
+        with self._resolve_lock:
+            if self._host == host:
+                self._address = (ip, port, monotonic())
+
+        return ip, port
+
+    def start_monitor(self, on_health=None, interval=HEALTH_INTERVAL):
+        """
+        Resolves the host and probes the encoder every `interval` seconds from a
+        background thread. on_health(health) is called after each probe.
+        """
+        if self._monitor_thread is None:
+            self._monitor_thread = threading.Thread(
+                target=self._monitor, args=(on_health, interval), daemon=True
+            )
+            self._monitor_thread.start()
+
+    def probe(self) -> dict:
+        "Resolves the host and measures the time to open a TCP connection to it"
+        # Renova o endereço um pouco antes de expirar, para os comandos não esperarem
+        address = self.resolve(RESOLVE_TTL - 2 * HEALTH_INTERVAL)
+        health = {"reachable": False, "rtt_ms": None, "address": None}
+
+        if address is not None:
+            health["address"] = address[0]
+            start = perf_counter()
+            try:
+                socket.create_connection(address, timeout=TIMEOUT).close()
+                health["reachable"] = True
+                health["rtt_ms"] = (perf_counter() - start) * 1000
+            except OSError:
+                pass
+
+        self.health = health
+        return health
+
+    def _monitor(self, on_health, interval):
+        while True:
+            health = self.probe()
+            if on_health is not None:
+                on_health(health)
+
+            self._monitor_wake.wait(interval)
+            self._monitor_wake.clear()
+
+    def _url(self, path):
+        address = self.resolve()
+        if address is None:
+            # Deixa o requests tentar, e contar a falha
+            return f"http://{self._host}/{path}"
+
+        ip, port = address
+        ip = f"[{ip}]" if ":" in ip else ip
+        return f"http://{ip}:{port}/{path}"
+
+    def start_acquisition(self, pulses_per_second: int, reason: str, wait=False):
         """
         If in the ModoOdometro or in the ModoTempo at the Ready state, starts an aquisition.
         pulses_per_second must be an integer, reason must be an UTF-8 encoded string.
         ModoOdometro ignores the parameter pulses_per_second.
         """
-        try:
-            requests.post(f"http://{self.host}/start_acquisition/{pulses_per_second}/{reason}", timeout=3)
-            return True
-        except requests.RequestException:
-            return False
-
+        path = f"start_acquisition/{pulses_per_second}/{quote(reason, safe='')}"
+        return self._send("start_acquisition", path, wait)
 
-    def stop_acquisition(self):
+    def stop_acquisition(self, wait=False):
         """
         If in the ModoOdometro or in the ModoTempo at the Aquisição state, stops and saves an aquisition.
         """
-        try:
-            requests.post(f"http://{self.host}/stop_acquisition", timeout=3)
-            return True
-        except requests.RequestException:
-            return False
-
+        return self._send("stop_acquisition", "stop_acquisition", wait)
 
-    def start_stream(self):
+    def start_stream(self, wait=False):
         """
         Starts the video stream.
         """
-        try:
-            requests.post(f"http://{self.host}/start_stream", timeout=3)
-            return True
-        except requests.RequestException:
-            return False
+        return self._send("start_stream", "start_stream", wait)
 
-
-    def stop_stream(self):
+    def stop_stream(self, wait=False):
         """
         Stops the video stream.
         """
-        try:
-            requests.post(f"http://{self.host}/stop_stream", timeout=3)
-            return True
-        except requests.RequestException:
-            return False
+        return self._send("stop_stream", "stop_stream", wait)
 
-
-    def set_exposure(self, value: int):
+    def set_exposure(self, value: int, wait=False):
         """
         Sets the camera exposure. Value must be an integer in microseconds.
         """
+        return self._send("set_exposure", f"set_exposure/{value}", wait)
+
+    def stats(self) -> dict:
+        """
+        Per command: how many were sent and failed, and the latency in ms (mean
+        and maximum), measured from the moment the command was queued.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        return {
+            name: {
+                "sent": sent,
+                "failed": failed,
+                "mean_latency_ms": latency_sum / sent * 1000 if sent else 0.0,
+                "max_latency_ms": latency_max * 1000,
+            }
+            for name, (sent, failed, latency_sum, latency_max) in stats.items()
+        }
+
+    def pending(self) -> int:
+        "Commands queued and not sent yet"
+        return self._queue.qsize()
+
+    def _send(self, name, path, wait):
+        # A thread só é criada no primeiro comando
+        with self._stats_lock:
+            if self._worker_thread is None:
+                self._worker_thread = threading.Thread(target=self._worker, daemon=True)
+                self._worker_thread.start()
+
+        future = Future()
+        self._queue.put((name, path, perf_counter(), future))
+        if not wait:
+            return future
+
         try:
-            requests.post(f"http://{self.host}/set_exposure/{value}", timeout=3)
-            return True
-        except requests.RequestException:
+            return future.result(timeout=WAIT_TIMEOUT)
+        except TimeoutError:
+            print(f"Encoder command {name} timed out")
             return False
+
+    def _worker(self):
+        while True:
+            name, path, queued_at, future = self._queue.get()
+
+            try:
+                url = self._url(path)
+                headers = {"Host": self._host}
+                ok = self.session.post(url, headers=headers, timeout=TIMEOUT).ok
+            except requests.RequestException as e:
+                print(f"Encoder command {name} failed: {e}")
+                ok = False
+
+            self._record(name, ok, perf_counter() - queued_at)
+            future.set_result(ok)
+
+    def _record(self, name, ok, latency):
+        with self._stats_lock:
+            sent, failed, latency_sum, latency_max = self._stats.get(name, (0, 0, 0, 0))
+            self._stats[name] = (
+                sent + 1,
+                failed + (not ok),
+                latency_sum + latency,
+                max(latency_max, latency),
+            )
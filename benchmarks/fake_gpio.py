@@ -0,0 +1,77 @@
+"""
+Stand-in for RPi.GPIO, so the motion code runs on a machine without the Pi pins.
+
+install() puts it in sys.modules as RPi.GPIO, before actuator_xrl8.motor is
+imported. Outputs keep the last level written and inputs read LOW, so the
+endstops are never pressed. `calls` counts the output and input calls.
+"""
+
+import sys
+import types
+
+BCM = 11
+BOARD = 10
+OUT = 0
+IN = 1
+LOW = 0
+HIGH = 1
+PUD_OFF = 20
+PUD_DOWN = 21
+PUD_UP = 22
+RISING = 31
+FALLING = 32
+BOTH = 33
+
+levels = {}
+calls = 0
+
+
+def setwarnings(flag):
+    pass
+
+
+def setmode(mode):
+    pass
+
+
+def cleanup(*channels):
+    levels.clear()
+
+
+def setup(channel, direction, pull_up_down=PUD_OFF, initial=LOW):
+    levels.setdefault(channel, initial)
+
+
+def output(channels, values):
+    global calls
+    calls += 1
+
+    if not isinstance(channels, (list, tuple)):
+        channels = (channels,)
+    if not isinstance(values, (list, tuple)):
+        values = (values,) * len(channels)
+
+    for channel, value in zip(channels, values):
+        levels[channel] = int(value)
+
+
+def input(channel):
+    global calls
+    calls += 1
+    return levels.get(channel, LOW)
+
+
+def add_event_detect(channel, edge, callback=None, bouncetime=None):
+    pass
+
+
+def remove_event_detect(channel):
+    pass
+
+
+def install():
+    "Makes `import RPi.GPIO` return this module"
+    package = types.ModuleType("RPi")
+    package.GPIO = sys.modules[__name__]
+    sys.modules["RPi"] = package
+    sys.modules["RPi.GPIO"] = package.GPIO
@@ -0,0 +1,381 @@
+"""
+Microbenchmarks of the motion core, run against a fake RPi.GPIO so they work on
+any Linux machine:
+
+    step_rate  highest step rate the motion process keeps up with
+    jitter     lateness of the step pulses in the motion process, as percentiles
+    arcs       cost of planning g2/g3 arcs
+    parse      tokenizer and compiler throughput, 1k to 1M lines
+    status     cost of reading and publishing the status, per broadcast tick
+    metrics    cost per tick of the step loop instrumentation
+
+    python benchmarks/motion.py --output motion.json
+    python benchmarks/motion.py --quick --only arcs parse
+
+The result is printed as JSON, to compare between releases. On the Pi use
+--real-gpio to drive the real pins, with the motors disconnected.
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from time import perf_counter, sleep
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Antes de importar o actuator_xrl8.motor. O processo de movimentação (spawn)
+# importa este módulo de novo, com os mesmos argumentos
+if "--real-gpio" not in sys.argv:
+    import fake_gpio
+
+    fake_gpio.install()
+
+STEP_RATES = (1_000, 2_000, 5_000, 10_000, 20_000, 50_000, 100_000, 200_000)
+STEP_RATE_DURATION = 0.25  # s of steps at each rate
+KEEP_UP_MARGIN = 0.05  # a sustained move takes at most 5% longer than planned
+JITTER_RATES = (1_000, 5_000, 20_000)
+JITTER_STEPS = 20_000
+ARC_RADII = (1, 10, 100)  # mm
+PARSE_LINES = (1_000, 10_000, 100_000, 1_000_000)
+QUICK_PARSE_LINES = 100_000
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _per_call(function, min_time=0.2) -> float:
+    "Seconds per call of function(), repeated for at least `min_time`"
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(3, number)) / number
+
+
+def bench_step_rate(quick=False) -> dict:
+    """
+    Runs constant speed moves through MotorGcodeMachine.move, the path of every
+    movement, at increasing step rates. A rate is sustained when the move takes
+    at most KEEP_UP_MARGIN longer than planned, so the motion process keeps up
+    with the pulses. Pulses later than the clock's late threshold are counted.
+    """
+    from actuator_xrl8.motor import MotorGcodeMachine, STEPS_PER_MM
+
+    duration = STEP_RATE_DURATION / 2 if quick else STEP_RATE_DURATION
+    machine = MotorGcodeMachine(acceleration=1e9, motion_core=None)
+    rates = []
+    sustained = 0
+
+    try:
+        for rate in STEP_RATES:
+            steps = int(rate * duration)
+            speed = rate / STEPS_PER_MM
+            machine.move(speed, 0, 0, 0)
+
+            # O processo publica as estatísticas depois de cada lote de ticks
+            sleep(0.01)
+            before = machine.motion.timing()
+
+            start = perf_counter()
+            machine.move(speed, steps / STEPS_PER_MM, 0, 0)
+            elapsed = perf_counter() - start
+
+            sleep(0.01)
+            waits, error_sum, _, late = (
+                after - previous
+                for after, previous in zip(machine.motion.timing(), before)
+            )
+
+            planned = steps / rate
+            keeps_up = elapsed <= planned * (1 + KEEP_UP_MARGIN)
+            # Só conta enquanto todas as taxas menores também foram sustentadas
+            if keeps_up and all(r["sustained"] for r in rates):
+                sustained = rate
+            rates.append(
+                {
+                    "rate_hz": rate,
+                    "steps": steps,
+                    "planned_s": planned,
+                    "wall_s": elapsed,
+                    "mean_error_us": error_sum / waits / 1000 if waits else 0.0,
+                    "late_fraction": late / waits if waits else 0.0,
+                    "sustained": keeps_up,
+                }
+            )
+    finally:
+        machine.cleanup()
+
+    return {"max_sustained_rate_hz": sustained, "rates": rates}
+
+
+def _fake_backend():
+    "Backend of the motion process in bench_jitter, built after the spawn"
+    from actuator_xrl8.clock import HybridClock
+    from actuator_xrl8.pin_driver import FakePinDriver, PinStepBackend
+
+    step_pins, dir_pins = (0, 1), (2, 3)
+    clock = HybridClock()
+    driver = FakePinDriver(step_pins + dir_pins, clock)
+    return PinStepBackend(driver, step_pins, dir_pins, lambda: 0, clock)
+
+
+def bench_jitter(quick=False) -> dict:
+    """
+    Plays constant rate plans through a MotionProcess with its StepMetrics
+    enabled, and reports the lateness of the X step pulses against their
+    deadlines as percentiles. Percentiles are the upper end of their histogram
+    bucket, at most 6% above the real value.
+    """
+    from actuator_xrl8.motion_process import MotionProcess
+    from actuator_xrl8.step_metrics import BUCKET_EDGES
+    from actuator_xrl8.step_planner import plan_line
+
+    steps = JITTER_STEPS // 4 if quick else JITTER_STEPS
+    motion = MotionProcess(_fake_backend, trajectory_capacity=1, metrics=True)
+    results = []
+
+    try:
+        # O primeiro movimento paga a partida do processo e fica fora da medida
+        motion.wait(motion.enqueue(plan_line(100, 0, 10_000, math.inf)))
+
+        for rate in JITTER_RATES:
+            before = motion.metrics.histogram("x")
+            motion.wait(motion.enqueue(plan_line(steps, 0, rate, math.inf, rate, rate)))
+            counts = motion.metrics.histogram("x") - before
+
+            cumulative = np.cumsum(counts)
+            upper = BUCKET_EDGES[1:] / 1000
+
+            def percentile(q):
+                return float(upper[np.searchsorted(cumulative, cumulative[-1] * q)])
+
+            results.append(
+                {
+                    "rate_hz": rate,
+                    "steps": int(cumulative[-1]),
+                    **{f"p{p}_us": percentile(p / 100) for p in PERCENTILES},
+                    "max_us": float(upper[np.flatnonzero(counts)[-1]]),
+                }
+            )
+    finally:
+        motion.close()
+
+    return {"rates": results}
+
+
+def bench_arcs(quick=False) -> dict:
+    """
+    Half circles planned by plan_arc and sampled by arc_points, with their caches
+    bypassed so every call does the whole work.
+    """
+    from actuator_xrl8.arc import arc_points
+    from actuator_xrl8.motor import STEPS_PER_MM
+    from actuator_xrl8.step_planner import plan_arc
+
+    min_time = 0.05 if quick else 0.2
+    results = []
+
+    for radius in ARC_RADII:
+        r = radius * STEPS_PER_MM
+        feed, acceleration = 50 * STEPS_PER_MM, 1000 * STEPS_PER_MM
+        plan = plan_arc.__wrapped__(2 * r, 0, r, 0, True, feed, acceleration)
+
+        plan_s = _per_call(
+            lambda: plan_arc.__wrapped__(2 * r, 0, r, 0, True, feed, acceleration),
+            min_time,
+        )
+        points_s = _per_call(
+            lambda: arc_points.__wrapped__(0, 0, 2 * radius, 0, radius, True),
+            min_time,
+        )
+        results.append(
+            {
+                "radius_mm": radius,
+                "steps": len(plan),
+                "plan_us": plan_s * 1e6,
+                "plan_ns_per_step": plan_s * 1e9 / len(plan),
+                "points_us": points_s * 1e6,
+            }
+        )
+
+    return {"radii": results}
+
+
+def _program(lines) -> str:
+    "G-code with a mix of the motion commands, `lines` lines long"
+    body = (
+        "G90\n",
+        "G0 X10 Y10\n",
+        "G1 X20.5 Y10 S30\n",
+        "G2 X30.5 Y10 S30 R5\n",
+        "G3 X20.5 Y10 S30 R5\n",
+        "G4 P10\n",
+        "G1 X10 Y10 S30 ; volta\n",
+    )
+    return "".join(body[i % len(body)] for i in range(lines))
+
+
+def bench_parse(quick=False) -> dict:
+    """
+    Lines per second of the tokenizer alone (Lexer) and of the whole compilation
+    (GcodeInterpreter._parse) of programs of increasing size.
+    """
+    from actuator_xrl8.gcode_interpreter import GcodeInterpreter, tokenize
+    from actuator_xrl8.gcode_machine import NullGcodeMachine
+
+    machine = NullGcodeMachine(trajectory_capacity=1)
+    results = []
+
+    for lines in PARSE_LINES:
+        if quick and lines > QUICK_PARSE_LINES:
+            continue
+        source = _program(lines)
+
+        start = perf_counter()
+        for _ in tokenize(io.StringIO(source)):
+            pass
+        tokenize_s = perf_counter() - start
+
+        start = perf_counter()
+        GcodeInterpreter(source, machine)
+        parse_s = perf_counter() - start
+
+        results.append(
+            {
+                "lines": lines,
+                "tokenize_s": tokenize_s,
+                "tokenize_lines_per_s": lines / tokenize_s,
+                "parse_s": parse_s,
+                "parse_lines_per_s": lines / parse_s,
+            }
+        )
+
+    return {"programs": results}
+
+
+def bench_metrics(quick=False) -> dict:
+    "Cost per tick of recording in StepMetrics, paid only while it is enabled"
+    from actuator_xrl8.step_metrics import StepMetrics
+    from actuator_xrl8.step_planner import STEP_X, STEP_Y
+
+    metrics = StepMetrics()
+    record_s = _per_call(
+        lambda: metrics.record(STEP_X | STEP_Y, 1234, 5678), 0.05 if quick else 0.2
+    )
+    return {"record_us": record_s * 1e6}
+
+
+class _JsonEmitter:
+    "Stands in for the Socket.IO server, encoding the events like it would"
+
+    def __init__(self):
+        self.events = 0
+
+    def emit(self, event, data=None, **kwargs):
+        json.dumps(data)
+        self.events += 1
+
+
+def bench_status(quick=False) -> dict:
+    """
+    Cost of ActuatorApp.get_status, and of one tick of the StatusBroadcaster with
+    and without changes, including the JSON encoding of what is emitted. The CPU
+    share is the cost of a tick times STATUS_RATE.
+    """
+    from actuator_xrl8.actuator_app import ActuatorApp
+    from actuator_xrl8.status import STATUS_RATE
+
+    min_time = 0.05 if quick else 0.2
+    app = ActuatorApp()
+    app.ws = _JsonEmitter()
+    broadcaster = app.status_broadcaster
+
+    try:
+        get_status_s = _per_call(app.get_status, min_time)
+
+        broadcaster.publish()
+        unchanged_s = _per_call(broadcaster.publish, min_time)
+
+        def changed():
+            broadcaster._last = {}
+            broadcaster.publish()
+
+        changed_s = _per_call(changed, min_time)
+        full_s = _per_call(lambda: broadcaster.publish(full=True), min_time)
+    finally:
+        app.machine.cleanup()
+
+    return {
+        "status_rate_hz": STATUS_RATE,
+        "get_status_us": get_status_s * 1e6,
+        "tick_unchanged_us": unchanged_s * 1e6,
+        "tick_changed_us": changed_s * 1e6,
+        "tick_full_us": full_s * 1e6,
+        "cpu_share_changed": changed_s * STATUS_RATE,
+    }
+
+
+BENCHMARKS = {
+    "step_rate": bench_step_rate,
+    "jitter": bench_jitter,
+    "arcs": bench_arcs,
+    "parse": bench_parse,
+    "status": bench_status,
+    "metrics": bench_metrics,
+}
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+
+    return {
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "system": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, metavar="NAME")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads")
+    parser.add_argument("--real-gpio", action="store_true", help="use RPi.GPIO")
+    parser.add_argument("--output", help="write the JSON to this file")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        print(f"running {name}...", file=sys.stderr)
+        results[name] = BENCHMARKS[name](args.quick)
+
+    report = json.dumps(
+        {"environment": environment(), "quick": args.quick, "results": results},
+        indent=2,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Time to first request: starts main.py and measures how long it takes until the
+server answers an HTTP request, over several runs.
+
+    python benchmarks/startup.py --runs 5
+
+Run it on the Pi with the service stopped, since it uses the same port.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+URL = "http://127.0.0.1:8080/socket.io/?EIO=4&transport=polling"
+
+
+def time_to_first_request(timeout=60.0, poll=0.01) -> float:
+    "Seconds between starting main.py and its first HTTP answer"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py")],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"main.py exited with code {process.returncode}")
+
+            try:
+                urllib.request.urlopen(URL, timeout=1).read()
+                return time.perf_counter() - start
+            except urllib.error.HTTPError:
+                # Qualquer resposta HTTP quer dizer que o servidor já atende
+                return time.perf_counter() - start
+            except OSError:
+                time.sleep(poll)
+
+        raise TimeoutError(f"no answer after {timeout} s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    times = []
+    for i in range(args.runs):
+        times.append(time_to_first_request())
+        if not args.json:
+            print(f"run {i + 1}: {times[-1]:.3f} s")
+
+    result = {
+        "runs": args.runs,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "max_s": max(times),
+    }
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(
+            f"time to first request: median {result['median_s']:.3f} s, "
+            f"min {result['min_s']:.3f} s, max {result['max_s']:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
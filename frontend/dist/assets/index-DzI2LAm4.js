@@ -1,2 +0,0 @@
-(function(){const e=document.createElement("link").relList;if(e&&e.supports&&e.supports("modulepreload"))return;for(const i of document.querySelectorAll('link[rel="modulepreload"]'))r(i);new MutationObserver(i=>{for(const s of i)if(s.type==="childList")for(const a of s.addedNodes)a.tagName==="LINK"&&a.rel==="modulepreload"&&r(a)}).observe(document,{childList:!0,subtree:!0});function t(i){const s={};return i.integrity&&(s.integrity=i.integrity),i.referrerPolicy&&(s.referrerPolicy=i.referrerPolicy),i.crossOrigin==="use-credentials"?s.credentials="include":i.crossOrigin==="anonymous"?s.credentials="omit":s.credentials="same-origin",s}function r(i){if(i.ep)return;i.ep=!0;const s=t(i);fetch(i.href,s)}})();var he,A,nt,W,Fe,rt,it,st,Re,ve,be,ot,J={},at=[],Lt=/acit|ex(?:s|g|n|p|$)|rph|grid|ows|mnc|ntw|ine[ch]|zoo|^ord|itera/i,ue=Array.isArray;function H(n,e){for(var t in e)n[t]=e[t];return n}function Oe(n){n&&n.parentNode&&n.parentNode.removeChild(n)}function Pt(n,e,t){var r,i,s,a={};for(s in e)s=="key"?r=e[s]:s=="ref"?i=e[s]:a[s]=e[s];if(arguments.length>2&&(a.children=arguments.length>3?he.call(arguments,2):t),typeof n=="function"&&n.defaultProps!=null)for(s in n.defaultProps)a[s]===void 0&&(a[s]=n.defaultProps[s]);return te(n,a,r,i,null)}function te(n,e,t,r,i){var s={type:n,props:e,key:t,ref:r,__k:null,__:null,__b:0,__e:null,__c:null,constructor:void 0,__v:i??++nt,__i:-1,__u:0};return i==null&&A.vnode!=null&&A.vnode(s),s}function $(n){return n.children}function ne(n,e){this.props=n,this.context=e}function X(n,e){if(e==null)return n.__?X(n.__,n.__i+1):null;for(var t;e<n.__k.length;e++)if((t=n.__k[e])!=null&&t.__e!=null)return t.__e;return typeof n.type=="function"?X(n):null}function ct(n){var e,t;if((n=n.__)!=null&&n.__c!=null){for(n.__e=n.__c.base=null,e=0;e<n.__k.length;e++)if((t=n.__k[e])!=null&&t.__e!=null){n.__e=n.__c.base=t.__e;break}return ct(n)}}function we(n){(!n.__d&&(n.__d=!0)&&W.push(n)&&!ce.__r++||Fe!=A.debounceRendering)&&((Fe=A.debounceRendering)||rt)(ce)}function ce(){for(var n,e,t,r,i,s,a,l=1;W.length;)W.length>l&&W.sort(it),n=W.shift(),l=W.length,n.__d&&(t=void 0,i=(r=(e=n).__v).__e,s=[],a=[],e.__P&&((t=H({},r)).__v=r.__v+1,A.vnode&&A.vnode(t),Be(e.__P,t,r,e.__n,e.__P.namespaceURI,32&r.__u?[i]:null,s,i??X(r),!!(32&r.__u),a),t.__v=r.__v,t.__.__k[t.__i]=t,ut(s,t,a),t.__e!=i&&ct(t)));ce.__r=0}function lt(n,e,t,r,i,s,a,l,d,u,f){var c,h,m,b,_,p,v,E=r&&r.__k||at,C=e.length;for(d=It(t,e,E,d,C),c=0;c<C;c++)(m=t.__k[c])!=null&&(h=m.__i==-1?J:E[m.__i]||J,m.__i=c,p=Be(n,m,h,i,s,a,l,d,u,f),b=m.__e,m.ref&&h.ref!=m.ref&&(h.ref&&Le(h.ref,null,m),f.push(m.ref,m.__c||b,m)),_==null&&b!=null&&(_=b),(v=!!(4&m.__u))||h.__k===m.__k?d=ht(m,d,n,v):typeof m.type=="function"&&p!==void 0?d=p:b&&(d=b.nextSibling),m.__u&=-7);return t.__e=_,d}function It(n,e,t,r,i){var s,a,l,d,u,f=t.length,c=f,h=0;for(n.__k=new Array(i),s=0;s<i;s++)(a=e[s])!=null&&typeof a!="boolean"&&typeof a!="function"?(d=s+h,(a=n.__k[s]=typeof a=="string"||typeof a=="number"||typeof a=="bigint"||a.constructor==String?te(null,a,null,null,null):ue(a)?te($,{children:a},null,null,null):a.constructor==null&&a.__b>0?te(a.type,a.props,a.key,a.ref?a.ref:null,a.__v):a).__=n,a.__b=n.__b+1,l=null,(u=a.__i=$t(a,t,d,c))!=-1&&(c--,(l=t[u])&&(l.__u|=2)),l==null||l.__v==null?(u==-1&&(i>f?h--:i<f&&h++),typeof a.type!="function"&&(a.__u|=4)):u!=d&&(u==d-1?h--:u==d+1?h++:(u>d?h--:h++,a.__u|=4))):n.__k[s]=null;if(c)for(s=0;s<f;s++)(l=t[s])!=null&&(2&l.__u)==0&&(l.__e==r&&(r=X(l)),ft(l,l));return r}function ht(n,e,t,r){var i,s;if(typeof n.type=="function"){for(i=n.__k,s=0;i&&s<i.length;s++)i[s]&&(i[s].__=n,e=ht(i[s],e,t,r));return e}n.__e!=e&&(r&&(e&&n.type&&!e.parentNode&&(e=X(n)),t.insertBefore(n.__e,e||null)),e=n.__e);do e=e&&e.nextSibling;while(e!=null&&e.nodeType==8);return e}function $t(n,e,t,r){var i,s,a,l=n.key,d=n.type,u=e[t],f=u!=null&&(2&u.__u)==0;if(u===null&&n.key==null||f&&l==u.key&&d==u.type)return t;if(r>(f?1:0)){for(i=t-1,s=t+1;i>=0||s<e.length;)if((u=e[a=i>=0?i--:s++])!=null&&(2&u.__u)==0&&l==u.key&&d==u.type)return a}return-1}function Ue(n,e,t){e[0]=="-"?n.setProperty(e,t??""):n[e]=t==null?"":typeof t!="number"||Lt.test(e)?t:t+"px"}function Q(n,e,t,r,i){var s,a;e:if(e=="style")if(typeof t=="string")n.style.cssText=t;else{if(typeof r=="string"&&(n.style.cssText=r=""),r)for(e in r)t&&e in t||Ue(n.style,e,"");if(t)for(e in t)r&&t[e]==r[e]||Ue(n.style,e,t[e])}else if(e[0]=="o"&&e[1]=="n")s=e!=(e=e.replace(st,"$1")),a=e.toLowerCase(),e=a in n||e=="onFocusOut"||e=="onFocusIn"?a.slice(2):e.slice(2),n.l||(n.l={}),n.l[e+s]=t,t?r?t.u=r.u:(t.u=Re,n.addEventListener(e,s?be:ve,s)):n.removeEventListener(e,s?be:ve,s);else{if(i=="http://www.w3.org/2000/svg")e=e.replace(/xlink(H|:h)/,"h").replace(/sName$/,"s");else if(e!="width"&&e!="height"&&e!="href"&&e!="list"&&e!="form"&&e!="tabIndex"&&e!="download"&&e!="rowSpan"&&e!="colSpan"&&e!="role"&&e!="popover"&&e in n)try{n[e]=t??"";break e}catch{}typeof t=="function"||(t==null||t===!1&&e[4]!="-"?n.removeAttribute(e):n.setAttribute(e,e=="popover"&&t==1?"":t))}}function He(n){return function(e){if(this.l){var t=this.l[e.type+n];if(e.t==null)e.t=Re++;else if(e.t<t.u)return;return t(A.event?A.event(e):e)}}}function Be(n,e,t,r,i,s,a,l,d,u){var f,c,h,m,b,_,p,v,E,C,g,y,w,k,N,T,R,I=e.type;if(e.constructor!=null)return null;128&t.__u&&(d=!!(32&t.__u),s=[l=e.__e=t.__e]),(f=A.__b)&&f(e);e:if(typeof I=="function")try{if(v=e.props,E="prototype"in I&&I.prototype.render,C=(f=I.contextType)&&r[f.__c],g=f?C?C.props.value:f.__:r,t.__c?p=(c=e.__c=t.__c).__=c.__E:(E?e.__c=c=new I(v,g):(e.__c=c=new ne(v,g),c.constructor=I,c.render=Dt),C&&C.sub(c),c.props=v,c.state||(c.state={}),c.context=g,c.__n=r,h=c.__d=!0,c.__h=[],c._sb=[]),E&&c.__s==null&&(c.__s=c.state),E&&I.getDerivedStateFromProps!=null&&(c.__s==c.state&&(c.__s=H({},c.__s)),H(c.__s,I.getDerivedStateFromProps(v,c.__s))),m=c.props,b=c.state,c.__v=e,h)E&&I.getDerivedStateFromProps==null&&c.componentWillMount!=null&&c.componentWillMount(),E&&c.componentDidMount!=null&&c.__h.push(c.componentDidMount);else{if(E&&I.getDerivedStateFromProps==null&&v!==m&&c.componentWillReceiveProps!=null&&c.componentWillReceiveProps(v,g),!c.__e&&c.shouldComponentUpdate!=null&&c.shouldComponentUpdate(v,c.__s,g)===!1||e.__v==t.__v){for(e.__v!=t.__v&&(c.props=v,c.state=c.__s,c.__d=!1),e.__e=t.__e,e.__k=t.__k,e.__k.some(function(V){V&&(V.__=e)}),y=0;y<c._sb.length;y++)c.__h.push(c._sb[y]);c._sb=[],c.__h.length&&a.push(c);break e}c.componentWillUpdate!=null&&c.componentWillUpdate(v,c.__s,g),E&&c.componentDidUpdate!=null&&c.__h.push(function(){c.componentDidUpdate(m,b,_)})}if(c.context=g,c.props=v,c.__P=n,c.__e=!1,w=A.__r,k=0,E){for(c.state=c.__s,c.__d=!1,w&&w(e),f=c.render(c.props,c.state,c.context),N=0;N<c._sb.length;N++)c.__h.push(c._sb[N]);c._sb=[]}else do c.__d=!1,w&&w(e),f=c.render(c.props,c.state,c.context),c.state=c.__s;while(c.__d&&++k<25);c.state=c.__s,c.getChildContext!=null&&(r=H(H({},r),c.getChildContext())),E&&!h&&c.getSnapshotBeforeUpdate!=null&&(_=c.getSnapshotBeforeUpdate(m,b)),T=f,f!=null&&f.type===$&&f.key==null&&(T=dt(f.props.children)),l=lt(n,ue(T)?T:[T],e,t,r,i,s,a,l,d,u),c.base=e.__e,e.__u&=-161,c.__h.length&&a.push(c),p&&(c.__E=c.__=null)}catch(V){if(e.__v=null,d||s!=null)if(V.then){for(e.__u|=d?160:128;l&&l.nodeType==8&&l.nextSibling;)l=l.nextSibling;s[s.indexOf(l)]=null,e.__e=l}else{for(R=s.length;R--;)Oe(s[R]);xe(e)}else e.__e=t.__e,e.__k=t.__k,V.then||xe(e);A.__e(V,e,t)}else s==null&&e.__v==t.__v?(e.__k=t.__k,e.__e=t.__e):l=e.__e=Mt(t.__e,e,t,r,i,s,a,d,u);return(f=A.diffed)&&f(e),128&e.__u?void 0:l}function xe(n){n&&n.__c&&(n.__c.__e=!0),n&&n.__k&&n.__k.forEach(xe)}function ut(n,e,t){for(var r=0;r<t.length;r++)Le(t[r],t[++r],t[++r]);A.__c&&A.__c(e,n),n.some(function(i){try{n=i.__h,i.__h=[],n.some(function(s){s.call(i)})}catch(s){A.__e(s,i.__v)}})}function dt(n){return typeof n!="object"||n==null||n.__b&&n.__b>0?n:ue(n)?n.map(dt):H({},n)}function Mt(n,e,t,r,i,s,a,l,d){var u,f,c,h,m,b,_,p=t.props,v=e.props,E=e.type;if(E=="svg"?i="http://www.w3.org/2000/svg":E=="math"?i="http://www.w3.org/1998/Math/MathML":i||(i="http://www.w3.org/1999/xhtml"),s!=null){for(u=0;u<s.length;u++)if((m=s[u])&&"setAttribute"in m==!!E&&(E?m.localName==E:m.nodeType==3)){n=m,s[u]=null;break}}if(n==null){if(E==null)return document.createTextNode(v);n=document.createElementNS(i,E,v.is&&v),l&&(A.__m&&A.__m(e,s),l=!1),s=null}if(E==null)p===v||l&&n.data==v||(n.data=v);else{if(s=s&&he.call(n.childNodes),p=t.props||J,!l&&s!=null)for(p={},u=0;u<n.attributes.length;u++)p[(m=n.attributes[u]).name]=m.value;for(u in p)if(m=p[u],u!="children"){if(u=="dangerouslySetInnerHTML")c=m;else if(!(u in v)){if(u=="value"&&"defaultValue"in v||u=="checked"&&"defaultChecked"in v)continue;Q(n,u,null,m,i)}}for(u in v)m=v[u],u=="children"?h=m:u=="dangerouslySetInnerHTML"?f=m:u=="value"?b=m:u=="checked"?_=m:l&&typeof m!="function"||p[u]===m||Q(n,u,m,p[u],i);if(f)l||c&&(f.__html==c.__html||f.__html==n.innerHTML)||(n.innerHTML=f.__html),e.__k=[];else if(c&&(n.innerHTML=""),lt(e.type=="template"?n.content:n,ue(h)?h:[h],e,t,r,E=="foreignObject"?"http://www.w3.org/1999/xhtml":i,s,a,s?s[0]:t.__k&&X(t,0),l,d),s!=null)for(u=s.length;u--;)Oe(s[u]);l||(u="value",E=="progress"&&b==null?n.removeAttribute("value"):b!=null&&(b!==n[u]||E=="progress"&&!b||E=="option"&&b!=p[u])&&Q(n,u,b,p[u],i),u="checked",_!=null&&_!=n[u]&&Q(n,u,_,p[u],i))}return n}function Le(n,e,t){try{if(typeof n=="function"){var r=typeof n.__u=="function";r&&n.__u(),r&&e==null||(n.__u=n(e))}else n.current=e}catch(i){A.__e(i,t)}}function ft(n,e,t){var r,i;if(A.unmount&&A.unmount(n),(r=n.ref)&&(r.current&&r.current!=n.__e||Le(r,null,e)),(r=n.__c)!=null){if(r.componentWillUnmount)try{r.componentWillUnmount()}catch(s){A.__e(s,e)}r.base=r.__P=null}if(r=n.__k)for(i=0;i<r.length;i++)r[i]&&ft(r[i],e,t||typeof n.type!="function");t||Oe(n.__e),n.__c=n.__=n.__e=void 0}function Dt(n,e,t){return this.constructor(n,t)}function qt(n,e,t){var r,i,s,a;e==document&&(e=document.documentElement),A.__&&A.__(n,e),i=(r=!1)?null:e.__k,s=[],a=[],Be(e,n=e.__k=Pt($,null,[n]),i||J,J,e.namespaceURI,i?null:e.firstChild?he.call(e.childNodes):null,s,i?i.__e:e.firstChild,r,a),ut(s,n,a)}function Ft(n){function e(t){var r,i;return this.getChildContext||(r=new Set,(i={})[e.__c]=this,this.getChildContext=function(){return i},this.componentWillUnmount=function(){r=null},this.shouldComponentUpdate=function(s){this.props.value!=s.value&&r.forEach(function(a){a.__e=!0,we(a)})},this.sub=function(s){r.add(s);var a=s.componentWillUnmount;s.componentWillUnmount=function(){r&&r.delete(s),a&&a.call(s)}}),t.children}return e.__c="__cC"+ot++,e.__=n,e.Provider=e.__l=(e.Consumer=function(t,r){return t.children(r)}).contextType=e,e}he=at.slice,A={__e:function(n,e,t,r){for(var i,s,a;e=e.__;)if((i=e.__c)&&!i.__)try{if((s=i.constructor)&&s.getDerivedStateFromError!=null&&(i.setState(s.getDerivedStateFromError(n)),a=i.__d),i.componentDidCatch!=null&&(i.componentDidCatch(n,r||{}),a=i.__d),a)return i.__E=i}catch(l){n=l}throw n}},nt=0,ne.prototype.setState=function(n,e){var t;t=this.__s!=null&&this.__s!=this.state?this.__s:this.__s=H({},this.state),typeof n=="function"&&(n=n(H({},t),this.props)),n&&H(t,n),n!=null&&this.__v&&(e&&this._sb.push(e),we(this))},ne.prototype.forceUpdate=function(n){this.__v&&(this.__e=!0,n&&this.__h.push(n),we(this))},ne.prototype.render=$,W=[],rt=typeof Promise=="function"?Promise.prototype.then.bind(Promise.resolve()):setTimeout,it=function(n,e){return n.__v.__b-e.__v.__b},ce.__r=0,st=/(PointerCapture)$|Capture$/i,Re=0,ve=He(!1),be=He(!0),ot=0;var Ut=0;function o(n,e,t,r,i,s){e||(e={});var a,l,d=e;if("ref"in d)for(l in d={},e)l=="ref"?a=e[l]:d[l]=e[l];var u={type:n,props:d,key:t,ref:a,__k:null,__:null,__b:0,__e:null,__c:null,constructor:void 0,__v:--Ut,__i:-1,__u:0,__source:i,__self:s};if(typeof n=="function"&&(a=n.defaultProps))for(l in a)d[l]===void 0&&(d[l]=a[l]);return A.vnode&&A.vnode(u),u}var j,O,_e,Ve,le=0,pt=[],L=A,Ye=L.__b,We=L.__r,Xe=L.diffed,je=L.__c,ze=L.unmount,Ke=L.__;function de(n,e){L.__h&&L.__h(O,n,le||e),le=0;var t=O.__H||(O.__H={__:[],__h:[]});return n>=t.__.length&&t.__.push({}),t.__[n]}function q(n){return le=1,Ht(yt,n)}function Ht(n,e,t){var r=de(j++,2);if(r.t=n,!r.__c&&(r.__=[yt(void 0,e),function(l){var d=r.__N?r.__N[0]:r.__[0],u=r.t(d,l);d!==u&&(r.__N=[u,r.__[1]],r.__c.setState({}))}],r.__c=O,!O.__f)){var i=function(l,d,u){if(!r.__c.__H)return!0;var f=r.__c.__H.__.filter(function(h){return!!h.__c});if(f.every(function(h){return!h.__N}))return!s||s.call(this,l,d,u);var c=r.__c.props!==l;return f.forEach(function(h){if(h.__N){var m=h.__[0];h.__=h.__N,h.__N=void 0,m!==h.__[0]&&(c=!0)}}),s&&s.call(this,l,d,u)||c};O.__f=!0;var s=O.shouldComponentUpdate,a=O.componentWillUpdate;O.componentWillUpdate=function(l,d,u){if(this.__e){var f=s;s=void 0,i(l,d,u),s=f}a&&a.call(this,l,d,u)},O.shouldComponentUpdate=i}return r.__N||r.__}function Vt(n,e){var t=de(j++,3);!L.__s&&mt(t.__H,e)&&(t.__=n,t.u=e,O.__H.__h.push(t))}function _t(n){return le=5,Yt(function(){return{current:n}},[])}function Yt(n,e){var t=de(j++,7);return mt(t.__H,e)&&(t.__=n(),t.__H=e,t.__h=n),t.__}function Wt(n){var e=O.context[n.__c],t=de(j++,9);return t.c=n,e?(t.__==null&&(t.__=!0,e.sub(O)),e.props.value):n.__}function Xt(){for(var n;n=pt.shift();)if(n.__P&&n.__H)try{n.__H.__h.forEach(re),n.__H.__h.forEach(ke),n.__H.__h=[]}catch(e){n.__H.__h=[],L.__e(e,n.__v)}}L.__b=function(n){O=null,Ye&&Ye(n)},L.__=function(n,e){n&&e.__k&&e.__k.__m&&(n.__m=e.__k.__m),Ke&&Ke(n,e)},L.__r=function(n){We&&We(n),j=0;var e=(O=n.__c).__H;e&&(_e===O?(e.__h=[],O.__h=[],e.__.forEach(function(t){t.__N&&(t.__=t.__N),t.u=t.__N=void 0})):(e.__h.forEach(re),e.__h.forEach(ke),e.__h=[],j=0)),_e=O},L.diffed=function(n){Xe&&Xe(n);var e=n.__c;e&&e.__H&&(e.__H.__h.length&&(pt.push(e)!==1&&Ve===L.requestAnimationFrame||((Ve=L.requestAnimationFrame)||jt)(Xt)),e.__H.__.forEach(function(t){t.u&&(t.__H=t.u),t.u=void 0})),_e=O=null},L.__c=function(n,e){e.some(function(t){try{t.__h.forEach(re),t.__h=t.__h.filter(function(r){return!r.__||ke(r)})}catch(r){e.some(function(i){i.__h&&(i.__h=[])}),e=[],L.__e(r,t.__v)}}),je&&je(n,e)},L.unmount=function(n){ze&&ze(n);var e,t=n.__c;t&&t.__H&&(t.__H.__.forEach(function(r){try{re(r)}catch(i){e=i}}),t.__H=void 0,e&&L.__e(e,t.__v))};var Ge=typeof requestAnimationFrame=="function";function jt(n){var e,t=function(){clearTimeout(r),Ge&&cancelAnimationFrame(e),setTimeout(n)},r=setTimeout(t,35);Ge&&(e=requestAnimationFrame(t))}function re(n){var e=O,t=n.__c;typeof t=="function"&&(n.__c=void 0,t()),O=e}function ke(n){var e=O;n.__c=n.__(),O=e}function mt(n,e){return!n||n.length!==e.length||e.some(function(t,r){return t!==n[r]})}function yt(n,e){return typeof e=="function"?e(n):e}const x={Iniciar:-1,Linear:0,Sleep:1,Arco_horario:2,Arco_antihorario:3,Start_acquisition:1e3,Stop_acquisition:1001,Start_stream:1002,Stop_stream:1003,Set_exposure:1004,is_movement:n=>n===x.Iniciar||n===x.Linear||n===x.Arco_horario||n==x.Arco_antihorario};function gt(n,e){let t=n-1;for(;t>=0&&!x.is_movement(e[t].command.type);)t-=1;return t>=0?e[t]:e[0]}const vt=Ft({is_dirty:!0,setIsDirty:()=>{},nodes:[],setNodes:n=>{},getNextNodeId:()=>0,encoder_host:"",setEncoder_host:()=>{}});function Pe(){return Wt(vt)}function zt({status:n,offset:e,bounds:t}){const r=_t(null),{setIsDirty:i,nodes:s,setNodes:a,getNextNodeId:l}=Pe();function d(_,p,v,E){const C=v.x,g=v.y,y=E.x,w=E.y;if(_===x.Arco_horario){const N=(y-C)*(y-C)+(w-g)*(w-g)>2*p*2*p;return o("path",{d:`M ${C} ${g} A ${p} ${p} 0 0 1 ${y} ${w}`,stroke:N?"var(--warning-color)":"var(--on-surface-alt-color)","stroke-width":"2.5","stroke-linecap":"round",fill:"none","marker-end":"url(#arrowhead)",opacity:"0.95"})}else if(_===x.Arco_antihorario){const N=(y-C)*(y-C)+(w-g)*(w-g)>2*p*2*p;return o("path",{d:`M ${C} ${g} A ${p} ${p} 0 0 0 ${y} ${w}`,stroke:N?"var(--warning-color)":"var(--on-surface-alt-color)","stroke-width":"2.5","stroke-linecap":"round",fill:"none","marker-end":"url(#arrowhead)",opacity:"0.95"})}return o("line",{x1:C,y1:g,x2:y,y2:w,stroke:"var(--on-surface-alt-color)","stroke-width":"2.5","stroke-linecap":"round","marker-end":"url(#arrowhead)",opacity:"0.95"})}function u(_){const p=_.target.ownerSVGElement||_.target;if(p){const v=p.createSVGPoint();v.x=_.clientX,v.y=_.clientY;const E=p.getScreenCTM()?.inverse(),C=v.matrixTransform(E);return{x:C.x,y:C.y}}return{x:0,y:0}}const f=_=>{const p=u(_),v=s.filter(w=>x.is_movement(w.command.type)),E=v[v.length-1]||{},C=Math.max(Math.min(Math.round((p.x-e.x)*5)/5,t.x0+t.width),t.x0)-e.x,g=Math.max(Math.min(Math.round((p.y-e.y)*5)/5,t.y0+t.height),t.y0)-e.y;let y={id:l(),command:{type:x.Linear,x:C,y:g,s:E.command.s,p:1e3,r:100,f:10,e:500,str:""}};a(w=>[...w,y]),i(!0)},c=(_,p)=>{if(!n.running){const v=u(_);r.current={i:p,offsetX:s[p].command.x+e.x-v.x,offsetY:s[p].command.y+e.y-v.y},_.target.setPointerCapture(_.pointerId)}},h=_=>{if(!r.current)return;const{i:p,offsetX:v,offsetY:E}=r.current,C=u(_),g=Math.max(Math.min(Math.round((C.x+v)*5)/5,t.x0+t.width),t.x0)-e.x,y=Math.max(Math.min(Math.round((C.y+E)*5)/5,t.y0+t.height),t.y0)-e.y;a(w=>{const k=[...w],N=k[p].command.type;if(N===x.Arco_horario||N===x.Arco_antihorario){const{command:{x:T,y:R}}=gt(p,k),I=Math.ceil(Math.sqrt(Math.pow(g-T,2)+Math.pow(y-R,2))*500/2)/500;k[p].command.x=g,k[p].command.y=y,k[p].command.r=I}else k[p].command.x=g,k[p].command.y=y;return i(!0),k})},m=()=>{r.current=null},b=s.map((_,p)=>[_,p]).filter(_=>x.is_movement(_[0].command.type));return o("div",{className:"svg-wrap",children:o("svg",{viewBox:`${t.x0} ${t.y0} ${t.width} ${t.height}`,onDblClick:f,onPointerMove:h,onPointerUp:m,children:[o("defs",{children:[o("marker",{id:"arrowhead",markerWidth:"10",markerHeight:"10",refX:"5.5",refY:"2.5",orient:"auto",markerUnits:"strokeWidth",children:o("path",{d:"M0,0 L5,2.5 L0,5 z",fill:"var(--on-surface-alt-color)"})}),o("filter",{id:"shadow",x:"-50%",y:"-50%",width:"250%",height:"250%",children:o("feDropShadow",{dx:"0",dy:"3",stdDeviation:"4","flood-color":"#000","flood-opacity":"0.12"})})]}),o("g",{children:b.map((_,p)=>{const[v,E]=_;if(E==0)return null;const C=s[b[p-1][1]];return d(v.command.type,v.command.r,{...C,x:C.command.x+e.x,y:C.command.y+e.y},{x:v.command.x+e.x,y:v.command.y+e.y})})}),o("g",{children:b.map(_=>o("g",{onPointerDown:p=>c(p,_[1]),children:o("circle",{cx:_[0].command.x+e.x,cy:_[0].command.y+e.y,r:4.5,fill:"var(--on-surface-color)",filter:"url(#shadow)",style:n.running?"cursor: not-allowed":"cursor: grab"})},_[0].id))}),n.calibrated?o("g",{children:o("circle",{style:"pointer-events: none;",cx:n.pos[0],cy:n.pos[1],r:5,fill:"var(--warning-color)",filter:"url(#shadow)"})}):null]})})}const U=Object.create(null);U.open="0";U.close="1";U.ping="2";U.pong="3";U.message="4";U.upgrade="5";U.noop="6";const ie=Object.create(null);Object.keys(U).forEach(n=>{ie[U[n]]=n});const Ee={type:"error",data:"parser error"},bt=typeof Blob=="function"||typeof Blob<"u"&&Object.prototype.toString.call(Blob)==="[object BlobConstructor]",wt=typeof ArrayBuffer=="function",xt=n=>typeof ArrayBuffer.isView=="function"?ArrayBuffer.isView(n):n&&n.buffer instanceof ArrayBuffer,Ie=({type:n,data:e},t,r)=>bt&&e instanceof Blob?t?r(e):Je(e,r):wt&&(e instanceof ArrayBuffer||xt(e))?t?r(e):Je(new Blob([e]),r):r(U[n]+(e||"")),Je=(n,e)=>{const t=new FileReader;return t.onload=function(){const r=t.result.split(",")[1];e("b"+(r||""))},t.readAsDataURL(n)};function Qe(n){return n instanceof Uint8Array?n:n instanceof ArrayBuffer?new Uint8Array(n):new Uint8Array(n.buffer,n.byteOffset,n.byteLength)}let me;function Kt(n,e){if(bt&&n.data instanceof Blob)return n.data.arrayBuffer().then(Qe).then(e);if(wt&&(n.data instanceof ArrayBuffer||xt(n.data)))return e(Qe(n.data));Ie(n,!1,t=>{me||(me=new TextEncoder),e(me.encode(t))})}const Ze="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",G=typeof Uint8Array>"u"?[]:new Uint8Array(256);for(let n=0;n<Ze.length;n++)G[Ze.charCodeAt(n)]=n;const Gt=n=>{let e=n.length*.75,t=n.length,r,i=0,s,a,l,d;n[n.length-1]==="="&&(e--,n[n.length-2]==="="&&e--);const u=new ArrayBuffer(e),f=new Uint8Array(u);for(r=0;r<t;r+=4)s=G[n.charCodeAt(r)],a=G[n.charCodeAt(r+1)],l=G[n.charCodeAt(r+2)],d=G[n.charCodeAt(r+3)],f[i++]=s<<2|a>>4,f[i++]=(a&15)<<4|l>>2,f[i++]=(l&3)<<6|d&63;return u},Jt=typeof ArrayBuffer=="function",$e=(n,e)=>{if(typeof n!="string")return{type:"message",data:kt(n,e)};const t=n.charAt(0);return t==="b"?{type:"message",data:Qt(n.substring(1),e)}:ie[t]?n.length>1?{type:ie[t],data:n.substring(1)}:{type:ie[t]}:Ee},Qt=(n,e)=>{if(Jt){const t=Gt(n);return kt(t,e)}else return{base64:!0,data:n}},kt=(n,e)=>{switch(e){case"blob":return n instanceof Blob?n:new Blob([n]);case"arraybuffer":default:return n instanceof ArrayBuffer?n:n.buffer}},Et="",Zt=(n,e)=>{const t=n.length,r=new Array(t);let i=0;n.forEach((s,a)=>{Ie(s,!1,l=>{r[a]=l,++i===t&&e(r.join(Et))})})},en=(n,e)=>{const t=n.split(Et),r=[];for(let i=0;i<t.length;i++){const s=$e(t[i],e);if(r.push(s),s.type==="error")break}return r};function tn(){return new TransformStream({transform(n,e){Kt(n,t=>{const r=t.length;let i;if(r<126)i=new Uint8Array(1),new DataView(i.buffer).setUint8(0,r);else if(r<65536){i=new Uint8Array(3);const s=new DataView(i.buffer);s.setUint8(0,126),s.setUint16(1,r)}else{i=new Uint8Array(9);const s=new DataView(i.buffer);s.setUint8(0,127),s.setBigUint64(1,BigInt(r))}n.data&&typeof n.data!="string"&&(i[0]|=128),e.enqueue(i),e.enqueue(t)})}})}let ye;function Z(n){return n.reduce((e,t)=>e+t.length,0)}function ee(n,e){if(n[0].length===e)return n.shift();const t=new Uint8Array(e);let r=0;for(let i=0;i<e;i++)t[i]=n[0][r++],r===n[0].length&&(n.shift(),r=0);return n.length&&r<n[0].length&&(n[0]=n[0].slice(r)),t}function nn(n,e){ye||(ye=new TextDecoder);const t=[];let r=0,i=-1,s=!1;return new TransformStream({transform(a,l){for(t.push(a);;){if(r===0){if(Z(t)<1)break;const d=ee(t,1);s=(d[0]&128)===128,i=d[0]&127,i<126?r=3:i===126?r=1:r=2}else if(r===1){if(Z(t)<2)break;const d=ee(t,2);i=new DataView(d.buffer,d.byteOffset,d.length).getUint16(0),r=3}else if(r===2){if(Z(t)<8)break;const d=ee(t,8),u=new DataView(d.buffer,d.byteOffset,d.length),f=u.getUint32(0);if(f>Math.pow(2,21)-1){l.enqueue(Ee);break}i=f*Math.pow(2,32)+u.getUint32(4),r=3}else{if(Z(t)<i)break;const d=ee(t,i);l.enqueue($e(s?d:ye.decode(d),e)),r=0}if(i===0||i>n){l.enqueue(Ee);break}}}})}const St=4;function P(n){if(n)return rn(n)}function rn(n){for(var e in P.prototype)n[e]=P.prototype[e];return n}P.prototype.on=P.prototype.addEventListener=function(n,e){return this._callbacks=this._callbacks||{},(this._callbacks["$"+n]=this._callbacks["$"+n]||[]).push(e),this};P.prototype.once=function(n,e){function t(){this.off(n,t),e.apply(this,arguments)}return t.fn=e,this.on(n,t),this};P.prototype.off=P.prototype.removeListener=P.prototype.removeAllListeners=P.prototype.removeEventListener=function(n,e){if(this._callbacks=this._callbacks||{},arguments.length==0)return this._callbacks={},this;var t=this._callbacks["$"+n];if(!t)return this;if(arguments.length==1)return delete this._callbacks["$"+n],this;for(var r,i=0;i<t.length;i++)if(r=t[i],r===e||r.fn===e){t.splice(i,1);break}return t.length===0&&delete this._callbacks["$"+n],this};P.prototype.emit=function(n){this._callbacks=this._callbacks||{};for(var e=new Array(arguments.length-1),t=this._callbacks["$"+n],r=1;r<arguments.length;r++)e[r-1]=arguments[r];if(t){t=t.slice(0);for(var r=0,i=t.length;r<i;++r)t[r].apply(this,e)}return this};P.prototype.emitReserved=P.prototype.emit;P.prototype.listeners=function(n){return this._callbacks=this._callbacks||{},this._callbacks["$"+n]||[]};P.prototype.hasListeners=function(n){return!!this.listeners(n).length};const fe=typeof Promise=="function"&&typeof Promise.resolve=="function"?e=>Promise.resolve().then(e):(e,t)=>t(e,0),M=typeof self<"u"?self:typeof window<"u"?window:Function("return this")(),sn="arraybuffer";function Ct(n,...e){return e.reduce((t,r)=>(n.hasOwnProperty(r)&&(t[r]=n[r]),t),{})}const on=M.setTimeout,an=M.clearTimeout;function pe(n,e){e.useNativeTimers?(n.setTimeoutFn=on.bind(M),n.clearTimeoutFn=an.bind(M)):(n.setTimeoutFn=M.setTimeout.bind(M),n.clearTimeoutFn=M.clearTimeout.bind(M))}const cn=1.33;function ln(n){return typeof n=="string"?hn(n):Math.ceil((n.byteLength||n.size)*cn)}function hn(n){let e=0,t=0;for(let r=0,i=n.length;r<i;r++)e=n.charCodeAt(r),e<128?t+=1:e<2048?t+=2:e<55296||e>=57344?t+=3:(r++,t+=4);return t}function Tt(){return Date.now().toString(36).substring(3)+Math.random().toString(36).substring(2,5)}function un(n){let e="";for(let t in n)n.hasOwnProperty(t)&&(e.length&&(e+="&"),e+=encodeURIComponent(t)+"="+encodeURIComponent(n[t]));return e}function dn(n){let e={},t=n.split("&");for(let r=0,i=t.length;r<i;r++){let s=t[r].split("=");e[decodeURIComponent(s[0])]=decodeURIComponent(s[1])}return e}class fn extends Error{constructor(e,t,r){super(e),this.description=t,this.context=r,this.type="TransportError"}}class Me extends P{constructor(e){super(),this.writable=!1,pe(this,e),this.opts=e,this.query=e.query,this.socket=e.socket,this.supportsBinary=!e.forceBase64}onError(e,t,r){return super.emitReserved("error",new fn(e,t,r)),this}open(){return this.readyState="opening",this.doOpen(),this}close(){return(this.readyState==="opening"||this.readyState==="open")&&(this.doClose(),this.onClose()),this}send(e){this.readyState==="open"&&this.write(e)}onOpen(){this.readyState="open",this.writable=!0,super.emitReserved("open")}onData(e){const t=$e(e,this.socket.binaryType);this.onPacket(t)}onPacket(e){super.emitReserved("packet",e)}onClose(e){this.readyState="closed",super.emitReserved("close",e)}pause(e){}createUri(e,t={}){return e+"://"+this._hostname()+this._port()+this.opts.path+this._query(t)}_hostname(){const e=this.opts.hostname;return e.indexOf(":")===-1?e:"["+e+"]"}_port(){return this.opts.port&&(this.opts.secure&&+(this.opts.port!==443)||!this.opts.secure&&Number(this.opts.port)!==80)?":"+this.opts.port:""}_query(e){const t=un(e);return t.length?"?"+t:""}}class pn extends Me{constructor(){super(...arguments),this._polling=!1}get name(){return"polling"}doOpen(){this._poll()}pause(e){this.readyState="pausing";const t=()=>{this.readyState="paused",e()};if(this._polling||!this.writable){let r=0;this._polling&&(r++,this.once("pollComplete",function(){--r||t()})),this.writable||(r++,this.once("drain",function(){--r||t()}))}else t()}_poll(){this._polling=!0,this.doPoll(),this.emitReserved("poll")}onData(e){const t=r=>{if(this.readyState==="opening"&&r.type==="open"&&this.onOpen(),r.type==="close")return this.onClose({description:"transport closed by the server"}),!1;this.onPacket(r)};en(e,this.socket.binaryType).forEach(t),this.readyState!=="closed"&&(this._polling=!1,this.emitReserved("pollComplete"),this.readyState==="open"&&this._poll())}doClose(){const e=()=>{this.write([{type:"close"}])};this.readyState==="open"?e():this.once("open",e)}write(e){this.writable=!1,Zt(e,t=>{this.doWrite(t,()=>{this.writable=!0,this.emitReserved("drain")})})}uri(){const e=this.opts.secure?"https":"http",t=this.query||{};return this.opts.timestampRequests!==!1&&(t[this.opts.timestampParam]=Tt()),!this.supportsBinary&&!t.sid&&(t.b64=1),this.createUri(e,t)}}let At=!1;try{At=typeof XMLHttpRequest<"u"&&"withCredentials"in new XMLHttpRequest}catch{}const _n=At;function mn(){}class yn extends pn{constructor(e){if(super(e),typeof location<"u"){const t=location.protocol==="https:";let r=location.port;r||(r=t?"443":"80"),this.xd=typeof location<"u"&&e.hostname!==location.hostname||r!==e.port}}doWrite(e,t){const r=this.request({method:"POST",data:e});r.on("success",t),r.on("error",(i,s)=>{this.onError("xhr post error",i,s)})}doPoll(){const e=this.request();e.on("data",this.onData.bind(this)),e.on("error",(t,r)=>{this.onError("xhr poll error",t,r)}),this.pollXhr=e}}class F extends P{constructor(e,t,r){super(),this.createRequest=e,pe(this,r),this._opts=r,this._method=r.method||"GET",this._uri=t,this._data=r.data!==void 0?r.data:null,this._create()}_create(){var e;const t=Ct(this._opts,"agent","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","autoUnref");t.xdomain=!!this._opts.xd;const r=this._xhr=this.createRequest(t);try{r.open(this._method,this._uri,!0);try{if(this._opts.extraHeaders){r.setDisableHeaderCheck&&r.setDisableHeaderCheck(!0);for(let i in this._opts.extraHeaders)this._opts.extraHeaders.hasOwnProperty(i)&&r.setRequestHeader(i,this._opts.extraHeaders[i])}}catch{}if(this._method==="POST")try{r.setRequestHeader("Content-type","text/plain;charset=UTF-8")}catch{}try{r.setRequestHeader("Accept","*/*")}catch{}(e=this._opts.cookieJar)===null||e===void 0||e.addCookies(r),"withCredentials"in r&&(r.withCredentials=this._opts.withCredentials),this._opts.requestTimeout&&(r.timeout=this._opts.requestTimeout),r.onreadystatechange=()=>{var i;r.readyState===3&&((i=this._opts.cookieJar)===null||i===void 0||i.parseCookies(r.getResponseHeader("set-cookie"))),r.readyState===4&&(r.status===200||r.status===1223?this._onLoad():this.setTimeoutFn(()=>{this._onError(typeof r.status=="number"?r.status:0)},0))},r.send(this._data)}catch(i){this.setTimeoutFn(()=>{this._onError(i)},0);return}typeof document<"u"&&(this._index=F.requestsCount++,F.requests[this._index]=this)}_onError(e){this.emitReserved("error",e,this._xhr),this._cleanup(!0)}_cleanup(e){if(!(typeof this._xhr>"u"||this._xhr===null)){if(this._xhr.onreadystatechange=mn,e)try{this._xhr.abort()}catch{}typeof document<"u"&&delete F.requests[this._index],this._xhr=null}}_onLoad(){const e=this._xhr.responseText;e!==null&&(this.emitReserved("data",e),this.emitReserved("success"),this._cleanup())}abort(){this._cleanup()}}F.requestsCount=0;F.requests={};if(typeof document<"u"){if(typeof attachEvent=="function")attachEvent("onunload",et);else if(typeof addEventListener=="function"){const n="onpagehide"in M?"pagehide":"unload";addEventListener(n,et,!1)}}function et(){for(let n in F.requests)F.requests.hasOwnProperty(n)&&F.requests[n].abort()}const gn=(function(){const n=Nt({xdomain:!1});return n&&n.responseType!==null})();class vn extends yn{constructor(e){super(e);const t=e&&e.forceBase64;this.supportsBinary=gn&&!t}request(e={}){return Object.assign(e,{xd:this.xd},this.opts),new F(Nt,this.uri(),e)}}function Nt(n){const e=n.xdomain;try{if(typeof XMLHttpRequest<"u"&&(!e||_n))return new XMLHttpRequest}catch{}if(!e)try{return new M[["Active"].concat("Object").join("X")]("Microsoft.XMLHTTP")}catch{}}const Rt=typeof navigator<"u"&&typeof navigator.product=="string"&&navigator.product.toLowerCase()==="reactnative";class bn extends Me{get name(){return"websocket"}doOpen(){const e=this.uri(),t=this.opts.protocols,r=Rt?{}:Ct(this.opts,"agent","perMessageDeflate","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","localAddress","protocolVersion","origin","maxPayload","family","checkServerIdentity");this.opts.extraHeaders&&(r.headers=this.opts.extraHeaders);try{this.ws=this.createSocket(e,t,r)}catch(i){return this.emitReserved("error",i)}this.ws.binaryType=this.socket.binaryType,this.addEventListeners()}addEventListeners(){this.ws.onopen=()=>{this.opts.autoUnref&&this.ws._socket.unref(),this.onOpen()},this.ws.onclose=e=>this.onClose({description:"websocket connection closed",context:e}),this.ws.onmessage=e=>this.onData(e.data),this.ws.onerror=e=>this.onError("websocket error",e)}write(e){this.writable=!1;for(let t=0;t<e.length;t++){const r=e[t],i=t===e.length-1;Ie(r,this.supportsBinary,s=>{try{this.doWrite(r,s)}catch{}i&&fe(()=>{this.writable=!0,this.emitReserved("drain")},this.setTimeoutFn)})}}doClose(){typeof this.ws<"u"&&(this.ws.onerror=()=>{},this.ws.close(),this.ws=null)}uri(){const e=this.opts.secure?"wss":"ws",t=this.query||{};return this.opts.timestampRequests&&(t[this.opts.timestampParam]=Tt()),this.supportsBinary||(t.b64=1),this.createUri(e,t)}}const ge=M.WebSocket||M.MozWebSocket;class wn extends bn{createSocket(e,t,r){return Rt?new ge(e,t,r):t?new ge(e,t):new ge(e)}doWrite(e,t){this.ws.send(t)}}class xn extends Me{get name(){return"webtransport"}doOpen(){try{this._transport=new WebTransport(this.createUri("https"),this.opts.transportOptions[this.name])}catch(e){return this.emitReserved("error",e)}this._transport.closed.then(()=>{this.onClose()}).catch(e=>{this.onError("webtransport error",e)}),this._transport.ready.then(()=>{this._transport.createBidirectionalStream().then(e=>{const t=nn(Number.MAX_SAFE_INTEGER,this.socket.binaryType),r=e.readable.pipeThrough(t).getReader(),i=tn();i.readable.pipeTo(e.writable),this._writer=i.writable.getWriter();const s=()=>{r.read().then(({done:l,value:d})=>{l||(this.onPacket(d),s())}).catch(l=>{})};s();const a={type:"open"};this.query.sid&&(a.data=`{"sid":"${this.query.sid}"}`),this._writer.write(a).then(()=>this.onOpen())})})}write(e){this.writable=!1;for(let t=0;t<e.length;t++){const r=e[t],i=t===e.length-1;this._writer.write(r).then(()=>{i&&fe(()=>{this.writable=!0,this.emitReserved("drain")},this.setTimeoutFn)})}}doClose(){var e;(e=this._transport)===null||e===void 0||e.close()}}const kn={websocket:wn,webtransport:xn,polling:vn},En=/^(?:(?![^:@\/?#]+:[^:@\/]*@)(http|https|ws|wss):\/\/)?((?:(([^:@\/?#]*)(?::([^:@\/?#]*))?)?@)?((?:[a-f0-9]{0,4}:){2,7}[a-f0-9]{0,4}|[^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,Sn=["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"];function Se(n){if(n.length>8e3)throw"URI too long";const e=n,t=n.indexOf("["),r=n.indexOf("]");t!=-1&&r!=-1&&(n=n.substring(0,t)+n.substring(t,r).replace(/:/g,";")+n.substring(r,n.length));let i=En.exec(n||""),s={},a=14;for(;a--;)s[Sn[a]]=i[a]||"";return t!=-1&&r!=-1&&(s.source=e,s.host=s.host.substring(1,s.host.length-1).replace(/;/g,":"),s.authority=s.authority.replace("[","").replace("]","").replace(/;/g,":"),s.ipv6uri=!0),s.pathNames=Cn(s,s.path),s.queryKey=Tn(s,s.query),s}function Cn(n,e){const t=/\/{2,9}/g,r=e.replace(t,"/").split("/");return(e.slice(0,1)=="/"||e.length===0)&&r.splice(0,1),e.slice(-1)=="/"&&r.splice(r.length-1,1),r}function Tn(n,e){const t={};return e.replace(/(?:^|&)([^&=]*)=?([^&]*)/g,function(r,i,s){i&&(t[i]=s)}),t}const Ce=typeof addEventListener=="function"&&typeof removeEventListener=="function",se=[];Ce&&addEventListener("offline",()=>{se.forEach(n=>n())},!1);class Y extends P{constructor(e,t){if(super(),this.binaryType=sn,this.writeBuffer=[],this._prevBufferLen=0,this._pingInterval=-1,this._pingTimeout=-1,this._maxPayload=-1,this._pingTimeoutTime=1/0,e&&typeof e=="object"&&(t=e,e=null),e){const r=Se(e);t.hostname=r.host,t.secure=r.protocol==="https"||r.protocol==="wss",t.port=r.port,r.query&&(t.query=r.query)}else t.host&&(t.hostname=Se(t.host).host);pe(this,t),this.secure=t.secure!=null?t.secure:typeof location<"u"&&location.protocol==="https:",t.hostname&&!t.port&&(t.port=this.secure?"443":"80"),this.hostname=t.hostname||(typeof location<"u"?location.hostname:"localhost"),this.port=t.port||(typeof location<"u"&&location.port?location.port:this.secure?"443":"80"),this.transports=[],this._transportsByName={},t.transports.forEach(r=>{const i=r.prototype.name;this.transports.push(i),this._transportsByName[i]=r}),this.opts=Object.assign({path:"/engine.io",agent:!1,withCredentials:!1,upgrade:!0,timestampParam:"t",rememberUpgrade:!1,addTrailingSlash:!0,rejectUnauthorized:!0,perMessageDeflate:{threshold:1024},transportOptions:{},closeOnBeforeunload:!1},t),this.opts.path=this.opts.path.replace(/\/$/,"")+(this.opts.addTrailingSlash?"/":""),typeof this.opts.query=="string"&&(this.opts.query=dn(this.opts.query)),Ce&&(this.opts.closeOnBeforeunload&&(this._beforeunloadEventListener=()=>{this.transport&&(this.transport.removeAllListeners(),this.transport.close())},addEventListener("beforeunload",this._beforeunloadEventListener,!1)),this.hostname!=="localhost"&&(this._offlineEventListener=()=>{this._onClose("transport close",{description:"network connection lost"})},se.push(this._offlineEventListener))),this.opts.withCredentials&&(this._cookieJar=void 0),this._open()}createTransport(e){const t=Object.assign({},this.opts.query);t.EIO=St,t.transport=e,this.id&&(t.sid=this.id);const r=Object.assign({},this.opts,{query:t,socket:this,hostname:this.hostname,secure:this.secure,port:this.port},this.opts.transportOptions[e]);return new this._transportsByName[e](r)}_open(){if(this.transports.length===0){this.setTimeoutFn(()=>{this.emitReserved("error","No transports available")},0);return}const e=this.opts.rememberUpgrade&&Y.priorWebsocketSuccess&&this.transports.indexOf("websocket")!==-1?"websocket":this.transports[0];this.readyState="opening";const t=this.createTransport(e);t.open(),this.setTransport(t)}setTransport(e){this.transport&&this.transport.removeAllListeners(),this.transport=e,e.on("drain",this._onDrain.bind(this)).on("packet",this._onPacket.bind(this)).on("error",this._onError.bind(this)).on("close",t=>this._onClose("transport close",t))}onOpen(){this.readyState="open",Y.priorWebsocketSuccess=this.transport.name==="websocket",this.emitReserved("open"),this.flush()}_onPacket(e){if(this.readyState==="opening"||this.readyState==="open"||this.readyState==="closing")switch(this.emitReserved("packet",e),this.emitReserved("heartbeat"),e.type){case"open":this.onHandshake(JSON.parse(e.data));break;case"ping":this._sendPacket("pong"),this.emitReserved("ping"),this.emitReserved("pong"),this._resetPingTimeout();break;case"error":const t=new Error("server error");t.code=e.data,this._onError(t);break;case"message":this.emitReserved("data",e.data),this.emitReserved("message",e.data);break}}onHandshake(e){this.emitReserved("handshake",e),this.id=e.sid,this.transport.query.sid=e.sid,this._pingInterval=e.pingInterval,this._pingTimeout=e.pingTimeout,this._maxPayload=e.maxPayload,this.onOpen(),this.readyState!=="closed"&&this._resetPingTimeout()}_resetPingTimeout(){this.clearTimeoutFn(this._pingTimeoutTimer);const e=this._pingInterval+this._pingTimeout;this._pingTimeoutTime=Date.now()+e,this._pingTimeoutTimer=this.setTimeoutFn(()=>{this._onClose("ping timeout")},e),this.opts.autoUnref&&this._pingTimeoutTimer.unref()}_onDrain(){this.writeBuffer.splice(0,this._prevBufferLen),this._prevBufferLen=0,this.writeBuffer.length===0?this.emitReserved("drain"):this.flush()}flush(){if(this.readyState!=="closed"&&this.transport.writable&&!this.upgrading&&this.writeBuffer.length){const e=this._getWritablePackets();this.transport.send(e),this._prevBufferLen=e.length,this.emitReserved("flush")}}_getWritablePackets(){if(!(this._maxPayload&&this.transport.name==="polling"&&this.writeBuffer.length>1))return this.writeBuffer;let t=1;for(let r=0;r<this.writeBuffer.length;r++){const i=this.writeBuffer[r].data;if(i&&(t+=ln(i)),r>0&&t>this._maxPayload)return this.writeBuffer.slice(0,r);t+=2}return this.writeBuffer}_hasPingExpired(){if(!this._pingTimeoutTime)return!0;const e=Date.now()>this._pingTimeoutTime;return e&&(this._pingTimeoutTime=0,fe(()=>{this._onClose("ping timeout")},this.setTimeoutFn)),e}write(e,t,r){return this._sendPacket("message",e,t,r),this}send(e,t,r){return this._sendPacket("message",e,t,r),this}_sendPacket(e,t,r,i){if(typeof t=="function"&&(i=t,t=void 0),typeof r=="function"&&(i=r,r=null),this.readyState==="closing"||this.readyState==="closed")return;r=r||{},r.compress=r.compress!==!1;const s={type:e,data:t,options:r};this.emitReserved("packetCreate",s),this.writeBuffer.push(s),i&&this.once("flush",i),this.flush()}close(){const e=()=>{this._onClose("forced close"),this.transport.close()},t=()=>{this.off("upgrade",t),this.off("upgradeError",t),e()},r=()=>{this.once("upgrade",t),this.once("upgradeError",t)};return(this.readyState==="opening"||this.readyState==="open")&&(this.readyState="closing",this.writeBuffer.length?this.once("drain",()=>{this.upgrading?r():e()}):this.upgrading?r():e()),this}_onError(e){if(Y.priorWebsocketSuccess=!1,this.opts.tryAllTransports&&this.transports.length>1&&this.readyState==="opening")return this.transports.shift(),this._open();this.emitReserved("error",e),this._onClose("transport error",e)}_onClose(e,t){if(this.readyState==="opening"||this.readyState==="open"||this.readyState==="closing"){if(this.clearTimeoutFn(this._pingTimeoutTimer),this.transport.removeAllListeners("close"),this.transport.close(),this.transport.removeAllListeners(),Ce&&(this._beforeunloadEventListener&&removeEventListener("beforeunload",this._beforeunloadEventListener,!1),this._offlineEventListener)){const r=se.indexOf(this._offlineEventListener);r!==-1&&se.splice(r,1)}this.readyState="closed",this.id=null,this.emitReserved("close",e,t),this.writeBuffer=[],this._prevBufferLen=0}}}Y.protocol=St;class An extends Y{constructor(){super(...arguments),this._upgrades=[]}onOpen(){if(super.onOpen(),this.readyState==="open"&&this.opts.upgrade)for(let e=0;e<this._upgrades.length;e++)this._probe(this._upgrades[e])}_probe(e){let t=this.createTransport(e),r=!1;Y.priorWebsocketSuccess=!1;const i=()=>{r||(t.send([{type:"ping",data:"probe"}]),t.once("packet",c=>{if(!r)if(c.type==="pong"&&c.data==="probe"){if(this.upgrading=!0,this.emitReserved("upgrading",t),!t)return;Y.priorWebsocketSuccess=t.name==="websocket",this.transport.pause(()=>{r||this.readyState!=="closed"&&(f(),this.setTransport(t),t.send([{type:"upgrade"}]),this.emitReserved("upgrade",t),t=null,this.upgrading=!1,this.flush())})}else{const h=new Error("probe error");h.transport=t.name,this.emitReserved("upgradeError",h)}}))};function s(){r||(r=!0,f(),t.close(),t=null)}const a=c=>{const h=new Error("probe error: "+c);h.transport=t.name,s(),this.emitReserved("upgradeError",h)};function l(){a("transport closed")}function d(){a("socket closed")}function u(c){t&&c.name!==t.name&&s()}const f=()=>{t.removeListener("open",i),t.removeListener("error",a),t.removeListener("close",l),this.off("close",d),this.off("upgrading",u)};t.once("open",i),t.once("error",a),t.once("close",l),this.once("close",d),this.once("upgrading",u),this._upgrades.indexOf("webtransport")!==-1&&e!=="webtransport"?this.setTimeoutFn(()=>{r||t.open()},200):t.open()}onHandshake(e){this._upgrades=this._filterUpgrades(e.upgrades),super.onHandshake(e)}_filterUpgrades(e){const t=[];for(let r=0;r<e.length;r++)~this.transports.indexOf(e[r])&&t.push(e[r]);return t}}let Nn=class extends An{constructor(e,t={}){const r=typeof e=="object"?e:t;(!r.transports||r.transports&&typeof r.transports[0]=="string")&&(r.transports=(r.transports||["polling","websocket","webtransport"]).map(i=>kn[i]).filter(i=>!!i)),super(e,r)}};function Rn(n,e="",t){let r=n;t=t||typeof location<"u"&&location,n==null&&(n=t.protocol+"//"+t.host),typeof n=="string"&&(n.charAt(0)==="/"&&(n.charAt(1)==="/"?n=t.protocol+n:n=t.host+n),/^(https?|wss?):\/\//.test(n)||(typeof t<"u"?n=t.protocol+"//"+n:n="https://"+n),r=Se(n)),r.port||(/^(http|ws)$/.test(r.protocol)?r.port="80":/^(http|ws)s$/.test(r.protocol)&&(r.port="443")),r.path=r.path||"/";const s=r.host.indexOf(":")!==-1?"["+r.host+"]":r.host;return r.id=r.protocol+"://"+s+":"+r.port+e,r.href=r.protocol+"://"+s+(t&&t.port===r.port?"":":"+r.port),r}const On=typeof ArrayBuffer=="function",Bn=n=>typeof ArrayBuffer.isView=="function"?ArrayBuffer.isView(n):n.buffer instanceof ArrayBuffer,Ot=Object.prototype.toString,Ln=typeof Blob=="function"||typeof Blob<"u"&&Ot.call(Blob)==="[object BlobConstructor]",Pn=typeof File=="function"||typeof File<"u"&&Ot.call(File)==="[object FileConstructor]";function De(n){return On&&(n instanceof ArrayBuffer||Bn(n))||Ln&&n instanceof Blob||Pn&&n instanceof File}function oe(n,e){if(!n||typeof n!="object")return!1;if(Array.isArray(n)){for(let t=0,r=n.length;t<r;t++)if(oe(n[t]))return!0;return!1}if(De(n))return!0;if(n.toJSON&&typeof n.toJSON=="function"&&arguments.length===1)return oe(n.toJSON(),!0);for(const t in n)if(Object.prototype.hasOwnProperty.call(n,t)&&oe(n[t]))return!0;return!1}function In(n){const e=[],t=n.data,r=n;return r.data=Te(t,e),r.attachments=e.length,{packet:r,buffers:e}}function Te(n,e){if(!n)return n;if(De(n)){const t={_placeholder:!0,num:e.length};return e.push(n),t}else if(Array.isArray(n)){const t=new Array(n.length);for(let r=0;r<n.length;r++)t[r]=Te(n[r],e);return t}else if(typeof n=="object"&&!(n instanceof Date)){const t={};for(const r in n)Object.prototype.hasOwnProperty.call(n,r)&&(t[r]=Te(n[r],e));return t}return n}function $n(n,e){return n.data=Ae(n.data,e),delete n.attachments,n}function Ae(n,e){if(!n)return n;if(n&&n._placeholder===!0){if(typeof n.num=="number"&&n.num>=0&&n.num<e.length)return e[n.num];throw new Error("illegal attachments")}else if(Array.isArray(n))for(let t=0;t<n.length;t++)n[t]=Ae(n[t],e);else if(typeof n=="object")for(const t in n)Object.prototype.hasOwnProperty.call(n,t)&&(n[t]=Ae(n[t],e));return n}const Mn=["connect","connect_error","disconnect","disconnecting","newListener","removeListener"],Dn=5;var S;(function(n){n[n.CONNECT=0]="CONNECT",n[n.DISCONNECT=1]="DISCONNECT",n[n.EVENT=2]="EVENT",n[n.ACK=3]="ACK",n[n.CONNECT_ERROR=4]="CONNECT_ERROR",n[n.BINARY_EVENT=5]="BINARY_EVENT",n[n.BINARY_ACK=6]="BINARY_ACK"})(S||(S={}));class qn{constructor(e){this.replacer=e}encode(e){return(e.type===S.EVENT||e.type===S.ACK)&&oe(e)?this.encodeAsBinary({type:e.type===S.EVENT?S.BINARY_EVENT:S.BINARY_ACK,nsp:e.nsp,data:e.data,id:e.id}):[this.encodeAsString(e)]}encodeAsString(e){let t=""+e.type;return(e.type===S.BINARY_EVENT||e.type===S.BINARY_ACK)&&(t+=e.attachments+"-"),e.nsp&&e.nsp!=="/"&&(t+=e.nsp+","),e.id!=null&&(t+=e.id),e.data!=null&&(t+=JSON.stringify(e.data,this.replacer)),t}encodeAsBinary(e){const t=In(e),r=this.encodeAsString(t.packet),i=t.buffers;return i.unshift(r),i}}function tt(n){return Object.prototype.toString.call(n)==="[object Object]"}class qe extends P{constructor(e){super(),this.reviver=e}add(e){let t;if(typeof e=="string"){if(this.reconstructor)throw new Error("got plaintext data when reconstructing a packet");t=this.decodeString(e);const r=t.type===S.BINARY_EVENT;r||t.type===S.BINARY_ACK?(t.type=r?S.EVENT:S.ACK,this.reconstructor=new Fn(t),t.attachments===0&&super.emitReserved("decoded",t)):super.emitReserved("decoded",t)}else if(De(e)||e.base64)if(this.reconstructor)t=this.reconstructor.takeBinaryData(e),t&&(this.reconstructor=null,super.emitReserved("decoded",t));else throw new Error("got binary data when not reconstructing a packet");else throw new Error("Unknown type: "+e)}decodeString(e){let t=0;const r={type:Number(e.charAt(0))};if(S[r.type]===void 0)throw new Error("unknown packet type "+r.type);if(r.type===S.BINARY_EVENT||r.type===S.BINARY_ACK){const s=t+1;for(;e.charAt(++t)!=="-"&&t!=e.length;);const a=e.substring(s,t);if(a!=Number(a)||e.charAt(t)!=="-")throw new Error("Illegal attachments");r.attachments=Number(a)}if(e.charAt(t+1)==="/"){const s=t+1;for(;++t&&!(e.charAt(t)===","||t===e.length););r.nsp=e.substring(s,t)}else r.nsp="/";const i=e.charAt(t+1);if(i!==""&&Number(i)==i){const s=t+1;for(;++t;){const a=e.charAt(t);if(a==null||Number(a)!=a){--t;break}if(t===e.length)break}r.id=Number(e.substring(s,t+1))}if(e.charAt(++t)){const s=this.tryParse(e.substr(t));if(qe.isPayloadValid(r.type,s))r.data=s;else throw new Error("invalid payload")}return r}tryParse(e){try{return JSON.parse(e,this.reviver)}catch{return!1}}static isPayloadValid(e,t){switch(e){case S.CONNECT:return tt(t);case S.DISCONNECT:return t===void 0;case S.CONNECT_ERROR:return typeof t=="string"||tt(t);case S.EVENT:case S.BINARY_EVENT:return Array.isArray(t)&&(typeof t[0]=="number"||typeof t[0]=="string"&&Mn.indexOf(t[0])===-1);case S.ACK:case S.BINARY_ACK:return Array.isArray(t)}}destroy(){this.reconstructor&&(this.reconstructor.finishedReconstruction(),this.reconstructor=null)}}class Fn{constructor(e){this.packet=e,this.buffers=[],this.reconPack=e}takeBinaryData(e){if(this.buffers.push(e),this.buffers.length===this.reconPack.attachments){const t=$n(this.reconPack,this.buffers);return this.finishedReconstruction(),t}return null}finishedReconstruction(){this.reconPack=null,this.buffers=[]}}const Un=Object.freeze(Object.defineProperty({__proto__:null,Decoder:qe,Encoder:qn,get PacketType(){return S},protocol:Dn},Symbol.toStringTag,{value:"Module"}));function D(n,e,t){return n.on(e,t),function(){n.off(e,t)}}const Hn=Object.freeze({connect:1,connect_error:1,disconnect:1,disconnecting:1,newListener:1,removeListener:1});class Bt extends P{constructor(e,t,r){super(),this.connected=!1,this.recovered=!1,this.receiveBuffer=[],this.sendBuffer=[],this._queue=[],this._queueSeq=0,this.ids=0,this.acks={},this.flags={},this.io=e,this.nsp=t,r&&r.auth&&(this.auth=r.auth),this._opts=Object.assign({},r),this.io._autoConnect&&this.open()}get disconnected(){return!this.connected}subEvents(){if(this.subs)return;const e=this.io;this.subs=[D(e,"open",this.onopen.bind(this)),D(e,"packet",this.onpacket.bind(this)),D(e,"error",this.onerror.bind(this)),D(e,"close",this.onclose.bind(this))]}get active(){return!!this.subs}connect(){return this.connected?this:(this.subEvents(),this.io._reconnecting||this.io.open(),this.io._readyState==="open"&&this.onopen(),this)}open(){return this.connect()}send(...e){return e.unshift("message"),this.emit.apply(this,e),this}emit(e,...t){var r,i,s;if(Hn.hasOwnProperty(e))throw new Error('"'+e.toString()+'" is a reserved event name');if(t.unshift(e),this._opts.retries&&!this.flags.fromQueue&&!this.flags.volatile)return this._addToQueue(t),this;const a={type:S.EVENT,data:t};if(a.options={},a.options.compress=this.flags.compress!==!1,typeof t[t.length-1]=="function"){const f=this.ids++,c=t.pop();this._registerAckCallback(f,c),a.id=f}const l=(i=(r=this.io.engine)===null||r===void 0?void 0:r.transport)===null||i===void 0?void 0:i.writable,d=this.connected&&!(!((s=this.io.engine)===null||s===void 0)&&s._hasPingExpired());return this.flags.volatile&&!l||(d?(this.notifyOutgoingListeners(a),this.packet(a)):this.sendBuffer.push(a)),this.flags={},this}_registerAckCallback(e,t){var r;const i=(r=this.flags.timeout)!==null&&r!==void 0?r:this._opts.ackTimeout;if(i===void 0){this.acks[e]=t;return}const s=this.io.setTimeoutFn(()=>{delete this.acks[e];for(let l=0;l<this.sendBuffer.length;l++)this.sendBuffer[l].id===e&&this.sendBuffer.splice(l,1);t.call(this,new Error("operation has timed out"))},i),a=(...l)=>{this.io.clearTimeoutFn(s),t.apply(this,l)};a.withError=!0,this.acks[e]=a}emitWithAck(e,...t){return new Promise((r,i)=>{const s=(a,l)=>a?i(a):r(l);s.withError=!0,t.push(s),this.emit(e,...t)})}_addToQueue(e){let t;typeof e[e.length-1]=="function"&&(t=e.pop());const r={id:this._queueSeq++,tryCount:0,pending:!1,args:e,flags:Object.assign({fromQueue:!0},this.flags)};e.push((i,...s)=>r!==this._queue[0]?void 0:(i!==null?r.tryCount>this._opts.retries&&(this._queue.shift(),t&&t(i)):(this._queue.shift(),t&&t(null,...s)),r.pending=!1,this._drainQueue())),this._queue.push(r),this._drainQueue()}_drainQueue(e=!1){if(!this.connected||this._queue.length===0)return;const t=this._queue[0];t.pending&&!e||(t.pending=!0,t.tryCount++,this.flags=t.flags,this.emit.apply(this,t.args))}packet(e){e.nsp=this.nsp,this.io._packet(e)}onopen(){typeof this.auth=="function"?this.auth(e=>{this._sendConnectPacket(e)}):this._sendConnectPacket(this.auth)}_sendConnectPacket(e){this.packet({type:S.CONNECT,data:this._pid?Object.assign({pid:this._pid,offset:this._lastOffset},e):e})}onerror(e){this.connected||this.emitReserved("connect_error",e)}onclose(e,t){this.connected=!1,delete this.id,this.emitReserved("disconnect",e,t),this._clearAcks()}_clearAcks(){Object.keys(this.acks).forEach(e=>{if(!this.sendBuffer.some(r=>String(r.id)===e)){const r=this.acks[e];delete this.acks[e],r.withError&&r.call(this,new Error("socket has been disconnected"))}})}onpacket(e){if(e.nsp===this.nsp)switch(e.type){case S.CONNECT:e.data&&e.data.sid?this.onconnect(e.data.sid,e.data.pid):this.emitReserved("connect_error",new Error("It seems you are trying to reach a Socket.IO server in v2.x with a v3.x client, but they are not compatible (more information here: https://socket.io/docs/v3/migrating-from-2-x-to-3-0/)"));break;case S.EVENT:case S.BINARY_EVENT:this.onevent(e);break;case S.ACK:case S.BINARY_ACK:this.onack(e);break;case S.DISCONNECT:this.ondisconnect();break;case S.CONNECT_ERROR:this.destroy();const r=new Error(e.data.message);r.data=e.data.data,this.emitReserved("connect_error",r);break}}onevent(e){const t=e.data||[];e.id!=null&&t.push(this.ack(e.id)),this.connected?this.emitEvent(t):this.receiveBuffer.push(Object.freeze(t))}emitEvent(e){if(this._anyListeners&&this._anyListeners.length){const t=this._anyListeners.slice();for(const r of t)r.apply(this,e)}super.emit.apply(this,e),this._pid&&e.length&&typeof e[e.length-1]=="string"&&(this._lastOffset=e[e.length-1])}ack(e){const t=this;let r=!1;return function(...i){r||(r=!0,t.packet({type:S.ACK,id:e,data:i}))}}onack(e){const t=this.acks[e.id];typeof t=="function"&&(delete this.acks[e.id],t.withError&&e.data.unshift(null),t.apply(this,e.data))}onconnect(e,t){this.id=e,this.recovered=t&&this._pid===t,this._pid=t,this.connected=!0,this.emitBuffered(),this.emitReserved("connect"),this._drainQueue(!0)}emitBuffered(){this.receiveBuffer.forEach(e=>this.emitEvent(e)),this.receiveBuffer=[],this.sendBuffer.forEach(e=>{this.notifyOutgoingListeners(e),this.packet(e)}),this.sendBuffer=[]}ondisconnect(){this.destroy(),this.onclose("io server disconnect")}destroy(){this.subs&&(this.subs.forEach(e=>e()),this.subs=void 0),this.io._destroy(this)}disconnect(){return this.connected&&this.packet({type:S.DISCONNECT}),this.destroy(),this.connected&&this.onclose("io client disconnect"),this}close(){return this.disconnect()}compress(e){return this.flags.compress=e,this}get volatile(){return this.flags.volatile=!0,this}timeout(e){return this.flags.timeout=e,this}onAny(e){return this._anyListeners=this._anyListeners||[],this._anyListeners.push(e),this}prependAny(e){return this._anyListeners=this._anyListeners||[],this._anyListeners.unshift(e),this}offAny(e){if(!this._anyListeners)return this;if(e){const t=this._anyListeners;for(let r=0;r<t.length;r++)if(e===t[r])return t.splice(r,1),this}else this._anyListeners=[];return this}listenersAny(){return this._anyListeners||[]}onAnyOutgoing(e){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.push(e),this}prependAnyOutgoing(e){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.unshift(e),this}offAnyOutgoing(e){if(!this._anyOutgoingListeners)return this;if(e){const t=this._anyOutgoingListeners;for(let r=0;r<t.length;r++)if(e===t[r])return t.splice(r,1),this}else this._anyOutgoingListeners=[];return this}listenersAnyOutgoing(){return this._anyOutgoingListeners||[]}notifyOutgoingListeners(e){if(this._anyOutgoingListeners&&this._anyOutgoingListeners.length){const t=this._anyOutgoingListeners.slice();for(const r of t)r.apply(this,e.data)}}}function z(n){n=n||{},this.ms=n.min||100,this.max=n.max||1e4,this.factor=n.factor||2,this.jitter=n.jitter>0&&n.jitter<=1?n.jitter:0,this.attempts=0}z.prototype.duration=function(){var n=this.ms*Math.pow(this.factor,this.attempts++);if(this.jitter){var e=Math.random(),t=Math.floor(e*this.jitter*n);n=(Math.floor(e*10)&1)==0?n-t:n+t}return Math.min(n,this.max)|0};z.prototype.reset=function(){this.attempts=0};z.prototype.setMin=function(n){this.ms=n};z.prototype.setMax=function(n){this.max=n};z.prototype.setJitter=function(n){this.jitter=n};class Ne extends P{constructor(e,t){var r;super(),this.nsps={},this.subs=[],e&&typeof e=="object"&&(t=e,e=void 0),t=t||{},t.path=t.path||"/socket.io",this.opts=t,pe(this,t),this.reconnection(t.reconnection!==!1),this.reconnectionAttempts(t.reconnectionAttempts||1/0),this.reconnectionDelay(t.reconnectionDelay||1e3),this.reconnectionDelayMax(t.reconnectionDelayMax||5e3),this.randomizationFactor((r=t.randomizationFactor)!==null&&r!==void 0?r:.5),this.backoff=new z({min:this.reconnectionDelay(),max:this.reconnectionDelayMax(),jitter:this.randomizationFactor()}),this.timeout(t.timeout==null?2e4:t.timeout),this._readyState="closed",this.uri=e;const i=t.parser||Un;this.encoder=new i.Encoder,this.decoder=new i.Decoder,this._autoConnect=t.autoConnect!==!1,this._autoConnect&&this.open()}reconnection(e){return arguments.length?(this._reconnection=!!e,e||(this.skipReconnect=!0),this):this._reconnection}reconnectionAttempts(e){return e===void 0?this._reconnectionAttempts:(this._reconnectionAttempts=e,this)}reconnectionDelay(e){var t;return e===void 0?this._reconnectionDelay:(this._reconnectionDelay=e,(t=this.backoff)===null||t===void 0||t.setMin(e),this)}randomizationFactor(e){var t;return e===void 0?this._randomizationFactor:(this._randomizationFactor=e,(t=this.backoff)===null||t===void 0||t.setJitter(e),this)}reconnectionDelayMax(e){var t;return e===void 0?this._reconnectionDelayMax:(this._reconnectionDelayMax=e,(t=this.backoff)===null||t===void 0||t.setMax(e),this)}timeout(e){return arguments.length?(this._timeout=e,this):this._timeout}maybeReconnectOnOpen(){!this._reconnecting&&this._reconnection&&this.backoff.attempts===0&&this.reconnect()}open(e){if(~this._readyState.indexOf("open"))return this;this.engine=new Nn(this.uri,this.opts);const t=this.engine,r=this;this._readyState="opening",this.skipReconnect=!1;const i=D(t,"open",function(){r.onopen(),e&&e()}),s=l=>{this.cleanup(),this._readyState="closed",this.emitReserved("error",l),e?e(l):this.maybeReconnectOnOpen()},a=D(t,"error",s);if(this._timeout!==!1){const l=this._timeout,d=this.setTimeoutFn(()=>{i(),s(new Error("timeout")),t.close()},l);this.opts.autoUnref&&d.unref(),this.subs.push(()=>{this.clearTimeoutFn(d)})}return this.subs.push(i),this.subs.push(a),this}connect(e){return this.open(e)}onopen(){this.cleanup(),this._readyState="open",this.emitReserved("open");const e=this.engine;this.subs.push(D(e,"ping",this.onping.bind(this)),D(e,"data",this.ondata.bind(this)),D(e,"error",this.onerror.bind(this)),D(e,"close",this.onclose.bind(this)),D(this.decoder,"decoded",this.ondecoded.bind(this)))}onping(){this.emitReserved("ping")}ondata(e){try{this.decoder.add(e)}catch(t){this.onclose("parse error",t)}}ondecoded(e){fe(()=>{this.emitReserved("packet",e)},this.setTimeoutFn)}onerror(e){this.emitReserved("error",e)}socket(e,t){let r=this.nsps[e];return r?this._autoConnect&&!r.active&&r.connect():(r=new Bt(this,e,t),this.nsps[e]=r),r}_destroy(e){const t=Object.keys(this.nsps);for(const r of t)if(this.nsps[r].active)return;this._close()}_packet(e){const t=this.encoder.encode(e);for(let r=0;r<t.length;r++)this.engine.write(t[r],e.options)}cleanup(){this.subs.forEach(e=>e()),this.subs.length=0,this.decoder.destroy()}_close(){this.skipReconnect=!0,this._reconnecting=!1,this.onclose("forced close")}disconnect(){return this._close()}onclose(e,t){var r;this.cleanup(),(r=this.engine)===null||r===void 0||r.close(),this.backoff.reset(),this._readyState="closed",this.emitReserved("close",e,t),this._reconnection&&!this.skipReconnect&&this.reconnect()}reconnect(){if(this._reconnecting||this.skipReconnect)return this;const e=this;if(this.backoff.attempts>=this._reconnectionAttempts)this.backoff.reset(),this.emitReserved("reconnect_failed"),this._reconnecting=!1;else{const t=this.backoff.duration();this._reconnecting=!0;const r=this.setTimeoutFn(()=>{e.skipReconnect||(this.emitReserved("reconnect_attempt",e.backoff.attempts),!e.skipReconnect&&e.open(i=>{i?(e._reconnecting=!1,e.reconnect(),this.emitReserved("reconnect_error",i)):e.onreconnect()}))},t);this.opts.autoUnref&&r.unref(),this.subs.push(()=>{this.clearTimeoutFn(r)})}}onreconnect(){const e=this.backoff.attempts;this._reconnecting=!1,this.backoff.reset(),this.emitReserved("reconnect",e)}}const K={};function ae(n,e){typeof n=="object"&&(e=n,n=void 0),e=e||{};const t=Rn(n,e.path||"/socket.io"),r=t.source,i=t.id,s=t.path,a=K[i]&&s in K[i].nsps,l=e.forceNew||e["force new connection"]||e.multiplex===!1||a;let d;return l?d=new Ne(r,e):(K[i]||(K[i]=new Ne(r,e)),d=K[i]),t.query&&!e.query&&(e.query=t.queryKey),d.socket(t.path,e)}Object.assign(ae,{Manager:Ne,Socket:Bt,io:ae,connect:ae});const Vn=void 0,B=ae(Vn);function Yn({n,i:e,nodes:t,update_node:r}){const i=h=>r(e,{...n,command:{...n.command,x:h}}),s=h=>r(e,{...n,command:{...n.command,y:h}}),a=h=>r(e,{...n,command:{...n.command,s:h}}),l=h=>r(e,{...n,command:{...n.command,p:h}}),d=h=>r(e,{...n,command:{...n.command,f:h}}),u=h=>r(e,{...n,command:{...n.command,e:h}}),f=h=>r(e,{...n,command:{...n.command,str:h}}),c=h=>{const m=gt(e,t);if(m!==null){const{x:b,y:_}=m.command,p=n.command.x,v=n.command.y;h<1e-4&&(h=Math.ceil(Math.sqrt(Math.pow(p-b,2)+Math.pow(v-_,2))*500/2)/500),r(e,{...n,command:{...n.command,r:h}})}else r(e,{...n,command:{...n.command,r:h}})};switch(n.command.type){case x.Iniciar:return o($,{children:[o("label",{children:[" ",o("input",{title:"x (mm)",type:"number",step:"0.2",value:n.command.x,onChange:h=>i(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"y (mm)",type:"number",step:"0.2",value:n.command.y,onChange:h=>s(parseFloat(h.target.value))})," "]})]});case x.Linear:return o($,{children:[o("label",{children:[" ",o("input",{title:"x (mm)",type:"number",step:"0.2",value:n.command.x,onChange:h=>i(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"y (mm)",type:"number",step:"0.2",value:n.command.y,onChange:h=>s(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"velocidade (mm/s)",type:"number",step:"1",value:n.command.s,onInput:h=>a(parseFloat(h.target.value))})," "]})]});case x.Arco_horario:return o($,{children:[o("label",{children:[" ",o("input",{title:"x (mm)",type:"number",step:"0.2",value:n.command.x,onChange:h=>i(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"y (mm)",type:"number",step:"0.2",value:n.command.y,onChange:h=>s(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"velocidade (mm/s)",type:"number",step:"1",value:n.command.s,onInput:h=>a(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"radio (mm)",type:"number",step:"0.2",value:n.command.r,onInput:h=>c(parseFloat(h.target.value))})," "]})]});case x.Arco_antihorario:return o($,{children:[o("label",{children:[" ",o("input",{title:"x (mm)",type:"number",step:"0.2",value:n.command.x,onChange:h=>i(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"y (mm)",type:"number",step:"0.2",value:n.command.y,onChange:h=>s(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"velocidade (mm/s)",type:"number",step:"1",value:n.command.s,onInput:h=>a(parseFloat(h.target.value))})," "]}),o("label",{children:[" ",o("input",{title:"radio (mm)",type:"number",step:"0.2",value:n.command.r,onInput:h=>c(parseFloat(h.target.value))})," "]})]});case x.Sleep:return o("label",{children:[" ",o("input",{title:"tempo (mm)",type:"number",min:"0",step:"1",value:n.command.p,onInput:h=>l(parseInt(h.target.value))})," "]});case x.Start_acquisition:return o($,{children:[o("label",{children:[" ",o("input",{title:"frequência de disparo do encoder modo tempo (pulsos/s)",type:"number",step:"0.1",value:n.command.f,onInput:h=>d(parseFloat(h.target.value))})," "]}),o("label",{style:"grid-area: auto / auto / span 1 / span 3;",children:o("input",{title:"nome da aquisição",type:"text",value:n.command.str,onInput:h=>f(h.target.value)})})]});case x.Stop_acquisition:return null;case x.Start_stream:return null;case x.Stop_stream:return null;case x.Set_exposure:return o($,{children:o("label",{children:[" ",o("input",{title:"tempo (us)",type:"number",step:"0.1",value:n.command.e,onInput:h=>u(parseFloat(h.target.value))})," "]})})}}function Wn({status:n,offset:e,setOffset:t,bounds:r}){const i=_t(null),{is_dirty:s,setIsDirty:a,nodes:l,setNodes:d,getNextNodeId:u}=Pe();function f(g){g.preventDefault();const w=[...l].reverse().find(N=>x.is_movement(N.command.type))?.command||{x:40,y:10,s:50};let k={id:u(),command:{type:x.Linear,x:w.x+10,y:w.y+40,s:w.s,p:1e3,r:100,f:10,str:"",e:500}};k.command.y>r.height-50&&(k.command.x+=40,k.command.y=50),k.command.x>r.width-50&&(k.command.x=50),l.length===0&&(k.command.type=x.Iniciar),d(N=>[...N,k]),a(!0)}function c(g,y){g.preventDefault(),d(w=>{const k=[...w];return k.splice(y,1),a(!0),k})}function h(g,y){d(w=>{let k=[...w];return k[g]={...y},k[g].command.x=Math.max(Math.min(Math.round(k[g].command.x*5)/5,r.x0+r.width),r.x0)-e.x,k[g].command.y=Math.max(Math.min(Math.round(k[g].command.y*5)/5,r.y0+r.height),r.y0)-e.y,a(!0),k})}function m(){const g=l.map(y=>{const w=y.command.x+e.x,k=y.command.y+e.y;switch(y.command.type){case x.Iniciar:return`G0 X${w} Y${k}`;case x.Linear:return`G1 X${w} Y${k} S${y.command.s}`;case x.Arco_horario:return`G2 X${w} Y${k} S${y.command.s} R${y.command.r}`;case x.Arco_antihorario:return`G3 X${w} Y${k} S${y.command.s} R${y.command.r}`;case x.Sleep:return`G4 P${y.command.p}`;case x.Start_acquisition:return`M1000 F${y.command.f} "${y.command.str}"`;case x.Stop_acquisition:return"M1001";case x.Start_stream:return"M1002";case x.Stop_stream:return"M1003";case x.Set_exposure:return`M1004 E${y.command.e}`}}).join(`
-`);B.emit("gcode",g),a(!1)}function b(){B.emit("gcode","G28"),a(!0)}function _(){n.running?B.emit("pause"):B.emit("play")}function p(){B.emit("step")}function v(g,y){i.current=y,g.dataTransfer.effectAllowed="move"}function E(g,y){g.preventDefault(),g.dataTransfer.dropEffect="move";const w=i.current;w===null||w===y||d(k=>{const N=[...k],[T]=N.splice(w,1);return y===0?(N[y].command.type=T.command.type,T.command.type=x.Iniciar):i.current===0&&(T.command.type=N[y-1].command.type),N.splice(y,0,T),i.current=y,N})}function C(g){g.preventDefault(),i.current=null}return o($,{children:[o("table",{children:[o("thead",{children:o("tr",{children:[o("th",{children:" Offset X "}),o("th",{children:" Offset Y "})]})}),o("tbody",{children:o("tr",{children:[o("th",{children:[" ",o("input",{type:"number",step:"0.2",value:e.x,onInput:g=>t({x:parseFloat(g.target.value),y:e.y})})," "]}),o("th",{children:[" ",o("input",{type:"number",step:"0.2",value:e.y,onInput:g=>t({x:e.x,y:parseFloat(g.target.value)})})," "]})]})})]}),o("div",{className:"trajetoria",children:[o("div",{class:"table",children:[o("div",{class:"trow",children:[o("div",{}),o("div",{children:"Comando"}),o("div",{children:["X (mm) ",o("br",{})," T (ms)"]}),o("div",{children:"Y (mm)"}),o("div",{children:"Speed (mm/s)"}),o("div",{children:"Raio (mm)"})]}),l.map((g,y)=>o("div",{class:"trow",children:[o("div",{draggable:!0,onDragStart:w=>v(w,y),onDragOver:w=>E(w,y),onDrop:C,children:o("i",{class:"mv-node bi bi-list"})}),o("select",{class:"command-sel",value:g.command.type,onInput:w=>h(y,{...g,command:{...g.command,type:parseInt(w.target.value)}}),children:y==0?o("option",{value:x.Iniciar,children:" Iniciar "}):o($,{children:[o("optgroup",{label:"Movimento",children:[o("option",{value:x.Linear,children:" Linear "}),o("option",{value:x.Arco_horario,children:" Arco 1 ↷ "}),o("option",{value:x.Arco_antihorario,children:" Arco 2 ↶ "}),o("option",{value:x.Sleep,children:" Sleep "})]}),o("hr",{}),o("optgroup",{label:"Encoder Virtual",children:[o("option",{value:x.Start_acquisition,children:" Iniciar Aquisição "}),o("option",{value:x.Stop_acquisition,children:" Parar Aquisição "}),o("option",{value:x.Set_exposure,children:" Setar Exposição "}),o("option",{value:x.Start_stream,children:" Iniciar Stream "}),o("option",{value:x.Stop_stream,children:" Parar Stream "})]})]})}),o(Yn,{n:g,i:y,nodes:l,update_node:h}),o("i",{class:"rm-node bi bi-x-circle",onClick:w=>c(w,y),onMouseEnter:w=>w.target.classList.replace("bi-x-circle","bi-x-circle-fill"),onMouseLeave:w=>w.target.classList.replace("bi-x-circle-fill","bi-x-circle")})]},g.id))]}),o("div",{className:"controls",children:[o("button",{disabled:n.running,onClick:f,children:" + 1 "}),o("button",{disabled:!n.connected||!n.calibrated||n.running,onClick:m,children:" Preparar trajetória "}),o("button",{disabled:!n.running&&(!n.connected||!n.calibrated||!n.gcode_loaded||s),onClick:_,children:n.running?o("span",{children:[o("i",{class:"bi bi-pause-circle"})," Pause"]}):o("span",{children:[o("i",{class:"bi bi-play-circle"})," Play"]})}),o("button",{disabled:!n.connected||!n.calibrated||!n.gcode_loaded||s||n.running,onClick:p,children:[o("i",{class:"bi bi-arrow-bar-right"})," Step"]}),o("button",{disabled:!n.connected||n.running,onClick:b,children:o("span",{children:[o("i",{class:"bi bi-house-fill"})," Calibrar Home"]})})]})]})]})}function Xn({status:n,stepSize:e,setStepSize:t,target:r,setTarget:i}){function s(b){i(_=>({x:b,y:_.y}))}function a(b){i(_=>({x:_.x,y:b}))}function l(b){b=Math.round(b*5)/5,t(b)}function d(){B.emit("gcode",`G0 X${r.x} Y${r.y}`)}function u(){B.emit("gcode","G28")}function f(){const b=n.pos[0]-e,_=n.pos[1];B.emit("gcode",`G0 X${b} Y${_}`)}function c(){const b=n.pos[0]+e,_=n.pos[1];B.emit("gcode",`G0 X${b} Y${_}`)}function h(){const b=n.pos[0],_=n.pos[1]-e;B.emit("gcode",`G0 X${b} Y${_}`)}function m(){const b=n.pos[0],_=n.pos[1]+e;B.emit("gcode",`G0 X${b} Y${_}`)}return o($,{children:[o("div",{className:"manual-wrap",children:[o("button",{disabled:!n.connected||!n.calibrated||n.running,onClick:h,children:o("i",{class:"bi bi-arrow-up"})}),o("button",{disabled:!n.connected||!n.calibrated||n.running,onClick:f,children:o("i",{class:"bi bi-arrow-left"})}),o("button",{disabled:!n.connected||n.running,onClick:u,children:o("i",{class:"home bi bi-house-fill"})}),o("button",{disabled:!n.connected||!n.calibrated||n.running,onClick:c,children:o("i",{class:"bi bi-arrow-right"})}),o("button",{disabled:!n.connected||!n.calibrated||n.running,onClick:m,children:o("i",{class:"bi bi-arrow-down"})})]}),o("label",{className:"manual-multiplier",children:[o("span",{children:"Tamanho do passo (mm):"}),o("input",{type:"number",step:"0.2",value:e,onChange:b=>l(parseFloat(b.target.value))})]}),o("label",{className:"manual-goto",children:[o("input",{type:"number",step:"0.2",placeholder:"x",value:r.x,onChange:b=>s(parseFloat(b.target.value))}),o("input",{type:"number",step:"0.2",placeholder:"y",value:r.y,onSubmit:console.log,onChange:b=>a(parseFloat(b.target.value))}),o("button",{onClick:()=>d(),children:"Go to"})]})]})}function jn({trajectoryImgSrc:n}){const{nodes:e,setNodes:t,encoder_host:r}=Pe();function i(){B.emit("shutdown"),alert("Desligando o atuador... Aguarde 1min antes de desligar a fonte de energia.")}function s(a){B.emit("set_encoder_host",a)}return o($,{children:[o("h2",{children:"Configurações"}),o("div",{className:"settings",children:[o("label",{children:[o("span",{children:"Trajetória: "}),o("textarea",{onInput:a=>t(JSON.parse(a.target.value)),children:[" ",JSON.stringify(e)]})]}),o("label",{children:[o("span",{children:"IP do encoder: "}),o("input",{type:"text",onInput:a=>s(a.target.value),value:r})]}),n!==void 0?o("div",{className:"last-trajectory",children:[o("a",{href:"/dl/trajectory.npz",children:"Baixar última trajetória realizada"}),o("img",{src:n})]}):null]}),o("button",{onClick:i,children:" Shutdown "})]})}function zn({pos:n}){const e=Math.round(100*n[0])/100,t=Math.round(100*n[1])/100;function r({target:i}){const s=i.innerText;navigator.clipboard.writeText(s)}return o("div",{class:"pos-display",children:[o("span",{title:"Click para copiar X",onClick:r,children:e}),", ",o("span",{title:"Click para copiar Y",onClick:r,children:t})]})}function Kn(){const[n,e]=q(0),[t,r]=q("virtual-encoder.local"),[i,s]=q(JSON.parse(localStorage.getItem("nodes")||"[]")),[a,l]=q(Math.max(...i.map(T=>T.id))+1),[d,u]=q({x:0,y:0}),[f,c]=q(!0),[h,m]=q(1),[b,_]=q({x:0,y:0}),[p,v]=q(void 0),E=T=>{const R=T instanceof Function?T(h):T;m(Math.round(R*5)/5)},C=T=>{const R=T instanceof Function?T(b):T,I=Math.round(R.x*5)/5,V=Math.round(R.y*5)/5;_({x:I,y:V})},g=T=>{const R=T instanceof Function?T(i):T;R[0].command.type=x.Iniciar,localStorage.setItem("nodes",JSON.stringify(R)),s(R)},y=()=>{const T=a;return l(R=>R+1),T},w={x0:0,y0:0,width:410,height:335},[k,N]=q({connected:!0,running:!1,gcode_loaded:!1,pos:[0,0],calibrated:!1});return Vt(()=>{const T=setTimeout(()=>N(R=>({...R,connected:!1})),3e3);return B.on("status",R=>N({...R,connected:!0})),B.on("disconnect",()=>N(R=>({...R,connected:!1}))),B.on("connect",()=>{clearTimeout(T),N(R=>({...R,connected:!0}))}),B.on("encoder_host",R=>{r(R)}),B.on("new_trajectory_plot",()=>v("/dl/trajectory.jpg?t="+new Date().getTime())),()=>{B.off("status"),B.off("connect"),B.off("disconnect")}},[]),o(vt.Provider,{value:{is_dirty:f,setIsDirty:c,nodes:i,setNodes:g,getNextNodeId:y,encoder_host:t,setEncoder_host:r},children:o("div",{className:"wrap",children:[o("div",{className:`toast-wrap${k.connected?"":" show"}`,children:o("div",{className:"toast-connect",children:[o("span",{children:"Erro ao conectar-se com o atuador, tentando novamente..."}),o("div",{className:"loader"})]})}),o("div",{className:"panel",children:[o("div",{className:"tabs",children:[o("button",{className:n==0?"selected":"",onClick:()=>e(0),children:" Trajetória "}),o("button",{className:n==1?"selected":"",onClick:()=>e(1),children:" Controle Manual "}),o("button",{className:n==2?"selected":"",onClick:()=>e(2),children:[" ",o("i",{className:n==2?"bi bi-gear":"bi bi-gear-fill"})," "]})]}),n==0?o(Wn,{status:k,offset:d,setOffset:u,bounds:w}):n==1?o(Xn,{status:k,stepSize:h,setStepSize:E,target:b,setTarget:C}):n==2?o(jn,{trajectoryImgSrc:p}):null]}),o(zt,{status:k,offset:d,bounds:w}),o(zn,{pos:k.pos})]})})}qt(o(Kn,{}),document.getElementById("app"));
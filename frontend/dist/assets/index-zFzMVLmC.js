@@ -0,0 +1,1537 @@
+const __m = {};
+const __preact = (() => {
+var he,A,nt,W,Fe,rt,it,st,Re,ve,be,ot,J={},at=[],Lt=/acit|ex(?:s|g|n|p|$)|rph|grid|ows|mnc|ntw|ine[ch]|zoo|^ord|itera/i,ue=Array.isArray;function H(n,e){for(var t in e)n[t]=e[t];return n}function Oe(n){n&&n.parentNode&&n.parentNode.removeChild(n)}function Pt(n,e,t){var r,i,s,a={};for(s in e)s=="key"?r=e[s]:s=="ref"?i=e[s]:a[s]=e[s];if(arguments.length>2&&(a.children=arguments.length>3?he.call(arguments,2):t),typeof n=="function"&&n.defaultProps!=null)for(s in n.defaultProps)a[s]===void 0&&(a[s]=n.defaultProps[s]);return te(n,a,r,i,null)}function te(n,e,t,r,i){var s={type:n,props:e,key:t,ref:r,__k:null,__:null,__b:0,__e:null,__c:null,constructor:void 0,__v:i??++nt,__i:-1,__u:0};return i==null&&A.vnode!=null&&A.vnode(s),s}function $(n){return n.children}function ne(n,e){this.props=n,this.context=e}function X(n,e){if(e==null)return n.__?X(n.__,n.__i+1):null;for(var t;e<n.__k.length;e++)if((t=n.__k[e])!=null&&t.__e!=null)return t.__e;return typeof n.type=="function"?X(n):null}function ct(n){var e,t;if((n=n.__)!=null&&n.__c!=null){for(n.__e=n.__c.base=null,e=0;e<n.__k.length;e++)if((t=n.__k[e])!=null&&t.__e!=null){n.__e=n.__c.base=t.__e;break}return ct(n)}}function we(n){(!n.__d&&(n.__d=!0)&&W.push(n)&&!ce.__r++||Fe!=A.debounceRendering)&&((Fe=A.debounceRendering)||rt)(ce)}function ce(){for(var n,e,t,r,i,s,a,l=1;W.length;)W.length>l&&W.sort(it),n=W.shift(),l=W.length,n.__d&&(t=void 0,i=(r=(e=n).__v).__e,s=[],a=[],e.__P&&((t=H({},r)).__v=r.__v+1,A.vnode&&A.vnode(t),Be(e.__P,t,r,e.__n,e.__P.namespaceURI,32&r.__u?[i]:null,s,i??X(r),!!(32&r.__u),a),t.__v=r.__v,t.__.__k[t.__i]=t,ut(s,t,a),t.__e!=i&&ct(t)));ce.__r=0}function lt(n,e,t,r,i,s,a,l,d,u,f){var c,h,m,b,_,p,v,E=r&&r.__k||at,C=e.length;for(d=It(t,e,E,d,C),c=0;c<C;c++)(m=t.__k[c])!=null&&(h=m.__i==-1?J:E[m.__i]||J,m.__i=c,p=Be(n,m,h,i,s,a,l,d,u,f),b=m.__e,m.ref&&h.ref!=m.ref&&(h.ref&&Le(h.ref,null,m),f.push(m.ref,m.__c||b,m)),_==null&&b!=null&&(_=b),(v=!!(4&m.__u))||h.__k===m.__k?d=ht(m,d,n,v):typeof m.type=="function"&&p!==void 0?d=p:b&&(d=b.nextSibling),m.__u&=-7);return t.__e=_,d}function It(n,e,t,r,i){var s,a,l,d,u,f=t.length,c=f,h=0;for(n.__k=new Array(i),s=0;s<i;s++)(a=e[s])!=null&&typeof a!="boolean"&&typeof a!="function"?(d=s+h,(a=n.__k[s]=typeof a=="string"||typeof a=="number"||typeof a=="bigint"||a.constructor==String?te(null,a,null,null,null):ue(a)?te($,{children:a},null,null,null):a.constructor==null&&a.__b>0?te(a.type,a.props,a.key,a.ref?a.ref:null,a.__v):a).__=n,a.__b=n.__b+1,l=null,(u=a.__i=$t(a,t,d,c))!=-1&&(c--,(l=t[u])&&(l.__u|=2)),l==null||l.__v==null?(u==-1&&(i>f?h--:i<f&&h++),typeof a.type!="function"&&(a.__u|=4)):u!=d&&(u==d-1?h--:u==d+1?h++:(u>d?h--:h++,a.__u|=4))):n.__k[s]=null;if(c)for(s=0;s<f;s++)(l=t[s])!=null&&(2&l.__u)==0&&(l.__e==r&&(r=X(l)),ft(l,l));return r}function ht(n,e,t,r){var i,s;if(typeof n.type=="function"){for(i=n.__k,s=0;i&&s<i.length;s++)i[s]&&(i[s].__=n,e=ht(i[s],e,t,r));return e}n.__e!=e&&(r&&(e&&n.type&&!e.parentNode&&(e=X(n)),t.insertBefore(n.__e,e||null)),e=n.__e);do e=e&&e.nextSibling;while(e!=null&&e.nodeType==8);return e}function $t(n,e,t,r){var i,s,a,l=n.key,d=n.type,u=e[t],f=u!=null&&(2&u.__u)==0;if(u===null&&n.key==null||f&&l==u.key&&d==u.type)return t;if(r>(f?1:0)){for(i=t-1,s=t+1;i>=0||s<e.length;)if((u=e[a=i>=0?i--:s++])!=null&&(2&u.__u)==0&&l==u.key&&d==u.type)return a}return-1}function Ue(n,e,t){e[0]=="-"?n.setProperty(e,t??""):n[e]=t==null?"":typeof t!="number"||Lt.test(e)?t:t+"px"}function Q(n,e,t,r,i){var s,a;e:if(e=="style")if(typeof t=="string")n.style.cssText=t;else{if(typeof r=="string"&&(n.style.cssText=r=""),r)for(e in r)t&&e in t||Ue(n.style,e,"");if(t)for(e in t)r&&t[e]==r[e]||Ue(n.style,e,t[e])}else if(e[0]=="o"&&e[1]=="n")s=e!=(e=e.replace(st,"$1")),a=e.toLowerCase(),e=a in n||e=="onFocusOut"||e=="onFocusIn"?a.slice(2):e.slice(2),n.l||(n.l={}),n.l[e+s]=t,t?r?t.u=r.u:(t.u=Re,n.addEventListener(e,s?be:ve,s)):n.removeEventListener(e,s?be:ve,s);else{if(i=="http://www.w3.org/2000/svg")e=e.replace(/xlink(H|:h)/,"h").replace(/sName$/,"s");else if(e!="width"&&e!="height"&&e!="href"&&e!="list"&&e!="form"&&e!="tabIndex"&&e!="download"&&e!="rowSpan"&&e!="colSpan"&&e!="role"&&e!="popover"&&e in n)try{n[e]=t??"";break e}catch{}typeof t=="function"||(t==null||t===!1&&e[4]!="-"?n.removeAttribute(e):n.setAttribute(e,e=="popover"&&t==1?"":t))}}function He(n){return function(e){if(this.l){var t=this.l[e.type+n];if(e.t==null)e.t=Re++;else if(e.t<t.u)return;return t(A.event?A.event(e):e)}}}function Be(n,e,t,r,i,s,a,l,d,u){var f,c,h,m,b,_,p,v,E,C,g,y,w,k,N,T,R,I=e.type;if(e.constructor!=null)return null;128&t.__u&&(d=!!(32&t.__u),s=[l=e.__e=t.__e]),(f=A.__b)&&f(e);e:if(typeof I=="function")try{if(v=e.props,E="prototype"in I&&I.prototype.render,C=(f=I.contextType)&&r[f.__c],g=f?C?C.props.value:f.__:r,t.__c?p=(c=e.__c=t.__c).__=c.__E:(E?e.__c=c=new I(v,g):(e.__c=c=new ne(v,g),c.constructor=I,c.render=Dt),C&&C.sub(c),c.props=v,c.state||(c.state={}),c.context=g,c.__n=r,h=c.__d=!0,c.__h=[],c._sb=[]),E&&c.__s==null&&(c.__s=c.state),E&&I.getDerivedStateFromProps!=null&&(c.__s==c.state&&(c.__s=H({},c.__s)),H(c.__s,I.getDerivedStateFromProps(v,c.__s))),m=c.props,b=c.state,c.__v=e,h)E&&I.getDerivedStateFromProps==null&&c.componentWillMount!=null&&c.componentWillMount(),E&&c.componentDidMount!=null&&c.__h.push(c.componentDidMount);else{if(E&&I.getDerivedStateFromProps==null&&v!==m&&c.componentWillReceiveProps!=null&&c.componentWillReceiveProps(v,g),!c.__e&&c.shouldComponentUpdate!=null&&c.shouldComponentUpdate(v,c.__s,g)===!1||e.__v==t.__v){for(e.__v!=t.__v&&(c.props=v,c.state=c.__s,c.__d=!1),e.__e=t.__e,e.__k=t.__k,e.__k.some(function(V){V&&(V.__=e)}),y=0;y<c._sb.length;y++)c.__h.push(c._sb[y]);c._sb=[],c.__h.length&&a.push(c);break e}c.componentWillUpdate!=null&&c.componentWillUpdate(v,c.__s,g),E&&c.componentDidUpdate!=null&&c.__h.push(function(){c.componentDidUpdate(m,b,_)})}if(c.context=g,c.props=v,c.__P=n,c.__e=!1,w=A.__r,k=0,E){for(c.state=c.__s,c.__d=!1,w&&w(e),f=c.render(c.props,c.state,c.context),N=0;N<c._sb.length;N++)c.__h.push(c._sb[N]);c._sb=[]}else do c.__d=!1,w&&w(e),f=c.render(c.props,c.state,c.context),c.state=c.__s;while(c.__d&&++k<25);c.state=c.__s,c.getChildContext!=null&&(r=H(H({},r),c.getChildContext())),E&&!h&&c.getSnapshotBeforeUpdate!=null&&(_=c.getSnapshotBeforeUpdate(m,b)),T=f,f!=null&&f.type===$&&f.key==null&&(T=dt(f.props.children)),l=lt(n,ue(T)?T:[T],e,t,r,i,s,a,l,d,u),c.base=e.__e,e.__u&=-161,c.__h.length&&a.push(c),p&&(c.__E=c.__=null)}catch(V){if(e.__v=null,d||s!=null)if(V.then){for(e.__u|=d?160:128;l&&l.nodeType==8&&l.nextSibling;)l=l.nextSibling;s[s.indexOf(l)]=null,e.__e=l}else{for(R=s.length;R--;)Oe(s[R]);xe(e)}else e.__e=t.__e,e.__k=t.__k,V.then||xe(e);A.__e(V,e,t)}else s==null&&e.__v==t.__v?(e.__k=t.__k,e.__e=t.__e):l=e.__e=Mt(t.__e,e,t,r,i,s,a,d,u);return(f=A.diffed)&&f(e),128&e.__u?void 0:l}function xe(n){n&&n.__c&&(n.__c.__e=!0),n&&n.__k&&n.__k.forEach(xe)}function ut(n,e,t){for(var r=0;r<t.length;r++)Le(t[r],t[++r],t[++r]);A.__c&&A.__c(e,n),n.some(function(i){try{n=i.__h,i.__h=[],n.some(function(s){s.call(i)})}catch(s){A.__e(s,i.__v)}})}function dt(n){return typeof n!="object"||n==null||n.__b&&n.__b>0?n:ue(n)?n.map(dt):H({},n)}function Mt(n,e,t,r,i,s,a,l,d){var u,f,c,h,m,b,_,p=t.props,v=e.props,E=e.type;if(E=="svg"?i="http://www.w3.org/2000/svg":E=="math"?i="http://www.w3.org/1998/Math/MathML":i||(i="http://www.w3.org/1999/xhtml"),s!=null){for(u=0;u<s.length;u++)if((m=s[u])&&"setAttribute"in m==!!E&&(E?m.localName==E:m.nodeType==3)){n=m,s[u]=null;break}}if(n==null){if(E==null)return document.createTextNode(v);n=document.createElementNS(i,E,v.is&&v),l&&(A.__m&&A.__m(e,s),l=!1),s=null}if(E==null)p===v||l&&n.data==v||(n.data=v);else{if(s=s&&he.call(n.childNodes),p=t.props||J,!l&&s!=null)for(p={},u=0;u<n.attributes.length;u++)p[(m=n.attributes[u]).name]=m.value;for(u in p)if(m=p[u],u!="children"){if(u=="dangerouslySetInnerHTML")c=m;else if(!(u in v)){if(u=="value"&&"defaultValue"in v||u=="checked"&&"defaultChecked"in v)continue;Q(n,u,null,m,i)}}for(u in v)m=v[u],u=="children"?h=m:u=="dangerouslySetInnerHTML"?f=m:u=="value"?b=m:u=="checked"?_=m:l&&typeof m!="function"||p[u]===m||Q(n,u,m,p[u],i);if(f)l||c&&(f.__html==c.__html||f.__html==n.innerHTML)||(n.innerHTML=f.__html),e.__k=[];else if(c&&(n.innerHTML=""),lt(e.type=="template"?n.content:n,ue(h)?h:[h],e,t,r,E=="foreignObject"?"http://www.w3.org/1999/xhtml":i,s,a,s?s[0]:t.__k&&X(t,0),l,d),s!=null)for(u=s.length;u--;)Oe(s[u]);l||(u="value",E=="progress"&&b==null?n.removeAttribute("value"):b!=null&&(b!==n[u]||E=="progress"&&!b||E=="option"&&b!=p[u])&&Q(n,u,b,p[u],i),u="checked",_!=null&&_!=n[u]&&Q(n,u,_,p[u],i))}return n}function Le(n,e,t){try{if(typeof n=="function"){var r=typeof n.__u=="function";r&&n.__u(),r&&e==null||(n.__u=n(e))}else n.current=e}catch(i){A.__e(i,t)}}function ft(n,e,t){var r,i;if(A.unmount&&A.unmount(n),(r=n.ref)&&(r.current&&r.current!=n.__e||Le(r,null,e)),(r=n.__c)!=null){if(r.componentWillUnmount)try{r.componentWillUnmount()}catch(s){A.__e(s,e)}r.base=r.__P=null}if(r=n.__k)for(i=0;i<r.length;i++)r[i]&&ft(r[i],e,t||typeof n.type!="function");t||Oe(n.__e),n.__c=n.__=n.__e=void 0}function Dt(n,e,t){return this.constructor(n,t)}function qt(n,e,t){var r,i,s,a;e==document&&(e=document.documentElement),A.__&&A.__(n,e),i=(r=!1)?null:e.__k,s=[],a=[],Be(e,n=e.__k=Pt($,null,[n]),i||J,J,e.namespaceURI,i?null:e.firstChild?he.call(e.childNodes):null,s,i?i.__e:e.firstChild,r,a),ut(s,n,a)}function Ft(n){function e(t){var r,i;return this.getChildContext||(r=new Set,(i={})[e.__c]=this,this.getChildContext=function(){return i},this.componentWillUnmount=function(){r=null},this.shouldComponentUpdate=function(s){this.props.value!=s.value&&r.forEach(function(a){a.__e=!0,we(a)})},this.sub=function(s){r.add(s);var a=s.componentWillUnmount;s.componentWillUnmount=function(){r&&r.delete(s),a&&a.call(s)}}),t.children}return e.__c="__cC"+ot++,e.__=n,e.Provider=e.__l=(e.Consumer=function(t,r){return t.children(r)}).contextType=e,e}he=at.slice,A={__e:function(n,e,t,r){for(var i,s,a;e=e.__;)if((i=e.__c)&&!i.__)try{if((s=i.constructor)&&s.getDerivedStateFromError!=null&&(i.setState(s.getDerivedStateFromError(n)),a=i.__d),i.componentDidCatch!=null&&(i.componentDidCatch(n,r||{}),a=i.__d),a)return i.__E=i}catch(l){n=l}throw n}},nt=0,ne.prototype.setState=function(n,e){var t;t=this.__s!=null&&this.__s!=this.state?this.__s:this.__s=H({},this.state),typeof n=="function"&&(n=n(H({},t),this.props)),n&&H(t,n),n!=null&&this.__v&&(e&&this._sb.push(e),we(this))},ne.prototype.forceUpdate=function(n){this.__v&&(this.__e=!0,n&&this.__h.push(n),we(this))},ne.prototype.render=$,W=[],rt=typeof Promise=="function"?Promise.prototype.then.bind(Promise.resolve()):setTimeout,it=function(n,e){return n.__v.__b-e.__v.__b},ce.__r=0,st=/(PointerCapture)$|Capture$/i,Re=0,ve=He(!1),be=He(!0),ot=0;var Ut=0;function o(n,e,t,r,i,s){e||(e={});var a,l,d=e;if("ref"in d)for(l in d={},e)l=="ref"?a=e[l]:d[l]=e[l];var u={type:n,props:d,key:t,ref:a,__k:null,__:null,__b:0,__e:null,__c:null,constructor:void 0,__v:--Ut,__i:-1,__u:0,__source:i,__self:s};if(typeof n=="function"&&(a=n.defaultProps))for(l in a)d[l]===void 0&&(d[l]=a[l]);return A.vnode&&A.vnode(u),u}var j,O,_e,Ve,le=0,pt=[],L=A,Ye=L.__b,We=L.__r,Xe=L.diffed,je=L.__c,ze=L.unmount,Ke=L.__;function de(n,e){L.__h&&L.__h(O,n,le||e),le=0;var t=O.__H||(O.__H={__:[],__h:[]});return n>=t.__.length&&t.__.push({}),t.__[n]}function q(n){return le=1,Ht(yt,n)}function Ht(n,e,t){var r=de(j++,2);if(r.t=n,!r.__c&&(r.__=[yt(void 0,e),function(l){var d=r.__N?r.__N[0]:r.__[0],u=r.t(d,l);d!==u&&(r.__N=[u,r.__[1]],r.__c.setState({}))}],r.__c=O,!O.__f)){var i=function(l,d,u){if(!r.__c.__H)return!0;var f=r.__c.__H.__.filter(function(h){return!!h.__c});if(f.every(function(h){return!h.__N}))return!s||s.call(this,l,d,u);var c=r.__c.props!==l;return f.forEach(function(h){if(h.__N){var m=h.__[0];h.__=h.__N,h.__N=void 0,m!==h.__[0]&&(c=!0)}}),s&&s.call(this,l,d,u)||c};O.__f=!0;var s=O.shouldComponentUpdate,a=O.componentWillUpdate;O.componentWillUpdate=function(l,d,u){if(this.__e){var f=s;s=void 0,i(l,d,u),s=f}a&&a.call(this,l,d,u)},O.shouldComponentUpdate=i}return r.__N||r.__}function Vt(n,e){var t=de(j++,3);!L.__s&&mt(t.__H,e)&&(t.__=n,t.u=e,O.__H.__h.push(t))}function _t(n){return le=5,Yt(function(){return{current:n}},[])}function Yt(n,e){var t=de(j++,7);return mt(t.__H,e)&&(t.__=n(),t.__H=e,t.__h=n),t.__}function Wt(n){var e=O.context[n.__c],t=de(j++,9);return t.c=n,e?(t.__==null&&(t.__=!0,e.sub(O)),e.props.value):n.__}function Xt(){for(var n;n=pt.shift();)if(n.__P&&n.__H)try{n.__H.__h.forEach(re),n.__H.__h.forEach(ke),n.__H.__h=[]}catch(e){n.__H.__h=[],L.__e(e,n.__v)}}L.__b=function(n){O=null,Ye&&Ye(n)},L.__=function(n,e){n&&e.__k&&e.__k.__m&&(n.__m=e.__k.__m),Ke&&Ke(n,e)},L.__r=function(n){We&&We(n),j=0;var e=(O=n.__c).__H;e&&(_e===O?(e.__h=[],O.__h=[],e.__.forEach(function(t){t.__N&&(t.__=t.__N),t.u=t.__N=void 0})):(e.__h.forEach(re),e.__h.forEach(ke),e.__h=[],j=0)),_e=O},L.diffed=function(n){Xe&&Xe(n);var e=n.__c;e&&e.__H&&(e.__H.__h.length&&(pt.push(e)!==1&&Ve===L.requestAnimationFrame||((Ve=L.requestAnimationFrame)||jt)(Xt)),e.__H.__.forEach(function(t){t.u&&(t.__H=t.u),t.u=void 0})),_e=O=null},L.__c=function(n,e){e.some(function(t){try{t.__h.forEach(re),t.__h=t.__h.filter(function(r){return!r.__||ke(r)})}catch(r){e.some(function(i){i.__h&&(i.__h=[])}),e=[],L.__e(r,t.__v)}}),je&&je(n,e)},L.unmount=function(n){ze&&ze(n);var e,t=n.__c;t&&t.__H&&(t.__H.__.forEach(function(r){try{re(r)}catch(i){e=i}}),t.__H=void 0,e&&L.__e(e,t.__v))};var Ge=typeof requestAnimationFrame=="function";function jt(n){var e,t=function(){clearTimeout(r),Ge&&cancelAnimationFrame(e),setTimeout(n)},r=setTimeout(t,35);Ge&&(e=requestAnimationFrame(t))}function re(n){var e=O,t=n.__c;typeof t=="function"&&(n.__c=void 0,t()),O=e}function ke(n){var e=O;n.__c=n.__(),O=e}function mt(n,e){return!n||n.length!==e.length||e.some(function(t,r){return t!==n[r]})}function yt(n,e){return typeof e=="function"?e(n):e}
+return { render: qt, createContext: Ft, Fragment: $, createElement: Pt, useState: q, useEffect: Vt, useRef: _t, useContext: Wt, useMemo: Yt, jsx: o };
+})();
+__m['preact'] = __m['preact/hooks'] = __m['preact/jsx-runtime'] = __preact;
+__preact.jsxs = __preact.jsx;
+__m['socket.io-client'] = (() => {
+const module = { exports: {} }, exports = module.exports;
+/*!
+ * Socket.IO v4.8.1
+ * (c) 2014-2024 Guillermo Rauch
+ * Released under the MIT License.
+ */
+!function(t,n){"object"==typeof exports&&"undefined"!=typeof module?module.exports=n():"function"==typeof define&&define.amd?define(n):(t="undefined"!=typeof globalThis?globalThis:t||self).io=n()}(this,(function(){"use strict";function t(t,n){(null==n||n>t.length)&&(n=t.length);for(var i=0,r=Array(n);i<n;i++)r[i]=t[i];return r}function n(t,n){for(var i=0;i<n.length;i++){var r=n[i];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(t,f(r.key),r)}}function i(t,i,r){return i&&n(t.prototype,i),r&&n(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t}function r(n,i){var r="undefined"!=typeof Symbol&&n[Symbol.iterator]||n["@@iterator"];if(!r){if(Array.isArray(n)||(r=function(n,i){if(n){if("string"==typeof n)return t(n,i);var r={}.toString.call(n).slice(8,-1);return"Object"===r&&n.constructor&&(r=n.constructor.name),"Map"===r||"Set"===r?Array.from(n):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?t(n,i):void 0}}(n))||i&&n&&"number"==typeof n.length){r&&(n=r);var e=0,o=function(){};return{s:o,n:function(){return e>=n.length?{done:!0}:{done:!1,value:n[e++]}},e:function(t){throw t},f:o}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var s,u=!0,h=!1;return{s:function(){r=r.call(n)},n:function(){var t=r.next();return u=t.done,t},e:function(t){h=!0,s=t},f:function(){try{u||null==r.return||r.return()}finally{if(h)throw s}}}}function e(){return e=Object.assign?Object.assign.bind():function(t){for(var n=1;n<arguments.length;n++){var i=arguments[n];for(var r in i)({}).hasOwnProperty.call(i,r)&&(t[r]=i[r])}return t},e.apply(null,arguments)}function o(t){return o=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},o(t)}function s(t,n){t.prototype=Object.create(n.prototype),t.prototype.constructor=t,h(t,n)}function u(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(u=function(){return!!t})()}function h(t,n){return h=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,n){return t.__proto__=n,t},h(t,n)}function f(t){var n=function(t,n){if("object"!=typeof t||!t)return t;var i=t[Symbol.toPrimitive];if(void 0!==i){var r=i.call(t,n||"default");if("object"!=typeof r)return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===n?String:Number)(t)}(t,"string");return"symbol"==typeof n?n:n+""}function c(t){return c="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},c(t)}function a(t){var n="function"==typeof Map?new Map:void 0;return a=function(t){if(null===t||!function(t){try{return-1!==Function.toString.call(t).indexOf("[native code]")}catch(n){return"function"==typeof t}}(t))return t;if("function"!=typeof t)throw new TypeError("Super expression must either be null or a function");if(void 0!==n){if(n.has(t))return n.get(t);n.set(t,i)}function i(){return function(t,n,i){if(u())return Reflect.construct.apply(null,arguments);var r=[null];r.push.apply(r,n);var e=new(t.bind.apply(t,r));return i&&h(e,i.prototype),e}(t,arguments,o(this).constructor)}return i.prototype=Object.create(t.prototype,{constructor:{value:i,enumerable:!1,writable:!0,configurable:!0}}),h(i,t)},a(t)}var v=Object.create(null);v.open="0",v.close="1",v.ping="2",v.pong="3",v.message="4",v.upgrade="5",v.noop="6";var l=Object.create(null);Object.keys(v).forEach((function(t){l[v[t]]=t}));var p,d={type:"error",data:"parser error"},y="function"==typeof Blob||"undefined"!=typeof Blob&&"[object BlobConstructor]"===Object.prototype.toString.call(Blob),b="function"==typeof ArrayBuffer,w=function(t){return"function"==typeof ArrayBuffer.isView?ArrayBuffer.isView(t):t&&t.buffer instanceof ArrayBuffer},g=function(t,n,i){var r=t.type,e=t.data;return y&&e instanceof Blob?n?i(e):m(e,i):b&&(e instanceof ArrayBuffer||w(e))?n?i(e):m(new Blob([e]),i):i(v[r]+(e||""))},m=function(t,n){var i=new FileReader;return i.onload=function(){var t=i.result.split(",")[1];n("b"+(t||""))},i.readAsDataURL(t)};function k(t){return t instanceof Uint8Array?t:t instanceof ArrayBuffer?new Uint8Array(t):new Uint8Array(t.buffer,t.byteOffset,t.byteLength)}for(var A="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",j="undefined"==typeof Uint8Array?[]:new Uint8Array(256),E=0;E<64;E++)j[A.charCodeAt(E)]=E;var O,B="function"==typeof ArrayBuffer,S=function(t,n){if("string"!=typeof t)return{type:"message",data:C(t,n)};var i=t.charAt(0);return"b"===i?{type:"message",data:N(t.substring(1),n)}:l[i]?t.length>1?{type:l[i],data:t.substring(1)}:{type:l[i]}:d},N=function(t,n){if(B){var i=function(t){var n,i,r,e,o,s=.75*t.length,u=t.length,h=0;"="===t[t.length-1]&&(s--,"="===t[t.length-2]&&s--);var f=new ArrayBuffer(s),c=new Uint8Array(f);for(n=0;n<u;n+=4)i=j[t.charCodeAt(n)],r=j[t.charCodeAt(n+1)],e=j[t.charCodeAt(n+2)],o=j[t.charCodeAt(n+3)],c[h++]=i<<2|r>>4,c[h++]=(15&r)<<4|e>>2,c[h++]=(3&e)<<6|63&o;return f}(t);return C(i,n)}return{base64:!0,data:t}},C=function(t,n){return"blob"===n?t instanceof Blob?t:new Blob([t]):t instanceof ArrayBuffer?t:t.buffer},T=String.fromCharCode(30);function U(){return new TransformStream({transform:function(t,n){!function(t,n){y&&t.data instanceof Blob?t.data.arrayBuffer().then(k).then(n):b&&(t.data instanceof ArrayBuffer||w(t.data))?n(k(t.data)):g(t,!1,(function(t){p||(p=new TextEncoder),n(p.encode(t))}))}(t,(function(i){var r,e=i.length;if(e<126)r=new Uint8Array(1),new DataView(r.buffer).setUint8(0,e);else if(e<65536){r=new Uint8Array(3);var o=new DataView(r.buffer);o.setUint8(0,126),o.setUint16(1,e)}else{r=new Uint8Array(9);var s=new DataView(r.buffer);s.setUint8(0,127),s.setBigUint64(1,BigInt(e))}t.data&&"string"!=typeof t.data&&(r[0]|=128),n.enqueue(r),n.enqueue(i)}))}})}function M(t){return t.reduce((function(t,n){return t+n.length}),0)}function x(t,n){if(t[0].length===n)return t.shift();for(var i=new Uint8Array(n),r=0,e=0;e<n;e++)i[e]=t[0][r++],r===t[0].length&&(t.shift(),r=0);return t.length&&r<t[0].length&&(t[0]=t[0].slice(r)),i}function I(t){if(t)return function(t){for(var n in I.prototype)t[n]=I.prototype[n];return t}(t)}I.prototype.on=I.prototype.addEventListener=function(t,n){return this.t=this.t||{},(this.t["$"+t]=this.t["$"+t]||[]).push(n),this},I.prototype.once=function(t,n){function i(){this.off(t,i),n.apply(this,arguments)}return i.fn=n,this.on(t,i),this},I.prototype.off=I.prototype.removeListener=I.prototype.removeAllListeners=I.prototype.removeEventListener=function(t,n){if(this.t=this.t||{},0==arguments.length)return this.t={},this;var i,r=this.t["$"+t];if(!r)return this;if(1==arguments.length)return delete this.t["$"+t],this;for(var e=0;e<r.length;e++)if((i=r[e])===n||i.fn===n){r.splice(e,1);break}return 0===r.length&&delete this.t["$"+t],this},I.prototype.emit=function(t){this.t=this.t||{};for(var n=new Array(arguments.length-1),i=this.t["$"+t],r=1;r<arguments.length;r++)n[r-1]=arguments[r];if(i){r=0;for(var e=(i=i.slice(0)).length;r<e;++r)i[r].apply(this,n)}return this},I.prototype.emitReserved=I.prototype.emit,I.prototype.listeners=function(t){return this.t=this.t||{},this.t["$"+t]||[]},I.prototype.hasListeners=function(t){return!!this.listeners(t).length};var R="function"==typeof Promise&&"function"==typeof Promise.resolve?function(t){return Promise.resolve().then(t)}:function(t,n){return n(t,0)},L="undefined"!=typeof self?self:"undefined"!=typeof window?window:Function("return this")();function _(t){for(var n=arguments.length,i=new Array(n>1?n-1:0),r=1;r<n;r++)i[r-1]=arguments[r];return i.reduce((function(n,i){return t.hasOwnProperty(i)&&(n[i]=t[i]),n}),{})}var D=L.setTimeout,P=L.clearTimeout;function $(t,n){n.useNativeTimers?(t.setTimeoutFn=D.bind(L),t.clearTimeoutFn=P.bind(L)):(t.setTimeoutFn=L.setTimeout.bind(L),t.clearTimeoutFn=L.clearTimeout.bind(L))}function F(){return Date.now().toString(36).substring(3)+Math.random().toString(36).substring(2,5)}var V=function(t){function n(n,i,r){var e;return(e=t.call(this,n)||this).description=i,e.context=r,e.type="TransportError",e}return s(n,t),n}(a(Error)),q=function(t){function n(n){var i;return(i=t.call(this)||this).writable=!1,$(i,n),i.opts=n,i.query=n.query,i.socket=n.socket,i.supportsBinary=!n.forceBase64,i}s(n,t);var i=n.prototype;return i.onError=function(n,i,r){return t.prototype.emitReserved.call(this,"error",new V(n,i,r)),this},i.open=function(){return this.readyState="opening",this.doOpen(),this},i.close=function(){return"opening"!==this.readyState&&"open"!==this.readyState||(this.doClose(),this.onClose()),this},i.send=function(t){"open"===this.readyState&&this.write(t)},i.onOpen=function(){this.readyState="open",this.writable=!0,t.prototype.emitReserved.call(this,"open")},i.onData=function(t){var n=S(t,this.socket.binaryType);this.onPacket(n)},i.onPacket=function(n){t.prototype.emitReserved.call(this,"packet",n)},i.onClose=function(n){this.readyState="closed",t.prototype.emitReserved.call(this,"close",n)},i.pause=function(t){},i.createUri=function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return t+"://"+this.i()+this.o()+this.opts.path+this.u(n)},i.i=function(){var t=this.opts.hostname;return-1===t.indexOf(":")?t:"["+t+"]"},i.o=function(){return this.opts.port&&(this.opts.secure&&Number(443!==this.opts.port)||!this.opts.secure&&80!==Number(this.opts.port))?":"+this.opts.port:""},i.u=function(t){var n=function(t){var n="";for(var i in t)t.hasOwnProperty(i)&&(n.length&&(n+="&"),n+=encodeURIComponent(i)+"="+encodeURIComponent(t[i]));return n}(t);return n.length?"?"+n:""},n}(I),X=function(t){function n(){var n;return(n=t.apply(this,arguments)||this).h=!1,n}s(n,t);var r=n.prototype;return r.doOpen=function(){this.v()},r.pause=function(t){var n=this;this.readyState="pausing";var i=function(){n.readyState="paused",t()};if(this.h||!this.writable){var r=0;this.h&&(r++,this.once("pollComplete",(function(){--r||i()}))),this.writable||(r++,this.once("drain",(function(){--r||i()})))}else i()},r.v=function(){this.h=!0,this.doPoll(),this.emitReserved("poll")},r.onData=function(t){var n=this;(function(t,n){for(var i=t.split(T),r=[],e=0;e<i.length;e++){var o=S(i[e],n);if(r.push(o),"error"===o.type)break}return r})(t,this.socket.binaryType).forEach((function(t){if("opening"===n.readyState&&"open"===t.type&&n.onOpen(),"close"===t.type)return n.onClose({description:"transport closed by the server"}),!1;n.onPacket(t)})),"closed"!==this.readyState&&(this.h=!1,this.emitReserved("pollComplete"),"open"===this.readyState&&this.v())},r.doClose=function(){var t=this,n=function(){t.write([{type:"close"}])};"open"===this.readyState?n():this.once("open",n)},r.write=function(t){var n=this;this.writable=!1,function(t,n){var i=t.length,r=new Array(i),e=0;t.forEach((function(t,o){g(t,!1,(function(t){r[o]=t,++e===i&&n(r.join(T))}))}))}(t,(function(t){n.doWrite(t,(function(){n.writable=!0,n.emitReserved("drain")}))}))},r.uri=function(){var t=this.opts.secure?"https":"http",n=this.query||{};return!1!==this.opts.timestampRequests&&(n[this.opts.timestampParam]=F()),this.supportsBinary||n.sid||(n.b64=1),this.createUri(t,n)},i(n,[{key:"name",get:function(){return"polling"}}])}(q),H=!1;try{H="undefined"!=typeof XMLHttpRequest&&"withCredentials"in new XMLHttpRequest}catch(t){}var z=H;function J(){}var K=function(t){function n(n){var i;if(i=t.call(this,n)||this,"undefined"!=typeof location){var r="https:"===location.protocol,e=location.port;e||(e=r?"443":"80"),i.xd="undefined"!=typeof location&&n.hostname!==location.hostname||e!==n.port}return i}s(n,t);var i=n.prototype;return i.doWrite=function(t,n){var i=this,r=this.request({method:"POST",data:t});r.on("success",n),r.on("error",(function(t,n){i.onError("xhr post error",t,n)}))},i.doPoll=function(){var t=this,n=this.request();n.on("data",this.onData.bind(this)),n.on("error",(function(n,i){t.onError("xhr poll error",n,i)})),this.pollXhr=n},n}(X),Y=function(t){function n(n,i,r){var e;return(e=t.call(this)||this).createRequest=n,$(e,r),e.l=r,e.p=r.method||"GET",e.m=i,e.k=void 0!==r.data?r.data:null,e.A(),e}s(n,t);var i=n.prototype;return i.A=function(){var t,i=this,r=_(this.l,"agent","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","autoUnref");r.xdomain=!!this.l.xd;var e=this.j=this.createRequest(r);try{e.open(this.p,this.m,!0);try{if(this.l.extraHeaders)for(var o in e.setDisableHeaderCheck&&e.setDisableHeaderCheck(!0),this.l.extraHeaders)this.l.extraHeaders.hasOwnProperty(o)&&e.setRequestHeader(o,this.l.extraHeaders[o])}catch(t){}if("POST"===this.p)try{e.setRequestHeader("Content-type","text/plain;charset=UTF-8")}catch(t){}try{e.setRequestHeader("Accept","*/*")}catch(t){}null===(t=this.l.cookieJar)||void 0===t||t.addCookies(e),"withCredentials"in e&&(e.withCredentials=this.l.withCredentials),this.l.requestTimeout&&(e.timeout=this.l.requestTimeout),e.onreadystatechange=function(){var t;3===e.readyState&&(null===(t=i.l.cookieJar)||void 0===t||t.parseCookies(e.getResponseHeader("set-cookie"))),4===e.readyState&&(200===e.status||1223===e.status?i.O():i.setTimeoutFn((function(){i.B("number"==typeof e.status?e.status:0)}),0))},e.send(this.k)}catch(t){return void this.setTimeoutFn((function(){i.B(t)}),0)}"undefined"!=typeof document&&(this.S=n.requestsCount++,n.requests[this.S]=this)},i.B=function(t){this.emitReserved("error",t,this.j),this.N(!0)},i.N=function(t){if(void 0!==this.j&&null!==this.j){if(this.j.onreadystatechange=J,t)try{this.j.abort()}catch(t){}"undefined"!=typeof document&&delete n.requests[this.S],this.j=null}},i.O=function(){var t=this.j.responseText;null!==t&&(this.emitReserved("data",t),this.emitReserved("success"),this.N())},i.abort=function(){this.N()},n}(I);if(Y.requestsCount=0,Y.requests={},"undefined"!=typeof document)if("function"==typeof attachEvent)attachEvent("onunload",G);else if("function"==typeof addEventListener){addEventListener("onpagehide"in L?"pagehide":"unload",G,!1)}function G(){for(var t in Y.requests)Y.requests.hasOwnProperty(t)&&Y.requests[t].abort()}var Q,W=(Q=tt({xdomain:!1}))&&null!==Q.responseType,Z=function(t){function n(n){var i;i=t.call(this,n)||this;var r=n&&n.forceBase64;return i.supportsBinary=W&&!r,i}return s(n,t),n.prototype.request=function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return e(t,{xd:this.xd},this.opts),new Y(tt,this.uri(),t)},n}(K);function tt(t){var n=t.xdomain;try{if("undefined"!=typeof XMLHttpRequest&&(!n||z))return new XMLHttpRequest}catch(t){}if(!n)try{return new(L[["Active"].concat("Object").join("X")])("Microsoft.XMLHTTP")}catch(t){}}var nt="undefined"!=typeof navigator&&"string"==typeof navigator.product&&"reactnative"===navigator.product.toLowerCase(),it=function(t){function n(){return t.apply(this,arguments)||this}s(n,t);var r=n.prototype;return r.doOpen=function(){var t=this.uri(),n=this.opts.protocols,i=nt?{}:_(this.opts,"agent","perMessageDeflate","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","localAddress","protocolVersion","origin","maxPayload","family","checkServerIdentity");this.opts.extraHeaders&&(i.headers=this.opts.extraHeaders);try{this.ws=this.createSocket(t,n,i)}catch(t){return this.emitReserved("error",t)}this.ws.binaryType=this.socket.binaryType,this.addEventListeners()},r.addEventListeners=function(){var t=this;this.ws.onopen=function(){t.opts.autoUnref&&t.ws.C.unref(),t.onOpen()},this.ws.onclose=function(n){return t.onClose({description:"websocket connection closed",context:n})},this.ws.onmessage=function(n){return t.onData(n.data)},this.ws.onerror=function(n){return t.onError("websocket error",n)}},r.write=function(t){var n=this;this.writable=!1;for(var i=function(){var i=t[r],e=r===t.length-1;g(i,n.supportsBinary,(function(t){try{n.doWrite(i,t)}catch(t){}e&&R((function(){n.writable=!0,n.emitReserved("drain")}),n.setTimeoutFn)}))},r=0;r<t.length;r++)i()},r.doClose=function(){void 0!==this.ws&&(this.ws.onerror=function(){},this.ws.close(),this.ws=null)},r.uri=function(){var t=this.opts.secure?"wss":"ws",n=this.query||{};return this.opts.timestampRequests&&(n[this.opts.timestampParam]=F()),this.supportsBinary||(n.b64=1),this.createUri(t,n)},i(n,[{key:"name",get:function(){return"websocket"}}])}(q),rt=L.WebSocket||L.MozWebSocket,et=function(t){function n(){return t.apply(this,arguments)||this}s(n,t);var i=n.prototype;return i.createSocket=function(t,n,i){return nt?new rt(t,n,i):n?new rt(t,n):new rt(t)},i.doWrite=function(t,n){this.ws.send(n)},n}(it),ot=function(t){function n(){return t.apply(this,arguments)||this}s(n,t);var r=n.prototype;return r.doOpen=function(){var t=this;try{this.T=new WebTransport(this.createUri("https"),this.opts.transportOptions[this.name])}catch(t){return this.emitReserved("error",t)}this.T.closed.then((function(){t.onClose()})).catch((function(n){t.onError("webtransport error",n)})),this.T.ready.then((function(){t.T.createBidirectionalStream().then((function(n){var i=function(t,n){O||(O=new TextDecoder);var i=[],r=0,e=-1,o=!1;return new TransformStream({transform:function(s,u){for(i.push(s);;){if(0===r){if(M(i)<1)break;var h=x(i,1);o=!(128&~h[0]),e=127&h[0],r=e<126?3:126===e?1:2}else if(1===r){if(M(i)<2)break;var f=x(i,2);e=new DataView(f.buffer,f.byteOffset,f.length).getUint16(0),r=3}else if(2===r){if(M(i)<8)break;var c=x(i,8),a=new DataView(c.buffer,c.byteOffset,c.length),v=a.getUint32(0);if(v>Math.pow(2,21)-1){u.enqueue(d);break}e=v*Math.pow(2,32)+a.getUint32(4),r=3}else{if(M(i)<e)break;var l=x(i,e);u.enqueue(S(o?l:O.decode(l),n)),r=0}if(0===e||e>t){u.enqueue(d);break}}}})}(Number.MAX_SAFE_INTEGER,t.socket.binaryType),r=n.readable.pipeThrough(i).getReader(),e=U();e.readable.pipeTo(n.writable),t.U=e.writable.getWriter();!function n(){r.read().then((function(i){var r=i.done,e=i.value;r||(t.onPacket(e),n())})).catch((function(t){}))}();var o={type:"open"};t.query.sid&&(o.data='{"sid":"'.concat(t.query.sid,'"}')),t.U.write(o).then((function(){return t.onOpen()}))}))}))},r.write=function(t){var n=this;this.writable=!1;for(var i=function(){var i=t[r],e=r===t.length-1;n.U.write(i).then((function(){e&&R((function(){n.writable=!0,n.emitReserved("drain")}),n.setTimeoutFn)}))},r=0;r<t.length;r++)i()},r.doClose=function(){var t;null===(t=this.T)||void 0===t||t.close()},i(n,[{key:"name",get:function(){return"webtransport"}}])}(q),st={websocket:et,webtransport:ot,polling:Z},ut=/^(?:(?![^:@\/?#]+:[^:@\/]*@)(http|https|ws|wss):\/\/)?((?:(([^:@\/?#]*)(?::([^:@\/?#]*))?)?@)?((?:[a-f0-9]{0,4}:){2,7}[a-f0-9]{0,4}|[^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,ht=["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"];function ft(t){if(t.length>8e3)throw"URI too long";var n=t,i=t.indexOf("["),r=t.indexOf("]");-1!=i&&-1!=r&&(t=t.substring(0,i)+t.substring(i,r).replace(/:/g,";")+t.substring(r,t.length));for(var e,o,s=ut.exec(t||""),u={},h=14;h--;)u[ht[h]]=s[h]||"";return-1!=i&&-1!=r&&(u.source=n,u.host=u.host.substring(1,u.host.length-1).replace(/;/g,":"),u.authority=u.authority.replace("[","").replace("]","").replace(/;/g,":"),u.ipv6uri=!0),u.pathNames=function(t,n){var i=/\/{2,9}/g,r=n.replace(i,"/").split("/");"/"!=n.slice(0,1)&&0!==n.length||r.splice(0,1);"/"==n.slice(-1)&&r.splice(r.length-1,1);return r}(0,u.path),u.queryKey=(e=u.query,o={},e.replace(/(?:^|&)([^&=]*)=?([^&]*)/g,(function(t,n,i){n&&(o[n]=i)})),o),u}var ct="function"==typeof addEventListener&&"function"==typeof removeEventListener,at=[];ct&&addEventListener("offline",(function(){at.forEach((function(t){return t()}))}),!1);var vt=function(t){function n(n,i){var r;if((r=t.call(this)||this).binaryType="arraybuffer",r.writeBuffer=[],r.M=0,r.I=-1,r.R=-1,r.L=-1,r._=1/0,n&&"object"===c(n)&&(i=n,n=null),n){var o=ft(n);i.hostname=o.host,i.secure="https"===o.protocol||"wss"===o.protocol,i.port=o.port,o.query&&(i.query=o.query)}else i.host&&(i.hostname=ft(i.host).host);return $(r,i),r.secure=null!=i.secure?i.secure:"undefined"!=typeof location&&"https:"===location.protocol,i.hostname&&!i.port&&(i.port=r.secure?"443":"80"),r.hostname=i.hostname||("undefined"!=typeof location?location.hostname:"localhost"),r.port=i.port||("undefined"!=typeof location&&location.port?location.port:r.secure?"443":"80"),r.transports=[],r.D={},i.transports.forEach((function(t){var n=t.prototype.name;r.transports.push(n),r.D[n]=t})),r.opts=e({path:"/engine.io",agent:!1,withCredentials:!1,upgrade:!0,timestampParam:"t",rememberUpgrade:!1,addTrailingSlash:!0,rejectUnauthorized:!0,perMessageDeflate:{threshold:1024},transportOptions:{},closeOnBeforeunload:!1},i),r.opts.path=r.opts.path.replace(/\/$/,"")+(r.opts.addTrailingSlash?"/":""),"string"==typeof r.opts.query&&(r.opts.query=function(t){for(var n={},i=t.split("&"),r=0,e=i.length;r<e;r++){var o=i[r].split("=");n[decodeURIComponent(o[0])]=decodeURIComponent(o[1])}return n}(r.opts.query)),ct&&(r.opts.closeOnBeforeunload&&(r.P=function(){r.transport&&(r.transport.removeAllListeners(),r.transport.close())},addEventListener("beforeunload",r.P,!1)),"localhost"!==r.hostname&&(r.$=function(){r.F("transport close",{description:"network connection lost"})},at.push(r.$))),r.opts.withCredentials&&(r.V=void 0),r.q(),r}s(n,t);var i=n.prototype;return i.createTransport=function(t){var n=e({},this.opts.query);n.EIO=4,n.transport=t,this.id&&(n.sid=this.id);var i=e({},this.opts,{query:n,socket:this,hostname:this.hostname,secure:this.secure,port:this.port},this.opts.transportOptions[t]);return new this.D[t](i)},i.q=function(){var t=this;if(0!==this.transports.length){var i=this.opts.rememberUpgrade&&n.priorWebsocketSuccess&&-1!==this.transports.indexOf("websocket")?"websocket":this.transports[0];this.readyState="opening";var r=this.createTransport(i);r.open(),this.setTransport(r)}else this.setTimeoutFn((function(){t.emitReserved("error","No transports available")}),0)},i.setTransport=function(t){var n=this;this.transport&&this.transport.removeAllListeners(),this.transport=t,t.on("drain",this.X.bind(this)).on("packet",this.H.bind(this)).on("error",this.B.bind(this)).on("close",(function(t){return n.F("transport close",t)}))},i.onOpen=function(){this.readyState="open",n.priorWebsocketSuccess="websocket"===this.transport.name,this.emitReserved("open"),this.flush()},i.H=function(t){if("opening"===this.readyState||"open"===this.readyState||"closing"===this.readyState)switch(this.emitReserved("packet",t),this.emitReserved("heartbeat"),t.type){case"open":this.onHandshake(JSON.parse(t.data));break;case"ping":this.J("pong"),this.emitReserved("ping"),this.emitReserved("pong"),this.K();break;case"error":var n=new Error("server error");n.code=t.data,this.B(n);break;case"message":this.emitReserved("data",t.data),this.emitReserved("message",t.data)}},i.onHandshake=function(t){this.emitReserved("handshake",t),this.id=t.sid,this.transport.query.sid=t.sid,this.I=t.pingInterval,this.R=t.pingTimeout,this.L=t.maxPayload,this.onOpen(),"closed"!==this.readyState&&this.K()},i.K=function(){var t=this;this.clearTimeoutFn(this.Y);var n=this.I+this.R;this._=Date.now()+n,this.Y=this.setTimeoutFn((function(){t.F("ping timeout")}),n),this.opts.autoUnref&&this.Y.unref()},i.X=function(){this.writeBuffer.splice(0,this.M),this.M=0,0===this.writeBuffer.length?this.emitReserved("drain"):this.flush()},i.flush=function(){if("closed"!==this.readyState&&this.transport.writable&&!this.upgrading&&this.writeBuffer.length){var t=this.G();this.transport.send(t),this.M=t.length,this.emitReserved("flush")}},i.G=function(){if(!(this.L&&"polling"===this.transport.name&&this.writeBuffer.length>1))return this.writeBuffer;for(var t,n=1,i=0;i<this.writeBuffer.length;i++){var r=this.writeBuffer[i].data;if(r&&(n+="string"==typeof(t=r)?function(t){for(var n=0,i=0,r=0,e=t.length;r<e;r++)(n=t.charCodeAt(r))<128?i+=1:n<2048?i+=2:n<55296||n>=57344?i+=3:(r++,i+=4);return i}(t):Math.ceil(1.33*(t.byteLength||t.size))),i>0&&n>this.L)return this.writeBuffer.slice(0,i);n+=2}return this.writeBuffer},i.W=function(){var t=this;if(!this._)return!0;var n=Date.now()>this._;return n&&(this._=0,R((function(){t.F("ping timeout")}),this.setTimeoutFn)),n},i.write=function(t,n,i){return this.J("message",t,n,i),this},i.send=function(t,n,i){return this.J("message",t,n,i),this},i.J=function(t,n,i,r){if("function"==typeof n&&(r=n,n=void 0),"function"==typeof i&&(r=i,i=null),"closing"!==this.readyState&&"closed"!==this.readyState){(i=i||{}).compress=!1!==i.compress;var e={type:t,data:n,options:i};this.emitReserved("packetCreate",e),this.writeBuffer.push(e),r&&this.once("flush",r),this.flush()}},i.close=function(){var t=this,n=function(){t.F("forced close"),t.transport.close()},i=function i(){t.off("upgrade",i),t.off("upgradeError",i),n()},r=function(){t.once("upgrade",i),t.once("upgradeError",i)};return"opening"!==this.readyState&&"open"!==this.readyState||(this.readyState="closing",this.writeBuffer.length?this.once("drain",(function(){t.upgrading?r():n()})):this.upgrading?r():n()),this},i.B=function(t){if(n.priorWebsocketSuccess=!1,this.opts.tryAllTransports&&this.transports.length>1&&"opening"===this.readyState)return this.transports.shift(),this.q();this.emitReserved("error",t),this.F("transport error",t)},i.F=function(t,n){if("opening"===this.readyState||"open"===this.readyState||"closing"===this.readyState){if(this.clearTimeoutFn(this.Y),this.transport.removeAllListeners("close"),this.transport.close(),this.transport.removeAllListeners(),ct&&(this.P&&removeEventListener("beforeunload",this.P,!1),this.$)){var i=at.indexOf(this.$);-1!==i&&at.splice(i,1)}this.readyState="closed",this.id=null,this.emitReserved("close",t,n),this.writeBuffer=[],this.M=0}},n}(I);vt.protocol=4;var lt=function(t){function n(){var n;return(n=t.apply(this,arguments)||this).Z=[],n}s(n,t);var i=n.prototype;return i.onOpen=function(){if(t.prototype.onOpen.call(this),"open"===this.readyState&&this.opts.upgrade)for(var n=0;n<this.Z.length;n++)this.tt(this.Z[n])},i.tt=function(t){var n=this,i=this.createTransport(t),r=!1;vt.priorWebsocketSuccess=!1;var e=function(){r||(i.send([{type:"ping",data:"probe"}]),i.once("packet",(function(t){if(!r)if("pong"===t.type&&"probe"===t.data){if(n.upgrading=!0,n.emitReserved("upgrading",i),!i)return;vt.priorWebsocketSuccess="websocket"===i.name,n.transport.pause((function(){r||"closed"!==n.readyState&&(c(),n.setTransport(i),i.send([{type:"upgrade"}]),n.emitReserved("upgrade",i),i=null,n.upgrading=!1,n.flush())}))}else{var e=new Error("probe error");e.transport=i.name,n.emitReserved("upgradeError",e)}})))};function o(){r||(r=!0,c(),i.close(),i=null)}var s=function(t){var r=new Error("probe error: "+t);r.transport=i.name,o(),n.emitReserved("upgradeError",r)};function u(){s("transport closed")}function h(){s("socket closed")}function f(t){i&&t.name!==i.name&&o()}var c=function(){i.removeListener("open",e),i.removeListener("error",s),i.removeListener("close",u),n.off("close",h),n.off("upgrading",f)};i.once("open",e),i.once("error",s),i.once("close",u),this.once("close",h),this.once("upgrading",f),-1!==this.Z.indexOf("webtransport")&&"webtransport"!==t?this.setTimeoutFn((function(){r||i.open()}),200):i.open()},i.onHandshake=function(n){this.Z=this.nt(n.upgrades),t.prototype.onHandshake.call(this,n)},i.nt=function(t){for(var n=[],i=0;i<t.length;i++)~this.transports.indexOf(t[i])&&n.push(t[i]);return n},n}(vt),pt=function(t){function n(n){var i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r="object"===c(n)?n:i;return(!r.transports||r.transports&&"string"==typeof r.transports[0])&&(r.transports=(r.transports||["polling","websocket","webtransport"]).map((function(t){return st[t]})).filter((function(t){return!!t}))),t.call(this,n,r)||this}return s(n,t),n}(lt);pt.protocol;var dt="function"==typeof ArrayBuffer,yt=function(t){return"function"==typeof ArrayBuffer.isView?ArrayBuffer.isView(t):t.buffer instanceof ArrayBuffer},bt=Object.prototype.toString,wt="function"==typeof Blob||"undefined"!=typeof Blob&&"[object BlobConstructor]"===bt.call(Blob),gt="function"==typeof File||"undefined"!=typeof File&&"[object FileConstructor]"===bt.call(File);function mt(t){return dt&&(t instanceof ArrayBuffer||yt(t))||wt&&t instanceof Blob||gt&&t instanceof File}function kt(t,n){if(!t||"object"!==c(t))return!1;if(Array.isArray(t)){for(var i=0,r=t.length;i<r;i++)if(kt(t[i]))return!0;return!1}if(mt(t))return!0;if(t.toJSON&&"function"==typeof t.toJSON&&1===arguments.length)return kt(t.toJSON(),!0);for(var e in t)if(Object.prototype.hasOwnProperty.call(t,e)&&kt(t[e]))return!0;return!1}function At(t){var n=[],i=t.data,r=t;return r.data=jt(i,n),r.attachments=n.length,{packet:r,buffers:n}}function jt(t,n){if(!t)return t;if(mt(t)){var i={_placeholder:!0,num:n.length};return n.push(t),i}if(Array.isArray(t)){for(var r=new Array(t.length),e=0;e<t.length;e++)r[e]=jt(t[e],n);return r}if("object"===c(t)&&!(t instanceof Date)){var o={};for(var s in t)Object.prototype.hasOwnProperty.call(t,s)&&(o[s]=jt(t[s],n));return o}return t}function Et(t,n){return t.data=Ot(t.data,n),delete t.attachments,t}function Ot(t,n){if(!t)return t;if(t&&!0===t._placeholder){if("number"==typeof t.num&&t.num>=0&&t.num<n.length)return n[t.num];throw new Error("illegal attachments")}if(Array.isArray(t))for(var i=0;i<t.length;i++)t[i]=Ot(t[i],n);else if("object"===c(t))for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(t[r]=Ot(t[r],n));return t}var Bt,St=["connect","connect_error","disconnect","disconnecting","newListener","removeListener"];!function(t){t[t.CONNECT=0]="CONNECT",t[t.DISCONNECT=1]="DISCONNECT",t[t.EVENT=2]="EVENT",t[t.ACK=3]="ACK",t[t.CONNECT_ERROR=4]="CONNECT_ERROR",t[t.BINARY_EVENT=5]="BINARY_EVENT",t[t.BINARY_ACK=6]="BINARY_ACK"}(Bt||(Bt={}));var Nt=function(){function t(t){this.replacer=t}var n=t.prototype;return n.encode=function(t){return t.type!==Bt.EVENT&&t.type!==Bt.ACK||!kt(t)?[this.encodeAsString(t)]:this.encodeAsBinary({type:t.type===Bt.EVENT?Bt.BINARY_EVENT:Bt.BINARY_ACK,nsp:t.nsp,data:t.data,id:t.id})},n.encodeAsString=function(t){var n=""+t.type;return t.type!==Bt.BINARY_EVENT&&t.type!==Bt.BINARY_ACK||(n+=t.attachments+"-"),t.nsp&&"/"!==t.nsp&&(n+=t.nsp+","),null!=t.id&&(n+=t.id),null!=t.data&&(n+=JSON.stringify(t.data,this.replacer)),n},n.encodeAsBinary=function(t){var n=At(t),i=this.encodeAsString(n.packet),r=n.buffers;return r.unshift(i),r},t}(),Ct=function(t){function n(n){var i;return(i=t.call(this)||this).reviver=n,i}s(n,t);var i=n.prototype;return i.add=function(n){var i;if("string"==typeof n){if(this.reconstructor)throw new Error("got plaintext data when reconstructing a packet");var r=(i=this.decodeString(n)).type===Bt.BINARY_EVENT;r||i.type===Bt.BINARY_ACK?(i.type=r?Bt.EVENT:Bt.ACK,this.reconstructor=new Tt(i),0===i.attachments&&t.prototype.emitReserved.call(this,"decoded",i)):t.prototype.emitReserved.call(this,"decoded",i)}else{if(!mt(n)&&!n.base64)throw new Error("Unknown type: "+n);if(!this.reconstructor)throw new Error("got binary data when not reconstructing a packet");(i=this.reconstructor.takeBinaryData(n))&&(this.reconstructor=null,t.prototype.emitReserved.call(this,"decoded",i))}},i.decodeString=function(t){var i=0,r={type:Number(t.charAt(0))};if(void 0===Bt[r.type])throw new Error("unknown packet type "+r.type);if(r.type===Bt.BINARY_EVENT||r.type===Bt.BINARY_ACK){for(var e=i+1;"-"!==t.charAt(++i)&&i!=t.length;);var o=t.substring(e,i);if(o!=Number(o)||"-"!==t.charAt(i))throw new Error("Illegal attachments");r.attachments=Number(o)}if("/"===t.charAt(i+1)){for(var s=i+1;++i;){if(","===t.charAt(i))break;if(i===t.length)break}r.nsp=t.substring(s,i)}else r.nsp="/";var u=t.charAt(i+1);if(""!==u&&Number(u)==u){for(var h=i+1;++i;){var f=t.charAt(i);if(null==f||Number(f)!=f){--i;break}if(i===t.length)break}r.id=Number(t.substring(h,i+1))}if(t.charAt(++i)){var c=this.tryParse(t.substr(i));if(!n.isPayloadValid(r.type,c))throw new Error("invalid payload");r.data=c}return r},i.tryParse=function(t){try{return JSON.parse(t,this.reviver)}catch(t){return!1}},n.isPayloadValid=function(t,n){switch(t){case Bt.CONNECT:return Mt(n);case Bt.DISCONNECT:return void 0===n;case Bt.CONNECT_ERROR:return"string"==typeof n||Mt(n);case Bt.EVENT:case Bt.BINARY_EVENT:return Array.isArray(n)&&("number"==typeof n[0]||"string"==typeof n[0]&&-1===St.indexOf(n[0]));case Bt.ACK:case Bt.BINARY_ACK:return Array.isArray(n)}},i.destroy=function(){this.reconstructor&&(this.reconstructor.finishedReconstruction(),this.reconstructor=null)},n}(I),Tt=function(){function t(t){this.packet=t,this.buffers=[],this.reconPack=t}var n=t.prototype;return n.takeBinaryData=function(t){if(this.buffers.push(t),this.buffers.length===this.reconPack.attachments){var n=Et(this.reconPack,this.buffers);return this.finishedReconstruction(),n}return null},n.finishedReconstruction=function(){this.reconPack=null,this.buffers=[]},t}();var Ut=Number.isInteger||function(t){return"number"==typeof t&&isFinite(t)&&Math.floor(t)===t};function Mt(t){return"[object Object]"===Object.prototype.toString.call(t)}var xt=Object.freeze({__proto__:null,protocol:5,get PacketType(){return Bt},Encoder:Nt,Decoder:Ct,isPacketValid:function(t){return"string"==typeof t.nsp&&(void 0===(n=t.id)||Ut(n))&&function(t,n){switch(t){case Bt.CONNECT:return void 0===n||Mt(n);case Bt.DISCONNECT:return void 0===n;case Bt.EVENT:return Array.isArray(n)&&("number"==typeof n[0]||"string"==typeof n[0]&&-1===St.indexOf(n[0]));case Bt.ACK:return Array.isArray(n);case Bt.CONNECT_ERROR:return"string"==typeof n||Mt(n);default:return!1}}(t.type,t.data);var n}});function It(t,n,i){return t.on(n,i),function(){t.off(n,i)}}var Rt=Object.freeze({connect:1,connect_error:1,disconnect:1,disconnecting:1,newListener:1,removeListener:1}),Lt=function(t){function n(n,i,r){var o;return(o=t.call(this)||this).connected=!1,o.recovered=!1,o.receiveBuffer=[],o.sendBuffer=[],o.it=[],o.rt=0,o.ids=0,o.acks={},o.flags={},o.io=n,o.nsp=i,r&&r.auth&&(o.auth=r.auth),o.l=e({},r),o.io.et&&o.open(),o}s(n,t);var o=n.prototype;return o.subEvents=function(){if(!this.subs){var t=this.io;this.subs=[It(t,"open",this.onopen.bind(this)),It(t,"packet",this.onpacket.bind(this)),It(t,"error",this.onerror.bind(this)),It(t,"close",this.onclose.bind(this))]}},o.connect=function(){return this.connected||(this.subEvents(),this.io.ot||this.io.open(),"open"===this.io.st&&this.onopen()),this},o.open=function(){return this.connect()},o.send=function(){for(var t=arguments.length,n=new Array(t),i=0;i<t;i++)n[i]=arguments[i];return n.unshift("message"),this.emit.apply(this,n),this},o.emit=function(t){var n,i,r;if(Rt.hasOwnProperty(t))throw new Error('"'+t.toString()+'" is a reserved event name');for(var e=arguments.length,o=new Array(e>1?e-1:0),s=1;s<e;s++)o[s-1]=arguments[s];if(o.unshift(t),this.l.retries&&!this.flags.fromQueue&&!this.flags.volatile)return this.ut(o),this;var u={type:Bt.EVENT,data:o,options:{}};if(u.options.compress=!1!==this.flags.compress,"function"==typeof o[o.length-1]){var h=this.ids++,f=o.pop();this.ht(h,f),u.id=h}var c=null===(i=null===(n=this.io.engine)||void 0===n?void 0:n.transport)||void 0===i?void 0:i.writable,a=this.connected&&!(null===(r=this.io.engine)||void 0===r?void 0:r.W());return this.flags.volatile&&!c||(a?(this.notifyOutgoingListeners(u),this.packet(u)):this.sendBuffer.push(u)),this.flags={},this},o.ht=function(t,n){var i,r=this,e=null!==(i=this.flags.timeout)&&void 0!==i?i:this.l.ackTimeout;if(void 0!==e){var o=this.io.setTimeoutFn((function(){delete r.acks[t];for(var i=0;i<r.sendBuffer.length;i++)r.sendBuffer[i].id===t&&r.sendBuffer.splice(i,1);n.call(r,new Error("operation has timed out"))}),e),s=function(){r.io.clearTimeoutFn(o);for(var t=arguments.length,i=new Array(t),e=0;e<t;e++)i[e]=arguments[e];n.apply(r,i)};s.withError=!0,this.acks[t]=s}else this.acks[t]=n},o.emitWithAck=function(t){for(var n=this,i=arguments.length,r=new Array(i>1?i-1:0),e=1;e<i;e++)r[e-1]=arguments[e];return new Promise((function(i,e){var o=function(t,n){return t?e(t):i(n)};o.withError=!0,r.push(o),n.emit.apply(n,[t].concat(r))}))},o.ut=function(t){var n,i=this;"function"==typeof t[t.length-1]&&(n=t.pop());var r={id:this.rt++,tryCount:0,pending:!1,args:t,flags:e({fromQueue:!0},this.flags)};t.push((function(t){if(r===i.it[0]){if(null!==t)r.tryCount>i.l.retries&&(i.it.shift(),n&&n(t));else if(i.it.shift(),n){for(var e=arguments.length,o=new Array(e>1?e-1:0),s=1;s<e;s++)o[s-1]=arguments[s];n.apply(void 0,[null].concat(o))}return r.pending=!1,i.ft()}})),this.it.push(r),this.ft()},o.ft=function(){var t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(this.connected&&0!==this.it.length){var n=this.it[0];n.pending&&!t||(n.pending=!0,n.tryCount++,this.flags=n.flags,this.emit.apply(this,n.args))}},o.packet=function(t){t.nsp=this.nsp,this.io.ct(t)},o.onopen=function(){var t=this;"function"==typeof this.auth?this.auth((function(n){t.vt(n)})):this.vt(this.auth)},o.vt=function(t){this.packet({type:Bt.CONNECT,data:this.lt?e({pid:this.lt,offset:this.dt},t):t})},o.onerror=function(t){this.connected||this.emitReserved("connect_error",t)},o.onclose=function(t,n){this.connected=!1,delete this.id,this.emitReserved("disconnect",t,n),this.yt()},o.yt=function(){var t=this;Object.keys(this.acks).forEach((function(n){if(!t.sendBuffer.some((function(t){return String(t.id)===n}))){var i=t.acks[n];delete t.acks[n],i.withError&&i.call(t,new Error("socket has been disconnected"))}}))},o.onpacket=function(t){if(t.nsp===this.nsp)switch(t.type){case Bt.CONNECT:t.data&&t.data.sid?this.onconnect(t.data.sid,t.data.pid):this.emitReserved("connect_error",new Error("It seems you are trying to reach a Socket.IO server in v2.x with a v3.x client, but they are not compatible (more information here: https://socket.io/docs/v3/migrating-from-2-x-to-3-0/)"));break;case Bt.EVENT:case Bt.BINARY_EVENT:this.onevent(t);break;case Bt.ACK:case Bt.BINARY_ACK:this.onack(t);break;case Bt.DISCONNECT:this.ondisconnect();break;case Bt.CONNECT_ERROR:this.destroy();var n=new Error(t.data.message);n.data=t.data.data,this.emitReserved("connect_error",n)}},o.onevent=function(t){var n=t.data||[];null!=t.id&&n.push(this.ack(t.id)),this.connected?this.emitEvent(n):this.receiveBuffer.push(Object.freeze(n))},o.emitEvent=function(n){if(this.bt&&this.bt.length){var i,e=r(this.bt.slice());try{for(e.s();!(i=e.n()).done;){i.value.apply(this,n)}}catch(t){e.e(t)}finally{e.f()}}t.prototype.emit.apply(this,n),this.lt&&n.length&&"string"==typeof n[n.length-1]&&(this.dt=n[n.length-1])},o.ack=function(t){var n=this,i=!1;return function(){if(!i){i=!0;for(var r=arguments.length,e=new Array(r),o=0;o<r;o++)e[o]=arguments[o];n.packet({type:Bt.ACK,id:t,data:e})}}},o.onack=function(t){var n=this.acks[t.id];"function"==typeof n&&(delete this.acks[t.id],n.withError&&t.data.unshift(null),n.apply(this,t.data))},o.onconnect=function(t,n){this.id=t,this.recovered=n&&this.lt===n,this.lt=n,this.connected=!0,this.emitBuffered(),this.emitReserved("connect"),this.ft(!0)},o.emitBuffered=function(){var t=this;this.receiveBuffer.forEach((function(n){return t.emitEvent(n)})),this.receiveBuffer=[],this.sendBuffer.forEach((function(n){t.notifyOutgoingListeners(n),t.packet(n)})),this.sendBuffer=[]},o.ondisconnect=function(){this.destroy(),this.onclose("io server disconnect")},o.destroy=function(){this.subs&&(this.subs.forEach((function(t){return t()})),this.subs=void 0),this.io.wt(this)},o.disconnect=function(){return this.connected&&this.packet({type:Bt.DISCONNECT}),this.destroy(),this.connected&&this.onclose("io client disconnect"),this},o.close=function(){return this.disconnect()},o.compress=function(t){return this.flags.compress=t,this},o.timeout=function(t){return this.flags.timeout=t,this},o.onAny=function(t){return this.bt=this.bt||[],this.bt.push(t),this},o.prependAny=function(t){return this.bt=this.bt||[],this.bt.unshift(t),this},o.offAny=function(t){if(!this.bt)return this;if(t){for(var n=this.bt,i=0;i<n.length;i++)if(t===n[i])return n.splice(i,1),this}else this.bt=[];return this},o.listenersAny=function(){return this.bt||[]},o.onAnyOutgoing=function(t){return this.gt=this.gt||[],this.gt.push(t),this},o.prependAnyOutgoing=function(t){return this.gt=this.gt||[],this.gt.unshift(t),this},o.offAnyOutgoing=function(t){if(!this.gt)return this;if(t){for(var n=this.gt,i=0;i<n.length;i++)if(t===n[i])return n.splice(i,1),this}else this.gt=[];return this},o.listenersAnyOutgoing=function(){return this.gt||[]},o.notifyOutgoingListeners=function(t){if(this.gt&&this.gt.length){var n,i=r(this.gt.slice());try{for(i.s();!(n=i.n()).done;){n.value.apply(this,t.data)}}catch(t){i.e(t)}finally{i.f()}}},i(n,[{key:"disconnected",get:function(){return!this.connected}},{key:"active",get:function(){return!!this.subs}},{key:"volatile",get:function(){return this.flags.volatile=!0,this}}])}(I);function _t(t){t=t||{},this.ms=t.min||100,this.max=t.max||1e4,this.factor=t.factor||2,this.jitter=t.jitter>0&&t.jitter<=1?t.jitter:0,this.attempts=0}_t.prototype.duration=function(){var t=this.ms*Math.pow(this.factor,this.attempts++);if(this.jitter){var n=Math.random(),i=Math.floor(n*this.jitter*t);t=1&Math.floor(10*n)?t+i:t-i}return 0|Math.min(t,this.max)},_t.prototype.reset=function(){this.attempts=0},_t.prototype.setMin=function(t){this.ms=t},_t.prototype.setMax=function(t){this.max=t},_t.prototype.setJitter=function(t){this.jitter=t};var Dt=function(t){function n(n,i){var r,e;(r=t.call(this)||this).nsps={},r.subs=[],n&&"object"===c(n)&&(i=n,n=void 0),(i=i||{}).path=i.path||"/socket.io",r.opts=i,$(r,i),r.reconnection(!1!==i.reconnection),r.reconnectionAttempts(i.reconnectionAttempts||1/0),r.reconnectionDelay(i.reconnectionDelay||1e3),r.reconnectionDelayMax(i.reconnectionDelayMax||5e3),r.randomizationFactor(null!==(e=i.randomizationFactor)&&void 0!==e?e:.5),r.backoff=new _t({min:r.reconnectionDelay(),max:r.reconnectionDelayMax(),jitter:r.randomizationFactor()}),r.timeout(null==i.timeout?2e4:i.timeout),r.st="closed",r.uri=n;var o=i.parser||xt;return r.encoder=new o.Encoder,r.decoder=new o.Decoder,r.et=!1!==i.autoConnect,r.et&&r.open(),r}s(n,t);var i=n.prototype;return i.reconnection=function(t){return arguments.length?(this.kt=!!t,t||(this.skipReconnect=!0),this):this.kt},i.reconnectionAttempts=function(t){return void 0===t?this.At:(this.At=t,this)},i.reconnectionDelay=function(t){var n;return void 0===t?this.jt:(this.jt=t,null===(n=this.backoff)||void 0===n||n.setMin(t),this)},i.randomizationFactor=function(t){var n;return void 0===t?this.Et:(this.Et=t,null===(n=this.backoff)||void 0===n||n.setJitter(t),this)},i.reconnectionDelayMax=function(t){var n;return void 0===t?this.Ot:(this.Ot=t,null===(n=this.backoff)||void 0===n||n.setMax(t),this)},i.timeout=function(t){return arguments.length?(this.Bt=t,this):this.Bt},i.maybeReconnectOnOpen=function(){!this.ot&&this.kt&&0===this.backoff.attempts&&this.reconnect()},i.open=function(t){var n=this;if(~this.st.indexOf("open"))return this;this.engine=new pt(this.uri,this.opts);var i=this.engine,r=this;this.st="opening",this.skipReconnect=!1;var e=It(i,"open",(function(){r.onopen(),t&&t()})),o=function(i){n.cleanup(),n.st="closed",n.emitReserved("error",i),t?t(i):n.maybeReconnectOnOpen()},s=It(i,"error",o);if(!1!==this.Bt){var u=this.Bt,h=this.setTimeoutFn((function(){e(),o(new Error("timeout")),i.close()}),u);this.opts.autoUnref&&h.unref(),this.subs.push((function(){n.clearTimeoutFn(h)}))}return this.subs.push(e),this.subs.push(s),this},i.connect=function(t){return this.open(t)},i.onopen=function(){this.cleanup(),this.st="open",this.emitReserved("open");var t=this.engine;this.subs.push(It(t,"ping",this.onping.bind(this)),It(t,"data",this.ondata.bind(this)),It(t,"error",this.onerror.bind(this)),It(t,"close",this.onclose.bind(this)),It(this.decoder,"decoded",this.ondecoded.bind(this)))},i.onping=function(){this.emitReserved("ping")},i.ondata=function(t){try{this.decoder.add(t)}catch(t){this.onclose("parse error",t)}},i.ondecoded=function(t){var n=this;R((function(){n.emitReserved("packet",t)}),this.setTimeoutFn)},i.onerror=function(t){this.emitReserved("error",t)},i.socket=function(t,n){var i=this.nsps[t];return i?this.et&&!i.active&&i.connect():(i=new Lt(this,t,n),this.nsps[t]=i),i},i.wt=function(t){for(var n=0,i=Object.keys(this.nsps);n<i.length;n++){var r=i[n];if(this.nsps[r].active)return}this.St()},i.ct=function(t){for(var n=this.encoder.encode(t),i=0;i<n.length;i++)this.engine.write(n[i],t.options)},i.cleanup=function(){this.subs.forEach((function(t){return t()})),this.subs.length=0,this.decoder.destroy()},i.St=function(){this.skipReconnect=!0,this.ot=!1,this.onclose("forced close")},i.disconnect=function(){return this.St()},i.onclose=function(t,n){var i;this.cleanup(),null===(i=this.engine)||void 0===i||i.close(),this.backoff.reset(),this.st="closed",this.emitReserved("close",t,n),this.kt&&!this.skipReconnect&&this.reconnect()},i.reconnect=function(){var t=this;if(this.ot||this.skipReconnect)return this;var n=this;if(this.backoff.attempts>=this.At)this.backoff.reset(),this.emitReserved("reconnect_failed"),this.ot=!1;else{var i=this.backoff.duration();this.ot=!0;var r=this.setTimeoutFn((function(){n.skipReconnect||(t.emitReserved("reconnect_attempt",n.backoff.attempts),n.skipReconnect||n.open((function(i){i?(n.ot=!1,n.reconnect(),t.emitReserved("reconnect_error",i)):n.onreconnect()})))}),i);this.opts.autoUnref&&r.unref(),this.subs.push((function(){t.clearTimeoutFn(r)}))}},i.onreconnect=function(){var t=this.backoff.attempts;this.ot=!1,this.backoff.reset(),this.emitReserved("reconnect",t)},n}(I),Pt={};function $t(t,n){"object"===c(t)&&(n=t,t=void 0);var i,r=function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",i=arguments.length>2?arguments[2]:void 0,r=t;i=i||"undefined"!=typeof location&&location,null==t&&(t=i.protocol+"//"+i.host),"string"==typeof t&&("/"===t.charAt(0)&&(t="/"===t.charAt(1)?i.protocol+t:i.host+t),/^(https?|wss?):\/\//.test(t)||(t=void 0!==i?i.protocol+"//"+t:"https://"+t),r=ft(t)),r.port||(/^(http|ws)$/.test(r.protocol)?r.port="80":/^(http|ws)s$/.test(r.protocol)&&(r.port="443")),r.path=r.path||"/";var e=-1!==r.host.indexOf(":")?"["+r.host+"]":r.host;return r.id=r.protocol+"://"+e+":"+r.port+n,r.href=r.protocol+"://"+e+(i&&i.port===r.port?"":":"+r.port),r}(t,(n=n||{}).path||"/socket.io"),e=r.source,o=r.id,s=r.path,u=Pt[o]&&s in Pt[o].nsps;return n.forceNew||n["force new connection"]||!1===n.multiplex||u?i=new Dt(e,n):(Pt[o]||(Pt[o]=new Dt(e,n)),i=Pt[o]),r.query&&!n.query&&(n.query=r.queryKey),i.socket(r.path,n)}return e($t,{Manager:Dt,Socket:Lt,io:$t,connect:$t}),$t}));
+//# sourceMappingURL=socket.io.min.js.map
+
+return { io: module.exports };
+})();
+__m['types.tsx'] = (() => {
+const CommandType = {
+  Iniciar: -1,
+  Linear: 0,
+  Sleep: 1,
+  Arco_horario: 2,
+  Arco_antihorario: 3,
+  Start_acquisition: 1000,
+  Stop_acquisition: 1001,
+  Start_stream: 1002,
+  Stop_stream: 1003,
+  Set_exposure: 1004,
+  is_movement: (n)=>n === CommandType.Iniciar || n === CommandType.Linear || n === CommandType.Arco_horario || n == CommandType.Arco_antihorario
+};
+function find_last_movement_node_before(i, nodes) {
+  let last_move_i = i - 1;
+  while(last_move_i >= 0){
+    if (CommandType.is_movement(nodes[last_move_i].command.type)) {
+      break;
+    }
+    last_move_i -= 1;
+  }
+  if (last_move_i >= 0) {
+    return nodes[last_move_i];
+  }
+  return nodes[0];
+}
+
+
+return { CommandType, find_last_movement_node_before };
+})();
+__m['trajetoria_context.tsx'] = (() => {
+const { createContext } = __m['preact'];
+const { useContext } = __m['preact/hooks'];
+const TrajetoriaContext = createContext({
+  is_dirty: true,
+  setIsDirty: ()=>{},
+  nodes: [],
+  setNodes: (_ns)=>{},
+  getNextNodeId: ()=>0,
+  encoder_host: '',
+  setEncoder_host: ()=>{},
+  encoder_health: {
+    reachable: null,
+    rtt_ms: null,
+    address: null
+  }
+});
+function useTrajetoria() {
+  return useContext(TrajetoriaContext);
+}
+
+
+return { TrajetoriaContext, useTrajetoria };
+})();
+__m['svg_wrap.tsx'] = (() => {
+const { jsx: _jsx, jsxs: _jsxs } = __m['preact/jsx-runtime'];
+const { useRef } = __m['preact/hooks'];
+const { CommandType, find_last_movement_node_before } = __m['types.tsx'];
+const { useTrajetoria } = __m['trajetoria_context.tsx'];
+function SvgWrap({ status, offset, bounds }) {
+  const dragInfo = useRef(null);
+  const { setIsDirty, nodes, setNodes, getNextNodeId } = useTrajetoria();
+  function make_arrow(type, r, a, b) {
+    const startX = a.x;
+    const startY = a.y;
+    const endX = b.x;
+    const endY = b.y;
+    if (type === CommandType.Arco_horario) {
+      const delta2 = (endX - startX) * (endX - startX) + (endY - startY) * (endY - startY);
+      const broken = delta2 > 2 * r * 2 * r;
+      return /*#__PURE__*/ _jsx("path", {
+        d: `M ${startX} ${startY} A ${r} ${r} 0 0 1 ${endX} ${endY}`,
+        stroke: broken ? "var(--warning-color)" : "var(--on-surface-alt-color)",
+        "stroke-width": "2.5",
+        "stroke-linecap": "round",
+        fill: "none",
+        "marker-end": "url(#arrowhead)",
+        opacity: "0.95"
+      });
+    } else if (type === CommandType.Arco_antihorario) {
+      const delta2 = (endX - startX) * (endX - startX) + (endY - startY) * (endY - startY);
+      const broken = delta2 > 2 * r * 2 * r;
+      return /*#__PURE__*/ _jsx("path", {
+        d: `M ${startX} ${startY} A ${r} ${r} 0 0 0 ${endX} ${endY}`,
+        stroke: broken ? "var(--warning-color)" : "var(--on-surface-alt-color)",
+        "stroke-width": "2.5",
+        "stroke-linecap": "round",
+        fill: "none",
+        "marker-end": "url(#arrowhead)",
+        opacity: "0.95"
+      });
+    }
+    return /*#__PURE__*/ _jsx("line", {
+      x1: startX,
+      y1: startY,
+      x2: endX,
+      y2: endY,
+      stroke: "var(--on-surface-alt-color)",
+      "stroke-width": "2.5",
+      "stroke-linecap": "round",
+      "marker-end": "url(#arrowhead)",
+      opacity: "0.95"
+    });
+  }
+  function getSvgPoint(e) {
+    const svg = e.target.ownerSVGElement || e.target;
+    if (svg) {
+      const pt = svg.createSVGPoint();
+      pt.x = e.clientX;
+      pt.y = e.clientY;
+      const ctm = svg.getScreenCTM()?.inverse();
+      const loc = pt.matrixTransform(ctm);
+      return {
+        x: loc.x,
+        y: loc.y
+      };
+    }
+    return {
+      x: 0,
+      y: 0
+    };
+  }
+  const onDoubleClick = (e)=>{
+    const pt = getSvgPoint(e);
+    const move_nodes = nodes.filter((n)=>CommandType.is_movement(n.command.type));
+    const last = move_nodes[move_nodes.length - 1] || {
+      s: 50
+    };
+    const nx = Math.max(Math.min(Math.round((pt.x - offset.x) * 5) / 5, bounds.x0 + bounds.width), bounds.x0) - offset.x;
+    const ny = Math.max(Math.min(Math.round((pt.y - offset.y) * 5) / 5, bounds.y0 + bounds.height), bounds.y0) - offset.y;
+    let next = {
+      id: getNextNodeId(),
+      command: {
+        type: CommandType.Linear,
+        x: nx,
+        y: ny,
+        s: last.command.s,
+        p: 1000,
+        r: 100,
+        f: 10,
+        e: 500,
+        str: ""
+      }
+    };
+    setNodes((prev)=>[
+        ...prev,
+        next
+      ]);
+    setIsDirty(true);
+  };
+  const onPointerDown = (e, i)=>{
+    if (!status.running) {
+      const pt = getSvgPoint(e);
+      dragInfo.current = {
+        i,
+        offsetX: nodes[i].command.x + offset.x - pt.x,
+        offsetY: nodes[i].command.y + offset.y - pt.y
+      };
+      e.target.setPointerCapture(e.pointerId);
+    }
+  };
+  const onPointerMove = (e)=>{
+    if (!dragInfo.current) return;
+    const { i, offsetX, offsetY } = dragInfo.current;
+    const pt = getSvgPoint(e);
+    const nx = Math.max(Math.min(Math.round((pt.x + offsetX) * 5) / 5, bounds.x0 + bounds.width), bounds.x0) - offset.x;
+    const ny = Math.max(Math.min(Math.round((pt.y + offsetY) * 5) / 5, bounds.y0 + bounds.height), bounds.y0) - offset.y;
+    setNodes((ns)=>{
+      const copy = [
+        ...ns
+      ];
+      const command_type = copy[i].command.type;
+      if (command_type === CommandType.Arco_horario || command_type === CommandType.Arco_antihorario) {
+        const { command: { x, y } } = find_last_movement_node_before(i, copy);
+        const min_r = Math.ceil(Math.sqrt(Math.pow(nx - x, 2) + Math.pow(ny - y, 2)) * 500 / 2) / 500;
+        copy[i].command.x = nx;
+        copy[i].command.y = ny;
+        copy[i].command.r = min_r;
+      } else {
+        copy[i].command.x = nx;
+        copy[i].command.y = ny;
+      }
+      setIsDirty(true);
+      return copy;
+    });
+  };
+  const onPointerUp = ()=>{
+    dragInfo.current = null;
+  };
+  const move_nodes = nodes.map((n, i)=>[
+      n,
+      i
+    ]).filter((a)=>CommandType.is_movement(a[0].command.type));
+  return /*#__PURE__*/ _jsx("div", {
+    className: "svg-wrap",
+    children: /*#__PURE__*/ _jsxs("svg", {
+      viewBox: `${bounds.x0} ${bounds.y0} ${bounds.width} ${bounds.height}`,
+      onDblClick: onDoubleClick,
+      onPointerMove: onPointerMove,
+      onPointerUp: onPointerUp,
+      children: [
+        /*#__PURE__*/ _jsxs("defs", {
+          children: [
+            /*#__PURE__*/ _jsx("marker", {
+              id: "arrowhead",
+              markerWidth: "10",
+              markerHeight: "10",
+              refX: "5.5",
+              refY: "2.5",
+              orient: "auto",
+              markerUnits: "strokeWidth",
+              children: /*#__PURE__*/ _jsx("path", {
+                d: "M0,0 L5,2.5 L0,5 z",
+                fill: "var(--on-surface-alt-color)"
+              })
+            }),
+            /*#__PURE__*/ _jsx("filter", {
+              id: "shadow",
+              x: "-50%",
+              y: "-50%",
+              width: "250%",
+              height: "250%",
+              children: /*#__PURE__*/ _jsx("feDropShadow", {
+                dx: "0",
+                dy: "3",
+                stdDeviation: "4",
+                "flood-color": "#000",
+                "flood-opacity": "0.12"
+              })
+            })
+          ]
+        }),
+        /*#__PURE__*/ _jsx("g", {
+          children: move_nodes.map((a, i0)=>{
+            const [n, i] = a;
+            if (i == 0) return null;
+            const prev = nodes[move_nodes[i0 - 1][1]];
+            return make_arrow(n.command.type, n.command.r, {
+              ...prev,
+              x: prev.command.x + offset.x,
+              y: prev.command.y + offset.y
+            }, {
+              x: n.command.x + offset.x,
+              y: n.command.y + offset.y
+            });
+          })
+        }),
+        /*#__PURE__*/ _jsx("g", {
+          children: move_nodes.map((n)=>/*#__PURE__*/ _jsx("g", {
+              onPointerDown: (e)=>onPointerDown(e, n[1]),
+              children: /*#__PURE__*/ _jsx("circle", {
+                cx: n[0].command.x + offset.x,
+                cy: n[0].command.y + offset.y,
+                r: 4.5,
+                fill: "var(--on-surface-color)",
+                filter: "url(#shadow)",
+                style: status.running ? "cursor: not-allowed" : "cursor: grab"
+              })
+            }, n[0].id))
+        }),
+        status.calibrated ? /*#__PURE__*/ _jsx("g", {
+          children: /*#__PURE__*/ _jsx("circle", {
+            style: "pointer-events: none;",
+            cx: status.pos[0],
+            cy: status.pos[1],
+            r: 5,
+            fill: "var(--warning-color)",
+            filter: "url(#shadow)"
+          })
+        }) : null
+      ]
+    })
+  });
+}
+
+
+return { SvgWrap };
+})();
+__m['socket.tsx'] = (() => {
+const { io } = __m['socket.io-client'];
+// "undefined" means the URL will be computed from the `window.location` object
+const URL = "production" === 'production' ? undefined : 'http://localhost:8080';
+const socket = io(URL);
+// Programs bigger than this are streamed in chunks, so motion starts before the
+// whole program is sent and the machine sets the pace
+const GCODE_CHUNK = 64 * 1024;
+async function send_gcode(gcode) {
+  if (gcode.length <= GCODE_CHUNK) {
+    socket.emit("gcode", gcode);
+    return;
+  }
+  await socket.emitWithAck("gcode_stream_start");
+  for(let start = 0; start < gcode.length; start += GCODE_CHUNK){
+    const accepted = await socket.emitWithAck("gcode_chunk", gcode.slice(start, start + GCODE_CHUNK));
+    if (!accepted) return;
+  }
+  socket.emit("gcode_stream_end");
+}
+
+
+return { socket, send_gcode };
+})();
+__m['trajetoria.tsx'] = (() => {
+const { jsx: _jsx, jsxs: _jsxs, Fragment: _Fragment } = __m['preact/jsx-runtime'];
+const { useRef } = __m['preact/hooks'];
+const { socket, send_gcode } = __m['socket.tsx'];
+const { CommandType, find_last_movement_node_before } = __m['types.tsx'];
+const { useTrajetoria } = __m['trajetoria_context.tsx'];
+function CommandArgs({ n, i, nodes, update_node }) {
+  const update_x = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        x: value
+      }
+    });
+  const update_y = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        y: value
+      }
+    });
+  const update_s = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        s: value
+      }
+    });
+  const update_p = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        p: value
+      }
+    });
+  const update_f = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        f: value
+      }
+    });
+  const update_e = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        e: value
+      }
+    });
+  const update_str = (value)=>update_node(i, {
+      ...n,
+      command: {
+        ...n.command,
+        str: value
+      }
+    });
+  const update_r = (value)=>{
+    const last_move_node = find_last_movement_node_before(i, nodes);
+    if (last_move_node !== null) {
+      const { x, y } = last_move_node.command;
+      const nx = n.command.x;
+      const ny = n.command.y;
+      if (value < 0.0001) {
+        const min_r = Math.ceil(Math.sqrt(Math.pow(nx - x, 2) + Math.pow(ny - y, 2)) * 500 / 2) / 500;
+        value = min_r;
+      }
+      update_node(i, {
+        ...n,
+        command: {
+          ...n.command,
+          r: value
+        }
+      });
+    } else {
+      update_node(i, {
+        ...n,
+        command: {
+          ...n.command,
+          r: value
+        }
+      });
+    }
+  };
+  switch(n.command.type){
+    case CommandType.Iniciar:
+      return /*#__PURE__*/ _jsxs(_Fragment, {
+        children: [
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "x (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.x,
+                onChange: (e)=>update_x(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "y (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.y,
+                onChange: (e)=>update_y(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          })
+        ]
+      });
+    case CommandType.Linear:
+      return /*#__PURE__*/ _jsxs(_Fragment, {
+        children: [
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "x (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.x,
+                onChange: (e)=>update_x(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "y (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.y,
+                onChange: (e)=>update_y(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "velocidade (mm/s)",
+                type: "number",
+                step: "1",
+                value: n.command.s,
+                onInput: (e)=>update_s(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          })
+        ]
+      });
+    case CommandType.Arco_horario:
+      return /*#__PURE__*/ _jsxs(_Fragment, {
+        children: [
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "x (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.x,
+                onChange: (e)=>update_x(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "y (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.y,
+                onChange: (e)=>update_y(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "velocidade (mm/s)",
+                type: "number",
+                step: "1",
+                value: n.command.s,
+                onInput: (e)=>update_s(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "radio (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.r,
+                onInput: (e)=>update_r(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          })
+        ]
+      });
+    case CommandType.Arco_antihorario:
+      return /*#__PURE__*/ _jsxs(_Fragment, {
+        children: [
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "x (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.x,
+                onChange: (e)=>update_x(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "y (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.y,
+                onChange: (e)=>update_y(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "velocidade (mm/s)",
+                type: "number",
+                step: "1",
+                value: n.command.s,
+                onInput: (e)=>update_s(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "radio (mm)",
+                type: "number",
+                step: "0.2",
+                value: n.command.r,
+                onInput: (e)=>update_r(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          })
+        ]
+      });
+    case CommandType.Sleep:
+      return /*#__PURE__*/ _jsxs("label", {
+        children: [
+          " ",
+          /*#__PURE__*/ _jsx("input", {
+            title: "tempo (mm)",
+            type: "number",
+            min: "0",
+            step: "1",
+            value: n.command.p,
+            onInput: (e)=>update_p(parseInt(e.target.value))
+          }),
+          " "
+        ]
+      });
+    case CommandType.Start_acquisition:
+      return /*#__PURE__*/ _jsxs(_Fragment, {
+        children: [
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              " ",
+              /*#__PURE__*/ _jsx("input", {
+                title: "frequência de disparo do encoder modo tempo (pulsos/s)",
+                type: "number",
+                step: "0.1",
+                value: n.command.f,
+                onInput: (e)=>update_f(parseFloat(e.target.value))
+              }),
+              " "
+            ]
+          }),
+          /*#__PURE__*/ _jsx("label", {
+            style: "grid-area: auto / auto / span 1 / span 3;",
+            children: /*#__PURE__*/ _jsx("input", {
+              title: "nome da aquisição",
+              type: "text",
+              value: n.command.str,
+              onInput: (e)=>update_str(e.target.value)
+            })
+          })
+        ]
+      });
+    case CommandType.Stop_acquisition:
+      return null;
+    case CommandType.Start_stream:
+      return null;
+    case CommandType.Stop_stream:
+      return null;
+    case CommandType.Set_exposure:
+      return /*#__PURE__*/ _jsx(_Fragment, {
+        children: /*#__PURE__*/ _jsxs("label", {
+          children: [
+            " ",
+            /*#__PURE__*/ _jsx("input", {
+              title: "tempo (us)",
+              type: "number",
+              step: "0.1",
+              value: n.command.e,
+              onInput: (e)=>update_e(parseFloat(e.target.value))
+            }),
+            " "
+          ]
+        })
+      });
+  }
+}
+function Trajetoria({ status, offset, setOffset, bounds }) {
+  const rowDragIndex = useRef(null);
+  const { is_dirty, setIsDirty, nodes, setNodes, getNextNodeId } = useTrajetoria();
+  function add_node(e) {
+    e.preventDefault();
+    let rev_nodes = [
+      ...nodes
+    ].reverse();
+    const last_args = rev_nodes.find((n)=>CommandType.is_movement(n.command.type))?.command || {
+      x: 40,
+      y: 10,
+      s: 50
+    };
+    let next = {
+      id: getNextNodeId(),
+      command: {
+        type: CommandType.Linear,
+        x: last_args.x + 10,
+        y: last_args.y + 40,
+        s: last_args.s,
+        p: 1000,
+        r: 100,
+        f: 10,
+        str: "",
+        e: 500
+      }
+    };
+    if (next.command.y > bounds.height - 50) {
+      next.command.x += 40;
+      next.command.y = 50;
+    }
+    if (next.command.x > bounds.width - 50) {
+      next.command.x = 50;
+    }
+    if (nodes.length === 0) {
+      next.command.type = CommandType.Iniciar;
+    }
+    setNodes((prev)=>[
+        ...prev,
+        next
+      ]);
+    setIsDirty(true);
+  }
+  function remove_node(e, i) {
+    e.preventDefault();
+    setNodes((prev)=>{
+      const next = [
+        ...prev
+      ];
+      next.splice(i, 1);
+      setIsDirty(true);
+      return next;
+    });
+  }
+  function update_node(i, node) {
+    setNodes((prev)=>{
+      let nodes = [
+        ...prev
+      ];
+      nodes[i] = {
+        ...node
+      };
+      nodes[i].command.x = Math.max(Math.min(Math.round(nodes[i].command.x * 5) / 5, bounds.x0 + bounds.width), bounds.x0) - offset.x;
+      nodes[i].command.y = Math.max(Math.min(Math.round(nodes[i].command.y * 5) / 5, bounds.y0 + bounds.height), bounds.y0) - offset.y;
+      setIsDirty(true);
+      return nodes;
+    });
+  }
+  function send_trajetoria() {
+    const gcode = nodes.map((n)=>{
+      const x = n.command.x + offset.x;
+      const y = n.command.y + offset.y;
+      switch(n.command.type){
+        case CommandType.Iniciar:
+          return `G0 X${x} Y${y}`;
+        case CommandType.Linear:
+          return `G1 X${x} Y${y} S${n.command.s}`;
+        case CommandType.Arco_horario:
+          return `G2 X${x} Y${y} S${n.command.s} R${n.command.r}`;
+        case CommandType.Arco_antihorario:
+          return `G3 X${x} Y${y} S${n.command.s} R${n.command.r}`;
+        case CommandType.Sleep:
+          return `G4 P${n.command.p}`;
+        case CommandType.Start_acquisition:
+          return `M1000 F${n.command.f} "${n.command.str}"`;
+        case CommandType.Stop_acquisition:
+          return `M1001`;
+        case CommandType.Start_stream:
+          return `M1002`;
+        case CommandType.Stop_stream:
+          return `M1003`;
+        case CommandType.Set_exposure:
+          return `M1004 E${n.command.e}`;
+      }
+    }).join('\n');
+    send_gcode(gcode);
+    setIsDirty(false);
+  }
+  function home() {
+    socket.emit("gcode", "G28");
+    setIsDirty(true);
+  }
+  function toggle_play_pause() {
+    if (status.running) {
+      socket.emit("pause");
+    } else {
+      socket.emit("play");
+    }
+  }
+  function step() {
+    socket.emit("step");
+  }
+  function onRowDragStart(e, i) {
+    rowDragIndex.current = i;
+    e.dataTransfer.effectAllowed = "move";
+  }
+  function onRowDragOver(e, i) {
+    e.preventDefault();
+    e.dataTransfer.dropEffect = "move";
+    const from = rowDragIndex.current;
+    if (from === null || from === i) return;
+    setNodes((prev)=>{
+      const copy = [
+        ...prev
+      ];
+      const [moved] = copy.splice(from, 1);
+      if (i === 0) {
+        copy[i].command.type = moved.command.type;
+        moved.command.type = CommandType.Iniciar;
+      } else if (rowDragIndex.current === 0) {
+        moved.command.type = copy[i - 1].command.type;
+      }
+      copy.splice(i, 0, moved);
+      rowDragIndex.current = i;
+      return copy;
+    });
+  }
+  function onRowDrop(e) {
+    e.preventDefault();
+    rowDragIndex.current = null;
+  }
+  return /*#__PURE__*/ _jsxs(_Fragment, {
+    children: [
+      /*#__PURE__*/ _jsxs("table", {
+        children: [
+          /*#__PURE__*/ _jsx("thead", {
+            children: /*#__PURE__*/ _jsxs("tr", {
+              children: [
+                /*#__PURE__*/ _jsx("th", {
+                  children: " Offset X "
+                }),
+                /*#__PURE__*/ _jsx("th", {
+                  children: " Offset Y "
+                })
+              ]
+            })
+          }),
+          /*#__PURE__*/ _jsx("tbody", {
+            children: /*#__PURE__*/ _jsxs("tr", {
+              children: [
+                /*#__PURE__*/ _jsxs("th", {
+                  children: [
+                    " ",
+                    /*#__PURE__*/ _jsx("input", {
+                      type: "number",
+                      step: "0.2",
+                      value: offset.x,
+                      onInput: (e)=>setOffset({
+                          x: parseFloat(e.target.value),
+                          y: offset.y
+                        })
+                    }),
+                    " "
+                  ]
+                }),
+                /*#__PURE__*/ _jsxs("th", {
+                  children: [
+                    " ",
+                    /*#__PURE__*/ _jsx("input", {
+                      type: "number",
+                      step: "0.2",
+                      value: offset.y,
+                      onInput: (e)=>setOffset({
+                          x: offset.x,
+                          y: parseFloat(e.target.value)
+                        })
+                    }),
+                    " "
+                  ]
+                })
+              ]
+            })
+          })
+        ]
+      }),
+      /*#__PURE__*/ _jsxs("div", {
+        className: "trajetoria",
+        children: [
+          /*#__PURE__*/ _jsxs("div", {
+            class: "table",
+            children: [
+              /*#__PURE__*/ _jsxs("div", {
+                class: "trow",
+                children: [
+                  /*#__PURE__*/ _jsx("div", {}),
+                  /*#__PURE__*/ _jsx("div", {
+                    children: "Comando"
+                  }),
+                  /*#__PURE__*/ _jsxs("div", {
+                    children: [
+                      "X (mm) ",
+                      /*#__PURE__*/ _jsx("br", {}),
+                      " T (ms)"
+                    ]
+                  }),
+                  /*#__PURE__*/ _jsx("div", {
+                    children: "Y (mm)"
+                  }),
+                  /*#__PURE__*/ _jsx("div", {
+                    children: "Speed (mm/s)"
+                  }),
+                  /*#__PURE__*/ _jsx("div", {
+                    children: "Raio (mm)"
+                  })
+                ]
+              }),
+              nodes.map((n, i)=>/*#__PURE__*/ _jsxs("div", {
+                  class: "trow",
+                  children: [
+                    /*#__PURE__*/ _jsx("div", {
+                      draggable: true,
+                      onDragStart: (e)=>onRowDragStart(e, i),
+                      onDragOver: (e)=>onRowDragOver(e, i),
+                      onDrop: onRowDrop,
+                      children: /*#__PURE__*/ _jsx("i", {
+                        class: "mv-node bi bi-list"
+                      })
+                    }),
+                    /*#__PURE__*/ _jsx("select", {
+                      class: "command-sel",
+                      value: n.command.type,
+                      onInput: (e)=>update_node(i, {
+                          ...n,
+                          command: {
+                            ...n.command,
+                            type: parseInt(e.target.value)
+                          }
+                        }),
+                      children: i == 0 ? /*#__PURE__*/ _jsx("option", {
+                        value: CommandType.Iniciar,
+                        children: " Iniciar "
+                      }) : /*#__PURE__*/ _jsxs(_Fragment, {
+                        children: [
+                          /*#__PURE__*/ _jsxs("optgroup", {
+                            label: "Movimento",
+                            children: [
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Linear,
+                                children: " Linear "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Arco_horario,
+                                children: " Arco 1 ↷ "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Arco_antihorario,
+                                children: " Arco 2 ↶ "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Sleep,
+                                children: " Sleep "
+                              })
+                            ]
+                          }),
+                          /*#__PURE__*/ _jsx("hr", {}),
+                          /*#__PURE__*/ _jsxs("optgroup", {
+                            label: "Encoder Virtual",
+                            children: [
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Start_acquisition,
+                                children: " Iniciar Aquisição "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Stop_acquisition,
+                                children: " Parar Aquisição "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Set_exposure,
+                                children: " Setar Exposição "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Start_stream,
+                                children: " Iniciar Stream "
+                              }),
+                              /*#__PURE__*/ _jsx("option", {
+                                value: CommandType.Stop_stream,
+                                children: " Parar Stream "
+                              })
+                            ]
+                          })
+                        ]
+                      })
+                    }),
+                    /*#__PURE__*/ _jsx(CommandArgs, {
+                      n: n,
+                      i: i,
+                      nodes: nodes,
+                      update_node: update_node
+                    }),
+                    /*#__PURE__*/ _jsx("i", {
+                      class: "rm-node bi bi-x-circle",
+                      onClick: (e)=>remove_node(e, i),
+                      onMouseEnter: (ev)=>ev.target.classList.replace('bi-x-circle', 'bi-x-circle-fill'),
+                      onMouseLeave: (ev)=>ev.target.classList.replace('bi-x-circle-fill', 'bi-x-circle')
+                    })
+                  ]
+                }, n.id))
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("div", {
+            className: "controls",
+            children: [
+              /*#__PURE__*/ _jsx("button", {
+                disabled: status.running,
+                onClick: add_node,
+                children: " + 1 "
+              }),
+              /*#__PURE__*/ _jsx("button", {
+                disabled: !status.connected || !status.calibrated || status.running,
+                onClick: send_trajetoria,
+                children: " Preparar trajetória "
+              }),
+              /*#__PURE__*/ _jsx("button", {
+                disabled: !status.running && (!status.connected || !status.calibrated || !status.gcode_loaded || is_dirty),
+                onClick: toggle_play_pause,
+                children: status.running ? /*#__PURE__*/ _jsxs("span", {
+                  children: [
+                    /*#__PURE__*/ _jsx("i", {
+                      class: "bi bi-pause-circle"
+                    }),
+                    " Pause"
+                  ]
+                }) : /*#__PURE__*/ _jsxs("span", {
+                  children: [
+                    /*#__PURE__*/ _jsx("i", {
+                      class: "bi bi-play-circle"
+                    }),
+                    " Play"
+                  ]
+                })
+              }),
+              /*#__PURE__*/ _jsxs("button", {
+                disabled: !status.connected || !status.calibrated || !status.gcode_loaded || is_dirty || status.running,
+                onClick: step,
+                children: [
+                  /*#__PURE__*/ _jsx("i", {
+                    class: "bi bi-arrow-bar-right"
+                  }),
+                  " Step"
+                ]
+              }),
+              /*#__PURE__*/ _jsx("button", {
+                disabled: !status.connected || status.running,
+                onClick: home,
+                children: /*#__PURE__*/ _jsxs("span", {
+                  children: [
+                    /*#__PURE__*/ _jsx("i", {
+                      class: "bi bi-house-fill"
+                    }),
+                    " Calibrar Home"
+                  ]
+                })
+              })
+            ]
+          })
+        ]
+      })
+    ]
+  });
+}
+
+
+return { Trajetoria };
+})();
+__m['manual.tsx'] = (() => {
+const { jsx: _jsx, jsxs: _jsxs, Fragment: _Fragment } = __m['preact/jsx-runtime'];
+const { socket } = __m['socket.tsx'];
+function Manual({ status, stepSize, setStepSize, target, setTarget }) {
+  function setTargetX(value) {
+    setTarget((prev)=>{
+      return {
+        x: value,
+        y: prev.y
+      };
+    });
+  }
+  ;
+  function setTargetY(value) {
+    setTarget((prev)=>{
+      return {
+        x: prev.x,
+        y: value
+      };
+    });
+  }
+  ;
+  function setStepSizeRound(value) {
+    value = Math.round(value * 5) / 5;
+    setStepSize(value);
+  }
+  function goto() {
+    socket.emit("gcode", `G0 X${target.x} Y${target.y}`);
+  }
+  function home() {
+    socket.emit("gcode", "G28");
+  }
+  function left() {
+    const x = status.pos[0] - stepSize;
+    const y = status.pos[1];
+    socket.emit("gcode", `G0 X${x} Y${y}`);
+  }
+  function right() {
+    const x = status.pos[0] + stepSize;
+    const y = status.pos[1];
+    socket.emit("gcode", `G0 X${x} Y${y}`);
+  }
+  function up() {
+    const x = status.pos[0];
+    const y = status.pos[1] - stepSize;
+    socket.emit("gcode", `G0 X${x} Y${y}`);
+  }
+  function down() {
+    const x = status.pos[0];
+    const y = status.pos[1] + stepSize;
+    socket.emit("gcode", `G0 X${x} Y${y}`);
+  }
+  return /*#__PURE__*/ _jsxs(_Fragment, {
+    children: [
+      /*#__PURE__*/ _jsxs("div", {
+        className: "manual-wrap",
+        children: [
+          /*#__PURE__*/ _jsx("button", {
+            disabled: !status.connected || !status.calibrated || status.running,
+            onClick: up,
+            children: /*#__PURE__*/ _jsx("i", {
+              class: "bi bi-arrow-up"
+            })
+          }),
+          /*#__PURE__*/ _jsx("button", {
+            disabled: !status.connected || !status.calibrated || status.running,
+            onClick: left,
+            children: /*#__PURE__*/ _jsx("i", {
+              class: "bi bi-arrow-left"
+            })
+          }),
+          /*#__PURE__*/ _jsx("button", {
+            disabled: !status.connected || status.running,
+            onClick: home,
+            children: /*#__PURE__*/ _jsx("i", {
+              class: "home bi bi-house-fill"
+            })
+          }),
+          /*#__PURE__*/ _jsx("button", {
+            disabled: !status.connected || !status.calibrated || status.running,
+            onClick: right,
+            children: /*#__PURE__*/ _jsx("i", {
+              class: "bi bi-arrow-right"
+            })
+          }),
+          /*#__PURE__*/ _jsx("button", {
+            disabled: !status.connected || !status.calibrated || status.running,
+            onClick: down,
+            children: /*#__PURE__*/ _jsx("i", {
+              class: "bi bi-arrow-down"
+            })
+          })
+        ]
+      }),
+      /*#__PURE__*/ _jsxs("label", {
+        className: "manual-multiplier",
+        children: [
+          /*#__PURE__*/ _jsx("span", {
+            children: "Tamanho do passo (mm):"
+          }),
+          /*#__PURE__*/ _jsx("input", {
+            type: "number",
+            step: "0.2",
+            value: stepSize,
+            onChange: (e)=>setStepSizeRound(parseFloat(e.target.value))
+          })
+        ]
+      }),
+      /*#__PURE__*/ _jsxs("label", {
+        className: "manual-goto",
+        children: [
+          /*#__PURE__*/ _jsx("input", {
+            type: "number",
+            step: "0.2",
+            placeholder: "x",
+            value: target.x,
+            onChange: (e)=>setTargetX(parseFloat(e.target.value))
+          }),
+          /*#__PURE__*/ _jsx("input", {
+            type: "number",
+            step: "0.2",
+            placeholder: "y",
+            value: target.y,
+            onSubmit: console.log,
+            onChange: (e)=>setTargetY(parseFloat(e.target.value))
+          }),
+          /*#__PURE__*/ _jsx("button", {
+            onClick: ()=>goto(),
+            children: "Go to"
+          })
+        ]
+      })
+    ]
+  });
+}
+
+
+return { Manual };
+})();
+__m['settings.tsx'] = (() => {
+const { jsx: _jsx, jsxs: _jsxs, Fragment: _Fragment } = __m['preact/jsx-runtime'];
+const { useTrajetoria } = __m['trajetoria_context.tsx'];
+const { socket } = __m['socket.tsx'];
+function Settings({ trajectoryImgSrc, stepTiming }) {
+  const { nodes, setNodes, encoder_host, encoder_health } = useTrajetoria();
+  function shutdown_request() {
+    socket.emit('shutdown');
+    alert("Desligando o atuador... Aguarde 1min antes de desligar a fonte de energia.");
+  }
+  function set_encoder_host(host) {
+    socket.emit("set_encoder_host", host);
+  }
+  function set_step_metrics(enabled) {
+    socket.emit("set_step_metrics", enabled);
+  }
+  return /*#__PURE__*/ _jsxs(_Fragment, {
+    children: [
+      /*#__PURE__*/ _jsx("h2", {
+        children: "Configurações"
+      }),
+      /*#__PURE__*/ _jsxs("div", {
+        className: "settings",
+        children: [
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              /*#__PURE__*/ _jsx("span", {
+                children: "Trajetória: "
+              }),
+              /*#__PURE__*/ _jsxs("textarea", {
+                onInput: (ev)=>setNodes(JSON.parse(ev.target.value)),
+                children: [
+                  " ",
+                  JSON.stringify(nodes)
+                ]
+              })
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              /*#__PURE__*/ _jsx("span", {
+                children: "IP do encoder: "
+              }),
+              /*#__PURE__*/ _jsx("input", {
+                type: "text",
+                onInput: (ev)=>set_encoder_host(ev.target.value),
+                value: encoder_host
+              }),
+              /*#__PURE__*/ _jsx("span", {
+                className: "encoder-health",
+                children: encoder_health.reachable === null ? "verificando..." : encoder_health.reachable ? `online (${encoder_health.address}, ${encoder_health.rtt_ms?.toFixed(1)} ms)` : "offline"
+              })
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("label", {
+            children: [
+              /*#__PURE__*/ _jsx("span", {
+                children: "Medir atrasos dos passos: "
+              }),
+              /*#__PURE__*/ _jsx("input", {
+                type: "checkbox",
+                checked: stepTiming?.enabled ?? false,
+                onChange: (ev)=>set_step_metrics(ev.target.checked)
+              }),
+              stepTiming?.enabled ? /*#__PURE__*/ _jsxs("span", {
+                className: "step-timing",
+                children: [
+                  `X p99 ${stepTiming.x?.p99_us ?? 0} µs, Y p99 ${stepTiming.y?.p99_us ?? 0} µs, `,
+                  `loop p99 ${stepTiming.loop?.p99_us ?? 0} µs, `,
+                  `perdidos ${(stepTiming.missed?.x ?? 0) + (stepTiming.missed?.y ?? 0)}`
+                ]
+              }) : null
+            ]
+          }),
+          trajectoryImgSrc !== undefined ? /*#__PURE__*/ _jsxs("div", {
+            className: "last-trajectory",
+            children: [
+              /*#__PURE__*/ _jsx("a", {
+                href: "/dl/trajectory.npz",
+                children: "Baixar última trajetória realizada"
+              }),
+              /*#__PURE__*/ _jsx("img", {
+                src: trajectoryImgSrc
+              })
+            ]
+          }) : null
+        ]
+      }),
+      /*#__PURE__*/ _jsx("button", {
+        onClick: shutdown_request,
+        children: " Shutdown "
+      })
+    ]
+  });
+}
+
+
+return { Settings };
+})();
+__m['position_diplay.tsx'] = (() => {
+const { jsx: _jsx, jsxs: _jsxs } = __m['preact/jsx-runtime'];
+function formatTime(s) {
+  return `${Math.floor(s / 60)}:${String(Math.round(s % 60)).padStart(2, "0")}`;
+}
+function PositionDisplay({ pos, progress }) {
+  const x = Math.round(100 * pos[0]) / 100;
+  const y = Math.round(100 * pos[1]) / 100;
+  function copy({ target }) {
+    const text = target.innerText;
+    navigator.clipboard.writeText(text);
+  }
+  return /*#__PURE__*/ _jsxs("div", {
+    class: "pos-display",
+    children: [
+      /*#__PURE__*/ _jsx("span", {
+        title: "Click para copiar X",
+        onClick: copy,
+        children: x
+      }),
+      ", ",
+      /*#__PURE__*/ _jsx("span", {
+        title: "Click para copiar Y",
+        onClick: copy,
+        children: y
+      }),
+      progress && /*#__PURE__*/ _jsx("div", {
+        class: "progress",
+        children: progress.commands === null ? `${progress.command} comandos` : `${progress.command}/${progress.commands} · ${progress.distance_mm}/${progress.total_mm} mm · faltam ${formatTime(progress.eta_s ?? 0)}`
+      })
+    ]
+  });
+}
+
+
+return { PositionDisplay };
+})();
+__m['app.tsx'] = (() => {
+const { jsx: _jsx, jsxs: _jsxs } = __m['preact/jsx-runtime'];
+const { useEffect, useState } = __m['preact/hooks'];
+const { SvgWrap } = __m['svg_wrap.tsx'];
+const { Trajetoria } = __m['trajetoria.tsx'];
+const { Manual } = __m['manual.tsx'];
+const { Settings } = __m['settings.tsx'];
+const { socket } = __m['socket.tsx'];
+const { CommandType } = __m['types.tsx'];
+const { TrajetoriaContext } = __m['trajetoria_context.tsx'];
+const { PositionDisplay } = __m['position_diplay.tsx'];
+function App() {
+  const [tab, setTab] = useState(0);
+  const [encoder_host, setEncoder_host] = useState("virtual-encoder.local");
+  const [encoder_health, setEncoder_health] = useState({
+    reachable: null,
+    rtt_ms: null,
+    address: null
+  });
+  const [nodes, setNodes] = useState(JSON.parse(localStorage.getItem("nodes") || "[]"));
+  const [nextId, setNextId] = useState(Math.max(...nodes.map((n)=>n.id)) + 1);
+  const [offset, setOffset] = useState({
+    x: 0,
+    y: 0
+  });
+  const [is_dirty, setIsDirty] = useState(true);
+  const [stepSize, setStepSize] = useState(1);
+  const [target, setTarget] = useState({
+    x: 0,
+    y: 0
+  });
+  const [trajectoryImgSrc, setTrajectorImgSrc] = useState(undefined);
+  const setStepSizeRound = (s)=>{
+    const next_s = s instanceof Function ? s(stepSize) : s;
+    setStepSize(Math.round(next_s * 5) / 5);
+  };
+  const setTargetRound = (t)=>{
+    const next_target = t instanceof Function ? t(target) : t;
+    const x = Math.round(next_target.x * 5) / 5;
+    const y = Math.round(next_target.y * 5) / 5;
+    setTarget({
+      x,
+      y
+    });
+  };
+  const setNodesStorage = (value)=>{
+    const next_ns = value instanceof Function ? value(nodes) : value;
+    next_ns[0].command.type = CommandType.Iniciar;
+    localStorage.setItem('nodes', JSON.stringify(next_ns));
+    setNodes(next_ns);
+  };
+  const getNextNodeId = ()=>{
+    const id = nextId;
+    setNextId((prev)=>prev + 1);
+    return id;
+  };
+  const bounds = {
+    x0: 0,
+    y0: 0,
+    width: 410,
+    height: 335
+  };
+  const [status, setStatus] = useState({
+    connected: true,
+    running: false,
+    gcode_loaded: false,
+    pos: [
+      0,
+      0
+    ],
+    calibrated: false
+  });
+  useEffect(()=>{
+    const t = setTimeout(()=>setStatus((prev)=>({
+          ...prev,
+          connected: false
+        })), 3000);
+    socket.on("status", (value)=>setStatus({
+        ...value,
+        connected: true
+      }));
+    // Only the fields that changed since the last update
+    socket.on("status_delta", (delta)=>setStatus((prev)=>({
+          ...prev,
+          ...delta,
+          connected: true
+        })));
+    socket.on("disconnect", ()=>setStatus((prev)=>({
+          ...prev,
+          connected: false
+        })));
+    socket.on("connect", ()=>{
+      clearTimeout(t);
+      setStatus((prev)=>({
+          ...prev,
+          connected: true
+        }));
+    });
+    socket.on("encoder_host", (value)=>{
+      setEncoder_host(value);
+    });
+    socket.on("encoder_health", (value)=>setEncoder_health(value));
+    // Programs with errors are rejected before they move anything
+    socket.on("gcode_analysis", (analysis)=>{
+      if (analysis.errors.length) {
+        alert("Trajetória rejeitada:\n" + analysis.errors.map(([line, message])=>`linha ${line}: ${message}`).join("\n"));
+      }
+    });
+    socket.on("new_trajectory_plot", ()=>setTrajectorImgSrc("/dl/trajectory.jpg?t=" + new Date().getTime()));
+    return ()=>{
+      socket.off("status");
+      socket.off("status_delta");
+      socket.off("gcode_analysis");
+      socket.off("connect");
+      socket.off("disconnect");
+    };
+  }, []);
+  return /*#__PURE__*/ _jsx(TrajetoriaContext.Provider, {
+    value: {
+      is_dirty,
+      setIsDirty,
+      nodes,
+      setNodes: setNodesStorage,
+      getNextNodeId,
+      encoder_host,
+      setEncoder_host,
+      encoder_health
+    },
+    children: /*#__PURE__*/ _jsxs("div", {
+      className: "wrap",
+      children: [
+        /*#__PURE__*/ _jsx("div", {
+          className: `toast-wrap${status.connected ? "" : " show"}`,
+          children: /*#__PURE__*/ _jsxs("div", {
+            className: "toast-connect",
+            children: [
+              /*#__PURE__*/ _jsx("span", {
+                children: "Erro ao conectar-se com o atuador, tentando novamente..."
+              }),
+              /*#__PURE__*/ _jsx("div", {
+                className: "loader"
+              })
+            ]
+          })
+        }),
+        /*#__PURE__*/ _jsxs("div", {
+          className: "panel",
+          children: [
+            /*#__PURE__*/ _jsxs("div", {
+              className: "tabs",
+              children: [
+                /*#__PURE__*/ _jsx("button", {
+                  className: tab == 0 ? "selected" : "",
+                  onClick: ()=>setTab(0),
+                  children: " Trajetória "
+                }),
+                /*#__PURE__*/ _jsx("button", {
+                  className: tab == 1 ? "selected" : "",
+                  onClick: ()=>setTab(1),
+                  children: " Controle Manual "
+                }),
+                /*#__PURE__*/ _jsxs("button", {
+                  className: tab == 2 ? "selected" : "",
+                  onClick: ()=>setTab(2),
+                  children: [
+                    " ",
+                    /*#__PURE__*/ _jsx("i", {
+                      className: tab == 2 ? "bi bi-gear" : "bi bi-gear-fill"
+                    }),
+                    " "
+                  ]
+                })
+              ]
+            }),
+            tab == 0 ? /*#__PURE__*/ _jsx(Trajetoria, {
+              status: status,
+              offset: offset,
+              setOffset: setOffset,
+              bounds: bounds
+            }) : tab == 1 ? /*#__PURE__*/ _jsx(Manual, {
+              status: status,
+              stepSize: stepSize,
+              setStepSize: setStepSizeRound,
+              target: target,
+              setTarget: setTargetRound
+            }) : tab == 2 ? /*#__PURE__*/ _jsx(Settings, {
+              trajectoryImgSrc: trajectoryImgSrc,
+              stepTiming: status.step_timing
+            }) : null
+          ]
+        }),
+        /*#__PURE__*/ _jsx(SvgWrap, {
+          status: status,
+          offset: offset,
+          bounds: bounds
+        }),
+        /*#__PURE__*/ _jsx(PositionDisplay, {
+          pos: status.pos,
+          progress: status.progress
+        })
+      ]
+    })
+  });
+}
+
+
+return { App };
+})();
+__m['main.tsx'] = (() => {
+const { jsx: _jsx } = __m['preact/jsx-runtime'];
+const { render } = __m['preact'];
+const { App } = __m['app.tsx'];
+render(/*#__PURE__*/ _jsx(App, {}), document.getElementById('app'));
+
+
+return {  };
+})();
@@ -6,7 +6,7 @@ import { Manual } from './manual.tsx';
 import { Settings } from './settings.tsx';
 
 import { socket } from './socket.tsx';
-import { type TrajetoriaNode, CommandType, type Status } from './types.tsx';
+import { type TrajetoriaNode, CommandType, type Status, type EncoderHealth, type ProgramAnalysis } from './types.tsx';
 import './app.css'
 import { TrajetoriaContext } from './trajetoria_context.tsx';
 import { PositionDisplay } from './position_diplay.tsx';
@@ -14,6 +14,7 @@ import { PositionDisplay } from './position_diplay.tsx';
 export function App() {
   const [tab, setTab] = useState<number>(0);
   const [encoder_host, setEncoder_host] = useState<string>("virtual-encoder.local");
+  const [encoder_health, setEncoder_health] = useState<EncoderHealth>({ reachable: null, rtt_ms: null, address: null });
 
   const [nodes, setNodes] = useState<Array<TrajetoriaNode>>(JSON.parse(localStorage.getItem("nodes") || "[]"));
   const [nextId, setNextId] = useState<number>(Math.max(...nodes.map(n => n.id)) + 1);
@@ -71,6 +72,8 @@ export function App() {
     const t = setTimeout(() => setStatus(prev => ({ ...prev, connected: false })), 3000);
 
     socket.on("status", (value: Status) => setStatus(({ ...value, connected: true })));
+    // Only the fields that changed since the last update
+    socket.on("status_delta", (delta: Partial<Status>) => setStatus(prev => ({ ...prev, ...delta, connected: true })));
     socket.on("disconnect", () => setStatus(prev => ({ ...prev, connected: false })));
 
     socket.on("connect", () => {
@@ -82,10 +85,21 @@ export function App() {
         setEncoder_host(value);
     });
 
+    socket.on("encoder_health", (value: EncoderHealth) => setEncoder_health(value));
+
+    // Programs with errors are rejected before they move anything
+    socket.on("gcode_analysis", (analysis: ProgramAnalysis) => {
+      if (analysis.errors.length) {
+        alert("Trajetória rejeitada:\n" + analysis.errors.map(([line, message]) => `linha ${line}: ${message}`).join("\n"));
+      }
+    });
+
     socket.on("new_trajectory_plot", () => setTrajectorImgSrc("/dl/trajectory.jpg?t=" + new Date().getTime()));
 
     return () => {
       socket.off("status");
+      socket.off("status_delta");
+      socket.off("gcode_analysis");
       socket.off("connect");
       socket.off("disconnect");
     };
@@ -93,7 +107,7 @@ export function App() {
 
 
   return (
-    <TrajetoriaContext.Provider value={{ is_dirty, setIsDirty, nodes, setNodes: setNodesStorage, getNextNodeId, encoder_host, setEncoder_host }}>
+    <TrajetoriaContext.Provider value={{ is_dirty, setIsDirty, nodes, setNodes: setNodesStorage, getNextNodeId, encoder_host, setEncoder_host, encoder_health }}>
       <div className="wrap">
         <div className={`toast-wrap${status.connected ? "" : " show"}`}>
           <div className="toast-connect">
@@ -114,13 +128,13 @@ export function App() {
               tab == 1 ?
                 <Manual status={status} stepSize={stepSize} setStepSize={setStepSizeRound} target={target} setTarget={setTargetRound} /> :
                 tab == 2 ?
-                  <Settings trajectoryImgSrc={trajectoryImgSrc} /> :
+                  <Settings trajectoryImgSrc={trajectoryImgSrc} stepTiming={status.step_timing} /> :
                   null
           }
         </div>
         <SvgWrap status={status} offset={offset} bounds={bounds} />
 
-        <PositionDisplay pos={status.pos} />
+        <PositionDisplay pos={status.pos} progress={status.progress} />
       </div>
     </TrajetoriaContext.Provider>
   )
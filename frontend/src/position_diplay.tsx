@@ -1,6 +1,11 @@
 import './position_diplay.css'
+import { type Progress } from './types.tsx';
 
-export function PositionDisplay({ pos }: { pos: number[] }) {
+function formatTime(s: number) {
+  return `${Math.floor(s / 60)}:${String(Math.round(s % 60)).padStart(2, "0")}`;
+}
+
+export function PositionDisplay({ pos, progress }: { pos: number[], progress?: Progress | null }) {
   const x = Math.round(100*pos[0])/100;
   const y = Math.round(100*pos[1])/100;
 
@@ -12,6 +17,13 @@ export function PositionDisplay({ pos }: { pos: number[] }) {
   return (
     <div class="pos-display">
       <span title="Click para copiar X" onClick={copy}>{x}</span>, <span title="Click para copiar Y" onClick={copy}>{y}</span>
+      {progress && (
+        <div class="progress">
+          {progress.commands === null ?
+            `${progress.command} comandos` :
+            `${progress.command}/${progress.commands} · ${progress.distance_mm}/${progress.total_mm} mm · faltam ${formatTime(progress.eta_s ?? 0)}`}
+        </div>
+      )}
     </div>
   );
 }
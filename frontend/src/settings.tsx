@@ -1,14 +1,16 @@
 import { useTrajetoria } from "./trajetoria_context";
 import { socket } from "./socket";
+import { StepTiming } from "./types";
 
 import './settings.css'
 
 export type SettingsArgsType = {
   trajectoryImgSrc: string|undefined,
+  stepTiming?: StepTiming,
 };
 
-export function Settings({trajectoryImgSrc}: SettingsArgsType) {
-  const { nodes, setNodes, encoder_host } = useTrajetoria();
+export function Settings({trajectoryImgSrc, stepTiming}: SettingsArgsType) {
+  const { nodes, setNodes, encoder_host, encoder_health } = useTrajetoria();
 
   function shutdown_request() {
     socket.emit('shutdown');
@@ -19,6 +21,10 @@ export function Settings({trajectoryImgSrc}: SettingsArgsType) {
     socket.emit("set_encoder_host", host);
   }
 
+  function set_step_metrics(enabled: boolean) {
+    socket.emit("set_step_metrics", enabled);
+  }
+
   return (
     <>
       <h2>Configurações</h2>
@@ -31,6 +37,27 @@ export function Settings({trajectoryImgSrc}: SettingsArgsType) {
         <label>
           <span>IP do encoder: </span>
           <input type="text" onInput={ev => set_encoder_host((ev.target as any).value)} value={encoder_host} />
+          <span className={"encoder-health"}>
+            {
+              encoder_health.reachable === null ? "verificando..." :
+                encoder_health.reachable ? `online (${encoder_health.address}, ${encoder_health.rtt_ms?.toFixed(1)} ms)` :
+                  "offline"
+            }
+          </span>
+        </label>
+
+        <label>
+          <span>Medir atrasos dos passos: </span>
+          <input type="checkbox" checked={stepTiming?.enabled ?? false} onChange={ev => set_step_metrics(ev.target.checked)} />
+          {stepTiming?.enabled ?
+            <span className={"step-timing"}>
+              {`X p99 ${stepTiming.x?.p99_us ?? 0} µs, Y p99 ${stepTiming.y?.p99_us ?? 0} µs, `}
+              {`loop p99 ${stepTiming.loop?.p99_us ?? 0} µs, `}
+              {`perdidos ${(stepTiming.missed?.x ?? 0) + (stepTiming.missed?.y ?? 0)}`}
+            </span>
+            :
+            null
+          }
         </label>
 
         {trajectoryImgSrc !== undefined?
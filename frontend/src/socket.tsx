@@ -4,3 +4,23 @@ import { io } from 'socket.io-client'
 const URL = process.env.NODE_ENV === 'production' ? undefined : 'http://localhost:8080';
 
 export const socket = io(URL);
+
+// Programs bigger than this are streamed in chunks, so motion starts before the
+// whole program is sent and the machine sets the pace
+const GCODE_CHUNK = 64 * 1024;
+
+export async function send_gcode(gcode: string) {
+  if (gcode.length <= GCODE_CHUNK) {
+    socket.emit("gcode", gcode);
+    return;
+  }
+
+  await socket.emitWithAck("gcode_stream_start");
+
+  for (let start = 0; start < gcode.length; start += GCODE_CHUNK) {
+    const accepted = await socket.emitWithAck("gcode_chunk", gcode.slice(start, start + GCODE_CHUNK));
+    if (!accepted) return;
+  }
+
+  socket.emit("gcode_stream_end");
+}
@@ -0,0 +1,40 @@
+import { socket } from './socket.tsx';
+
+// Frame of the "telemetry" event, see actuator_xrl8/telemetry.py:
+// u8 version, pad, u16 count, i64 base_ns, f32 steps_per_mm, then count u32
+// microseconds since base_ns, count i32 x steps and count i32 y steps
+const HEADER_SIZE = 16;
+
+export type TelemetrySample = { t_ns: bigint, x: number, y: number };
+
+export function decode_telemetry(frame: ArrayBuffer): TelemetrySample[] {
+  const view = new DataView(frame);
+  const count = view.getUint16(2, true);
+  const base = view.getBigInt64(4, true);
+  const steps_per_mm = view.getFloat32(12, true);
+
+  const samples: TelemetrySample[] = [];
+  for (let i = 0; i < count; i++) {
+    const dt_us = view.getUint32(HEADER_SIZE + 4 * i, true);
+    samples.push({
+      t_ns: base + BigInt(dt_us) * 1000n,
+      x: view.getInt32(HEADER_SIZE + 4 * (count + i), true) / steps_per_mm,
+      y: view.getInt32(HEADER_SIZE + 4 * (2 * count + i), true) / steps_per_mm,
+    });
+  }
+
+  return samples;
+}
+
+// Positions in mm at a few hundred Hz. Returns the function that unsubscribes
+export function subscribe_telemetry(callback: (samples: TelemetrySample[]) => void) {
+  const listener = (frame: ArrayBuffer) => callback(decode_telemetry(frame));
+
+  socket.on("telemetry", listener);
+  socket.emit("telemetry_subscribe");
+
+  return () => {
+    socket.emit("telemetry_unsubscribe");
+    socket.off("telemetry", listener);
+  };
+}
@@ -1,7 +1,7 @@
 import { useRef, type Dispatch, type StateUpdater } from 'preact/hooks'
 import "bootstrap-icons/font/bootstrap-icons.css"
 
-import { socket } from './socket.tsx'
+import { socket, send_gcode } from './socket.tsx'
 import { CommandType, find_last_movement_node_before, type Bounds, type Status, type TrajetoriaNode } from './types.tsx'
 import './trajetoria.css'
 import { useTrajetoria } from './trajetoria_context.tsx'
@@ -199,7 +199,7 @@ export function Trajetoria({ status, offset, setOffset, bounds }: TrajetoriaArgs
 
     }).join('\n');
 
-    socket.emit("gcode", gcode)
+    send_gcode(gcode)
     setIsDirty(false);
   }
 
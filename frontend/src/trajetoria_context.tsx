@@ -1,6 +1,6 @@
 import { createContext } from "preact";
 import { useContext, type Dispatch, type StateUpdater } from "preact/hooks";
-import type { TrajetoriaNode } from "./types";
+import type { EncoderHealth, TrajetoriaNode } from "./types";
 
 export type TrajetoriaContextType = {
   is_dirty: boolean,
@@ -10,6 +10,7 @@ export type TrajetoriaContextType = {
   getNextNodeId: () => number,
   encoder_host: string,
   setEncoder_host: Dispatch<StateUpdater<string>>,
+  encoder_health: EncoderHealth,
 };
 
 export const TrajetoriaContext = createContext<TrajetoriaContextType>({
@@ -20,6 +21,7 @@ export const TrajetoriaContext = createContext<TrajetoriaContextType>({
   getNextNodeId: () => 0,
   encoder_host: '',
   setEncoder_host: () => {},
+  encoder_health: { reachable: null, rtt_ms: null, address: null },
 });
 
 export function useTrajetoria() {
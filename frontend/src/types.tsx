@@ -23,6 +23,57 @@ export type CommandData = {
   e: number,
 };
 
+export type EncoderHealth = {
+  reachable: boolean | null,
+  rtt_ms: number | null,
+  address: string | null,
+};
+
+export type TimingHistogram = {
+  count: number,
+  p50_us?: number,
+  p99_us?: number,
+  max_us?: number,
+};
+
+// Summary of the step loop instrumentation, see actuator_xrl8/step_metrics.py
+export type StepTiming = {
+  enabled: boolean,
+  missed?: { x: number, y: number },
+  x?: TimingHistogram,
+  y?: TimingHistogram,
+  loop?: TimingHistogram,
+};
+
+// Result of actuator_xrl8/program_analysis.py, sent when a program is loaded
+export type ProgramAnalysis = {
+  errors: Array<[number, string]>,
+  warnings: Array<[number, string]>,
+  commands: number,
+  length_mm: number,
+  duration_s: number,
+  acquisitions: Array<{
+    name: string | null,
+    pulses_per_second: number,
+    start_line: number,
+    end_line: number | null,
+    start_s: number,
+    end_s: number | null,
+    length_mm: number | null,
+  }>,
+};
+
+// Progress of the loaded program, see actuator_xrl8/progress.py. Totals and eta
+// are null for a streamed program
+export type Progress = {
+  command: number,
+  commands: number | null,
+  distance_mm: number | null,
+  total_mm: number | null,
+  elapsed_s: number,
+  eta_s: number | null,
+};
+
 export type TrajetoriaNode = { id: number; command: CommandData; };
 export type Status = {
   connected: boolean;
@@ -30,6 +81,8 @@ export type Status = {
   gcode_loaded: boolean;
   pos: Array<number>;
   calibrated: boolean;
+  step_timing?: StepTiming;
+  progress?: Progress | null;
 };
 
 export type Bounds = {
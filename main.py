@@ -1,18 +1,21 @@
-from flask import send_from_directory
-from flask_socketio import SocketIO
+import codecs
+import json
 
-from threading import Thread
-from time import sleep
+from flask import Response, request, send_from_directory
+from flask_socketio import SocketIO, join_room, leave_room
 
 try:
-    from actuator_xrl8.button import start_button_thread
+    from actuator_xrl8.button import start_button_events
 except RuntimeError:
 
-    def start_button_thread(app):
+    def start_button_events(app):
         pass
 
 
 from actuator_xrl8.actuator_app import ActuatorApp
+from actuator_xrl8.telemetry import TELEMETRY_ROOM
+
+UPLOAD_CHUNK = 1 << 16  # bytes
 
 
 def main():
@@ -28,15 +31,84 @@ def main():
     def img(file):
         return send_from_directory("/tmp", file)
 
+    @app.route("/metrics")
+    def metrics():
+        return Response(
+            app.machine.step_metrics.prometheus(),
+            mimetype="text/plain; version=0.0.4",
+        )
+
+    @app.route("/timeline.json")
+    def timeline():
+        # Abre no chrome://tracing ou no Perfetto
+        return Response(
+            json.dumps(app.timeline.chrome_trace()), mimetype="application/json"
+        )
+
+    @app.route("/profile", methods=["POST"])
+    def profile():
+        mode = request.args.get("mode", "cprofile")
+        if not app.profiler.request(mode):
+            return {"error": f"unknown mode {mode}"}, 400
+        return {"profiling": mode}
+
     @ws.on("connect")
     def connect():
         ws.emit("status", app.get_status())
         ws.emit("encoder_host", app.machine.encoder.host)
+        ws.emit("encoder_health", app.machine.encoder.health)
+
+    @ws.on("disconnect")
+    def disconnect(*args):
+        app.telemetry.unsubscribe(request.sid)
+
+    @ws.on("telemetry_subscribe")
+    def telemetry_subscribe():
+        join_room(TELEMETRY_ROOM)
+        app.telemetry.subscribe(request.sid)
+
+    @ws.on("telemetry_unsubscribe")
+    def telemetry_unsubscribe():
+        leave_room(TELEMETRY_ROOM)
+        app.telemetry.unsubscribe(request.sid)
 
     @ws.on("gcode")
     def gcode(gcode_src):
         app.initialize_trajectory(gcode_src)
 
+    @app.route("/gcode", methods=["POST"])
+    def upload_gcode():
+        # O corpo é lido aos poucos, no ritmo em que o programa é executado
+        stream = app.stream_trajectory()
+        chunks = iter(lambda: request.stream.read(UPLOAD_CHUNK), b"")
+
+        for chunk in codecs.iterdecode(chunks, "utf-8"):
+            if not stream.feed(chunk):
+                return "aborted", 409
+
+        stream.close()
+        return ""
+
+    @ws.on("gcode_stream_start")
+    def gcode_stream_start():
+        app.stream_trajectory()
+        return True
+
+    @ws.on("gcode_chunk")
+    def gcode_chunk(chunk):
+        # O cliente espera esta resposta antes de mandar o próximo pedaço
+        stream = app.gcode_stream
+        return stream is not None and stream.feed(chunk)
+
+    @ws.on("gcode_stream_end")
+    def gcode_stream_end():
+        if app.gcode_stream is not None:
+            app.gcode_stream.close()
+
+    @ws.on("preview")
+    def preview(gcode_src):
+        return app.preview_trajectory(gcode_src)
+
     @ws.on("step")
     def step():
         app.step()
@@ -54,25 +126,29 @@ def main():
         import os
         os.system("sudo shutdown now -P")
 
-    @ws.on("set_encoder_host")
-    def set_encoder_host(host):
-        app.set_encoder_host(host)
+    @ws.on("encoder_stats")
+    def encoder_stats():
+        return app.machine.encoder.stats()
 
-    def send_status():
-        last_status = app.get_status()
-        data = []
+    @ws.on("profile_next_run")
+    def profile_next_run(mode="cprofile"):
+        return app.profiler.request(mode)
 
-        while True:
-            status = app.get_status()
+    @ws.on("timeline_summary")
+    def timeline_summary():
+        return app.timeline.summary()
 
-            if last_status != status:
-                ws.emit("status", status)
-                last_status = status
+    @ws.on("set_step_metrics")
+    def set_step_metrics(enabled):
+        app.set_step_metrics(bool(enabled))
 
-            sleep(1 / 30)
+    @ws.on("set_encoder_host")
+    def set_encoder_host(host):
+        app.set_encoder_host(host)
 
-    Thread(target=send_status, daemon=True).start()
-    start_button_thread(app)
+    app.status_broadcaster.start()
+    app.start_encoder_monitor()
+    start_button_events(app)
     ws.run(app, allow_unsafe_werkzeug=True, host="0.0.0.0", port=8080)
 
 
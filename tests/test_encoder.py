@@ -0,0 +1,65 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+from time import sleep
+
+import pytest
+
+from actuator_xrl8 import virtual_encoder_api
+from actuator_xrl8.gcode_interpreter import GcodeInterpreter
+from actuator_xrl8.gcode_machine import NullGcodeMachine
+
+
+class EncoderHandler(BaseHTTPRequestHandler):
+    status = 200
+    delay = 0.0
+
+    def do_POST(self):
+        self.server.paths.append(self.path)
+        sleep(self.delay)
+        self.send_response(self.status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def encoder():
+    server = HTTPServer(("127.0.0.1", 0), EncoderHandler)
+    server.paths = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+def machine_for(server):
+    machine = NullGcodeMachine(trajectory_capacity=1)
+    machine.encoder.host = "127.0.0.1:%d" % server.server_port
+    return machine
+
+
+def test_acquisition_commands_wait_for_the_encoder(encoder):
+    machine = machine_for(encoder)
+
+    assert machine.m1000(100, "scan 1") is True
+    assert machine.m1001() is True
+    assert encoder.paths == ["/start_acquisition/100/scan%201", "/stop_acquisition"]
+
+
+def test_refused_acquisition_stops_the_program(encoder, monkeypatch):
+    monkeypatch.setattr(EncoderHandler, "status", 500)
+    machine = machine_for(encoder)
+    interpreter = GcodeInterpreter('M1000 F100 "scan 1"\nG4 P0\n', machine)
+
+    assert interpreter.step() is False
+    assert interpreter.executed == 0
+    assert interpreter.current_line() == 1
+    assert machine.encoder.stats()["start_acquisition"]["failed"] == 1
+
+
+def test_unanswered_command_times_out(encoder, monkeypatch):
+    monkeypatch.setattr(virtual_encoder_api, "WAIT_TIMEOUT", 0.05)
+    monkeypatch.setattr(EncoderHandler, "delay", 0.3)
+    machine = machine_for(encoder)
+
+    assert machine.m1001() is False
@@ -0,0 +1,40 @@
+from actuator_xrl8.gcode_interpreter import GcodeInterpreter, OPCODE
+from actuator_xrl8.gcode_machine import PreviewGcodeMachine
+
+
+def program(gcode):
+    return GcodeInterpreter(gcode, PreviewGcodeMachine()).program
+
+
+def test_arguments_are_read_by_letter():
+    rows = program('G1 X1.5 Y-2 S10\nG4 P250\nM1000 F100 "scan 1"\n')
+
+    assert rows["op"].tolist() == [OPCODE["G1"], OPCODE["G4"], OPCODE["M1000"]]
+    assert rows[0][["x", "y", "s"]].tolist() == (1.5, -2.0, 10.0)
+    assert rows["n"].tolist() == [0, 250, 100]
+
+
+def test_malformed_arguments_drop_the_command(capsys):
+    rows = program("G1 X1 Y2\nG1 Y1 X1 S1\nG4 P1.5\nG4 P#1\nG0 X3 Y4\n")
+
+    assert rows["op"].tolist() == [OPCODE["G0"]]
+    assert "malformed G4: p = None" in capsys.readouterr().out
+
+
+def test_subroutine_parameters_and_o_words():
+    rows = program(
+        "O3 SUB\n"
+        "  G1 X-#2 Y#1 S#3\n"
+        "O3 ENDSUB\n"
+        "O1 REPEAT [2]\n"
+        "  O3 CALL [1] [2.5] [10]\n"
+        "O1 ENDREPEAT\n"
+    )
+
+    assert rows["op"].tolist() == [OPCODE["G1"], OPCODE["G1"]]
+    assert rows[["x", "y", "s"]].tolist() == [(-2.5, 1.0, 10.0)] * 2
+
+
+def test_o_word_needs_an_integer(capsys):
+    assert len(program("O1.5 REPEAT [2]\nG4 P1\nO1.5 ENDREPEAT\n")) == 1
+    assert 'invalid "O1.5" code' in capsys.readouterr().out
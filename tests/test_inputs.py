@@ -0,0 +1,85 @@
+from time import sleep
+
+from actuator_xrl8.inputs import AxisFlags, InputEvents, SimulatedInputSource
+from actuator_xrl8.step_planner import STEP_X, STEP_Y
+
+PIN = 5
+DEBOUNCE = 0.01  # s
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def watch(pin=PIN):
+    "Events of a pin active when low, starting released"
+    clock = FakeClock()
+    source = SimulatedInputSource({pin: 1})
+    events = InputEvents(source, debounce=DEBOUNCE, clock=clock)
+    events.watch(pin, active_level=0)
+    received = []
+    events.subscribe(pin, lambda pin, active: received.append(active))
+    return clock, source, events, received
+
+
+def test_bounces_after_a_change_are_ignored():
+    clock, source, events, received = watch()
+
+    clock.now = 1.0
+    source.set_level(PIN, 0)
+    for level in (1, 0, 1, 0):
+        clock.now += DEBOUNCE / 10
+        source.set_level(PIN, level)
+    sleep(DEBOUNCE * 5)
+
+    assert received == [True]
+    assert events.is_active(PIN)
+
+
+def test_bounce_ending_in_another_level_is_read_after_the_window():
+    clock, source, events, received = watch()
+
+    clock.now = 1.0
+    source.set_level(PIN, 0)
+    clock.now += DEBOUNCE / 10
+    source.set_level(PIN, 1)
+    assert received == [True]
+
+    # O nível final do repique só é lido quando a janela acaba
+    clock.now += DEBOUNCE
+    sleep(DEBOUNCE * 5)
+    assert received == [True, False]
+    assert not events.is_active(PIN)
+
+
+def test_changes_outside_the_window_are_all_delivered():
+    clock, source, events, received = watch()
+
+    for level in (0, 1, 0):
+        clock.now += DEBOUNCE * 2
+        source.set_level(PIN, level)
+
+    assert received == [True, False, True]
+
+
+def test_axis_flags_follow_the_inputs():
+    clock = FakeClock()
+    source = SimulatedInputSource({1: 1, 2: 1, 3: 1})
+    events = InputEvents(source, debounce=DEBOUNCE, clock=clock)
+    for pin in (1, 2, 3):
+        events.watch(pin, active_level=0)
+    flags = AxisFlags(events, {STEP_X: (1, 2), STEP_Y: (3,)})
+    assert flags() == 0
+
+    clock.now = 1.0
+    source.set_level(2, 0)
+    assert flags() == STEP_X
+    source.set_level(3, 0)
+    assert flags() == STEP_X | STEP_Y
+    clock.now = 2.0
+    source.set_level(2, 1)
+    assert flags() == STEP_Y
@@ -0,0 +1,158 @@
+import math
+import threading
+from time import monotonic, sleep
+
+import numpy as np
+
+from actuator_xrl8.clock import HybridClock, VirtualClock
+from actuator_xrl8.motion_process import MotionProcess
+from actuator_xrl8.pin_driver import FakePinDriver, PinStepBackend
+from actuator_xrl8.step_planner import plan_line, STEP_Y, DIR_MASK
+
+STEP_PINS = (0, 1)
+DIR_PINS = (2, 3)
+
+
+def fake_backend():
+    "Built inside the motion process, which is spawned and imports this module"
+    clock = HybridClock()
+    driver = FakePinDriver(STEP_PINS + DIR_PINS, clock)
+    return PinStepBackend(driver, STEP_PINS, DIR_PINS, lambda: 0, clock)
+
+
+def virtual_backend():
+    "Jumps to each deadline, so the recorded times are exactly the planned ones"
+    clock = VirtualClock()
+    driver = FakePinDriver(STEP_PINS + DIR_PINS, clock)
+    return PinStepBackend(driver, STEP_PINS, DIR_PINS, lambda: 0, clock)
+
+
+def endstop_backend():
+    "The Y endstop triggers after the third X step"
+    clock = VirtualClock()
+    driver = FakePinDriver(STEP_PINS + DIR_PINS, clock)
+
+    def endstop_triggered():
+        return STEP_Y if driver.step_count(STEP_PINS[0]) >= 3 else 0
+
+    return PinStepBackend(driver, STEP_PINS, DIR_PINS, endstop_triggered, clock)
+
+
+def wait_for(condition, timeout=10.0):
+    end = monotonic() + timeout
+    while not condition():
+        assert monotonic() < end, "timed out"
+        sleep(0.001)
+
+
+def test_plan_runs_to_its_end():
+    motion = MotionProcess(fake_backend, trajectory_capacity=1024)
+    try:
+        end = motion.enqueue(plan_line(200, -100, 20_000, math.inf, 20_000, 20_000))
+        deadline = monotonic() + 10
+        assert motion.wait(end, lambda: monotonic() > deadline)
+        assert motion.position() == (200, -100)
+    finally:
+        motion.close()
+
+
+def test_ticks_run_at_their_deadlines():
+    motion = MotionProcess(
+        virtual_backend, trajectory_capacity=1024, record_interval_ns=0
+    )
+    try:
+        plan = plan_line(6, -4, 1000, math.inf, 1000, 1000)
+        end = motion.enqueue(plan)
+        assert motion.wait(end)
+        wait_for(motion.is_idle)
+
+        # Uma amostra no início e uma depois de cada tick
+        timestamps, x, y = motion.trajectory.samples()
+        steps_x, steps_y = plan.steps()
+        assert np.array_equal(timestamps[1 : end + 1] - timestamps[0], plan.times)
+        assert np.array_equal(x[1 : end + 1], steps_x)
+        assert np.array_equal(y[1 : end + 1], steps_y)
+        assert motion.position() == (6, -4)
+        assert motion.dir_bits() == plan.bits[-1] & DIR_MASK
+    finally:
+        motion.close()
+
+
+def test_endstop_stops_before_the_next_pulse():
+    motion = MotionProcess(endstop_backend, trajectory_capacity=1024)
+    try:
+        end = motion.enqueue(plan_line(10, 10, 1000, math.inf, 1000, 1000))
+        assert not motion.wait(end)
+
+        assert motion.faults() == STEP_Y
+        assert motion.stopped_at() == 3
+        assert motion.position() == (3, 3)
+    finally:
+        motion.close()
+
+
+def test_stop_during_a_wait_skips_the_pulse():
+    motion = MotionProcess(fake_backend, trajectory_capacity=1024)
+    try:
+        # Dois passos por segundo: o stop chega enquanto espera o primeiro
+        end = motion.enqueue(plan_line(4, 0, 2, math.inf, 2, 2))
+        wait_for(lambda: motion.trajectory.count() > 0)
+        sleep(0.05)
+        motion.request_stop()
+        motion.wait_stopped()
+
+        assert motion.position() == (0, 0)
+        assert motion.stopped_at() == 0
+        assert motion.executed() == 0
+        assert not motion.wait(end)
+
+        motion.discard()
+        wait_for(motion.is_idle)
+    finally:
+        motion.close()
+
+
+def test_stop_while_enqueue_waits_for_space():
+    motion = MotionProcess(fake_backend, capacity=64, trajectory_capacity=1024)
+    try:
+        # 400 ticks a 1 kHz não cabem no anel, o enqueue fica esperando espaço
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                motion.enqueue(plan_line(400, 0, 1000, math.inf, 1000, 1000))
+            )
+        )
+        thread.start()
+        wait_for(lambda: motion.executed() > 10)
+        motion.request_stop()
+        thread.join()
+        assert results == [-1]
+
+        motion.discard()
+        stopped = motion.position()
+        assert stopped[0] == motion.executed() == motion.stopped_at()
+        sleep(0.05)
+        assert motion.position() == stopped
+        assert motion.is_idle()
+
+        # Depois do descarte a fila volta a andar a partir de onde parou
+        end = motion.enqueue(plan_line(5, 0, 20_000, math.inf, 20_000, 20_000))
+        assert motion.wait(end)
+        assert motion.position() == (stopped[0] + 5, 0)
+    finally:
+        motion.close()
+
+
+def test_ticks_queued_after_a_stop_wait_for_the_discard():
+    motion = MotionProcess(fake_backend, trajectory_capacity=1024)
+    try:
+        motion.request_stop()
+        motion.wait_stopped()
+        assert motion.enqueue(plan_line(5, 0, 20_000, math.inf)) == -1
+
+        motion.discard()
+        end = motion.enqueue(plan_line(5, 0, 20_000, math.inf))
+        assert motion.wait(end)
+        assert motion.position() == (5, 0)
+    finally:
+        motion.close()
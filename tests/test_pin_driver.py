@@ -0,0 +1,61 @@
+from actuator_xrl8.clock import SpinClock, VirtualClock
+from actuator_xrl8.pin_driver import FakePinDriver, GpioPinDriver, PinStepBackend
+from actuator_xrl8.step_planner import STEP_X, STEP_Y, DIR_X
+
+STEP_PINS = (0, 1)
+DIR_PINS = (2, 3)
+
+
+class RecordingGpio:
+    def __init__(self):
+        self.outputs = []
+
+    def output(self, pins, level):
+        self.outputs.append((list(pins), level))
+
+
+def test_fake_driver_records_only_changes():
+    driver = FakePinDriver(STEP_PINS, VirtualClock(100))
+
+    driver.write(STEP_PINS, True)
+    driver.write(STEP_PINS, True)
+    driver.clock.wait_until(200)
+    driver.write((0,), False)
+
+    assert driver.writes == 2
+    assert driver.edges == [(100, 0, True), (100, 1, True), (200, 0, False)]
+    assert driver.level(0) is False
+    assert driver.level(1) is True
+    assert list(driver.rising_edges(1)) == [100]
+    assert driver.step_count(0) == 1
+
+
+def test_gpio_driver_writes_changed_pins_together():
+    gpio = RecordingGpio()
+    driver = GpioPinDriver(gpio, STEP_PINS + DIR_PINS)
+
+    driver.write((2,), True)
+    driver.write(STEP_PINS + DIR_PINS, True)
+    driver.write((2,), True)
+
+    assert gpio.outputs == [([2], True), ([0, 1, 3], True)]
+
+
+def test_step_pulse_lasts_the_minimum_width():
+    driver = FakePinDriver(STEP_PINS + DIR_PINS, SpinClock())
+    backend = PinStepBackend(
+        driver, STEP_PINS, DIR_PINS, lambda: 0, min_pulse_ns=50_000
+    )
+
+    backend.set_direction(DIR_X)
+    backend.step(STEP_X | STEP_Y)
+    backend.step(0)
+
+    assert driver.level(DIR_PINS[0]) is True
+    assert driver.level(DIR_PINS[1]) is False
+    for pin in STEP_PINS:
+        (rise, _, _), (fall, _, level) = [e for e in driver.edges if e[1] == pin]
+        assert level is False
+        assert fall - rise >= 50_000
+    # Os dois pinos de passo sobem e descem juntos, e um tick vazio não escreve
+    assert driver.writes == 3
@@ -0,0 +1,39 @@
+from actuator_xrl8.gcode_interpreter import GcodeInterpreter
+from actuator_xrl8.gcode_machine import NullGcodeMachine
+from actuator_xrl8.program_analysis import analyze
+
+RASTER = """
+G0 X0 Y0
+O1 REPEAT [50]
+  G1 X10 Y0 S10
+  G1 X0 Y0 S10
+O1 ENDREPEAT
+"""
+
+
+def test_expand_program_reports_truncation():
+    interpreter = GcodeInterpreter(RASTER, NullGcodeMachine())
+
+    program, truncated = interpreter.expand_program()
+    assert len(program) == 101
+    assert not truncated
+
+    program, truncated = interpreter.expand_program(limit=20)
+    assert len(program) == 20
+    assert truncated
+
+
+def test_truncated_program_gets_a_warning():
+    interpreter = GcodeInterpreter(RASTER, NullGcodeMachine())
+    program, truncated = interpreter.expand_program(limit=20)
+
+    analysis = analyze(program, interpreter.strings, truncated=truncated)
+    assert analysis["errors"] == []
+    assert analysis["commands"] == 20
+    assert analysis["length_mm"] == 190.0
+    assert analysis["warnings"] == [
+        (
+            int(program["line"][-1]),
+            "only the first 20 commands were checked and estimated",
+        )
+    ]
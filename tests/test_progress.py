@@ -0,0 +1,55 @@
+import numpy as np
+
+from actuator_xrl8.progress import ProgramProgress
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_progress(commands=4):
+    clock = FakeClock()
+    durations = np.ones(commands)
+    lengths = np.full(commands, 10.0)
+    return ProgramProgress(durations, lengths, clock), clock
+
+
+def test_summary_follows_executed_commands():
+    progress, clock = make_progress()
+    progress.start()
+    clock.now = 2.0
+    progress.update(2)
+
+    summary = progress.summary()
+    assert summary["command"] == 2
+    assert summary["commands"] == 4
+    assert summary["distance_mm"] == 20.0
+    assert summary["total_mm"] == 40.0
+    assert summary["eta_s"] == 2
+
+
+def test_program_longer_than_its_estimates():
+    # GcodeInterpreter.program é truncado, a execução segue além das estimativas
+    progress, clock = make_progress()
+    progress.start()
+    clock.now = 6.0
+    progress.update(6)
+
+    summary = progress.summary()
+    assert summary["command"] == 6
+    assert summary["distance_mm"] == 40.0
+    assert summary["eta_s"] == 0
+
+
+def test_streamed_program_has_no_totals():
+    progress = ProgramProgress(clock=FakeClock())
+    progress.update(3)
+
+    summary = progress.summary()
+    assert summary["command"] == 3
+    assert summary["commands"] is None
+    assert summary["eta_s"] is None
@@ -0,0 +1,22 @@
+import pytest
+
+from actuator_xrl8.gcode_machine import LOCAL_TRAJECTORY_CAPACITY
+from actuator_xrl8.simulation import SimulatedGcodeMachine, simulate
+
+
+def test_simulated_line_takes_its_planned_time():
+    duration, timestamps, x, y = simulate("G1 X100 Y0 S10\n", acceleration=1e9)
+
+    assert duration == pytest.approx(10.0, rel=1e-3)
+    assert x[-1] == pytest.approx(100.0)
+    assert timestamps[-1] == pytest.approx(10e9, rel=1e-3)
+
+
+def test_machines_without_motion_process_keep_a_small_ring():
+    machine = SimulatedGcodeMachine()
+    assert machine.trajectory.capacity == LOCAL_TRAJECTORY_CAPACITY
+
+    machine = SimulatedGcodeMachine(trajectory_capacity=16)
+    machine.run("G1 X100 Y0 S10\n")
+    assert machine.trajectory.count() > 16
+    assert len(machine.trajectory_mm()[0]) == 16